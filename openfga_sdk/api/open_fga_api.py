@@ -35,6 +35,9 @@ class OpenFgaApi:
         "_headers",
         "_retry_params",
         "_streaming",
+        "_deadline",
+        "_priority",
+        "_store_id",
     ]
 
     _COMMON_ERROR_RESPONSE_TYPES = {
@@ -71,6 +74,16 @@ class OpenFgaApi:
     async def close(self):
         await self.api_client.close()
 
+    def _get_store_id(self, options: dict) -> str:
+        """
+        Return the store of a request: the one passed as `_store_id`, by a client viewing
+        a store, or else the one of the api_client's configuration
+        """
+        store_id = options.get("_store_id")
+        if store_id:
+            return store_id
+        return self.api_client._get_store_id()
+
     async def _execute(
         self,
         method: str,
@@ -103,7 +116,8 @@ class OpenFgaApi:
 
         telemetry_attributes: dict[TelemetryAttribute, str | bool | int | float] = {
             TelemetryAttributes.fga_client_request_method: operation_name,
-            TelemetryAttributes.fga_client_request_store_id: self.api_client.get_store_id(),
+            TelemetryAttributes.fga_client_request_store_id: options.get("_store_id")
+            or self.api_client.get_store_id(),
             TelemetryAttributes.fga_client_request_model_id: options.get(
                 "authorization_model_id", ""
             ),
@@ -213,16 +227,22 @@ class OpenFgaApi:
             else None
         )
         request_timeout = options.get("_request_timeout") if options else None
+        deadline = options.get("_deadline") if options else None
+        priority = options.get("_priority") if options else None
         async_req = options.get("async_req") if options else None
 
         if telemetry_attributes is None:
             telemetry_attributes = {
                 TelemetryAttributes.fga_client_request_method: operation_name.lower(),
             }
-            if self.api_client.get_store_id():
+            # The store of a client viewing a store, else the configured one, if any
+            store_id = (options or {}).get(
+                "_store_id"
+            ) or self.api_client.get_store_id()
+            if store_id:
                 telemetry_attributes[
                     TelemetryAttributes.fga_client_request_store_id
-                ] = self.api_client.get_store_id()
+                ] = store_id
 
         if response_types_map is not None:
             merged_response_types_map = {
@@ -245,6 +265,8 @@ class OpenFgaApi:
                 _preload_content=True,
                 _request_timeout=request_timeout,
                 _retry_params=retry_params,
+                _deadline=deadline,
+                _priority=priority,
                 collection_formats={},
                 _oauth2_client=self._oauth2_client,
                 _telemetry_attributes=telemetry_attributes,
@@ -263,6 +285,8 @@ class OpenFgaApi:
             _return_http_data_only=True,
             _preload_content=True,
             _retry_params=retry_params,
+            _deadline=deadline,
+            _priority=priority,
             _oauth2_client=self._oauth2_client,
             _telemetry_attributes=telemetry_attributes,
             _streaming=False,
@@ -347,15 +371,21 @@ class OpenFgaApi:
             else None
         )
         request_timeout = options.get("_request_timeout") if options else None
+        deadline = options.get("_deadline") if options else None
+        priority = options.get("_priority") if options else None
 
         if telemetry_attributes is None:
             telemetry_attributes = {
                 TelemetryAttributes.fga_client_request_method: operation_name.lower(),
             }
-            if self.api_client.get_store_id():
+            # The store of a client viewing a store, else the configured one, if any
+            store_id = (options or {}).get(
+                "_store_id"
+            ) or self.api_client.get_store_id()
+            if store_id:
                 telemetry_attributes[
                     TelemetryAttributes.fga_client_request_store_id
-                ] = self.api_client.get_store_id()
+                ] = store_id
 
         if response_types_map is not None:
             merged_response_types_map = {
@@ -377,13 +407,18 @@ class OpenFgaApi:
             _preload_content=True,
             _request_timeout=request_timeout,
             _retry_params=retry_params,
+            _deadline=deadline,
+            _priority=priority,
             _oauth2_client=self._oauth2_client,
             _telemetry_attributes=telemetry_attributes,
             _streaming=True,
         )
 
-        async for chunk in stream:
-            yield chunk
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
 
     async def batch_check(self, body, **kwargs):
         """Send a list of `check` operations in a single request
@@ -467,11 +502,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `batch_check`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `batch_check`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/batch-check",
@@ -564,11 +599,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `check`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `check`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/check",
@@ -739,11 +774,11 @@ class OpenFgaApi:
                 )
             local_var_params[key] = val
         del local_var_params["kwargs"]
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `delete_store`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="DELETE",
             path=f"/stores/{store_id}",
@@ -835,11 +870,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `expand`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `expand`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/expand",
@@ -918,11 +953,11 @@ class OpenFgaApi:
                 )
             local_var_params[key] = val
         del local_var_params["kwargs"]
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `get_store`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="GET",
             path=f"/stores/{store_id}",
@@ -1014,11 +1049,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `list_objects`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `list_objects`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/list-objects",
@@ -1214,11 +1249,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `list_users`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `list_users`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/list-users",
@@ -1311,11 +1346,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `read`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/read",
@@ -1409,11 +1444,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `authorization_model_id` when calling `read_assertions`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_assertions`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="GET",
             path=f"/stores/{store_id}/assertions/{authorization_model_id}",
@@ -1504,11 +1539,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `id` when calling `read_authorization_model`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_authorization_model`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="GET",
             path=f"/stores/{store_id}/authorization-models/{id}",
@@ -1597,11 +1632,11 @@ class OpenFgaApi:
                 )
             local_var_params[key] = val
         del local_var_params["kwargs"]
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_authorization_models`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         query_params = []
         if local_var_params.get("page_size") is not None:
             query_params.append(("page_size", local_var_params["page_size"]))
@@ -1708,11 +1743,11 @@ class OpenFgaApi:
                 )
             local_var_params[key] = val
         del local_var_params["kwargs"]
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_changes`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         query_params = []
         if local_var_params.get("type") is not None:
             query_params.append(("type", local_var_params["type"]))
@@ -1816,11 +1851,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `streamed_list_objects`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `streamed_list_objects`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/streamed-list-objects",
@@ -1913,11 +1948,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `write`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `write`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/write",
@@ -2026,11 +2061,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `write_assertions`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `write_assertions`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="PUT",
             path=f"/stores/{store_id}/assertions/{authorization_model_id}",
@@ -2123,11 +2158,11 @@ class OpenFgaApi:
             raise ApiValueError(
                 "Missing the required parameter `body` when calling `write_authorization_model`"
             )
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `write_authorization_model`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         return await self._execute(
             method="POST",
             path=f"/stores/{store_id}/authorization-models",
@@ -1,6 +1,10 @@
-from openfga_sdk.client.client import OpenFgaClient
-from openfga_sdk.client.configuration import ClientConfiguration
-from openfga_sdk.client.models.check_request import ClientCheckRequest
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from openfga_sdk.client.client import OpenFgaClient
+    from openfga_sdk.client.configuration import ClientConfiguration
+    from openfga_sdk.client.models.check_request import ClientCheckRequest
 
 
 __all__ = [
@@ -8,3 +12,25 @@ __all__ = [
     "ClientConfiguration",
     "ClientCheckRequest",
 ]
+
+# The module defining each export, imported on first access (PEP 562),
+# so the sync client can use the client models without loading the asyncio client.
+_exports: dict[str, str] = {
+    "OpenFgaClient": "openfga_sdk.client.client",
+    "ClientConfiguration": "openfga_sdk.client.configuration",
+    "ClientCheckRequest": "openfga_sdk.client.models.check_request",
+}
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(__import__(module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports})
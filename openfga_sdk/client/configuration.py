@@ -1,4 +1,5 @@
 from openfga_sdk.configuration import Configuration
+from openfga_sdk.constants import CLIENT_MAX_METHOD_PARALLEL_REQUESTS
 from openfga_sdk.exceptions import FgaValidationException
 from openfga_sdk.telemetry.attributes import TelemetryAttribute
 from openfga_sdk.telemetry.configuration import (
@@ -7,6 +8,7 @@ from openfga_sdk.telemetry.configuration import (
     TelemetryMetricsConfiguration,
 )
 from openfga_sdk.telemetry.counters import TelemetryCounter
+from openfga_sdk.telemetry.gauges import TelemetryGauge
 from openfga_sdk.telemetry.histograms import TelemetryHistogram
 from openfga_sdk.validation import is_well_formed_ulid_string
 
@@ -32,7 +34,7 @@ class ClientConfiguration(Configuration):
                 TelemetryConfigurationType | str,
                 TelemetryMetricsConfiguration
                 | dict[
-                    TelemetryHistogram | TelemetryCounter | str,
+                    TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                     TelemetryMetricConfiguration
                     | dict[TelemetryAttribute | str, bool]
                     | None,
@@ -42,7 +44,17 @@ class ClientConfiguration(Configuration):
             | None
         ) = None,
         headers: dict[str, str] | None = None,
+        authorization_model_cache_size: int = 100,
+        latest_authorization_model_ttl_in_sec: float = 10.0,
+        pin_latest_authorization_model: bool = False,
+        max_worker_threads: int = CLIENT_MAX_METHOD_PARALLEL_REQUESTS,
     ):
+        """
+        :param authorization_model_cache_size: Number of authorization models read by id to keep in memory; 0 disables the cache
+        :param latest_authorization_model_ttl_in_sec: How long the latest authorization model of a store is cached; 0 disables the cache
+        :param pin_latest_authorization_model: Set `authorization_model_id` to the latest authorization model whenever it is read, reading it on the first request when none is set
+        :param max_worker_threads: Size of the thread pool the synchronous client sends the requests of its parallel methods from
+        """
         super().__init__(
             api_scheme,
             api_host,
@@ -56,6 +68,12 @@ class ClientConfiguration(Configuration):
             headers=headers,
         )
         self._authorization_model_id = authorization_model_id
+        self._authorization_model_cache_size = authorization_model_cache_size
+        self._latest_authorization_model_ttl_in_sec = (
+            latest_authorization_model_ttl_in_sec
+        )
+        self._pin_latest_authorization_model = pin_latest_authorization_model
+        self._max_worker_threads = max_worker_threads
 
     def is_valid(self):
         super().is_valid()
@@ -69,6 +87,11 @@ class ClientConfiguration(Configuration):
                 f"authorization_model_id ('{self.authorization_model_id}') is not in a valid ulid format"
             )
 
+        if not isinstance(self.max_worker_threads, int) or self.max_worker_threads < 1:
+            raise FgaValidationException(
+                f"max_worker_threads must be a positive integer, got {self.max_worker_threads!r}"
+            )
+
     @property
     def authorization_model_id(self):
         return self._authorization_model_id
@@ -76,3 +99,35 @@ class ClientConfiguration(Configuration):
     @authorization_model_id.setter
     def authorization_model_id(self, value):
         self._authorization_model_id = value
+
+    @property
+    def authorization_model_cache_size(self) -> int:
+        return self._authorization_model_cache_size
+
+    @authorization_model_cache_size.setter
+    def authorization_model_cache_size(self, value: int):
+        self._authorization_model_cache_size = value
+
+    @property
+    def latest_authorization_model_ttl_in_sec(self) -> float:
+        return self._latest_authorization_model_ttl_in_sec
+
+    @latest_authorization_model_ttl_in_sec.setter
+    def latest_authorization_model_ttl_in_sec(self, value: float):
+        self._latest_authorization_model_ttl_in_sec = value
+
+    @property
+    def pin_latest_authorization_model(self) -> bool:
+        return self._pin_latest_authorization_model
+
+    @pin_latest_authorization_model.setter
+    def pin_latest_authorization_model(self, value: bool):
+        self._pin_latest_authorization_model = value
+
+    @property
+    def max_worker_threads(self) -> int:
+        return self._max_worker_threads
+
+    @max_worker_threads.setter
+    def max_worker_threads(self, value: int):
+        self._max_worker_threads = value
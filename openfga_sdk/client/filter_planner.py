@@ -0,0 +1,192 @@
+import math
+
+from collections.abc import Iterable
+from enum import Enum
+
+from openfga_sdk.client.models.client_batch_check_response import (
+    check_error_to_exception,
+)
+from openfga_sdk.exceptions import ServiceException
+from openfga_sdk.models.batch_check_single_result import BatchCheckSingleResult
+
+
+class ClientFilterStrategy(str, Enum):
+    BATCH_CHECK = "batch_check"
+    LIST_OBJECTS = "list_objects"
+
+
+def allowed_batch_check_results(
+    objects: list[str],
+    indexes: Iterable[int],
+    results: dict[str, BatchCheckSingleResult] | None,
+) -> list[str]:
+    """
+    Return the objects allowed in a BatchCheck response whose correlation ids are positions in `objects`.
+    Raises the error of the first check that failed.
+    """
+    results = results or {}
+    allowed = []
+    for index in indexes:
+        result = results.get(str(index))
+        if result is None:
+            raise ServiceException(
+                status=500, reason="check missing from the batch check response"
+            )
+        if result.error is not None:
+            raise check_error_to_exception(result.error)
+        if result.allowed:
+            allowed.append(objects[index])
+    return allowed
+
+
+class _Average:
+    """
+    Exponentially weighted moving average
+    """
+
+    def __init__(self, smoothing: float) -> None:
+        self._smoothing = smoothing
+        self.value: float | None = None
+
+    def add(self, value: float) -> None:
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self._smoothing * (value - self.value)
+
+
+class FilterPlanner:
+    """
+    FilterPlanner picks the cheaper way of filtering candidate objects down to those a user can access,
+    based on the latencies and result sizes observed on previous calls:
+
+    - batch_check: check every candidate, in chunks of `max_batch_size` with `max_parallel_requests` in flight
+    - list_objects: stream every object the user can access and intersect it with the candidates
+    """
+
+    def __init__(self, smoothing: float = 0.2) -> None:
+        """
+        :param smoothing - weight of the latest observation in the moving averages
+        """
+        self._smoothing = smoothing
+        self._batch_check_latency = _Average(smoothing)
+        # (type, relation) -> moving averages of the time per streamed object and of the listing size
+        self._list_objects_rate: dict[tuple[str, str], _Average] = {}
+        self._list_objects_size: dict[tuple[str, str], _Average] = {}
+
+    def record_batch_check(self, duration: float) -> None:
+        """
+        Record the duration, in seconds, of a single BatchCheck request
+        """
+        self._batch_check_latency.add(duration)
+
+    def record_list_objects(
+        self,
+        type: str,
+        relation: str,
+        duration: float,
+        size: int,
+        complete: bool = True,
+    ) -> None:
+        """
+        Record the duration, in seconds, and number of objects of a streamed list objects call.
+        A listing stopped early only tells that the full result is at least `size` objects.
+        """
+        key = (type, relation)
+        self._list_objects_rate.setdefault(key, _Average(self._smoothing)).add(
+            duration / max(size, 1)
+        )
+
+        average_size = self._list_objects_size.setdefault(
+            key, _Average(self._smoothing)
+        )
+        if complete or average_size.value is None or average_size.value < size:
+            average_size.add(size)
+
+    def expected_size(self, type: str, relation: str) -> float | None:
+        """
+        Return the average number of objects a listing returned for this type and relation, if observed
+        """
+        size = self._list_objects_size.get((type, relation))
+        return size.value if size is not None else None
+
+    def estimate(
+        self,
+        strategy: ClientFilterStrategy,
+        candidates: int,
+        type: str,
+        relation: str,
+        max_batch_size: int,
+        max_parallel_requests: int,
+    ) -> float | None:
+        """
+        Return the estimated duration, in seconds, of a strategy, or None when nothing was observed yet
+        """
+        if strategy == ClientFilterStrategy.BATCH_CHECK:
+            latency = self._batch_check_latency.value
+            if latency is None:
+                return None
+            return (
+                self.batch_check_waves(
+                    candidates, max_batch_size, max_parallel_requests
+                )
+                * latency
+            )
+
+        rate = self._list_objects_rate.get((type, relation))
+        size = self.expected_size(type, relation)
+        if rate is None or rate.value is None or size is None:
+            return None
+        return rate.value * max(size, 1)
+
+    @staticmethod
+    def batch_check_waves(
+        candidates: int, max_batch_size: int, max_parallel_requests: int
+    ) -> int:
+        """
+        Return the number of rounds of parallel BatchCheck requests needed to check the candidates
+        """
+        return math.ceil(math.ceil(candidates / max_batch_size) / max_parallel_requests)
+
+    def choose(
+        self,
+        candidates: int,
+        type: str,
+        relation: str,
+        max_batch_size: int,
+        max_parallel_requests: int,
+    ) -> ClientFilterStrategy:
+        """
+        Return the strategy expected to filter the candidates fastest
+        """
+        list_objects = self.estimate(
+            ClientFilterStrategy.LIST_OBJECTS,
+            candidates,
+            type,
+            relation,
+            max_batch_size,
+            max_parallel_requests,
+        )
+        if list_objects is None:
+            # A single round of batch checks is hard to beat; otherwise try listing to learn its cost
+            waves = self.batch_check_waves(
+                candidates, max_batch_size, max_parallel_requests
+            )
+            return (
+                ClientFilterStrategy.BATCH_CHECK
+                if waves <= 1
+                else ClientFilterStrategy.LIST_OBJECTS
+            )
+
+        batch_check = self.estimate(
+            ClientFilterStrategy.BATCH_CHECK,
+            candidates,
+            type,
+            relation,
+            max_batch_size,
+            max_parallel_requests,
+        )
+        if batch_check is None or batch_check <= list_objects:
+            return ClientFilterStrategy.BATCH_CHECK
+
+        return ClientFilterStrategy.LIST_OBJECTS
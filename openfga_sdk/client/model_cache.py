@@ -0,0 +1,100 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+from openfga_sdk.models.read_authorization_model_response import (
+    ReadAuthorizationModelResponse,
+)
+
+
+class AuthorizationModelCache:
+    """
+    AuthorizationModelCache keeps the authorization models read by a client.
+
+    Models are immutable once written, so models read by id are kept until the least recently used ones
+    are evicted to stay within `max_size`. The latest model of a store changes whenever a model is written,
+    so it is only kept for `latest_ttl_in_sec`, for at most `max_size` stores.
+    """
+
+    def __init__(self, max_size: int = 100, latest_ttl_in_sec: float = 10.0) -> None:
+        self._max_size = max_size
+        self._latest_ttl_in_sec = latest_ttl_in_sec
+        self._lock = threading.Lock()
+        self._models: OrderedDict[tuple[str, str], ReadAuthorizationModelResponse] = (
+            OrderedDict()
+        )
+        self._latest: OrderedDict[str, tuple[float, ReadAuthorizationModelResponse]] = (
+            OrderedDict()
+        )
+
+    def get(
+        self, store_id: str, authorization_model_id: str
+    ) -> ReadAuthorizationModelResponse | None:
+        """
+        Return the cached model with this id, if any
+        """
+        key = (store_id, authorization_model_id)
+        with self._lock:
+            response = self._models.get(key)
+            if response is not None:
+                self._models.move_to_end(key)
+            return response
+
+    def set(
+        self,
+        store_id: str,
+        authorization_model_id: str,
+        response: ReadAuthorizationModelResponse,
+    ) -> None:
+        """
+        Cache the model with this id
+        """
+        if self._max_size <= 0:
+            return
+
+        key = (store_id, authorization_model_id)
+        with self._lock:
+            self._models[key] = response
+            self._models.move_to_end(key)
+            while len(self._models) > self._max_size:
+                self._models.popitem(last=False)
+
+    def get_latest(self, store_id: str) -> ReadAuthorizationModelResponse | None:
+        """
+        Return the latest model of the store, if it was cached less than `latest_ttl_in_sec` ago
+        """
+        with self._lock:
+            entry = self._latest.get(store_id)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._latest[store_id]
+                return None
+            self._latest.move_to_end(store_id)
+            return entry[1]
+
+    def set_latest(
+        self, store_id: str, response: ReadAuthorizationModelResponse
+    ) -> None:
+        """
+        Cache the latest model of the store
+        """
+        if self._latest_ttl_in_sec <= 0 or self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._latest[store_id] = (
+                time.monotonic() + self._latest_ttl_in_sec,
+                response,
+            )
+            self._latest.move_to_end(store_id)
+            while len(self._latest) > self._max_size:
+                self._latest.popitem(last=False)
+
+    def invalidate_latest(self, store_id: str) -> None:
+        """
+        Forget the latest model of the store, e.g. after writing a new one
+        """
+        with self._lock:
+            self._latest.pop(store_id, None)
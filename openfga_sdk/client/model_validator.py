@@ -0,0 +1,136 @@
+from openfga_sdk.client.models.batch_check_item import ClientBatchCheckItem
+from openfga_sdk.client.models.check_request import ClientCheckRequest
+from openfga_sdk.client.models.client_batch_check_response import (
+    check_error_to_exception,
+)
+from openfga_sdk.client.models.tuple import ClientTuple
+from openfga_sdk.exceptions import ValidationException
+from openfga_sdk.models.authorization_model import AuthorizationModel
+from openfga_sdk.models.check_error import CheckError
+from openfga_sdk.models.error_code import ErrorCode
+
+
+def model_validation_check_error(message: str) -> CheckError:
+    """
+    Return the error the server would have answered an invalid check within a batch with
+    """
+    return CheckError(input_error=ErrorCode.VALIDATION_ERROR, message=message)
+
+
+def model_validation_error(message: str) -> ValidationException:
+    """
+    Return the exception the server would have answered an invalid request with
+    """
+    return check_error_to_exception(model_validation_check_error(message))
+
+
+class ClientModelValidator:
+    """
+    ClientModelValidator checks tuples and check requests against an authorization model before they are sent,
+    catching the mistakes the server would reject with a validation error:
+
+    - an object type or relation that the model does not define
+    - a user type that the relation does not allow, per the relation's directly related user types
+    - a missing or unknown condition
+    """
+
+    def __init__(self, model: AuthorizationModel) -> None:
+        self._conditions = set(model.conditions or {})
+        # type -> relation -> allowed user references, or None when the model carries no metadata
+        self._relations: dict[str, dict[str, dict[str, set[str | None]] | None]] = {}
+
+        for type_definition in model.type_definitions or []:
+            metadata = type_definition.metadata
+            relations_metadata = (metadata.relations if metadata else None) or {}
+            relations: dict[str, dict[str, set[str | None]] | None] = {}
+
+            for relation in type_definition.relations or {}:
+                relation_metadata = relations_metadata.get(relation)
+                if relation_metadata is None:
+                    relations[relation] = None
+                    continue
+
+                # "user", "user:*" or "group#member" -> names of the conditions allowed, None for no condition
+                allowed: dict[str, set[str | None]] = {}
+                for reference in relation_metadata.directly_related_user_types or []:
+                    if reference.wildcard is not None:
+                        key = f"{reference.type}:*"
+                    elif reference.relation:
+                        key = f"{reference.type}#{reference.relation}"
+                    else:
+                        key = reference.type
+                    allowed.setdefault(key, set()).add(reference.condition or None)
+                relations[relation] = allowed
+
+            self._relations[type_definition.type] = relations
+
+    @staticmethod
+    def _user_key(user: str) -> str:
+        type, _, rest = user.partition(":")
+        if rest == "*":
+            return f"{type}:*"
+        _, _, relation = rest.partition("#")
+        return f"{type}#{relation}" if relation else type
+
+    def _validate_relation(self, relation: str, object: str) -> str | None:
+        type = object.partition(":")[0]
+        if type not in self._relations:
+            return f"type '{type}' of object '{object}' is not defined in the authorization model"
+        if relation not in self._relations[type]:
+            return f"relation '{type}#{relation}' is not defined in the authorization model"
+        return None
+
+    def _validate_user_type(self, user: str) -> str | None:
+        type = user.partition(":")[0]
+        if type not in self._relations:
+            return f"type '{type}' of user '{user}' is not defined in the authorization model"
+        return None
+
+    def validate_tuple(self, tuple: ClientTuple, is_write: bool = True) -> str | None:
+        """
+        Return why the tuple would be rejected by the server, or None when it is valid.
+        Deletes are only checked against the types and relations of the model.
+        """
+        error = self._validate_relation(tuple.relation, tuple.object)
+        if error is None:
+            error = self._validate_user_type(tuple.user)
+        if error is not None or not is_write:
+            return error
+
+        allowed = self._relations[tuple.object.partition(":")[0]][tuple.relation]
+        if allowed is None:
+            return None
+
+        conditions = allowed.get(self._user_key(tuple.user))
+        if conditions is None:
+            return (
+                f"type '{self._user_key(tuple.user)}' is not an allowed type "
+                f"for relation '{tuple.object.partition(':')[0]}#{tuple.relation}'"
+            )
+
+        condition = tuple.condition.name if tuple.condition else None
+        if condition is not None and condition not in self._conditions:
+            return f"condition '{condition}' is not defined in the authorization model"
+        if condition not in conditions:
+            if condition is None:
+                return f"tuple for relation '{tuple.relation}' of '{tuple.object}' requires a condition"
+            return f"condition '{condition}' is not allowed for relation '{tuple.relation}' of '{tuple.object}'"
+        return None
+
+    def validate_check(
+        self, check: ClientCheckRequest | ClientBatchCheckItem
+    ) -> str | None:
+        """
+        Return why the check, including its contextual tuples, would be rejected by the server, or None when it is valid
+        """
+        error = self._validate_relation(check.relation, check.object)
+        if error is None:
+            error = self._validate_user_type(check.user)
+        if error is not None:
+            return error
+
+        for contextual_tuple in check.contextual_tuples or []:
+            error = self.validate_tuple(contextual_tuple)
+            if error is not None:
+                return f"invalid contextual tuple: {error}"
+        return None
@@ -5,6 +5,7 @@ from openfga_sdk.client.models.batch_check_response import ClientBatchCheckRespo
 from openfga_sdk.client.models.batch_check_single_response import (
     ClientBatchCheckSingleResponse,
 )
+from openfga_sdk.client.models.check_matrix import ClientCheckMatrix
 from openfga_sdk.client.models.check_request import ClientCheckRequest
 from openfga_sdk.client.models.client_batch_check_response import (
     ClientBatchCheckClientResponse,
@@ -14,6 +15,9 @@ from openfga_sdk.client.models.list_objects_request import ClientListObjectsRequ
 from openfga_sdk.client.models.list_relations_request import ClientListRelationsRequest
 from openfga_sdk.client.models.raw_response import RawResponse
 from openfga_sdk.client.models.read_changes_request import ClientReadChangesRequest
+from openfga_sdk.client.models.streamed_list_objects_fan_out_response import (
+    ClientStreamedListObjectsFanOutResponse,
+)
 from openfga_sdk.client.models.tuple import ClientTuple
 from openfga_sdk.client.models.write_conflict_opts import (
     ClientWriteRequestOnDuplicateWrites,
@@ -32,12 +36,14 @@ __all__ = [
     "ClientBatchCheckRequest",
     "ClientBatchCheckResponse",
     "ClientBatchCheckSingleResponse",
+    "ClientCheckMatrix",
     "ClientCheckRequest",
     "ClientBatchCheckClientResponse",
     "ClientExpandRequest",
     "ClientListObjectsRequest",
     "ClientListRelationsRequest",
     "ClientReadChangesRequest",
+    "ClientStreamedListObjectsFanOutResponse",
     "ClientTuple",
     "ClientWriteRequest",
     "ClientWriteResponse",
@@ -1,28 +1,110 @@
+import json
+
 from openfga_sdk.client.models.tuple import ClientTuple, convert_tuple_keys
 from openfga_sdk.models.batch_check_item import BatchCheckItem
 from openfga_sdk.models.check_request_tuple_key import CheckRequestTupleKey
 from openfga_sdk.models.contextual_tuple_keys import ContextualTupleKeys
 
 
-def construct_batch_item(check) -> BatchCheckItem:
+def construct_batch_item(check, interned: dict | None = None) -> BatchCheckItem:
+    """
+    Convert a check into a BatchCheckItem.
+    When given, `interned` holds the contextual tuples and contexts already converted for the request:
+    checks sharing them then reference the same objects, which are converted and serialized once.
+    """
+    context = check.context
+    if interned is not None and context is not None:
+        context = interned.setdefault(
+            ("context", _context_key(context, interned)), context
+        )
+
     batch_item = BatchCheckItem(
         tuple_key=CheckRequestTupleKey(
             user=check.user,
             relation=check.relation,
             object=check.object,
         ),
-        context=check.context,
+        context=context,
         correlation_id=check.correlation_id,
     )
 
     if check.contextual_tuples:
-        batch_item.contextual_tuples = ContextualTupleKeys(
-            tuple_keys=convert_tuple_keys(check.contextual_tuples)
+        if interned is None:
+            batch_item.contextual_tuples = ContextualTupleKeys(
+                tuple_keys=convert_tuple_keys(check.contextual_tuples)
+            )
+            return batch_item
+
+        # The same list is usually passed to every check, so look it up by identity before content
+        by_identity = interned.get(
+            ("contextual_tuples_id", id(check.contextual_tuples))
         )
+        if by_identity is not None:
+            batch_item.contextual_tuples = by_identity[1]
+            return batch_item
+
+        key = (
+            "contextual_tuples",
+            _contextual_tuples_key(check.contextual_tuples, interned),
+        )
+        contextual_tuples = interned.get(key)
+        if contextual_tuples is None:
+            contextual_tuples = interned[key] = ContextualTupleKeys(
+                tuple_keys=convert_tuple_keys(check.contextual_tuples)
+            )
+        # The list is kept alongside so that its id cannot be reused during the request
+        interned[("contextual_tuples_id", id(check.contextual_tuples))] = (
+            check.contextual_tuples,
+            contextual_tuples,
+        )
+        batch_item.contextual_tuples = contextual_tuples
 
     return batch_item
 
 
+def _context_key(context, interned: dict | None = None) -> str | None:
+    if context is None:
+        return None
+    if interned is None:
+        return json.dumps(context, sort_keys=True, default=str)
+
+    # The same dict is usually passed to every check, so only serialize it the first time it is seen
+    by_identity = interned.get(("context_id", id(context)))
+    if by_identity is not None:
+        return by_identity[1]
+    key = json.dumps(context, sort_keys=True, default=str)
+    # The dict is kept alongside so that its id cannot be reused during the request
+    interned[("context_id", id(context))] = (context, key)
+    return key
+
+
+def _contextual_tuples_key(contextual_tuples, interned: dict | None = None) -> tuple:
+    return tuple(
+        (
+            item.user,
+            item.relation,
+            item.object,
+            item.condition.name if item.condition else None,
+            _context_key(item.condition.context, interned) if item.condition else None,
+        )
+        for item in contextual_tuples or []
+    )
+
+
+def batch_check_item_key(check, interned: dict | None = None) -> tuple:
+    """
+    Return a hashable key identifying what a check evaluates, regardless of its correlation id.
+    When given, `interned` remembers the keys of the contexts already seen, as in construct_batch_item.
+    """
+    return (
+        check.user,
+        check.relation,
+        check.object,
+        _context_key(check.context, interned),
+        _contextual_tuples_key(check.contextual_tuples, interned),
+    )
+
+
 class ClientBatchCheckItem:
     def __init__(
         self,
@@ -0,0 +1,160 @@
+import threading
+
+from collections.abc import Iterable, Iterator
+
+from openfga_sdk.client.models.client_batch_check_response import (
+    check_error_to_exception,
+)
+from openfga_sdk.exceptions import ServiceException
+from openfga_sdk.models.batch_check_single_result import BatchCheckSingleResult
+
+
+def apply_check_matrix_results(
+    matrix: "ClientCheckMatrix",
+    indexes: Iterable[int],
+    results: dict[str, BatchCheckSingleResult] | None,
+) -> None:
+    """
+    Record the results of a BatchCheck request whose correlation ids are positions in the matrix
+    """
+    results = results or {}
+    for index in indexes:
+        result = results.get(str(index))
+        if result is None:
+            matrix.set_error(
+                index,
+                ServiceException(
+                    status=500, reason="check missing from the batch check response"
+                ),
+            )
+        elif result.error is not None:
+            matrix.set_error(index, check_error_to_exception(result.error))
+        else:
+            matrix.set(index, bool(result.allowed))
+
+
+class ClientCheckMatrix:
+    """
+    ClientCheckMatrix holds the results of checking every (user, relation, object) combination.
+
+    Results are packed one bit per check; errors are kept separately, only for the checks that failed.
+    Results can be set from several threads: the checks of a byte may be sent in different requests.
+    """
+
+    def __init__(
+        self,
+        users: Iterable[str],
+        relations: Iterable[str],
+        objects: Iterable[str],
+    ) -> None:
+        self._users = list(dict.fromkeys(users))
+        self._relations = list(dict.fromkeys(relations))
+        self._objects = list(dict.fromkeys(objects))
+        self._user_index = {user: i for i, user in enumerate(self._users)}
+        self._relation_index = {
+            relation: i for i, relation in enumerate(self._relations)
+        }
+        self._object_index = {object: i for i, object in enumerate(self._objects)}
+        self._bits = bytearray((len(self) + 7) // 8)
+        self._errors: dict[int, Exception] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._users) * len(self._relations) * len(self._objects)
+
+    def __iter__(self) -> Iterator[tuple[str, str, str, bool]]:
+        for index in range(len(self)):
+            user, relation, object = self.key(index)
+            yield user, relation, object, self.get(index)
+
+    @property
+    def users(self) -> list[str]:
+        """
+        Return the distinct users, in the order they were given
+        """
+        return self._users
+
+    @property
+    def relations(self) -> list[str]:
+        """
+        Return the distinct relations, in the order they were given
+        """
+        return self._relations
+
+    @property
+    def objects(self) -> list[str]:
+        """
+        Return the distinct objects, in the order they were given
+        """
+        return self._objects
+
+    @property
+    def errors(self) -> dict[tuple[str, str, str], Exception]:
+        """
+        Return the error of every check that failed, keyed by (user, relation, object)
+        """
+        return {self.key(index): error for index, error in self._errors.items()}
+
+    def index(self, user: str, relation: str, object: str) -> int:
+        """
+        Return the position of a check in the matrix. Raises KeyError for unknown values.
+        """
+        return (
+            self._user_index[user] * len(self._relations)
+            + self._relation_index[relation]
+        ) * len(self._objects) + self._object_index[object]
+
+    def key(self, index: int) -> tuple[str, str, str]:
+        """
+        Return the (user, relation, object) checked at a position of the matrix
+        """
+        rest, object = divmod(index, len(self._objects))
+        user, relation = divmod(rest, len(self._relations))
+        return self._users[user], self._relations[relation], self._objects[object]
+
+    def allowed(self, user: str, relation: str, object: str) -> bool:
+        """
+        Return whether the user has the relation with the object
+        """
+        return self.get(self.index(user, relation, object))
+
+    def error(self, user: str, relation: str, object: str) -> Exception | None:
+        """
+        Return the error encountered while checking, if any
+        """
+        return self._errors.get(self.index(user, relation, object))
+
+    def allowed_objects(self, user: str, relation: str) -> list[str]:
+        """
+        Return the objects the user has the relation with
+        """
+        start = self.index(user, relation, self._objects[0]) if self._objects else 0
+        return [
+            object
+            for offset, object in enumerate(self._objects)
+            if self.get(start + offset)
+        ]
+
+    def get(self, index: int) -> bool:
+        """
+        Return the result of the check at a position of the matrix
+        """
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def set(self, index: int, allowed: bool) -> None:
+        """
+        Set the result of the check at a position of the matrix
+        """
+        with self._lock:
+            if allowed:
+                self._bits[index >> 3] |= 1 << (index & 7)
+            else:
+                self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def set_error(self, index: int, error: Exception) -> None:
+        """
+        Record the error of the check at a position of the matrix, which is then not allowed
+        """
+        self.set(index, False)
+        with self._lock:
+            self._errors[index] = error
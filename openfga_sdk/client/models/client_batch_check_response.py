@@ -1,5 +1,77 @@
 from openfga_sdk.client.models.check_request import ClientCheckRequest
+from openfga_sdk.exceptions import ApiException, ServiceException, ValidationException
+from openfga_sdk.models.batch_check_single_result import BatchCheckSingleResult
+from openfga_sdk.models.check_error import CheckError
 from openfga_sdk.models.check_response import CheckResponse
+from openfga_sdk.models.internal_error_code import InternalErrorCode
+from openfga_sdk.models.internal_error_message_response import (
+    InternalErrorMessageResponse,
+)
+from openfga_sdk.models.validation_error_message_response import (
+    ValidationErrorMessageResponse,
+)
+
+
+def check_error_to_exception(error: CheckError) -> ApiException:
+    """
+    Convert the error of a single check within a batch into the exception a standalone check would have raised
+    """
+    if error.input_error is not None:
+        exception = ValidationException(status=400, reason=error.message)
+        exception.parsed_exception = ValidationErrorMessageResponse(
+            code=error.input_error, message=error.message
+        )
+        return exception
+
+    exception = ServiceException(status=500, reason=error.message)
+    exception.parsed_exception = InternalErrorMessageResponse(
+        code=error.internal_error, message=error.message
+    )
+    return exception
+
+
+def deadline_exceeded_check_result(error: Exception) -> BatchCheckSingleResult:
+    """
+    Return the result of a check within a batch that the deadline of the operation cut short
+    """
+    return BatchCheckSingleResult(
+        allowed=False,
+        error=CheckError(
+            internal_error=InternalErrorCode.DEADLINE_EXCEEDED, message=str(error)
+        ),
+    )
+
+
+def construct_client_batch_check_response(
+    request: ClientCheckRequest, result: BatchCheckSingleResult | None
+) -> "ClientBatchCheckClientResponse":
+    """
+    Convert the result of a single check within a batch into a ClientBatchCheckClientResponse
+    """
+    if result is None:
+        return ClientBatchCheckClientResponse(
+            allowed=False,
+            request=request,
+            response=None,
+            error=ServiceException(
+                status=500, reason="check missing from the batch check response"
+            ),
+        )
+
+    if result.error is not None:
+        return ClientBatchCheckClientResponse(
+            allowed=False,
+            request=request,
+            response=None,
+            error=check_error_to_exception(result.error),
+        )
+
+    return ClientBatchCheckClientResponse(
+        allowed=bool(result.allowed),
+        request=request,
+        response=CheckResponse(allowed=bool(result.allowed)),
+        error=None,
+    )
 
 
 class ClientBatchCheckClientResponse:
@@ -0,0 +1,38 @@
+from openfga_sdk.client.models.list_objects_request import ClientListObjectsRequest
+
+
+class ClientStreamedListObjectsFanOutResponse:
+    """
+    An object streamed by one of the requests of a fan-out, tagged with the request it came from
+    """
+
+    def __init__(
+        self,
+        object: str,
+        source: int,
+        request: ClientListObjectsRequest,
+    ) -> None:
+        self._object = object
+        self._source = source
+        self._request = request
+
+    @property
+    def object(self) -> str:
+        """
+        Return object
+        """
+        return self._object
+
+    @property
+    def source(self) -> int:
+        """
+        Return the position of the request that streamed the object
+        """
+        return self._source
+
+    @property
+    def request(self) -> ClientListObjectsRequest:
+        """
+        Return the request that streamed the object
+        """
+        return self._request
@@ -1,3 +1,5 @@
+import json
+
 from openfga_sdk.models.relationship_condition import RelationshipCondition
 from openfga_sdk.models.tuple_key import TupleKey
 
@@ -75,6 +77,23 @@ class ClientTuple:
         )
 
 
+def tuple_identity(item: ClientTuple | TupleKey) -> tuple:
+    """
+    Return a hashable key identifying a tuple, including its condition
+    """
+    condition = item.condition
+    if condition is None:
+        return item.user, item.relation, item.object, None, None
+
+    return (
+        item.user,
+        item.relation,
+        item.object,
+        condition.name,
+        json.dumps(condition.context, sort_keys=True, default=str),
+    )
+
+
 def convert_tuple_keys(lists: list[ClientTuple]) -> list[TupleKey] | None:
     """
     Return the items as tuple_keys
@@ -1,4 +1,8 @@
-from openfga_sdk.client.models.tuple import ClientTuple, convert_tuple_keys
+from openfga_sdk.client.models.tuple import (
+    ClientTuple,
+    convert_tuple_keys,
+    tuple_identity,
+)
 from openfga_sdk.models.write_request_deletes import WriteRequestDeletes
 from openfga_sdk.models.write_request_writes import WriteRequestWrites
 
@@ -44,6 +48,25 @@ class ClientWriteRequest:
         """
         self._deletes = value
 
+    def compact(self) -> "ClientWriteRequest":
+        """
+        Return a request with the same net effect and no redundant tuples: a tuple written (with the same
+        condition) or deleted several times is sent once, and a tuple both written and deleted is only deleted
+        """
+        deletes: dict[tuple[str, str, str], ClientTuple] = {}
+        for item in self._deletes or []:
+            deletes.setdefault((item.user, item.relation, item.object), item)
+
+        writes: dict[tuple, ClientTuple] = {}
+        for item in self._writes or []:
+            if (item.user, item.relation, item.object) not in deletes:
+                writes.setdefault(tuple_identity(item), item)
+
+        return ClientWriteRequest(
+            writes=list(writes.values()) or None,
+            deletes=list(deletes.values()) or None,
+        )
+
     @property
     def writes_tuple_keys(self) -> WriteRequestWrites | None:
         """
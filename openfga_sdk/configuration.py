@@ -1,10 +1,8 @@
 import copy
-import http
+import http.client
 import logging
 import sys
-import urllib
-
-import urllib3
+import urllib.parse
 
 from openfga_sdk._version import SDK_VERSION
 from openfga_sdk.constants import (
@@ -22,6 +20,7 @@ from openfga_sdk.telemetry.configuration import (
     TelemetryMetricsConfiguration,
 )
 from openfga_sdk.telemetry.counters import TelemetryCounter
+from openfga_sdk.telemetry.gauges import TelemetryGauge
 from openfga_sdk.telemetry.histograms import TelemetryHistogram
 from openfga_sdk.validation import is_well_formed_ulid_string
 
@@ -192,7 +191,7 @@ class Configuration:
                 TelemetryConfigurationType | str,
                 TelemetryMetricsConfiguration
                 | dict[
-                    TelemetryHistogram | TelemetryCounter | str,
+                    TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                     TelemetryMetricConfiguration
                     | dict[TelemetryAttribute | str, bool]
                     | None,
@@ -292,7 +291,14 @@ class Configuration:
 
         self.connection_pool_maxsize = 100
         """This value is passed to the aiohttp to limit simultaneous connections.
-           Default values is 100, None means no-limit.
+           Default values is 100, None means no-limit; the synchronous client then
+           keeps as many connections as its max_worker_threads.
+           A warning is logged when requests outnumber the connections.
+        """
+        self.connection_pool_reserved_for_high_priority = 0
+        """Number of the connection_pool_maxsize connections that only high priority
+           requests may use, see openfga_sdk.priority. Default value is 0, which
+           does not enforce priorities.
         """
 
         self.proxy = None
@@ -469,7 +475,7 @@ class Configuration:
                 TelemetryConfigurationType | str,
                 TelemetryMetricsConfiguration
                 | dict[
-                    TelemetryHistogram | TelemetryCounter | str,
+                    TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                     TelemetryMetricConfiguration
                     | dict[TelemetryAttribute | str, bool]
                     | None,
@@ -521,6 +527,8 @@ class Configuration:
         password = ""
         if self.password is not None:
             password = self.password
+        import urllib3
+
         return urllib3.util.make_headers(basic_auth=username + ":" + password).get(
             "authorization"
         )
@@ -661,6 +669,15 @@ class Configuration:
                     f"timeout_millisec not within reasonable range (0,60000), {self._timeout_millisec}"
                 )
 
+        reserved = self.connection_pool_reserved_for_high_priority
+        if reserved and self.connection_pool_maxsize is not None:
+            if not isinstance(reserved, int) or not (
+                0 < reserved < self.connection_pool_maxsize
+            ):
+                raise FgaValidationException(
+                    f"connection_pool_reserved_for_high_priority must leave low priority requests at least one of the {self.connection_pool_maxsize} connections, got {reserved}"
+                )
+
         if self._headers is not None:
             for key, value in self._headers.items():
                 if not isinstance(key, str):
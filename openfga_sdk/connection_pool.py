@@ -0,0 +1,187 @@
+import functools
+import logging
+import os
+import ssl
+import threading
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPoolStats(NamedTuple):
+    """
+    A snapshot of the connections of a pool and the requests they serve
+    """
+
+    active: int
+    idle: int
+    waiting: int
+    created: int
+    reused: int
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """
+        Share of the requests sent over a connection that was already open, None before any request
+        """
+        requests = self.created + self.reused
+        return self.reused / requests if requests else None
+
+
+class ConnectionPoolUsage:
+    """
+    ConnectionPoolUsage tracks how many requests share a connection pool at once,
+    grows the pool to the parallelism expected of it while it can still be sized,
+    and warns the first time requests outnumber its connections.
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None,
+        overflow: str,
+        grow: Callable[[int], bool] | None = None,
+    ) -> None:
+        """
+        :param maxsize - the number of connections of the pool, None when it is unbounded
+        :param overflow - what happens to a request finding every connection busy, for the warning
+        :param grow - resizes the pool to the given number of connections, returning False once it can no longer be sized
+        """
+        self.maxsize = maxsize
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        # Requests started while every connection of the pool was busy
+        self.waited = 0
+        # Connections opened, and requests sent over an already open one, when the transport reports them
+        self.created = 0
+        self.reused = 0
+        self._overflow = overflow
+        self._grow = grow
+        self._warned: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _warn_once(self, key: str, message: str, *args) -> None:
+        with self._lock:
+            if key in self._warned:
+                return
+            self._warned.add(key)
+        logger.warning(message, *args)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """
+        Count a request as in flight for the duration of the block
+        """
+        with self._lock:
+            busy = self.maxsize is not None and self.in_flight >= self.maxsize
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            if busy:
+                self.waited += 1
+
+        if busy:
+            self._warn_once(
+                "busy",
+                "All %s connections of the pool are busy: %s. "
+                "Raise connection_pool_maxsize, or lower max_parallel_requests.",
+                self.maxsize,
+                self._overflow,
+            )
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @property
+    def waiting(self) -> int:
+        """
+        Number of requests in flight beyond the connections of the pool
+        """
+        if self.maxsize is None:
+            return 0
+        return max(0, self.in_flight - self.maxsize)
+
+    def connection_created(self) -> None:
+        with self._lock:
+            self.created += 1
+
+    def connection_reused(self) -> None:
+        with self._lock:
+            self.reused += 1
+
+    def expect(self, parallel_requests: int) -> None:
+        """
+        Grow the pool when an operation is about to send more requests at once than it has connections,
+        or warn when it can no longer be resized
+        """
+        if self.maxsize is None or parallel_requests <= self.maxsize:
+            return
+        with self._lock:
+            if self._grow is not None and self._grow(parallel_requests):
+                self.maxsize = parallel_requests
+                return
+        self._warn_once(
+            f"expect:{parallel_requests}",
+            "max_parallel_requests (%s) exceeds connection_pool_maxsize (%s): %s.",
+            parallel_requests,
+            self.maxsize,
+            self._overflow,
+        )
+
+
+def _file_version(path: str | None) -> tuple[int, int] | None:
+    """
+    Identify the version of a certificate file, so a rotated one is loaded again
+    """
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _ssl_context(
+    ca_cert: str | None,
+    cert_file: str | None,
+    key_file: str | None,
+    verify_ssl: bool,
+    versions: tuple,
+) -> ssl.SSLContext:
+    ssl_context = ssl.create_default_context(cafile=ca_cert)
+
+    if cert_file:
+        ssl_context.load_cert_chain(cert_file, keyfile=key_file)
+
+    if not verify_ssl:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    return ssl_context
+
+
+def create_ssl_context(configuration: Any) -> ssl.SSLContext:
+    """
+    Returns the SSL context for the TLS settings of the configuration.
+
+    Creating one loads the CA certificates, which takes tens of milliseconds with OpenSSL 3.0+
+    (see https://github.com/openssl/openssl/issues/17064), so contexts are shared by every client
+    of the process with the same settings, and created again once a certificate file changes.
+    """
+    ca_cert = configuration.ssl_ca_cert
+    cert_file = configuration.cert_file
+    key_file = configuration.key_file if cert_file else None
+    return _ssl_context(
+        ca_cert,
+        cert_file,
+        key_file,
+        bool(configuration.verify_ssl),
+        tuple(_file_version(path) for path in (ca_cert, cert_file, key_file)),
+    )
@@ -115,6 +115,22 @@ class ApiKeyError(OpenApiException, KeyError):
         super().__init__(full_msg)
 
 
+class FgaDeadlineExceededException(OpenApiException, TimeoutError):
+    def __init__(self, msg, partial_result=None):
+        """
+        Raised when the deadline of an operation passed before it completed.
+
+        Args:
+            msg (str): the exception message
+
+        Keyword Args:
+            partial_result: what the operation had completed before the deadline,
+                for operations that return a single result. None if unset
+        """
+        self.partial_result = partial_result
+        super().__init__(msg)
+
+
 class ApiException(OpenApiException):
     def __init__(
         self, status=None, reason=None, http_resp=None, *, operation_name=None
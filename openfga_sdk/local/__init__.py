@@ -0,0 +1,10 @@
+from openfga_sdk.local.evaluator import LocalCheckEvaluator
+from openfga_sdk.local.replica import TupleReplica
+from openfga_sdk.local.tuple_store import LocalTupleStore
+
+
+__all__ = [
+    "LocalCheckEvaluator",
+    "LocalTupleStore",
+    "TupleReplica",
+]
@@ -0,0 +1,613 @@
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+from openfga_sdk.client.models.check_request import ClientCheckRequest
+from openfga_sdk.client.models.list_objects_request import ClientListObjectsRequest
+from openfga_sdk.client.models.list_users_request import ClientListUsersRequest
+from openfga_sdk.exceptions import FgaValidationException
+from openfga_sdk.local.tuple_store import LocalTupleStore
+from openfga_sdk.models.authorization_model import AuthorizationModel
+from openfga_sdk.models.check_response import CheckResponse
+from openfga_sdk.models.fga_object import FgaObject
+from openfga_sdk.models.list_objects_response import ListObjectsResponse
+from openfga_sdk.models.list_users_response import ListUsersResponse
+from openfga_sdk.models.relationship_condition import RelationshipCondition
+from openfga_sdk.models.typed_wildcard import TypedWildcard
+from openfga_sdk.models.user import User
+from openfga_sdk.models.user_type_filter import UserTypeFilter
+from openfga_sdk.models.userset_user import UsersetUser
+
+
+ConditionEvaluator = Callable[[RelationshipCondition, dict[str, Any] | None], bool]
+
+
+class _This(NamedTuple):
+    # None when the model carries no type restrictions (schema 1.0)
+    direct_types: frozenset[str] | None
+    wildcard_types: frozenset[str]
+    userset_types: frozenset[tuple[str, str]] | None
+
+
+class _ComputedUserset(NamedTuple):
+    relation: str
+
+
+class _TupleToUserset(NamedTuple):
+    tupleset: str
+    computed_relation: str
+
+
+class _Union(NamedTuple):
+    children: tuple
+
+
+class _Intersection(NamedTuple):
+    children: tuple
+
+
+class _Difference(NamedTuple):
+    base: Any
+    subtract: Any
+
+
+# Fields whose JSON key differs from the model attribute name
+_JSON_KEYS = {
+    "computed_userset": "computedUserset",
+    "tuple_to_userset": "tupleToUserset",
+}
+
+
+def _get(value: Any, name: str) -> Any:
+    """
+    Helper function to read a field from either a model instance or its JSON representation
+    """
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value.get(_JSON_KEYS.get(name, name))
+    return getattr(value, name, None)
+
+
+def _object_type(value: str) -> str:
+    return value.split(":", 1)[0]
+
+
+def _compile_this(relation_metadata: Any) -> _This:
+    references = _get(relation_metadata, "directly_related_user_types")
+    if references is None:
+        return _This(None, frozenset(), None)
+
+    direct_types = set()
+    wildcard_types = set()
+    userset_types = set()
+    for reference in references:
+        type = _get(reference, "type")
+        if _get(reference, "wildcard") is not None:
+            wildcard_types.add(type)
+        elif _get(reference, "relation"):
+            userset_types.add((type, _get(reference, "relation")))
+        else:
+            direct_types.add(type)
+
+    return _This(
+        frozenset(direct_types), frozenset(wildcard_types), frozenset(userset_types)
+    )
+
+
+def _compile_userset(userset: Any, relation_metadata: Any) -> Any:
+    computed_userset = _get(userset, "computed_userset")
+    if computed_userset is not None:
+        return _ComputedUserset(_get(computed_userset, "relation"))
+
+    tuple_to_userset = _get(userset, "tuple_to_userset")
+    if tuple_to_userset is not None:
+        return _TupleToUserset(
+            _get(_get(tuple_to_userset, "tupleset"), "relation"),
+            _get(_get(tuple_to_userset, "computed_userset"), "relation"),
+        )
+
+    union = _get(userset, "union")
+    if union is not None:
+        return _Union(
+            tuple(
+                _compile_userset(child, relation_metadata)
+                for child in _get(union, "child") or []
+            )
+        )
+
+    intersection = _get(userset, "intersection")
+    if intersection is not None:
+        return _Intersection(
+            tuple(
+                _compile_userset(child, relation_metadata)
+                for child in _get(intersection, "child") or []
+            )
+        )
+
+    difference = _get(userset, "difference")
+    if difference is not None:
+        return _Difference(
+            _compile_userset(_get(difference, "base"), relation_metadata),
+            _compile_userset(_get(difference, "subtract"), relation_metadata),
+        )
+
+    # `this` is an empty object, which does not always survive deserialization
+    return _compile_this(relation_metadata)
+
+
+def compile_model(
+    model: AuthorizationModel | dict[str, Any],
+) -> dict[str, dict[str, Any]]:
+    """
+    Compile the type definitions of an authorization model into a relation graph:
+    type -> relation -> rewrite
+    """
+    graph: dict[str, dict[str, Any]] = {}
+    for type_definition in _get(model, "type_definitions") or []:
+        metadata_relations = _get(_get(type_definition, "metadata"), "relations") or {}
+        relations = _get(type_definition, "relations") or {}
+        graph[_get(type_definition, "type")] = {
+            relation: _compile_userset(userset, metadata_relations.get(relation))
+            for relation, userset in relations.items()
+        }
+    return graph
+
+
+class _ReverseEdge(NamedTuple):
+    # Having `relation` on an object grants `target_relation` on objects of `target_type`,
+    # either the same object, or the objects it is related to through `tupleset`
+    target_type: str
+    target_relation: str
+    tupleset: str | None
+
+
+def _leaves(rewrite: Any) -> Iterable[Any]:
+    """
+    Helper function to yield the rewrites that can grant a relation, ignoring what is subtracted
+    """
+    if isinstance(rewrite, _Union | _Intersection):
+        for child in rewrite.children:
+            yield from _leaves(child)
+    elif isinstance(rewrite, _Difference):
+        yield from _leaves(rewrite.base)
+    else:
+        yield rewrite
+
+
+def compile_reverse_edges(
+    graph: dict[str, dict[str, Any]],
+) -> dict[tuple[str, str], list[_ReverseEdge]]:
+    """
+    Invert the computed usersets and tuple-to-usersets of a relation graph:
+    (type, relation) -> the (type, relation) pairs it contributes to
+    """
+    edges: dict[tuple[str, str], list[_ReverseEdge]] = {}
+    for type, relations in graph.items():
+        for relation, rewrite in relations.items():
+            for leaf in _leaves(rewrite):
+                if isinstance(leaf, _ComputedUserset):
+                    edges.setdefault((type, leaf.relation), []).append(
+                        _ReverseEdge(type, relation, None)
+                    )
+                elif isinstance(leaf, _TupleToUserset):
+                    tupleset = relations.get(leaf.tupleset)
+                    parent_types = (
+                        tupleset.direct_types
+                        if isinstance(tupleset, _This)
+                        and tupleset.direct_types is not None
+                        else graph.keys()
+                    )
+                    for parent_type in parent_types:
+                        if leaf.computed_relation in graph.get(parent_type, {}):
+                            edges.setdefault(
+                                (parent_type, leaf.computed_relation), []
+                            ).append(_ReverseEdge(type, relation, leaf.tupleset))
+    return edges
+
+
+class _Evaluation:
+    """
+    State of a single check: the stores to read from and the memoized sub-problems
+    """
+
+    def __init__(
+        self,
+        graph: dict[str, dict[str, Any]],
+        stores: tuple[LocalTupleStore, ...],
+        context: dict[str, Any] | None,
+        condition_evaluator: ConditionEvaluator | None,
+    ) -> None:
+        self._graph = graph
+        self._stores = stores
+        self._context = context
+        self._condition_evaluator = condition_evaluator
+        self._memo: dict[tuple[str, str, str], bool] = {}
+        self._visiting: set[tuple[str, str, str]] = set()
+        self._cycles = 0
+
+    def _rewrite(self, object: str, relation: str) -> Any:
+        relations = self._graph.get(_object_type(object))
+        if relations is None:
+            raise FgaValidationException(
+                f"type '{_object_type(object)}' not found in the authorization model"
+            )
+
+        rewrite = relations.get(relation)
+        if rewrite is None:
+            raise FgaValidationException(
+                f"relation '{_object_type(object)}#{relation}' not found in the authorization model"
+            )
+        return rewrite
+
+    def _has_tuple(self, user: str, relation: str, object: str) -> bool:
+        for store in self._stores:
+            if not store.contains(user, relation, object):
+                continue
+
+            condition = store.condition(user, relation, object)
+            if condition is None or self._condition_met(condition):
+                return True
+        return False
+
+    def _condition_met(self, condition: RelationshipCondition) -> bool:
+        if self._condition_evaluator is None:
+            raise FgaValidationException(
+                f"condition '{condition.name}' cannot be evaluated locally without a condition_evaluator"
+            )
+
+        # The context written with the tuple takes precedence over the one of the request
+        context = dict(self._context or {})
+        context.update(condition.context or {})
+        return bool(self._condition_evaluator(condition, context))
+
+    def _related(self, object: str, relation: str) -> Iterable[str]:
+        for store in self._stores:
+            yield from store.users(object, relation)
+
+    def _related_usersets(self, object: str, relation: str) -> Iterable[str]:
+        for store in self._stores:
+            yield from store.usersets(object, relation)
+
+    def _related_objects(self, user: str, relation: str) -> Iterable[str]:
+        for store in self._stores:
+            yield from store.objects(user, relation)
+
+    def check(self, user: str, relation: str, object: str) -> bool:
+        key = (object, relation, user)
+        result = self._memo.get(key)
+        if result is not None:
+            return result
+
+        if key in self._visiting:
+            # A cycle contributes nothing to its own result
+            self._cycles += 1
+            return False
+
+        cycles = self._cycles
+        self._visiting.add(key)
+        try:
+            result = self._evaluate(
+                self._rewrite(object, relation), user, relation, object
+            )
+        finally:
+            self._visiting.discard(key)
+
+        # An answer computed while a cycle was cut short may change once it resolves, either way
+        # when the cycle was cut in what a difference subtracts
+        if cycles == self._cycles:
+            self._memo[key] = result
+        return result
+
+    def _evaluate(self, rewrite: Any, user: str, relation: str, object: str) -> bool:
+        if isinstance(rewrite, _This):
+            return self._evaluate_this(rewrite, user, relation, object)
+
+        if isinstance(rewrite, _ComputedUserset):
+            return self.check(user, rewrite.relation, object)
+
+        if isinstance(rewrite, _TupleToUserset):
+            for parent in list(self._related(object, rewrite.tupleset)):
+                if not self._has_tuple(parent, rewrite.tupleset, object):
+                    continue
+                parent_relations = self._graph.get(_object_type(parent), {})
+                if rewrite.computed_relation not in parent_relations:
+                    continue
+                if self.check(user, rewrite.computed_relation, parent):
+                    return True
+            return False
+
+        if isinstance(rewrite, _Union):
+            return any(
+                self._evaluate(child, user, relation, object)
+                for child in rewrite.children
+            )
+
+        if isinstance(rewrite, _Intersection):
+            return all(
+                self._evaluate(child, user, relation, object)
+                for child in rewrite.children
+            )
+
+        if isinstance(rewrite, _Difference):
+            return self._evaluate(
+                rewrite.base, user, relation, object
+            ) and not self._evaluate(rewrite.subtract, user, relation, object)
+
+        raise FgaValidationException(f"Unsupported userset rewrite: {rewrite!r}")
+
+    def _evaluate_this(
+        self, rewrite: _This, user: str, relation: str, object: str
+    ) -> bool:
+        user_object, _, user_relation = user.partition("#")
+        user_type = _object_type(user_object)
+
+        if user_relation:
+            allowed = (
+                rewrite.userset_types is None
+                or (user_type, user_relation) in rewrite.userset_types
+            )
+        else:
+            allowed = rewrite.direct_types is None or user_type in rewrite.direct_types
+
+        if allowed and self._has_tuple(user, relation, object):
+            return True
+
+        if (
+            not user_relation
+            and (rewrite.direct_types is None or user_type in rewrite.wildcard_types)
+            and self._has_tuple(f"{user_type}:*", relation, object)
+        ):
+            return True
+
+        for userset in list(self._related_usersets(object, relation)):
+            if userset == user:
+                continue
+
+            userset_object, _, userset_relation = userset.partition("#")
+            if (
+                rewrite.userset_types is not None
+                and (_object_type(userset_object), userset_relation)
+                not in rewrite.userset_types
+            ):
+                continue
+
+            if self._has_tuple(userset, relation, object) and self.check(
+                user, userset_relation, userset_object
+            ):
+                return True
+
+        return False
+
+
+class LocalCheckEvaluator:
+    """
+    LocalCheckEvaluator answers checks, list objects and list users in-process by walking a
+    compiled authorization model over a tuple snapshot, such as the store of a `TupleReplica`.
+
+    Listing expands candidates through the store's indexes (objects per user and relation for
+    list objects, users per object and relation for list users) and confirms each with a check.
+    The indexes are maintained as tuples are written and deleted, so the evaluator always
+    reflects the current contents of the store.
+
+    Relationship conditions are CEL expressions that this evaluator does not interpret; checks
+    reaching a conditional tuple are delegated to `condition_evaluator`, and fail without one.
+    """
+
+    def __init__(
+        self,
+        model: AuthorizationModel | dict[str, Any],
+        store: LocalTupleStore | None = None,
+        condition_evaluator: ConditionEvaluator | None = None,
+    ) -> None:
+        """
+        :param model - authorization model the checks are evaluated against
+        :param store - tuples to evaluate the checks over
+        :param condition_evaluator - callable receiving a tuple condition and the merged context, returning whether it is met
+        """
+        self._graph = compile_model(model)
+        self._reverse_edges = compile_reverse_edges(self._graph)
+        self._relations = frozenset(
+            relation for relations in self._graph.values() for relation in relations
+        )
+        self._store = store if store is not None else LocalTupleStore()
+        self._condition_evaluator = condition_evaluator
+
+    @property
+    def store(self) -> LocalTupleStore:
+        """
+        Return the tuple store the checks are evaluated over
+        """
+        return self._store
+
+    def is_allowed(
+        self,
+        user: str,
+        relation: str,
+        object: str,
+        contextual_tuples: Iterable[Any] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Return whether the user has the relation with the object
+        :param contextual_tuples - tuples considered in addition to the store for this check only
+        :param context - request context passed to the condition evaluator
+        """
+        return self._evaluation(contextual_tuples, context).check(
+            user, relation, object
+        )
+
+    def _evaluation(
+        self,
+        contextual_tuples: Iterable[Any] | None,
+        context: dict[str, Any] | None,
+    ) -> _Evaluation:
+        stores: tuple[LocalTupleStore, ...] = (self._store,)
+        if contextual_tuples:
+            stores = (self._store, LocalTupleStore(contextual_tuples))
+
+        return _Evaluation(self._graph, stores, context, self._condition_evaluator)
+
+    def check(self, body: ClientCheckRequest) -> CheckResponse:
+        """
+        Evaluate a check request locally, following the semantics of `OpenFgaClient.check`
+        """
+        return CheckResponse(
+            allowed=self.is_allowed(
+                body.user,
+                body.relation,
+                body.object,
+                body.contextual_tuples,
+                body.context,
+            )
+        )
+
+    def allowed_objects(
+        self,
+        user: str,
+        relation: str,
+        type: str,
+        contextual_tuples: Iterable[Any] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """
+        Return the objects of the type the user has the relation with
+        :param contextual_tuples - tuples considered in addition to the store for this call only
+        :param context - request context passed to the condition evaluator
+        """
+        evaluation = self._evaluation(contextual_tuples, context)
+        evaluation._rewrite(f"{type}:", relation)
+
+        seen: set[tuple[str, str]] = set()
+        queue: deque[tuple[str, str]] = deque()
+        candidates: list[str] = []
+
+        def reach(subject: str) -> None:
+            for subject_relation in self._relations:
+                for object in evaluation._related_objects(subject, subject_relation):
+                    if (object, subject_relation) not in seen:
+                        seen.add((object, subject_relation))
+                        queue.append((object, subject_relation))
+
+        reach(user)
+        if "#" not in user:
+            reach(f"{_object_type(user)}:*")
+
+        while queue:
+            object, object_relation = queue.popleft()
+            object_type = _object_type(object)
+            if object_type == type and object_relation == relation:
+                candidates.append(object)
+
+            reach(f"{object}#{object_relation}")
+            for edge in self._reverse_edges.get((object_type, object_relation), ()):
+                if edge.tupleset is None:
+                    targets: Iterable[str] = (object,)
+                else:
+                    targets = [
+                        target
+                        for target in evaluation._related_objects(object, edge.tupleset)
+                        if _object_type(target) == edge.target_type
+                    ]
+                for target in targets:
+                    if (target, edge.target_relation) not in seen:
+                        seen.add((target, edge.target_relation))
+                        queue.append((target, edge.target_relation))
+
+        # Expansion ignores intersections, exclusions and conditions; a check settles them
+        return [
+            object for object in candidates if evaluation.check(user, relation, object)
+        ]
+
+    def allowed_users(
+        self,
+        object: str,
+        relation: str,
+        user_filters: list[UserTypeFilter],
+        contextual_tuples: Iterable[Any] | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> list[str]:
+        """
+        Return the users (`type:id`, `type:*` or `type:id#relation`) matching the filters that have the relation with the object
+        :param contextual_tuples - tuples considered in addition to the store for this call only
+        :param context - request context passed to the condition evaluator
+        """
+        evaluation = self._evaluation(contextual_tuples, context)
+        filters = {
+            (user_filter.type, user_filter.relation or "")
+            for user_filter in user_filters
+        }
+
+        seen: set[tuple[str, str]] = {(object, relation)}
+        queue: deque[tuple[str, str]] = deque(seen)
+        candidates: dict[str, None] = {}
+
+        def reach(target: str, target_relation: str) -> None:
+            if (target, target_relation) not in seen:
+                seen.add((target, target_relation))
+                queue.append((target, target_relation))
+
+        while queue:
+            current, current_relation = queue.popleft()
+            if (_object_type(current), current_relation) in filters:
+                candidates[f"{current}#{current_relation}"] = None
+
+            for leaf in _leaves(evaluation._rewrite(current, current_relation)):
+                if isinstance(leaf, _This):
+                    for user in evaluation._related(current, current_relation):
+                        user_object, _, user_relation = user.partition("#")
+                        if user_relation:
+                            reach(user_object, user_relation)
+                        elif (_object_type(user), "") in filters:
+                            candidates[user] = None
+                elif isinstance(leaf, _ComputedUserset):
+                    reach(current, leaf.relation)
+                elif isinstance(leaf, _TupleToUserset):
+                    for parent in evaluation._related(current, leaf.tupleset):
+                        if leaf.computed_relation in self._graph.get(
+                            _object_type(parent), {}
+                        ):
+                            reach(parent, leaf.computed_relation)
+
+        # Expansion ignores intersections, exclusions and conditions; a check settles them
+        return [user for user in candidates if evaluation.check(user, relation, object)]
+
+    def list_objects(self, body: ClientListObjectsRequest) -> ListObjectsResponse:
+        """
+        Evaluate a list objects request locally, following the semantics of `OpenFgaClient.list_objects`
+        """
+        return ListObjectsResponse(
+            objects=self.allowed_objects(
+                body.user,
+                body.relation,
+                body.type,
+                body.contextual_tuples,
+                body.context,
+            )
+        )
+
+    def list_users(self, body: ClientListUsersRequest) -> ListUsersResponse:
+        """
+        Evaluate a list users request locally, following the semantics of `OpenFgaClient.list_users`
+        """
+        users = self.allowed_users(
+            f"{body.object.type}:{body.object.id}",
+            body.relation,
+            body.user_filters or [],
+            body.contextual_tuples,
+            body.context,
+        )
+        return ListUsersResponse(users=[_to_user(user) for user in users])
+
+
+def _to_user(user: str) -> User:
+    """
+    Helper function to convert a user string into its list users representation
+    """
+    user_object, _, user_relation = user.partition("#")
+    type, _, id = user_object.partition(":")
+    if user_relation:
+        return User(userset=UsersetUser(type=type, id=id, relation=user_relation))
+    if id == "*":
+        return User(wildcard=TypedWildcard(type=type))
+    return User(object=FgaObject(type=type, id=id))
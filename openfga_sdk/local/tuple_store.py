@@ -0,0 +1,279 @@
+import sys
+import threading
+
+from collections.abc import Iterable, Iterator
+
+from openfga_sdk.models.relationship_condition import RelationshipCondition
+from openfga_sdk.models.tuple_change import TupleChange
+from openfga_sdk.models.tuple_key import TupleKey
+from openfga_sdk.models.tuple_operation import TupleOperation
+
+
+def _intern(value: str) -> str:
+    """
+    Helper function to intern identifiers so repeated users, relations and objects share one string
+    """
+    return sys.intern(value)
+
+
+class LocalTupleStore:
+    """
+    LocalTupleStore keeps relationship tuples in memory, indexed both by (object, relation) and by (user, relation).
+
+    It can be updated from one thread, such as the one keeping a replica up to date, while others read it:
+    changes and reads hold a lock, and reads return copies rather than the sets the store keeps updating.
+    """
+
+    def __init__(self, tuples: Iterable[TupleKey] | None = None) -> None:
+        # object -> relation -> users
+        self._users: dict[str, dict[str, set[str]]] = {}
+        # user -> relation -> objects
+        self._objects: dict[str, dict[str, set[str]]] = {}
+        # object -> relation -> userset users (`type:id#relation`), a subset of `_users`
+        self._usersets: dict[str, dict[str, set[str]]] = {}
+        # (object, relation, user) -> condition, only for conditional tuples
+        self._conditions: dict[tuple[str, str, str], RelationshipCondition] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+        if tuples is not None:
+            for tuple_key in tuples:
+                self.write(tuple_key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, tuple_key: TupleKey) -> bool:
+        return self.contains(tuple_key.user, tuple_key.relation, tuple_key.object)
+
+    def __iter__(self) -> Iterator[TupleKey]:
+        return iter(self.read())
+
+    def clear(self) -> None:
+        """
+        Remove every tuple from the store
+        """
+        with self._lock:
+            self._users.clear()
+            self._objects.clear()
+            self._usersets.clear()
+            self._conditions.clear()
+            self._size = 0
+
+    def write(self, tuple_key: TupleKey) -> bool:
+        """
+        Add a tuple to the store, replacing its condition if it is already present.
+        Returns whether the tuple was not present before.
+        """
+        with self._lock:
+            return self._write(tuple_key)
+
+    def _write(self, tuple_key: TupleKey) -> bool:
+        user = _intern(tuple_key.user)
+        relation = _intern(tuple_key.relation)
+        object = _intern(tuple_key.object)
+
+        if tuple_key.condition is not None:
+            self._conditions[(object, relation, user)] = tuple_key.condition
+        else:
+            self._conditions.pop((object, relation, user), None)
+
+        users = self._users.setdefault(object, {}).setdefault(relation, set())
+        if user in users:
+            return False
+
+        users.add(user)
+        self._objects.setdefault(user, {}).setdefault(relation, set()).add(object)
+        if "#" in user:
+            self._usersets.setdefault(object, {}).setdefault(relation, set()).add(user)
+        self._size += 1
+        return True
+
+    def delete(self, tuple_key: TupleKey) -> bool:
+        """
+        Remove a tuple from the store. Returns whether the tuple was present.
+        """
+        with self._lock:
+            return self._delete(tuple_key)
+
+    def _delete(self, tuple_key: TupleKey) -> bool:
+        user = tuple_key.user
+        relation = tuple_key.relation
+        object = tuple_key.object
+
+        relations = self._users.get(object)
+        users = relations.get(relation) if relations is not None else None
+        if users is None or user not in users:
+            return False
+
+        users.discard(user)
+        if not users:
+            del relations[relation]
+            if not relations:
+                del self._users[object]
+
+        user_relations = self._objects[user]
+        objects = user_relations[relation]
+        objects.discard(object)
+        if not objects:
+            del user_relations[relation]
+            if not user_relations:
+                del self._objects[user]
+
+        if "#" in user:
+            userset_relations = self._usersets[object]
+            usersets = userset_relations[relation]
+            usersets.discard(user)
+            if not usersets:
+                del userset_relations[relation]
+                if not userset_relations:
+                    del self._usersets[object]
+
+        self._conditions.pop((object, relation, user), None)
+        self._size -= 1
+        return True
+
+    def apply_changes(self, changes: list[TupleChange], type: str | None = None) -> int:
+        """
+        Apply a page of `read_changes` results, returning the number of changes applied.
+        Changes to objects of other types than `type` (if set) are skipped.
+        Readers see either none or all of the page.
+        """
+        applied = 0
+        with self._lock:
+            for change in changes:
+                tuple_key = change.tuple_key
+                if type is not None and not tuple_key.object.startswith(f"{type}:"):
+                    continue
+
+                if change.operation == TupleOperation.DELETE:
+                    self._delete(tuple_key)
+                else:
+                    self._write(tuple_key)
+                applied += 1
+
+        return applied
+
+    def contains(self, user: str, relation: str, object: str) -> bool:
+        """
+        Return whether the exact tuple is stored
+        """
+        with self._lock:
+            relations = self._users.get(object)
+            if relations is None:
+                return False
+
+            users = relations.get(relation)
+            return users is not None and user in users
+
+    def condition(
+        self, user: str, relation: str, object: str
+    ) -> RelationshipCondition | None:
+        """
+        Return the condition attached to a tuple, if any
+        """
+        with self._lock:
+            return self._conditions.get((object, relation, user))
+
+    def users(self, object: str, relation: str) -> set[str]:
+        """
+        Return the users directly related to the object through the relation
+        """
+        with self._lock:
+            relations = self._users.get(object)
+            if relations is None:
+                return set()
+
+            return set(relations.get(relation, ()))
+
+    def usersets(self, object: str, relation: str) -> set[str]:
+        """
+        Return the usersets (`type:id#relation`) directly related to the object through the relation
+        """
+        with self._lock:
+            relations = self._usersets.get(object)
+            if relations is None:
+                return set()
+
+            return set(relations.get(relation, ()))
+
+    def objects(self, user: str, relation: str) -> set[str]:
+        """
+        Return the objects the user is directly related to through the relation
+        """
+        with self._lock:
+            relations = self._objects.get(user)
+            if relations is None:
+                return set()
+
+            return set(relations.get(relation, ()))
+
+    def read(
+        self,
+        user: str | None = None,
+        relation: str | None = None,
+        object: str | None = None,
+    ) -> list[TupleKey]:
+        """
+        Return the tuples matching the filter, following the semantics of the Read API.
+        The object may be a full object (`document:roadmap`) or a type prefix (`document:`).
+        """
+        object_type = None
+        if object is not None and object.endswith(":"):
+            object_type = object
+            object = None
+
+        with self._lock:
+            if object is not None:
+                candidates = self._candidates_by_object(object, relation)
+            elif user is not None:
+                candidates = self._candidates_by_user(user, relation)
+            else:
+                candidates = (
+                    (u, r, o)
+                    for o, relations in self._users.items()
+                    for r, users in relations.items()
+                    if relation is None or r == relation
+                    for u in users
+                )
+
+            return [
+                self._tuple_key(u, r, o)
+                for u, r, o in candidates
+                if (user is None or u == user)
+                and (object_type is None or o.startswith(object_type))
+            ]
+
+    def _candidates_by_object(
+        self, object: str, relation: str | None
+    ) -> Iterator[tuple[str, str, str]]:
+        relations = self._users.get(object, {})
+        if relation is not None:
+            for user in relations.get(relation, ()):
+                yield user, relation, object
+            return
+
+        for r, users in relations.items():
+            for user in users:
+                yield user, r, object
+
+    def _candidates_by_user(
+        self, user: str, relation: str | None
+    ) -> Iterator[tuple[str, str, str]]:
+        relations = self._objects.get(user, {})
+        if relation is not None:
+            for object in relations.get(relation, ()):
+                yield user, relation, object
+            return
+
+        for r, objects in relations.items():
+            for object in objects:
+                yield user, r, object
+
+    def _tuple_key(self, user: str, relation: str, object: str) -> TupleKey:
+        return TupleKey(
+            user=user,
+            relation=relation,
+            object=object,
+            condition=self._conditions.get((object, relation, user)),
+        )
@@ -10,116 +10,122 @@ License: [Apache-2.0](https://github.com/openfga/python-sdk/blob/main/LICENSE)
 NOTE: This file was auto generated by OpenAPI Generator (https://openapi-generator.tech). DO NOT EDIT.
 """
 
-from openfga_sdk.models.aborted_message_response import AbortedMessageResponse
-from openfga_sdk.models.any import Any
-from openfga_sdk.models.assertion import Assertion
-from openfga_sdk.models.assertion_tuple_key import AssertionTupleKey
-from openfga_sdk.models.auth_error_code import AuthErrorCode
-from openfga_sdk.models.authorization_model import AuthorizationModel
-from openfga_sdk.models.batch_check_item import BatchCheckItem
-from openfga_sdk.models.batch_check_request import BatchCheckRequest
-from openfga_sdk.models.batch_check_response import BatchCheckResponse
-from openfga_sdk.models.batch_check_single_result import BatchCheckSingleResult
-from openfga_sdk.models.check_error import CheckError
-from openfga_sdk.models.check_request import CheckRequest
-from openfga_sdk.models.check_request_tuple_key import CheckRequestTupleKey
-from openfga_sdk.models.check_response import CheckResponse
-from openfga_sdk.models.computed import Computed
-from openfga_sdk.models.condition import Condition
-from openfga_sdk.models.condition_metadata import ConditionMetadata
-from openfga_sdk.models.condition_param_type_ref import ConditionParamTypeRef
-from openfga_sdk.models.consistency_preference import ConsistencyPreference
-from openfga_sdk.models.contextual_tuple_keys import ContextualTupleKeys
-from openfga_sdk.models.create_store_request import CreateStoreRequest
-from openfga_sdk.models.create_store_response import CreateStoreResponse
-from openfga_sdk.models.difference import Difference
-from openfga_sdk.models.error_code import ErrorCode
-from openfga_sdk.models.expand_request import ExpandRequest
-from openfga_sdk.models.expand_request_tuple_key import ExpandRequestTupleKey
-from openfga_sdk.models.expand_response import ExpandResponse
-from openfga_sdk.models.fga_object import FgaObject
-from openfga_sdk.models.forbidden_response import ForbiddenResponse
-from openfga_sdk.models.get_store_response import GetStoreResponse
-from openfga_sdk.models.internal_error_code import InternalErrorCode
-from openfga_sdk.models.internal_error_message_response import (
-    InternalErrorMessageResponse,
-)
-from openfga_sdk.models.leaf import Leaf
-from openfga_sdk.models.list_objects_request import ListObjectsRequest
-from openfga_sdk.models.list_objects_response import ListObjectsResponse
-from openfga_sdk.models.list_stores_response import ListStoresResponse
-from openfga_sdk.models.list_users_request import ListUsersRequest
-from openfga_sdk.models.list_users_response import ListUsersResponse
-from openfga_sdk.models.metadata import Metadata
-from openfga_sdk.models.node import Node
-from openfga_sdk.models.nodes import Nodes
-from openfga_sdk.models.not_found_error_code import NotFoundErrorCode
-from openfga_sdk.models.null_value import NullValue
-from openfga_sdk.models.object_relation import ObjectRelation
-from openfga_sdk.models.path_unknown_error_message_response import (
-    PathUnknownErrorMessageResponse,
-)
-from openfga_sdk.models.read_assertions_response import ReadAssertionsResponse
-from openfga_sdk.models.read_authorization_model_response import (
-    ReadAuthorizationModelResponse,
-)
-from openfga_sdk.models.read_authorization_models_response import (
-    ReadAuthorizationModelsResponse,
-)
-from openfga_sdk.models.read_changes_response import ReadChangesResponse
-from openfga_sdk.models.read_request import ReadRequest
-from openfga_sdk.models.read_request_tuple_key import ReadRequestTupleKey
-from openfga_sdk.models.read_response import ReadResponse
-from openfga_sdk.models.relation_metadata import RelationMetadata
-from openfga_sdk.models.relation_reference import RelationReference
-from openfga_sdk.models.relationship_condition import RelationshipCondition
-from openfga_sdk.models.source_info import SourceInfo
-from openfga_sdk.models.status import Status
-from openfga_sdk.models.store import Store
-from openfga_sdk.models.stream_result_of_streamed_list_objects_response import (
-    StreamResultOfStreamedListObjectsResponse,
-)
-from openfga_sdk.models.streamed_list_objects_response import (
-    StreamedListObjectsResponse,
-)
-from openfga_sdk.models.tuple import Tuple
-from openfga_sdk.models.tuple_change import TupleChange
-from openfga_sdk.models.tuple_key import TupleKey
-from openfga_sdk.models.tuple_key_without_condition import TupleKeyWithoutCondition
-from openfga_sdk.models.tuple_operation import TupleOperation
-from openfga_sdk.models.tuple_to_userset import TupleToUserset
-from openfga_sdk.models.type_definition import TypeDefinition
-from openfga_sdk.models.type_name import TypeName
-from openfga_sdk.models.typed_wildcard import TypedWildcard
-from openfga_sdk.models.unauthenticated_response import UnauthenticatedResponse
-from openfga_sdk.models.unprocessable_content_error_code import (
-    UnprocessableContentErrorCode,
-)
-from openfga_sdk.models.unprocessable_content_message_response import (
-    UnprocessableContentMessageResponse,
-)
-from openfga_sdk.models.user import User
-from openfga_sdk.models.user_type_filter import UserTypeFilter
-from openfga_sdk.models.users import Users
-from openfga_sdk.models.userset import Userset
-from openfga_sdk.models.userset_tree import UsersetTree
-from openfga_sdk.models.userset_tree_difference import UsersetTreeDifference
-from openfga_sdk.models.userset_tree_tuple_to_userset import UsersetTreeTupleToUserset
-from openfga_sdk.models.userset_user import UsersetUser
-from openfga_sdk.models.usersets import Usersets
-from openfga_sdk.models.validation_error_message_response import (
-    ValidationErrorMessageResponse,
-)
-from openfga_sdk.models.write_assertions_request import WriteAssertionsRequest
-from openfga_sdk.models.write_authorization_model_request import (
-    WriteAuthorizationModelRequest,
-)
-from openfga_sdk.models.write_authorization_model_response import (
-    WriteAuthorizationModelResponse,
-)
-from openfga_sdk.models.write_request import WriteRequest
-from openfga_sdk.models.write_request_deletes import WriteRequestDeletes
-from openfga_sdk.models.write_request_writes import WriteRequestWrites
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from openfga_sdk.models.aborted_message_response import AbortedMessageResponse
+    from openfga_sdk.models.any import Any
+    from openfga_sdk.models.assertion import Assertion
+    from openfga_sdk.models.assertion_tuple_key import AssertionTupleKey
+    from openfga_sdk.models.auth_error_code import AuthErrorCode
+    from openfga_sdk.models.authorization_model import AuthorizationModel
+    from openfga_sdk.models.batch_check_item import BatchCheckItem
+    from openfga_sdk.models.batch_check_request import BatchCheckRequest
+    from openfga_sdk.models.batch_check_response import BatchCheckResponse
+    from openfga_sdk.models.batch_check_single_result import BatchCheckSingleResult
+    from openfga_sdk.models.check_error import CheckError
+    from openfga_sdk.models.check_request import CheckRequest
+    from openfga_sdk.models.check_request_tuple_key import CheckRequestTupleKey
+    from openfga_sdk.models.check_response import CheckResponse
+    from openfga_sdk.models.computed import Computed
+    from openfga_sdk.models.condition import Condition
+    from openfga_sdk.models.condition_metadata import ConditionMetadata
+    from openfga_sdk.models.condition_param_type_ref import ConditionParamTypeRef
+    from openfga_sdk.models.consistency_preference import ConsistencyPreference
+    from openfga_sdk.models.contextual_tuple_keys import ContextualTupleKeys
+    from openfga_sdk.models.create_store_request import CreateStoreRequest
+    from openfga_sdk.models.create_store_response import CreateStoreResponse
+    from openfga_sdk.models.difference import Difference
+    from openfga_sdk.models.error_code import ErrorCode
+    from openfga_sdk.models.expand_request import ExpandRequest
+    from openfga_sdk.models.expand_request_tuple_key import ExpandRequestTupleKey
+    from openfga_sdk.models.expand_response import ExpandResponse
+    from openfga_sdk.models.fga_object import FgaObject
+    from openfga_sdk.models.forbidden_response import ForbiddenResponse
+    from openfga_sdk.models.get_store_response import GetStoreResponse
+    from openfga_sdk.models.internal_error_code import InternalErrorCode
+    from openfga_sdk.models.internal_error_message_response import (
+        InternalErrorMessageResponse,
+    )
+    from openfga_sdk.models.leaf import Leaf
+    from openfga_sdk.models.list_objects_request import ListObjectsRequest
+    from openfga_sdk.models.list_objects_response import ListObjectsResponse
+    from openfga_sdk.models.list_stores_response import ListStoresResponse
+    from openfga_sdk.models.list_users_request import ListUsersRequest
+    from openfga_sdk.models.list_users_response import ListUsersResponse
+    from openfga_sdk.models.metadata import Metadata
+    from openfga_sdk.models.node import Node
+    from openfga_sdk.models.nodes import Nodes
+    from openfga_sdk.models.not_found_error_code import NotFoundErrorCode
+    from openfga_sdk.models.null_value import NullValue
+    from openfga_sdk.models.object_relation import ObjectRelation
+    from openfga_sdk.models.path_unknown_error_message_response import (
+        PathUnknownErrorMessageResponse,
+    )
+    from openfga_sdk.models.read_assertions_response import ReadAssertionsResponse
+    from openfga_sdk.models.read_authorization_model_response import (
+        ReadAuthorizationModelResponse,
+    )
+    from openfga_sdk.models.read_authorization_models_response import (
+        ReadAuthorizationModelsResponse,
+    )
+    from openfga_sdk.models.read_changes_response import ReadChangesResponse
+    from openfga_sdk.models.read_request import ReadRequest
+    from openfga_sdk.models.read_request_tuple_key import ReadRequestTupleKey
+    from openfga_sdk.models.read_response import ReadResponse
+    from openfga_sdk.models.relation_metadata import RelationMetadata
+    from openfga_sdk.models.relation_reference import RelationReference
+    from openfga_sdk.models.relationship_condition import RelationshipCondition
+    from openfga_sdk.models.source_info import SourceInfo
+    from openfga_sdk.models.status import Status
+    from openfga_sdk.models.store import Store
+    from openfga_sdk.models.stream_result_of_streamed_list_objects_response import (
+        StreamResultOfStreamedListObjectsResponse,
+    )
+    from openfga_sdk.models.streamed_list_objects_response import (
+        StreamedListObjectsResponse,
+    )
+    from openfga_sdk.models.tuple import Tuple
+    from openfga_sdk.models.tuple_change import TupleChange
+    from openfga_sdk.models.tuple_key import TupleKey
+    from openfga_sdk.models.tuple_key_without_condition import TupleKeyWithoutCondition
+    from openfga_sdk.models.tuple_operation import TupleOperation
+    from openfga_sdk.models.tuple_to_userset import TupleToUserset
+    from openfga_sdk.models.type_definition import TypeDefinition
+    from openfga_sdk.models.type_name import TypeName
+    from openfga_sdk.models.typed_wildcard import TypedWildcard
+    from openfga_sdk.models.unauthenticated_response import UnauthenticatedResponse
+    from openfga_sdk.models.unprocessable_content_error_code import (
+        UnprocessableContentErrorCode,
+    )
+    from openfga_sdk.models.unprocessable_content_message_response import (
+        UnprocessableContentMessageResponse,
+    )
+    from openfga_sdk.models.user import User
+    from openfga_sdk.models.user_type_filter import UserTypeFilter
+    from openfga_sdk.models.users import Users
+    from openfga_sdk.models.userset import Userset
+    from openfga_sdk.models.userset_tree import UsersetTree
+    from openfga_sdk.models.userset_tree_difference import UsersetTreeDifference
+    from openfga_sdk.models.userset_tree_tuple_to_userset import (
+        UsersetTreeTupleToUserset,
+    )
+    from openfga_sdk.models.userset_user import UsersetUser
+    from openfga_sdk.models.usersets import Usersets
+    from openfga_sdk.models.validation_error_message_response import (
+        ValidationErrorMessageResponse,
+    )
+    from openfga_sdk.models.write_assertions_request import WriteAssertionsRequest
+    from openfga_sdk.models.write_authorization_model_request import (
+        WriteAuthorizationModelRequest,
+    )
+    from openfga_sdk.models.write_authorization_model_response import (
+        WriteAuthorizationModelResponse,
+    )
+    from openfga_sdk.models.write_request import WriteRequest
+    from openfga_sdk.models.write_request_deletes import WriteRequestDeletes
+    from openfga_sdk.models.write_request_writes import WriteRequestWrites
 
 
 __all__ = [
@@ -212,3 +218,109 @@ __all__ = [
     "WriteRequestDeletes",
     "WriteRequestWrites",
 ]
+
+# The module defining each model, imported on first access (PEP 562)
+_models: dict[str, str] = {
+    "AbortedMessageResponse": "openfga_sdk.models.aborted_message_response",
+    "Any": "openfga_sdk.models.any",
+    "Assertion": "openfga_sdk.models.assertion",
+    "AssertionTupleKey": "openfga_sdk.models.assertion_tuple_key",
+    "AuthErrorCode": "openfga_sdk.models.auth_error_code",
+    "AuthorizationModel": "openfga_sdk.models.authorization_model",
+    "BatchCheckItem": "openfga_sdk.models.batch_check_item",
+    "BatchCheckRequest": "openfga_sdk.models.batch_check_request",
+    "BatchCheckResponse": "openfga_sdk.models.batch_check_response",
+    "BatchCheckSingleResult": "openfga_sdk.models.batch_check_single_result",
+    "CheckError": "openfga_sdk.models.check_error",
+    "CheckRequest": "openfga_sdk.models.check_request",
+    "CheckRequestTupleKey": "openfga_sdk.models.check_request_tuple_key",
+    "CheckResponse": "openfga_sdk.models.check_response",
+    "Computed": "openfga_sdk.models.computed",
+    "Condition": "openfga_sdk.models.condition",
+    "ConditionMetadata": "openfga_sdk.models.condition_metadata",
+    "ConditionParamTypeRef": "openfga_sdk.models.condition_param_type_ref",
+    "ConsistencyPreference": "openfga_sdk.models.consistency_preference",
+    "ContextualTupleKeys": "openfga_sdk.models.contextual_tuple_keys",
+    "CreateStoreRequest": "openfga_sdk.models.create_store_request",
+    "CreateStoreResponse": "openfga_sdk.models.create_store_response",
+    "Difference": "openfga_sdk.models.difference",
+    "ErrorCode": "openfga_sdk.models.error_code",
+    "ExpandRequest": "openfga_sdk.models.expand_request",
+    "ExpandRequestTupleKey": "openfga_sdk.models.expand_request_tuple_key",
+    "ExpandResponse": "openfga_sdk.models.expand_response",
+    "FgaObject": "openfga_sdk.models.fga_object",
+    "ForbiddenResponse": "openfga_sdk.models.forbidden_response",
+    "GetStoreResponse": "openfga_sdk.models.get_store_response",
+    "InternalErrorCode": "openfga_sdk.models.internal_error_code",
+    "InternalErrorMessageResponse": "openfga_sdk.models.internal_error_message_response",
+    "Leaf": "openfga_sdk.models.leaf",
+    "ListObjectsRequest": "openfga_sdk.models.list_objects_request",
+    "ListObjectsResponse": "openfga_sdk.models.list_objects_response",
+    "ListStoresResponse": "openfga_sdk.models.list_stores_response",
+    "ListUsersRequest": "openfga_sdk.models.list_users_request",
+    "ListUsersResponse": "openfga_sdk.models.list_users_response",
+    "Metadata": "openfga_sdk.models.metadata",
+    "Node": "openfga_sdk.models.node",
+    "Nodes": "openfga_sdk.models.nodes",
+    "NotFoundErrorCode": "openfga_sdk.models.not_found_error_code",
+    "NullValue": "openfga_sdk.models.null_value",
+    "ObjectRelation": "openfga_sdk.models.object_relation",
+    "PathUnknownErrorMessageResponse": "openfga_sdk.models.path_unknown_error_message_response",
+    "ReadAssertionsResponse": "openfga_sdk.models.read_assertions_response",
+    "ReadAuthorizationModelResponse": "openfga_sdk.models.read_authorization_model_response",
+    "ReadAuthorizationModelsResponse": "openfga_sdk.models.read_authorization_models_response",
+    "ReadChangesResponse": "openfga_sdk.models.read_changes_response",
+    "ReadRequest": "openfga_sdk.models.read_request",
+    "ReadRequestTupleKey": "openfga_sdk.models.read_request_tuple_key",
+    "ReadResponse": "openfga_sdk.models.read_response",
+    "RelationMetadata": "openfga_sdk.models.relation_metadata",
+    "RelationReference": "openfga_sdk.models.relation_reference",
+    "RelationshipCondition": "openfga_sdk.models.relationship_condition",
+    "SourceInfo": "openfga_sdk.models.source_info",
+    "Status": "openfga_sdk.models.status",
+    "Store": "openfga_sdk.models.store",
+    "StreamResultOfStreamedListObjectsResponse": "openfga_sdk.models.stream_result_of_streamed_list_objects_response",
+    "StreamedListObjectsResponse": "openfga_sdk.models.streamed_list_objects_response",
+    "Tuple": "openfga_sdk.models.tuple",
+    "TupleChange": "openfga_sdk.models.tuple_change",
+    "TupleKey": "openfga_sdk.models.tuple_key",
+    "TupleKeyWithoutCondition": "openfga_sdk.models.tuple_key_without_condition",
+    "TupleOperation": "openfga_sdk.models.tuple_operation",
+    "TupleToUserset": "openfga_sdk.models.tuple_to_userset",
+    "TypeDefinition": "openfga_sdk.models.type_definition",
+    "TypeName": "openfga_sdk.models.type_name",
+    "TypedWildcard": "openfga_sdk.models.typed_wildcard",
+    "UnauthenticatedResponse": "openfga_sdk.models.unauthenticated_response",
+    "UnprocessableContentErrorCode": "openfga_sdk.models.unprocessable_content_error_code",
+    "UnprocessableContentMessageResponse": "openfga_sdk.models.unprocessable_content_message_response",
+    "User": "openfga_sdk.models.user",
+    "UserTypeFilter": "openfga_sdk.models.user_type_filter",
+    "Users": "openfga_sdk.models.users",
+    "Userset": "openfga_sdk.models.userset",
+    "UsersetTree": "openfga_sdk.models.userset_tree",
+    "UsersetTreeDifference": "openfga_sdk.models.userset_tree_difference",
+    "UsersetTreeTupleToUserset": "openfga_sdk.models.userset_tree_tuple_to_userset",
+    "UsersetUser": "openfga_sdk.models.userset_user",
+    "Usersets": "openfga_sdk.models.usersets",
+    "ValidationErrorMessageResponse": "openfga_sdk.models.validation_error_message_response",
+    "WriteAssertionsRequest": "openfga_sdk.models.write_assertions_request",
+    "WriteAuthorizationModelRequest": "openfga_sdk.models.write_authorization_model_request",
+    "WriteAuthorizationModelResponse": "openfga_sdk.models.write_authorization_model_response",
+    "WriteRequest": "openfga_sdk.models.write_request",
+    "WriteRequestDeletes": "openfga_sdk.models.write_request_deletes",
+    "WriteRequestWrites": "openfga_sdk.models.write_request_writes",
+}
+
+
+def __getattr__(name: str):
+    module = _models.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(__import__(module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_models})
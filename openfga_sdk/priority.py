@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import Enum
+
+from openfga_sdk.exceptions import FgaDeadlineExceededException
+
+
+class RequestPriority(str, Enum):
+    HIGH = "high"
+    LOW = "low"
+
+
+_request_priority: ContextVar[RequestPriority | None] = ContextVar(
+    "openfga_request_priority", default=None
+)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority | str) -> Iterator[None]:
+    """
+    Send the requests made within the block, and the tasks started from it, with the given priority
+    """
+    token = _request_priority.set(RequestPriority(priority))
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def resolve_request_priority(
+    priority: RequestPriority | str | None = None,
+) -> RequestPriority:
+    """
+    Return the priority of a request: the one given, else the one of the current context, else high
+    """
+    if priority is not None:
+        return RequestPriority(priority)
+    return _request_priority.get() or RequestPriority.HIGH
+
+
+def reserved_connections(configuration) -> int:
+    """
+    Return the number of connections reserved for high priority requests, 0 when priorities are not enforced
+    """
+    reserved = getattr(configuration, "connection_pool_reserved_for_high_priority", 0)
+    if not reserved or configuration.connection_pool_maxsize is None:
+        return 0
+    return reserved
+
+
+class PriorityScheduler:
+    """
+    PriorityScheduler bounds the requests in flight to the size of the connection pool,
+    keeping `reserved` connections for high priority requests:
+    low priority requests only use the leftover capacity, and wait while high priority requests are waiting.
+    """
+
+    def __init__(self, limit: int, reserved: int) -> None:
+        """
+        :param limit - the number of requests allowed in flight
+        :param reserved - how many of them only high priority requests may use
+        """
+        self._limit = limit
+        self._low_limit = limit - reserved
+        self._in_flight = 0
+        self._high_waiting = 0
+        self._condition = asyncio.Condition()
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        if priority == RequestPriority.HIGH:
+            return self._in_flight < self._limit
+        return self._in_flight < self._low_limit and not self._high_waiting
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: RequestPriority, deadline: float | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Wait for a request of the given priority to be allowed, and hold its place while it runs
+        :param deadline - time.monotonic() by which the wait must end, raising FgaDeadlineExceededException otherwise
+        """
+        async with self._condition:
+            high = priority == RequestPriority.HIGH
+            if high:
+                self._high_waiting += 1
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._condition.wait_for(lambda: self._can_start(priority)),
+                        None if deadline is None else deadline - time.monotonic(),
+                    )
+                except asyncio.TimeoutError:
+                    raise FgaDeadlineExceededException(
+                        "deadline exceeded waiting for a connection"
+                    ) from None
+                self._in_flight += 1
+            finally:
+                if high:
+                    self._high_waiting -= 1
+                    # Low priority requests may proceed once no high priority request waits
+                    self._condition.notify_all()
+
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
@@ -1,13 +1,18 @@
 import io
 import json
 import logging
-import ssl
+import time
 import urllib
 
 from typing import Any
 
 import aiohttp
 
+from openfga_sdk.connection_pool import (
+    ConnectionPoolStats,
+    ConnectionPoolUsage,
+    create_ssl_context,
+)
 from openfga_sdk.exceptions import (
     ApiException,
     ApiValueError,
@@ -33,6 +38,9 @@ class RESTResponse(io.IOBase):
     _status: int
     _reason: str | None
 
+    # Milliseconds spent in each phase of the request, by histogram, when request phases are recorded
+    timings: dict | None = None
+
     def __init__(
         self,
         response: aiohttp.ClientResponse,
@@ -142,27 +150,166 @@ class RESTClientObject:
         if maxsize is None:
             maxsize = configuration.connection_pool_maxsize
 
-        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
-        if configuration.cert_file:
-            ssl_context.load_cert_chain(
-                configuration.cert_file, keyfile=configuration.key_file
-            )
+        self._maxsize = maxsize
+        self._ssl_context = create_ssl_context(configuration)
+        self.pool_usage = ConnectionPoolUsage(
+            maxsize or None,
+            "requests wait for a connection to be released",
+            self._grow_pool,
+        )
 
-        if not configuration.verify_ssl:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        # Imported here, as the telemetry package depends on this module
+        from openfga_sdk.telemetry.configuration import isMetricEnabled
+        from openfga_sdk.telemetry.gauges import TelemetryGauges
+        from openfga_sdk.telemetry.histograms import TelemetryHistograms
+
+        # aiohttp only reports connections and request phases to trace hooks, which cost a call per request
+        trace_configs = []
+        telemetry = getattr(configuration, "telemetry", None)
+        if isMetricEnabled(
+            telemetry, TelemetryGauges.fga_client_connection_pool_created
+        ) or isMetricEnabled(
+            telemetry, TelemetryGauges.fga_client_connection_pool_reuse_ratio
+        ):
+            trace_configs.append(self._connection_trace_config())
 
-        connector = aiohttp.TCPConnector(limit=maxsize, ssl=ssl_context)
+        self._phase_timings = any(
+            isMetricEnabled(telemetry, histogram)
+            for histogram in TelemetryHistograms.getRequestPhases()
+        )
+        if self._phase_timings:
+            trace_configs.append(self._phase_trace_config())
+
+        # Requests collect timings for the request phases, and the time spent serializing them
+        self._timings = self._phase_timings or isMetricEnabled(
+            telemetry, TelemetryHistograms.fga_client_sdk_overhead
+        )
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
         self._timeout_millisec = configuration.timeout_millisec
-        self.pool_manager = aiohttp.ClientSession(connector=connector, trust_env=True)
+        self._trace_configs = trace_configs
+        # The session is bound to the event loop it is created in: it is created on first use,
+        # so a client can be built outside of any loop, and costs nothing until it sends a request
+        self._pool_manager: aiohttp.ClientSession | None = None
+
+    @property
+    def pool_manager(self) -> aiohttp.ClientSession:
+        """
+        Returns the aiohttp.ClientSession sending the requests, created on first use.
+        """
+        if self._pool_manager is None:
+            connector = aiohttp.TCPConnector(limit=self._maxsize, ssl=self._ssl_context)
+            self._pool_manager = aiohttp.ClientSession(
+                connector=connector,
+                trust_env=True,
+                trace_configs=self._trace_configs or None,
+            )
+        return self._pool_manager
+
+    @pool_manager.setter
+    def pool_manager(self, value: aiohttp.ClientSession) -> None:
+        """
+        Sets the aiohttp.ClientSession sending the requests.
+        """
+        self._pool_manager = value
+
+    def _grow_pool(self, maxsize: int) -> bool:
+        """
+        Raises the connection limit of the session not created yet, returns False once it exists.
+        """
+        if self._pool_manager is not None:
+            return False
+        self._maxsize = maxsize
+        return True
+
+    def _connection_trace_config(self) -> aiohttp.TraceConfig:
+        usage = self.pool_usage
+
+        async def on_connection_create_end(session, context, params) -> None:
+            usage.connection_created()
+
+        async def on_connection_reuseconn(session, context, params) -> None:
+            usage.connection_reused()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def _phase_trace_config(self) -> aiohttp.TraceConfig:
+        from openfga_sdk.telemetry.histograms import TelemetryHistograms
+
+        # Each hook receives the timings of its request as `trace_request_ctx`,
+        # and a namespace of its own, per request, to keep the start of a phase in
+        def started(attribute: str):
+            async def on_start(session, context, params) -> None:
+                setattr(context, attribute, time.perf_counter())
+
+            return on_start
+
+        def ended(attribute: str, histogram):
+            async def on_end(session, context, params) -> None:
+                start = getattr(context, attribute, None)
+                if start is not None and context.trace_request_ctx is not None:
+                    context.trace_request_ctx[histogram] = (
+                        time.perf_counter() - start
+                    ) * 1000
+
+            return on_end
+
+        async def on_connection_create_end(session, context, params) -> None:
+            # aiohttp resolves the host, then opens the connection and completes the TLS handshake
+            # within the same step: the time not spent resolving the host is connecting
+            start = getattr(context, "connect", None)
+            if start is not None and context.trace_request_ctx is not None:
+                timings = context.trace_request_ctx
+                timings[TelemetryHistograms.fga_client_request_connect] = max(
+                    0.0,
+                    (time.perf_counter() - start) * 1000
+                    - timings.get(TelemetryHistograms.fga_client_request_dns, 0.0),
+                )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(started("pool_wait"))
+        trace_config.on_connection_queued_end.append(
+            ended("pool_wait", TelemetryHistograms.fga_client_request_pool_wait)
+        )
+        trace_config.on_dns_resolvehost_start.append(started("dns"))
+        trace_config.on_dns_resolvehost_end.append(
+            ended("dns", TelemetryHistograms.fga_client_request_dns)
+        )
+        trace_config.on_connection_create_start.append(started("connect"))
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_request_headers_sent.append(started("sent"))
+        trace_config.on_request_end.append(
+            ended("sent", TelemetryHistograms.fga_client_request_time_to_first_byte)
+        )
+        return trace_config
+
+    def pool_stats(self) -> ConnectionPoolStats:
+        """
+        Returns a snapshot of the connection pool.
+        New and reused connections are only counted when the metrics reporting them are enabled.
+        """
+        usage = self.pool_usage
+        waiting = usage.waiting
+        # aiohttp keeps its idle connections, by host, in a private attribute
+        connector = getattr(self._pool_manager, "connector", None)
+        idle_connections = getattr(connector, "_conns", None) or {}
+        return ConnectionPoolStats(
+            active=usage.in_flight - waiting,
+            idle=sum(len(connections) for connections in idle_connections.values()),
+            waiting=waiting,
+            created=usage.created,
+            reused=usage.reused,
+        )
 
     async def close(self) -> None:
         """
-        Closes the underlying aiohttp.ClientSession.
+        Closes the underlying aiohttp.ClientSession, when one was created.
         """
-        await self.pool_manager.close()
+        if self._pool_manager is not None:
+            await self._pool_manager.close()
 
     async def build_request(
         self,
@@ -357,23 +504,24 @@ class RESTClientObject:
 
         try:
             # Send request, collect response handler
-            async with self.pool_manager.request(**args) as resp:
-                response = resp
-                try:
-                    # Iterate over streamed/chunked response data
-                    async for data, _ in resp.content.iter_chunks():
-                        if data:
-                            # Process data chunk
-                            leftover, decoded_objects = self._accumulate_json_lines(
-                                leftover, data, buffer
-                            )
-
-                            # Yield any complete objects
-                            for obj in decoded_objects:
-                                yield obj
-
-                except Exception as e:
-                    logger.exception("Stream reading error: %s", e)
+            with self.pool_usage.track():
+                async with self.pool_manager.request(**args) as resp:
+                    response = resp
+                    try:
+                        # Iterate over streamed/chunked response data
+                        async for data, _ in resp.content.iter_chunks():
+                            if data:
+                                # Process data chunk
+                                leftover, decoded_objects = self._accumulate_json_lines(
+                                    leftover, data, buffer
+                                )
+
+                                # Yield any complete objects
+                                for obj in decoded_objects:
+                                    yield obj
+
+                    except Exception as e:
+                        logger.exception("Stream reading error: %s", e)
 
         except Exception as conn_err:
             logger.exception("Connection or request setup error: %s", conn_err)
@@ -432,6 +580,7 @@ class RESTClientObject:
         """
 
         # Build our request payload
+        build_start = time.perf_counter()
         args = await self.build_request(
             method,
             url,
@@ -443,20 +592,44 @@ class RESTClientObject:
             _request_timeout=_request_timeout,
         )
 
+        # Collect the time spent in each phase of the request, and building it, when they are recorded
+        timings: dict | None = None
+        if self._timings:
+            from openfga_sdk.telemetry.histograms import TelemetryHistograms
+
+            timings = {
+                TelemetryHistograms.fga_client_sdk_overhead: (
+                    time.perf_counter() - build_start
+                )
+                * 1000
+            }
+            if self._phase_timings:
+                args["trace_request_ctx"] = timings
+
         # Send request, collect response handler
         wrapped_response: RESTResponse | None = None
-        raw_response: aiohttp.ClientResponse = await self.pool_manager.request(**args)
+        with self.pool_usage.track():
+            raw_response: aiohttp.ClientResponse = await self.pool_manager.request(
+                **args
+            )
+
+            # If we want to preload the response, read it
+            if _preload_content:
+                # Collect response data
+                read_start = time.perf_counter()
+                data = await raw_response.read()
 
-        # If we want to preload the response, read it
-        if _preload_content:
-            # Collect response data
-            data = await raw_response.read()
+                # Transform response JSON data into RESTResponse object
+                wrapped_response = RESTResponse(raw_response, data)
 
-            # Transform response JSON data into RESTResponse object
-            wrapped_response = RESTResponse(raw_response, data)
+                if timings is not None:
+                    timings[TelemetryHistograms.fga_client_response_body_read] = (
+                        time.perf_counter() - read_start
+                    ) * 1000
+                    wrapped_response.timings = timings
 
-            # Log the response body
-            logger.debug("response body: %s", data.decode("utf-8"))
+                # Log the response body
+                logger.debug("response body: %s", data.decode("utf-8"))
 
         # Handle any errors that may have occurred
         await self.handle_response_exception(raw_response)
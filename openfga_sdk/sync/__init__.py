@@ -1,8 +1,32 @@
-from openfga_sdk.sync.api_client import ApiClient
-from openfga_sdk.sync.client.client import OpenFgaClient
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from openfga_sdk.sync.api_client import ApiClient
+    from openfga_sdk.sync.client.client import OpenFgaClient
 
 
 __all__ = [
     "ApiClient",
     "OpenFgaClient",
 ]
+
+# The module defining each export, imported on first access (PEP 562)
+_exports: dict[str, str] = {
+    "ApiClient": "openfga_sdk.sync.api_client",
+    "OpenFgaClient": "openfga_sdk.sync.client.client",
+}
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(__import__(module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports})
@@ -7,8 +7,11 @@ import re
 import time
 import urllib
 
+from contextlib import nullcontext
 from multiprocessing.pool import ThreadPool
 
+import urllib3
+
 from dateutil.parser import parse  # type: ignore[import-untyped]
 
 import openfga_sdk.models
@@ -22,13 +25,23 @@ from openfga_sdk.constants import (
 from openfga_sdk.exceptions import (
     ApiException,
     ApiValueError,
+    FgaDeadlineExceededException,
     FgaValidationException,
     RateLimitExceededError,
     ServiceException,
 )
+from openfga_sdk.priority import (
+    RequestPriority,
+    reserved_connections,
+    resolve_request_priority,
+)
 from openfga_sdk.sync import oauth2, rest
+from openfga_sdk.sync.priority import PriorityScheduler
 from openfga_sdk.telemetry import Telemetry
 from openfga_sdk.telemetry.attributes import TelemetryAttribute, TelemetryAttributes
+from openfga_sdk.telemetry.configuration import isMetricEnabled
+from openfga_sdk.telemetry.gauges import TelemetryGauges
+from openfga_sdk.telemetry.histograms import TelemetryHistograms
 
 
 def random_time(loop_count, min_wait_in_ms) -> float:
@@ -40,6 +53,29 @@ def random_time(loop_count, min_wait_in_ms) -> float:
     return random.randrange(minimum, maximum) / 1000
 
 
+def deadline_timeout(request_timeout, remaining) -> urllib3.Timeout:
+    """
+    Helper function to cap a request timeout to the time (in s) left before the deadline.
+    Accepts the forms the REST client does: seconds (or milliseconds above 100), a (connect, read) tuple, or a urllib3.Timeout
+    """
+    if isinstance(request_timeout, urllib3.Timeout):
+        timeout = request_timeout.clone()
+        timeout.total = (
+            remaining if timeout.total is None else min(timeout.total, remaining)
+        )
+        return timeout
+    if isinstance(request_timeout, tuple):
+        connect, read = (
+            value / 1000 if value > 100 else value for value in request_timeout
+        )
+        return urllib3.Timeout(
+            connect=min(connect, remaining), read=min(read, remaining), total=remaining
+        )
+    if request_timeout > 100:
+        request_timeout /= 1000
+    return urllib3.Timeout(total=min(request_timeout, remaining))
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -91,6 +127,13 @@ class ApiClient:
 
         self.rest_client = rest.RESTClientObject(configuration)
 
+        reserved = reserved_connections(configuration)
+        self._scheduler = (
+            PriorityScheduler(configuration.connection_pool_maxsize, reserved)
+            if reserved
+            else None
+        )
+
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -102,6 +145,21 @@ class ApiClient:
         self.client_side_validation = configuration.client_side_validation
         self._telemetry = Telemetry()
 
+        # Only observe the pool when a gauge reports it, so building a client does not load opentelemetry
+        if any(
+            isMetricEnabled(configuration.telemetry, gauge)
+            for gauge in TelemetryGauges.getAll()
+        ):
+            api_url = urllib.parse.urlparse(configuration.api_url or "")
+            self._telemetry.metrics.connectionPool(
+                self.rest_client,
+                attributes={
+                    TelemetryAttributes.http_host: api_url.hostname,
+                    TelemetryAttributes.url_scheme: api_url.scheme,
+                },
+                configuration=configuration.telemetry,
+            )
+
     def __enter__(self):
         return self
 
@@ -128,6 +186,13 @@ class ApiClient:
             self._pool = ThreadPool(self.pool_threads)
         return self._pool
 
+    @property
+    def telemetry(self) -> Telemetry:
+        """
+        Return the telemetry the client records its metrics and spans with
+        """
+        return self._telemetry
+
     @property
     def user_agent(self):
         """User agent for this API client"""
@@ -162,10 +227,14 @@ class ApiClient:
         _telemetry_attributes: dict[TelemetryAttribute, str | bool | int | float]
         | None = None,
         _streaming: bool = False,
+        _deadline: float | None = None,
+        _priority: RequestPriority | str | None = None,
     ):
         self.configuration.is_valid()
         config = self.configuration
         start = float(time.time())
+        # Time spent within the SDK, rather than on the network or fetching credentials
+        overhead_start = time.perf_counter()
 
         # header parameters
         header_params = {**self.default_headers, **(header_params or {})}
@@ -198,6 +267,8 @@ class ApiClient:
             post_params = self.sanitize_for_serialization(post_params)
             post_params = self.parameters_to_tuples(post_params, collection_formats)
 
+        overhead = time.perf_counter() - overhead_start
+
         # auth setting
         self.update_params_for_auth(
             header_params,
@@ -207,6 +278,8 @@ class ApiClient:
             oauth2_client=_oauth2_client,
         )
 
+        overhead_start = time.perf_counter()
+
         # body
         if body:
             body = self.sanitize_for_serialization(body)
@@ -258,53 +331,108 @@ class ApiClient:
             if _retry_params.max_wait_in_sec is not None:
                 max_wait_in_sec = _retry_params.max_wait_in_sec
 
-        _telemetry_attributes = TelemetryAttributes.fromRequest(
-            user_agent=self.user_agent,
-            fga_method=resource_path,
-            http_method=method,
-            url=url,
-            resend_count=0,
-            start=start,
-            credentials=self.configuration.credentials,
-            attributes=_telemetry_attributes,
-        )
+        # The attributes of the metrics are only built when they will be recorded
+        recording = self._telemetry.metrics.isRecording(self.configuration.telemetry)
+        tracing = self._telemetry.tracing.isRecording()
+        if recording or tracing:
+            _telemetry_attributes = TelemetryAttributes.fromRequest(
+                user_agent=self.user_agent,
+                fga_method=resource_path,
+                http_method=method,
+                url=url,
+                resend_count=0,
+                start=start,
+                credentials=self.configuration.credentials,
+                attributes=_telemetry_attributes,
+            )
+        else:
+            _telemetry_attributes = _telemetry_attributes or {}
+
+        overhead += time.perf_counter() - overhead_start
 
         for retry in range(max_retry + 1):
             _telemetry_attributes[TelemetryAttributes.http_request_resend_count] = retry
 
-            try:
-                # perform request and return response
-                response_data = self.request(
-                    method,
-                    url,
-                    query_params=query_params,
-                    headers=header_params,
-                    post_params=post_params,
-                    body=body,
-                    _preload_content=_preload_content,
-                    _request_timeout=_request_timeout,
-                    _streaming=_streaming,
-                )
-            except (RateLimitExceededError, ServiceException) as e:
-                if retry < max_retry and e.status != 501:
-                    _telemetry_attributes = TelemetryAttributes.fromResponse(
-                        response=e.body.decode("utf-8"),
-                        credentials=self.configuration.credentials,
-                        attributes=_telemetry_attributes,
-                        start=start,
+            request_timeout = _request_timeout
+            if _deadline is not None:
+                remaining = _deadline - time.monotonic()
+                if remaining <= 0:
+                    raise FgaDeadlineExceededException(
+                        f"deadline exceeded before sending {method} {resource_path}"
                     )
-
-                    self._telemetry.metrics.request(
-                        attributes=_telemetry_attributes,
-                        configuration=self.configuration.telemetry,
+                if not request_timeout:
+                    request_timeout = urllib3.Timeout(
+                        total=min(self.configuration.timeout_millisec / 1000, remaining)
                     )
+                else:
+                    request_timeout = deadline_timeout(request_timeout, remaining)
 
+            try:
+                # perform request and return response
+                with (
+                    self._scheduler.slot(resolve_request_priority(_priority), _deadline)
+                    if self._scheduler is not None and not _streaming
+                    else nullcontext()
+                ):
+                    with (
+                        self._telemetry.tracing.attempt(
+                            method, _telemetry_attributes, header_params
+                        )
+                        if tracing
+                        else nullcontext()
+                    ) as span:
+                        response_data = self.request(
+                            method,
+                            url,
+                            query_params=query_params,
+                            headers=header_params,
+                            post_params=post_params,
+                            body=body,
+                            _preload_content=_preload_content,
+                            _request_timeout=request_timeout,
+                            _streaming=_streaming,
+                        )
+
+                        if span is not None:
+                            self._telemetry.tracing.recordResponse(span, response_data)
+            except (RateLimitExceededError, ServiceException) as e:
+                retryable = retry < max_retry and e.status != 501
+                if retryable:
                     try:
                         wait_time_in_sec = self._parse_retry_after_header(e.header)
+                        retry_after = True
                     except ValueError:
                         wait_time_in_sec = min(
                             random_time(retry, min_wait_in_ms), max_wait_in_sec
                         )
+                        retry_after = False
+                    # A retry that cannot complete before the deadline is not attempted
+                    if (
+                        _deadline is not None
+                        and time.monotonic() + wait_time_in_sec >= _deadline
+                    ):
+                        raise FgaDeadlineExceededException(
+                            f"deadline exceeded before retrying {method} {resource_path}"
+                        ) from e
+
+                if retryable:
+                    if recording:
+                        _telemetry_attributes = TelemetryAttributes.fromResponse(
+                            response=e.body.decode("utf-8"),
+                            credentials=self.configuration.credentials,
+                            attributes=_telemetry_attributes,
+                            start=start,
+                        )
+
+                        self._telemetry.metrics.request(
+                            attributes=_telemetry_attributes,
+                            configuration=self.configuration.telemetry,
+                        )
+
+                    if tracing:
+                        self._telemetry.tracing.retry(
+                            retry + 1, wait_time_in_sec, retry_after
+                        )
 
                     time.sleep(wait_time_in_sec)
                     continue
@@ -315,6 +443,11 @@ class ApiClient:
                         json.loads(e.body), response_type
                     )
                     e.body = None
+                if not recording:
+                    # The operation of the exception is named after the normalized method
+                    _telemetry_attributes = TelemetryAttributes.fromRequest(
+                        fga_method=resource_path, attributes=_telemetry_attributes
+                    )
                 # Set operation name from telemetry attributes
                 if (
                     isinstance(e, ApiException)
@@ -336,28 +469,34 @@ class ApiClient:
                     )
                     e.body = None
 
-                _telemetry_attributes = TelemetryAttributes.fromResponse(
-                    response=e,
-                    credentials=self.configuration.credentials,
-                    attributes=_telemetry_attributes,
-                    start=start,
-                )
+                if recording:
+                    _telemetry_attributes = TelemetryAttributes.fromResponse(
+                        response=e,
+                        credentials=self.configuration.credentials,
+                        attributes=_telemetry_attributes,
+                        start=start,
+                    )
 
-                self._telemetry.metrics.request(
-                    attributes=_telemetry_attributes,
-                    configuration=self.configuration.telemetry,
-                )
+                    self._telemetry.metrics.request(
+                        attributes=_telemetry_attributes,
+                        configuration=self.configuration.telemetry,
+                    )
 
-                self._telemetry.metrics.queryDuration(
-                    attributes=_telemetry_attributes,
-                    configuration=self.configuration.telemetry,
-                )
+                    self._telemetry.metrics.queryDuration(
+                        attributes=_telemetry_attributes,
+                        configuration=self.configuration.telemetry,
+                    )
 
-                self._telemetry.metrics.requestDuration(
-                    attributes=_telemetry_attributes,
-                    configuration=self.configuration.telemetry,
-                )
+                    self._telemetry.metrics.requestDuration(
+                        attributes=_telemetry_attributes,
+                        configuration=self.configuration.telemetry,
+                    )
 
+                if not recording:
+                    # The operation of the exception is named after the normalized method
+                    _telemetry_attributes = TelemetryAttributes.fromRequest(
+                        fga_method=resource_path, attributes=_telemetry_attributes
+                    )
                 # Set operation name from telemetry attributes
                 if (
                     isinstance(e, ApiException)
@@ -370,32 +509,45 @@ class ApiClient:
                     if isinstance(operation_name, str):
                         e.operation_name = operation_name.lower()
                 raise
+            except Exception as e:
+                # A request cut short by the deadline, rather than failing on its own
+                if (
+                    _deadline is not None
+                    and time.monotonic() >= _deadline
+                    and not isinstance(e, FgaDeadlineExceededException)
+                ):
+                    raise FgaDeadlineExceededException(
+                        f"deadline exceeded during {method} {resource_path}"
+                    ) from e
+                raise
 
             self.last_response = response_data
+            overhead_start = time.perf_counter()
 
             return_data = response_data
 
-            _telemetry_attributes = TelemetryAttributes.fromResponse(
-                response=response_data,
-                credentials=self.configuration.credentials,
-                attributes=_telemetry_attributes,
-                start=start,
-            )
+            if recording:
+                _telemetry_attributes = TelemetryAttributes.fromResponse(
+                    response=response_data,
+                    credentials=self.configuration.credentials,
+                    attributes=_telemetry_attributes,
+                    start=start,
+                )
 
-            self._telemetry.metrics.request(
-                attributes=_telemetry_attributes,
-                configuration=self.configuration.telemetry,
-            )
+                self._telemetry.metrics.request(
+                    attributes=_telemetry_attributes,
+                    configuration=self.configuration.telemetry,
+                )
 
-            self._telemetry.metrics.queryDuration(
-                attributes=_telemetry_attributes,
-                configuration=self.configuration.telemetry,
-            )
+                self._telemetry.metrics.queryDuration(
+                    attributes=_telemetry_attributes,
+                    configuration=self.configuration.telemetry,
+                )
 
-            self._telemetry.metrics.requestDuration(
-                attributes=_telemetry_attributes,
-                configuration=self.configuration.telemetry,
-            )
+                self._telemetry.metrics.requestDuration(
+                    attributes=_telemetry_attributes,
+                    configuration=self.configuration.telemetry,
+                )
 
             if not _preload_content or _streaming:
                 return return_data
@@ -413,11 +565,31 @@ class ApiClient:
 
             # deserialize response data
 
+            timings = getattr(response_data, "timings", None)
+
             if response_type:
-                return_data = self.deserialize(response_data, response_type)
+                return_data = self.deserialize(
+                    response_data, response_type, timings=timings
+                )
             else:
                 return_data = None
 
+            if timings and recording:
+                self._telemetry.metrics.requestPhases(
+                    timings,
+                    attributes=_telemetry_attributes,
+                    configuration=self.configuration.telemetry,
+                )
+
+                # The REST client adds the time it spent building the request
+                overhead += time.perf_counter() - overhead_start
+                self._telemetry.metrics.sdkOverhead(
+                    overhead * 1000
+                    + timings.get(TelemetryHistograms.fga_client_sdk_overhead, 0),
+                    attributes=_telemetry_attributes,
+                    configuration=self.configuration.telemetry,
+                )
+
             if _return_http_data_only:
                 return return_data
             else:
@@ -445,7 +617,7 @@ class ApiClient:
 
         return math.ceil(wait_time_in_sec)
 
-    def sanitize_for_serialization(self, obj):
+    def sanitize_for_serialization(self, obj, memo=None):
         """Builds a JSON POST object.
 
         If obj is None, return None.
@@ -455,21 +627,32 @@ class ApiClient:
         If obj is list, sanitize each element in the list.
         If obj is dict, return the dict.
         If obj is OpenAPI model, return the properties dict.
+        A model or dict referenced several times within obj is converted once.
 
         :param obj: The data to serialize.
+        :param memo: The models and dicts already converted, by id.
         :return: The serialized form of data.
         """
         if obj is None:
             return None
         elif isinstance(obj, self.PRIMITIVE_TYPES):
             return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj) for sub_obj in obj]
+
+        if memo is None:
+            memo = {}
+
+        if isinstance(obj, list):
+            return [self.sanitize_for_serialization(sub_obj, memo) for sub_obj in obj]
         elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj) for sub_obj in obj)
+            return tuple(
+                self.sanitize_for_serialization(sub_obj, memo) for sub_obj in obj
+            )
         elif isinstance(obj, datetime.datetime | datetime.date):
             return obj.isoformat()
 
+        if id(obj) in memo:
+            return memo[id(obj)][1]
+
         if isinstance(obj, dict):
             obj_dict = obj
         else:
@@ -484,19 +667,26 @@ class ApiClient:
                 if getattr(obj, attr) is not None
             }
 
-        return {
-            key: self.sanitize_for_serialization(val) for key, val in obj_dict.items()
+        sanitized = {
+            key: self.sanitize_for_serialization(val, memo)
+            for key, val in obj_dict.items()
         }
+        # obj is kept alongside so that its id cannot be reused while serializing
+        memo[id(obj)] = (obj, sanitized)
+        return sanitized
 
-    def deserialize(self, response, response_type):
+    def deserialize(self, response, response_type, timings=None):
         """Deserializes response into an object.
 
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param timings: dict the milliseconds spent decoding and deserializing
+            are added to, by histogram, when given.
 
         :return: deserialized object.
         """
+        start = time.perf_counter()
 
         # fetch data from response object
         try:
@@ -504,7 +694,18 @@ class ApiClient:
         except ValueError:
             data = response.data
 
-        return self.__deserialize(data, response_type)
+        if timings is None:
+            return self.__deserialize(data, response_type)
+
+        decoded = time.perf_counter()
+        deserialized = self.__deserialize(data, response_type)
+        timings[TelemetryHistograms.fga_client_response_json_decode] = (
+            decoded - start
+        ) * 1000
+        timings[TelemetryHistograms.fga_client_response_deserialize] = (
+            time.perf_counter() - decoded
+        ) * 1000
+        return deserialized
 
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
@@ -570,6 +771,8 @@ class ApiClient:
         _telemetry_attributes: dict[TelemetryAttribute, str | bool | int | float]
         | None = None,
         _streaming: bool = False,
+        _deadline: float | None = None,
+        _priority: RequestPriority | str | None = None,
     ):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
@@ -603,6 +806,9 @@ class ApiClient:
                               request; this effectively ignores the authentication
                               in the spec for a single request.
         :param _retry_params: If specified, override the default retry parameters
+        :param _deadline: time.monotonic() value by which the request must complete.
+                          The request is not sent, nor retried, when it cannot complete in time
+        :param _priority: RequestPriority of the request, defaults to the one of the current context
         :type _request_token: dict, optional
         :return:
             If async_req parameter is True,
@@ -632,6 +838,8 @@ class ApiClient:
                 _oauth2_client,
                 _telemetry_attributes,
                 _streaming,
+                _deadline,
+                _priority,
             )
 
         return self.pool.apply_async(
@@ -656,6 +864,8 @@ class ApiClient:
                 _oauth2_client,
                 _telemetry_attributes,
                 _streaming,
+                _deadline,
+                _priority,
             ),
         )
 
@@ -1,13 +1,31 @@
+import contextvars
+import copy
+import itertools
+import queue
+import threading
+import time
 import uuid
 
-from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Any
 
 from openfga_sdk.client.configuration import ClientConfiguration
+from openfga_sdk.client.filter_planner import (
+    ClientFilterStrategy,
+    FilterPlanner,
+    allowed_batch_check_results,
+)
+from openfga_sdk.client.model_cache import AuthorizationModelCache
+from openfga_sdk.client.model_validator import (
+    ClientModelValidator,
+    model_validation_check_error,
+    model_validation_error,
+)
 from openfga_sdk.client.models.assertion import ClientAssertion
 from openfga_sdk.client.models.batch_check_item import (
     ClientBatchCheckItem,
+    batch_check_item_key,
     construct_batch_item,
 )
 from openfga_sdk.client.models.batch_check_request import ClientBatchCheckRequest
@@ -15,12 +33,18 @@ from openfga_sdk.client.models.batch_check_response import ClientBatchCheckRespo
 from openfga_sdk.client.models.batch_check_single_response import (
     ClientBatchCheckSingleResponse,
 )
+from openfga_sdk.client.models.check_matrix import (
+    ClientCheckMatrix,
+    apply_check_matrix_results,
+)
 from openfga_sdk.client.models.check_request import (
     ClientCheckRequest,
     construct_check_request,
 )
 from openfga_sdk.client.models.client_batch_check_response import (
     ClientBatchCheckClientResponse,
+    construct_client_batch_check_response,
+    deadline_exceeded_check_result,
 )
 from openfga_sdk.client.models.expand_request import ClientExpandRequest
 from openfga_sdk.client.models.list_objects_request import ClientListObjectsRequest
@@ -28,10 +52,18 @@ from openfga_sdk.client.models.list_relations_request import ClientListRelations
 from openfga_sdk.client.models.list_users_request import ClientListUsersRequest
 from openfga_sdk.client.models.raw_response import RawResponse
 from openfga_sdk.client.models.read_changes_request import ClientReadChangesRequest
-from openfga_sdk.client.models.tuple import ClientTuple, convert_tuple_keys
+from openfga_sdk.client.models.streamed_list_objects_fan_out_response import (
+    ClientStreamedListObjectsFanOutResponse,
+)
+from openfga_sdk.client.models.tuple import (
+    ClientTuple,
+    convert_tuple_keys,
+    tuple_identity,
+)
 from openfga_sdk.client.models.write_request import ClientWriteRequest
 from openfga_sdk.client.models.write_response import ClientWriteResponse
 from openfga_sdk.client.models.write_single_response import (
+    ClientWriteSingleResponse,
     construct_write_single_response,
 )
 from openfga_sdk.client.models.write_transaction_opts import WriteTransactionOpts
@@ -43,12 +75,16 @@ from openfga_sdk.constants import (
 )
 from openfga_sdk.exceptions import (
     AuthenticationError,
+    FgaDeadlineExceededException,
     FgaValidationException,
     UnauthorizedException,
 )
 from openfga_sdk.models.assertion import Assertion
+from openfga_sdk.models.batch_check_item import BatchCheckItem
 from openfga_sdk.models.batch_check_request import BatchCheckRequest
+from openfga_sdk.models.batch_check_response import BatchCheckResponse
 from openfga_sdk.models.check_request import CheckRequest
+from openfga_sdk.models.check_request_tuple_key import CheckRequestTupleKey
 from openfga_sdk.models.contextual_tuple_keys import ContextualTupleKeys
 from openfga_sdk.models.create_store_request import CreateStoreRequest
 from openfga_sdk.models.expand_request import ExpandRequest
@@ -71,6 +107,14 @@ from openfga_sdk.models.write_authorization_model_request import (
 from openfga_sdk.models.write_request import WriteRequest
 from openfga_sdk.sync.api_client import ApiClient
 from openfga_sdk.sync.open_fga_api import OpenFgaApi
+from openfga_sdk.telemetry import Telemetry
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.configuration import TelemetryConfiguration
+from openfga_sdk.telemetry.tracing import (
+    FGA_CLIENT_REQUEST_BATCH_SIZE,
+    setSpanAttributes,
+    traced,
+)
 from openfga_sdk.validation import is_well_formed_ulid_string
 
 
@@ -106,6 +150,18 @@ def set_heading_if_not_set(
     return _options
 
 
+def set_deadline_if_not_set(
+    options: dict[str, int | str | dict[str, int | str]] | None = None,
+) -> dict[str, int | str | dict[str, int | str]]:
+    """
+    Turn the timeout budget into a deadline, so that it spans every request of the operation
+    """
+    _options = dict(options) if options is not None else {}
+    if _options.get("deadline") is None and _options.get("timeout_budget") is not None:
+        _options["deadline"] = time.monotonic() + float(_options["timeout_budget"])
+    return _options
+
+
 def options_to_kwargs(
     options: dict[str, int | str | dict[str, int | str]] | None = None,
 ) -> dict[str, int | str | dict[str, int | str]]:
@@ -124,6 +180,12 @@ def options_to_kwargs(
             kwargs["_headers"] = options["headers"]
         if options.get("retry_params"):
             kwargs["_retry_params"] = options["retry_params"]
+        if options.get("deadline") is not None:
+            kwargs["_deadline"] = options["deadline"]
+        elif options.get("timeout_budget") is not None:
+            kwargs["_deadline"] = time.monotonic() + float(options["timeout_budget"])
+        if options.get("priority"):
+            kwargs["_priority"] = options["priority"]
     return kwargs
 
 
@@ -149,6 +211,14 @@ def options_to_conflict_info(
     return None
 
 
+# Marks the threads of the clients' executors, on which parallel methods run inline
+_executor_thread = threading.local()
+
+
+def _mark_executor_thread() -> None:
+    _executor_thread.active = True
+
+
 def _check_errored(response: ClientBatchCheckClientResponse):
     """
     Helper function to return whether the response is errored
@@ -168,13 +238,43 @@ class OpenFgaClient:
     OpenFgaClient is the entry point for invoking calls against the OpenFGA API.
     """
 
-    def __init__(self, configuration: ClientConfiguration) -> None:
+    def __init__(
+        self,
+        configuration: ClientConfiguration,
+        api_client: ApiClient | None = None,
+    ) -> None:
+        """
+        :param configuration - the configuration of the client
+        :param api_client - an ApiClient to share with other clients, such as views of other
+            authorization models, instead of creating one: its connection pool, credentials
+            and store are reused, and closing the client leaves it open
+        """
         self._client_configuration = configuration
-        self._api_client = ApiClient(configuration)
+        self._owns_api_client = api_client is None
+        self._api_client = api_client or ApiClient(configuration)
         self._api = OpenFgaApi(self._api_client)
-
-        # Set default headers from configuration
-        if configuration.headers:
+        self._filter_planner = FilterPlanner()
+        self._model_cache = AuthorizationModelCache(
+            configuration.authorization_model_cache_size,
+            configuration.latest_authorization_model_ttl_in_sec,
+        )
+        # Single-flight refresh of the latest authorization model
+        self._latest_model_lock = threading.Lock()
+        # The store and authorization model of a view returned by for_store, sent with each request
+        # instead of read from the configuration, which the views share with the client
+        self._store_view = False
+        self._store_id: str | None = None
+        self._authorization_model_id: str | None = None
+        # The latest authorization model pinned by pin_latest_authorization_model, unpinned when a model is written
+        self._pinned_authorization_model_id: str | None = None
+        # Long-lived pool the parallel methods send their requests from, started on first use
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # The client whose pool its views send their requests from
+        self._executor_owner = self
+
+        # Set default headers from configuration, on the ApiClient the client owns
+        if self._owns_api_client and configuration.headers:
             for header_name, header_value in configuration.headers.items():
                 self._api_client.set_default_header(header_name, header_value)
 
@@ -185,7 +285,69 @@ class OpenFgaClient:
         self.close()
 
     def close(self) -> None:
-        self._api.close()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._owns_api_client:
+            self._api.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor_owner is not self:
+            return self._executor_owner._get_executor()
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._client_configuration.max_worker_threads,
+                    thread_name_prefix="openfga-client",
+                    initializer=_mark_executor_thread,
+                )
+            return self._executor
+
+    def _map_parallel(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable,
+        max_parallel_requests: int,
+    ) -> list:
+        """
+        Run fn over the items on the client's executor, at most max_parallel_requests at a time,
+        and return the results in order.
+        Calls made from an executor thread run inline, so nested parallel methods cannot exhaust the pool.
+        """
+        items = list(items)
+        if (
+            max_parallel_requests <= 1
+            or len(items) <= 1
+            or getattr(_executor_thread, "active", False)
+        ):
+            return [fn(item) for item in items]
+
+        executor = self._get_executor()
+        remaining = iter(enumerate(items))
+        results = [None] * len(items)
+        pending = {}
+
+        def submit(index, item):
+            # Each call runs in a copy of the caller's context, keeping its span as the parent of theirs
+            future = executor.submit(contextvars.copy_context().run, fn, item)
+            pending[future] = index
+
+        for index, item in itertools.islice(remaining, max_parallel_requests):
+            submit(index, item)
+        try:
+            # A slot is refilled as soon as any call finishes, so one slow call does not stall the window
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+                for index, item in itertools.islice(remaining, len(done)):
+                    submit(index, item)
+        finally:
+            for future in pending:
+                future.cancel()
+        return results
 
     def _get_authorization_model_id(
         self,
@@ -193,11 +355,33 @@ class OpenFgaClient:
     ) -> str | None:
         """
         Return the authorization model ID if specified in the options.
-        Otherwise, return the authorization model ID stored in the client's configuration
+        Otherwise, return the authorization model ID stored in the client's configuration,
+        resolved and pinned to the latest authorization model when none is and `pin_latest_authorization_model` is set
         """
-        authorization_model_id = self._client_configuration.authorization_model_id
+        authorization_model_id = self.get_authorization_model_id()
         if options is not None and "authorization_model_id" in options:
             authorization_model_id = options["authorization_model_id"]
+        elif (
+            not authorization_model_id
+            and self._client_configuration.pin_latest_authorization_model
+        ):
+            # The request options apply to the read, but not the headers naming the method
+            latest_options = {
+                key: options[key]
+                for key in ("retry_params", "deadline", "priority")
+                if options is not None and key in options
+            }
+            headers = (options or {}).get("headers")
+            if type(headers) is dict:
+                latest_options["headers"] = {
+                    name: value
+                    for name, value in headers.items()
+                    if name not in (CLIENT_METHOD_HEADER, CLIENT_BULK_REQUEST_ID_HEADER)
+                }
+            response = self.read_latest_authorization_model(latest_options)
+            if response.authorization_model is not None:
+                authorization_model_id = response.authorization_model.id
+                self.set_authorization_model_id(authorization_model_id)
         if authorization_model_id is None or authorization_model_id == "":
             return None
         if is_well_formed_ulid_string(authorization_model_id) is False:
@@ -225,32 +409,103 @@ class OpenFgaClient:
 
     def set_store_id(self, value):
         """
-        Update the store ID in the configuration
+        Update the store ID in the configuration, or of the view of a store
         """
+        if self._store_view:
+            self._store_id = value
+            return
         self._api_client.set_store_id(value)
 
     def get_store_id(self):
         """
-        Return the store id (if any) store in the configuration
+        Return the store id (if any) store in the configuration, or of the view of a store
         """
+        if self._store_view:
+            return self._store_id
         return self._api_client.get_store_id()
 
     def set_authorization_model_id(self, value):
         """
-        Update the authorization model id in the configuration
+        Update the authorization model id in the configuration, or of the view of a store
         """
+        if self._store_view:
+            self._authorization_model_id = value
+            return
         self._client_configuration.authorization_model_id = value
 
     def get_authorization_model_id(self):
         """
         Return the authorization model id
         """
+        if self._store_view:
+            return self._authorization_model_id
         return self._client_configuration.authorization_model_id
 
+    def get_telemetry(self) -> Telemetry:
+        """
+        Return the telemetry the client records its metrics and spans with
+        """
+        return self._api_client.telemetry
+
+    def get_telemetry_configuration(self) -> TelemetryConfiguration | None:
+        """
+        Return the telemetry configuration the client records its metrics with
+        """
+        return self._client_configuration.telemetry
+
+    def for_store(
+        self, store_id: str, authorization_model_id: str | None = None
+    ) -> "OpenFgaClient":
+        """
+        Return a view of the client for another store, and authorization model.
+        The view shares the connection pool, credentials and OAuth2 token, headers and
+        authorization model cache of the client, and sends the store and model with each request:
+        creating one is cheap, and closing it leaves the client open.
+        :param store_id - the store the view sends its requests to
+        :param authorization_model_id - the authorization model of the store, the latest one when None
+        """
+        if not is_well_formed_ulid_string(store_id):
+            raise FgaValidationException(
+                f"store_id ('{store_id}') is not in a valid ulid format"
+            )
+
+        view = copy.copy(self)
+        view._owns_api_client = False
+        view._store_view = True
+        view._store_id = store_id
+        view._authorization_model_id = authorization_model_id
+        view._latest_model_lock = threading.Lock()
+        view._pinned_authorization_model_id = None
+        view._executor = None
+        view._executor_lock = threading.Lock()
+        return view
+
+    def _options_to_kwargs(
+        self, options: dict[str, int | str | dict[str, int | str]] | None = None
+    ) -> dict[str, int | str | dict[str, int | str]]:
+        """
+        Return the kwargs of the options, with the store of the view of a store
+        """
+        kwargs = options_to_kwargs(options)
+        if self._store_view:
+            kwargs["_store_id"] = self._store_id
+        return kwargs
+
+    def _raw_request_options(
+        self, options: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Return the options of a raw API request, with the store of the view of a store for its telemetry
+        """
+        if not self._store_view:
+            return options
+        return {**(options or {}), "_store_id": self._store_id}
+
     #################
     # Stores
     #################
 
+    @traced
     def list_stores(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
@@ -265,12 +520,13 @@ class OpenFgaClient:
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
         # convert options to kwargs
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         api_response = self._api.list_stores(
             **kwargs,
         )
         return api_response
 
+    @traced
     def create_store(
         self,
         body: CreateStoreRequest,
@@ -283,10 +539,11 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         api_response = self._api.create_store(body, **kwargs)
         return api_response
 
+    @traced
     def get_store(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
@@ -297,12 +554,13 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         api_response = self._api.get_store(
             **kwargs,
         )
         return api_response
 
+    @traced
     def delete_store(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
@@ -313,7 +571,7 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         api_response = self._api.delete_store(
             **kwargs,
         )
@@ -323,6 +581,7 @@ class OpenFgaClient:
     # Authorization Models
     #######################
 
+    @traced
     def read_authorization_models(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
@@ -333,12 +592,13 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         api_response = self._api.read_authorization_models(
             **kwargs,
         )
         return api_response
 
+    @traced
     def write_authorization_model(
         self,
         body: WriteAuthorizationModelRequest,
@@ -352,57 +612,100 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         api_response = self._api.write_authorization_model(
             body,
             **kwargs,
         )
+        self._model_cache.invalidate_latest(self.get_store_id())
+        # The pinned model is no longer the latest: the next request needing one reads it again
+        pinned = self._pinned_authorization_model_id
+        if pinned is not None and self.get_authorization_model_id() == pinned:
+            self.set_authorization_model_id(None)
+        self._pinned_authorization_model_id = None
         return api_response
 
+    @traced
     def read_authorization_model(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
         """
-        Read an authorization model.
+        Read an authorization model. Models are immutable, so they are cached by id once read.
+        :param authorization_model_id(options) - Overrides the authorization model id in the configuration
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         authorization_model_id = self._get_authorization_model_id(options)
+        store_id = self.get_store_id()
+        if authorization_model_id:
+            cached = self._model_cache.get(store_id, authorization_model_id)
+            if cached is not None:
+                return cached
+
         api_response = self._api.read_authorization_model(
             authorization_model_id,
             **kwargs,
         )
+        if authorization_model_id:
+            self._model_cache.set(store_id, authorization_model_id, api_response)
         return api_response
 
+    @traced
     def read_latest_authorization_model(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
         """
-        Convenient method of reading the latest authorization model
+        Convenient method of reading the latest authorization model.
+        The result is cached for `latest_authorization_model_ttl_in_sec`, and concurrent callers share a single refresh.
+        When `pin_latest_authorization_model` is set, the configured authorization model id is updated to the model read.
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        options = set_heading_if_not_set(
-            options, CLIENT_METHOD_HEADER, "ReadLatestAuthorizationModel"
-        )
-        options["page_size"] = 1
-        api_response = self.read_authorization_models(options)
-        model = (
-            api_response.authorization_models[0]
-            if len(api_response.authorization_models) > 0
-            else None
-        )
-        return ReadAuthorizationModelResponse(model)
+        store_id = self.get_store_id()
+        cached = self._model_cache.get_latest(store_id)
+        if cached is not None:
+            return cached
+
+        with self._latest_model_lock:
+            # Another caller may have refreshed it while this one waited
+            cached = self._model_cache.get_latest(store_id)
+            if cached is not None:
+                return cached
+
+            # Copied, so that the page size does not leak into the options of the caller
+            options = set_heading_if_not_set(
+                dict(options or {}),
+                CLIENT_METHOD_HEADER,
+                "ReadLatestAuthorizationModel",
+            )
+            options["page_size"] = 1
+            api_response = self.read_authorization_models(options)
+            model = (
+                api_response.authorization_models[0]
+                if len(api_response.authorization_models) > 0
+                else None
+            )
+            response = ReadAuthorizationModelResponse(model)
+            if model is None:
+                return response
+
+            self._model_cache.set_latest(store_id, response)
+            self._model_cache.set(store_id, model.id, response)
+            if self._client_configuration.pin_latest_authorization_model:
+                self.set_authorization_model_id(model.id)
+                self._pinned_authorization_model_id = model.id
+            return response
 
     #######################
     # Relationship Tuples
     #######################
 
+    @traced
     def read_changes(
         self,
         body: ClientReadChangesRequest,
@@ -418,7 +721,7 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
 
         if body.type is not None:
             kwargs["type"] = body.type
@@ -431,6 +734,7 @@ class OpenFgaClient:
         )
         return api_response
 
+    @traced
     def read(
         self,
         body: ReadRequestTupleKey,
@@ -456,7 +760,7 @@ class OpenFgaClient:
             if options.get("continuation_token"):
                 continuation_token = options.get("continuation_token")
                 options.pop("continuation_token")
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
 
         if body is None or (
             body.object is None and body.relation is None and body.user is None
@@ -508,20 +812,44 @@ class OpenFgaClient:
         """
         Internal function for write/delete batches
         """
+        # Tuples the validator rejects are answered locally so they cannot fail the chunk they would be sent in
+        invalid: dict[int, ClientWriteSingleResponse] = {}
+        validator: ClientModelValidator | None = (options or {}).get("validator")
+        if validator is not None:
+            valid = []
+            for index, item in enumerate(tuple_keys):
+                error = validator.validate_tuple(item, is_write)
+                if error is None:
+                    valid.append(item)
+                else:
+                    invalid[index] = construct_write_single_response(
+                        item, False, model_validation_error(error)
+                    )
+            total = len(tuple_keys)
+            tuple_keys = valid
+
         chunks = _chuck_array(tuple_keys, transaction.max_per_chunk)
+        if len(chunks) > 1:
+            self._api_client.rest_client.pool_usage.expect(
+                min(len(chunks), transaction.max_parallel_requests)
+            )
 
-        write_batches = _chuck_array(chunks, transaction.max_parallel_requests)
-        batch_write_responses = []
-        for write_batch in write_batches:
-            response = [
-                self._write_single_batch(i, is_write, options) for i in write_batch
-            ]
-            flatten_list = [
-                item
-                for batch_single_response in response
-                for item in batch_single_response
+        batch_write_responses = [
+            item
+            for batch_single_response in self._map_parallel(
+                lambda chunk: self._write_single_batch(chunk, is_write, options),
+                chunks,
+                transaction.max_parallel_requests,
+            )
+            for item in batch_single_response
+        ]
+
+        if invalid:
+            responses = iter(batch_write_responses)
+            batch_write_responses = [
+                invalid[index] if index in invalid else next(responses)
+                for index in range(total)
             ]
-            batch_write_responses.extend(flatten_list)
 
         return batch_write_responses
 
@@ -533,7 +861,7 @@ class OpenFgaClient:
         """
         Write or deletes tuples
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         conflict_options = options_to_conflict_info(options)
 
         # Extract conflict options to pass to the tuple key methods
@@ -573,6 +901,7 @@ class OpenFgaClient:
             ]
         return ClientWriteResponse(writes=writes_response, deletes=deletes_response)
 
+    @traced
     def write(
         self,
         body: ClientWriteRequest,
@@ -581,14 +910,36 @@ class OpenFgaClient:
         """
         Write or deletes tuples
         :param body - the write request
+        :param compact(options) - Collapse repeated and cancelling tuples before sending, see ClientWriteRequest.compact
+        :param validator(options) - ClientModelValidator checking the tuples before sending. Invalid tuples fail a transaction before it is sent, or are reported in the response without being sent otherwise
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
         options = set_heading_if_not_set(options, CLIENT_METHOD_HEADER, "Writes")
+        options = set_deadline_if_not_set(options)
+        if options.get("compact"):
+            body = body.compact()
+        setSpanAttributes(
+            {
+                FGA_CLIENT_REQUEST_BATCH_SIZE: len(body.writes or [])
+                + len(body.deletes or [])
+            }
+        )
         transaction = options_to_transaction_info(options)
         if not transaction.disabled:
+            validator: ClientModelValidator | None = options.get("validator")
+            if validator is not None:
+                for item in body.writes or []:
+                    error = validator.validate_tuple(item, True)
+                    if error is not None:
+                        raise model_validation_error(error)
+                for item in body.deletes or []:
+                    error = validator.validate_tuple(item, False)
+                    if error is not None:
+                        raise model_validation_error(error)
             results = self._write_with_transaction(body, options)
             return results
 
@@ -609,6 +960,7 @@ class OpenFgaClient:
             )
         return ClientWriteResponse(writes=writes_response, deletes=deletes_response)
 
+    @traced
     def write_tuples(
         self,
         body: list[ClientTuple],
@@ -626,6 +978,7 @@ class OpenFgaClient:
         result = self.write(ClientWriteRequest(body, None), options)
         return result
 
+    @traced
     def delete_tuples(
         self,
         body: list[ClientTuple],
@@ -646,6 +999,106 @@ class OpenFgaClient:
     #######################
     # Relationship Queries
     #######################
+    @traced
+    def reconcile(
+        self,
+        filter: ReadRequestTupleKey,
+        desired_tuples: Iterable[ClientTuple],
+        options: dict[str, int | str | dict[str, int | str]] | None = None,
+    ) -> ClientWriteResponse:
+        """
+        Make the tuples matching a filter equal to the desired tuples, writing and deleting only the difference.
+        The current tuples are streamed page by page and joined against the desired tuples, and the tuples to delete
+        are sent as soon as they fill a chunk. Only the desired tuples are held in memory as a whole, so memory use is
+        O(n) in the size of the desired set; split very large sets by filter and reconcile each part separately.
+        Tuples whose condition changed are deleted, then written again.
+        :param filter - the tuples to reconcile, as for read. The desired tuples are expected to match it
+        :param desired_tuples - the tuples that should exist
+        :param page_size(options) - Number of tuples to read per request
+        :param transaction(options) - Write options, defaults to non-transactional chunks of 50 tuples
+        :param authorization_model_id(options) - Overrides the authorization model id in the configuration
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
+        :param header(options) - Custom headers to send alongside the request
+        :param retryParams(options) - Override the retry parameters for this request
+        :param retryParams.maxRetry(options) - Override the max number of retries on each API request
+        :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
+        :param consistency(options) - The type of consistency preferred for the request
+        """
+        options = set_heading_if_not_set(options, CLIENT_METHOD_HEADER, "Reconcile")
+        options = set_deadline_if_not_set(options)
+        options = set_heading_if_not_set(
+            options, CLIENT_BULK_REQUEST_ID_HEADER, str(uuid.uuid4())
+        )
+
+        desired: dict[tuple[str, str, str], ClientTuple] = {}
+        for item in desired_tuples:
+            desired[(item.user, item.relation, item.object)] = item
+
+        transaction = options.get("transaction") or WriteTransactionOpts(
+            disabled=True, max_per_chunk=CLIENT_MAX_BATCH_SIZE
+        )
+        write_options = {
+            key: value for key, value in options.items() if key != "page_size"
+        }
+
+        # Deletes go first so that tuples whose condition changed can be written again.
+        # They are sent a chunk at a time while reading, so at most one chunk of them is pending
+        deletes: list[ClientTuple] = []
+        deletes_response: list[ClientWriteSingleResponse] | None = None
+        continuation_token = None
+        while True:
+            read_options = {
+                key: options[key]
+                for key in (
+                    "headers",
+                    "retry_params",
+                    "consistency",
+                    "page_size",
+                    "deadline",
+                )
+                if key in options
+            }
+            if continuation_token:
+                read_options["continuation_token"] = continuation_token
+
+            response = self.read(filter, read_options)
+            for item in response.tuples or []:
+                key = item.key
+                wanted = desired.get((key.user, key.relation, key.object))
+                if wanted is not None and tuple_identity(wanted) == tuple_identity(key):
+                    # Already in place
+                    del desired[(key.user, key.relation, key.object)]
+                else:
+                    deletes.append(
+                        ClientTuple(
+                            user=key.user, relation=key.relation, object=key.object
+                        )
+                    )
+                    if len(deletes) >= transaction.max_per_chunk:
+                        deletes_response = (deletes_response or []) + (
+                            self._write_batches(
+                                deletes, transaction, False, write_options
+                            )
+                        )
+                        deletes = []
+
+            continuation_token = response.continuation_token
+            if not continuation_token:
+                break
+
+        if deletes:
+            deletes_response = (deletes_response or []) + self._write_batches(
+                deletes, transaction, False, write_options
+            )
+
+        writes_response = None
+        if desired:
+            writes_response = self._write_batches(
+                list(desired.values()), transaction, True, write_options
+            )
+        return ClientWriteResponse(writes=writes_response, deletes=deletes_response)
+
+    @traced
     def check(
         self,
         body: ClientCheckRequest,
@@ -655,13 +1108,20 @@ class OpenFgaClient:
         Check whether a user is authorized to access an object
         :param body - ClientCheckRequest defining check request
         :param authorization_model_id(options) - Overrides the authorization model id in the configuration
+        :param validator(options) - ClientModelValidator checking the request before sending
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         :param consistency(options) - The type of consistency preferred for the request
         """
-        kwargs = options_to_kwargs(options)
+        validator: ClientModelValidator | None = (options or {}).get("validator")
+        if validator is not None:
+            error = validator.validate_check(body)
+            if error is not None:
+                raise model_validation_error(error)
+
+        kwargs = self._options_to_kwargs(options)
 
         req_body = CheckRequest(
             tuple_key=TupleKey(
@@ -680,41 +1140,20 @@ class OpenFgaClient:
         api_response = self._api.check(body=req_body, **kwargs)
         return api_response
 
-    def _single_client_batch_check(
-        self,
-        body: ClientCheckRequest,
-        options: dict[str, int | str | dict[str, int | str]] | None = None,
-    ):
-        """
-        Run a single batch request and return body in a SingleBatchCheckResponse
-        :param body - ClientCheckRequest defining check request
-        :param authorization_model_id(options) - Overrides the authorization model id in the configuration
-        """
-        try:
-            api_response = self.check(body, options)
-            return ClientBatchCheckClientResponse(
-                allowed=api_response.allowed,
-                request=body,
-                response=api_response,
-                error=None,
-            )
-        except (AuthenticationError, UnauthorizedException) as err:
-            raise err
-        except Exception as err:
-            return ClientBatchCheckClientResponse(
-                allowed=False, request=body, response=None, error=err
-            )
-
+    @traced
     def client_batch_check(
         self,
         body: list[ClientCheckRequest],
         options: dict[str, int | str | dict[str, int | str]] | None = None,
     ):
         """
-        Run a set of checks
+        Run a set of checks, sending them in chunks to the BatchCheck API
         :param body - list of ClientCheckRequest defining check request
         :param authorization_model_id(options) - Overrides the authorization model id in the configuration
         :param max_parallel_requests(options) - Max number of requests to issue in parallel. Defaults to 10
+        :param max_batch_size(options) - Max number of checks to include in a request. Defaults to 50
+        :param validator(options) - ClientModelValidator checking the checks before sending. Invalid checks are answered with their error without being sent
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
@@ -722,9 +1161,11 @@ class OpenFgaClient:
         :param consistency(options) - The type of consistency preferred for the request
         """
         options = set_heading_if_not_set(options, CLIENT_METHOD_HEADER, "BatchCheck")
+        options = set_deadline_if_not_set(options)
         options = set_heading_if_not_set(
             options, CLIENT_BULK_REQUEST_ID_HEADER, str(uuid.uuid4())
         )
+        setSpanAttributes({FGA_CLIENT_REQUEST_BATCH_SIZE: len(body)})
 
         max_parallel_requests = CLIENT_MAX_METHOD_PARALLEL_REQUESTS
         if options is not None and "max_parallel_requests" in options:
@@ -735,15 +1176,94 @@ class OpenFgaClient:
                 max_parallel_requests = int(options["max_parallel_requests"])
             elif isinstance(options["max_parallel_requests"], int):
                 max_parallel_requests = options["max_parallel_requests"]
+        self._api_client.rest_client.pool_usage.expect(max_parallel_requests)
+
+        max_batch_size = CLIENT_MAX_BATCH_SIZE
+        if options is not None and "max_batch_size" in options:
+            if (
+                isinstance(options["max_batch_size"], str)
+                and options["max_batch_size"].isdigit()
+            ):
+                max_batch_size = int(options["max_batch_size"])
+            elif isinstance(options["max_batch_size"], int):
+                max_batch_size = options["max_batch_size"]
+
+        def single_batch_check(
+            chunk: list[tuple[int, ClientCheckRequest, BatchCheckItem]],
+        ):
+            try:
+                res = self._single_batch_check(
+                    BatchCheckRequest(
+                        checks=[item for _, _, item in chunk],
+                        authorization_model_id=self._get_authorization_model_id(
+                            options
+                        ),
+                        consistency=self._get_consistency(options),
+                    ),
+                    options,
+                )
+            except (AuthenticationError, UnauthorizedException) as err:
+                raise err
+            except Exception as err:
+                return [
+                    ClientBatchCheckClientResponse(
+                        allowed=False, request=request, response=None, error=err
+                    )
+                    for _, request, _ in chunk
+                ]
+
+            results = res.result or {}
+            return [
+                construct_client_batch_check_response(request, results.get(str(index)))
+                for index, request, _ in chunk
+            ]
 
-        batch_check_response = []
+        batch_check_response: list[ClientBatchCheckClientResponse | None] = [
+            None
+        ] * len(body)
+        pending = []
+        validator: ClientModelValidator | None = options.get("validator")
+        for index, request in enumerate(body):
+            error = validator.validate_check(request) if validator else None
+            if error is None:
+                pending.append((index, request))
+            else:
+                batch_check_response[index] = ClientBatchCheckClientResponse(
+                    allowed=False,
+                    request=request,
+                    response=None,
+                    error=model_validation_error(error),
+                )
 
-        def single_batch_check(request):
-            return self._single_client_batch_check(request, options)
+        # Contextual tuples and contexts shared by several checks are converted once, before any chunk is sent
+        # The position of each check doubles as its correlation id
+        interned = {}
+        items = [
+            (
+                index,
+                request,
+                construct_batch_item(
+                    ClientBatchCheckItem(
+                        user=request.user,
+                        relation=request.relation,
+                        object=request.object,
+                        correlation_id=str(index),
+                        contextual_tuples=request.contextual_tuples,
+                        context=request.context,
+                    ),
+                    interned,
+                ),
+            )
+            for index, request in pending
+        ]
+        chunks = _chuck_array(items, max_batch_size)
 
-        with ThreadPoolExecutor(max_workers=max_parallel_requests) as executor:
-            for response in executor.map(single_batch_check, body):
-                batch_check_response.append(response)
+        for chunk, responses in zip(
+            chunks,
+            self._map_parallel(single_batch_check, chunks, max_parallel_requests),
+        ):
+            for (index, _, _), response in zip(chunk, responses):
+                batch_check_response[index] = response
 
         return batch_check_response
 
@@ -758,13 +1278,14 @@ class OpenFgaClient:
         :param authorization_model_id(options) - Overrides the authorization model id in the configuration
         """
         try:
-            kwargs = options_to_kwargs(options)
+            kwargs = self._options_to_kwargs(options)
             api_response = self._api.batch_check(body, **kwargs)
             return api_response
         # Does this cover all error cases? If one fails with a 4xx/5xx then all should?
         except Exception as err:
             raise err
 
+    @traced
     def batch_check(
         self,
         body: ClientBatchCheckRequest,
@@ -776,6 +1297,8 @@ class OpenFgaClient:
         :param authorization_model_id(options) - Overrides the authorization model id in the configuration
         :param max_parallel_requests(options) - Max number of requests to issue in parallel. Defaults to 10
         :param max_batch_size(options) - Max number of checks to include in a request. Defaults to 50
+        :param validator(options) - ClientModelValidator checking the checks before sending. Invalid checks are answered with their error without being sent
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
@@ -784,6 +1307,8 @@ class OpenFgaClient:
         options = set_heading_if_not_set(
             options, CLIENT_BULK_REQUEST_ID_HEADER, str(uuid.uuid4())
         )
+        options = set_deadline_if_not_set(options)
+        setSpanAttributes({FGA_CLIENT_REQUEST_BATCH_SIZE: len(body.checks)})
 
         max_parallel_requests = CLIENT_MAX_METHOD_PARALLEL_REQUESTS
         if options is not None and "max_parallel_requests" in options:
@@ -794,6 +1319,7 @@ class OpenFgaClient:
                 max_parallel_requests = int(options["max_parallel_requests"])
             elif isinstance(options["max_parallel_requests"], int):
                 max_parallel_requests = options["max_parallel_requests"]
+        self._api_client.rest_client.pool_usage.expect(max_parallel_requests)
 
         max_batch_size = CLIENT_MAX_BATCH_SIZE
         if options is not None and "max_batch_size" in options:
@@ -806,64 +1332,437 @@ class OpenFgaClient:
                 max_batch_size = options["max_batch_size"]
 
         id_to_check: dict[str, ClientBatchCheckItem] = {}
+        # Checks the validator rejects are answered locally
+        invalid_results: list[ClientBatchCheckSingleResponse] = []
+        validator: ClientModelValidator | None = options.get("validator")
+        # Identical checks are sent once; their result is fanned out to the duplicates' correlation ids
+        unique_checks: dict[tuple, ClientBatchCheckItem] = {}
+        duplicate_ids: dict[str, list[str]] = {}
+        # Contextual tuples and contexts shared by several checks are keyed and converted once
+        interned = {}
+
+        for check in body.checks:
+            if check.correlation_id is None:
+                check.correlation_id = str(uuid.uuid4())
+
+            if check.correlation_id in id_to_check:
+                raise FgaValidationException(
+                    f"Duplicate correlation_id ({check.correlation_id}) provided"
+                )
 
-        def track_and_transform(checks):
-            transformed = []
-            for check in checks:
-                if check.correlation_id is None:
-                    check.correlation_id = str(uuid.uuid4())
+            id_to_check[check.correlation_id] = check
 
-                if check.correlation_id in id_to_check:
-                    raise FgaValidationException(
-                        f"Duplicate correlation_id ({check.correlation_id}) provided"
+            error = validator.validate_check(check) if validator else None
+            if error is not None:
+                invalid_results.append(
+                    ClientBatchCheckSingleResponse(
+                        allowed=False,
+                        request=check,
+                        correlation_id=check.correlation_id,
+                        error=model_validation_check_error(error),
                     )
+                )
+                continue
 
-                id_to_check[check.correlation_id] = check
-
-                transformed.append(construct_batch_item(check))
-            return transformed
+            first = unique_checks.setdefault(
+                batch_check_item_key(check, interned), check
+            )
+            if first is not check:
+                duplicate_ids.setdefault(first.correlation_id, []).append(
+                    check.correlation_id
+                )
 
+        unique = list(unique_checks.values())
         checks = [
-            track_and_transform(
-                body.checks[i * max_batch_size : (i + 1) * max_batch_size]
-            )
-            for i in range((len(body.checks) + max_batch_size - 1) // max_batch_size)
+            [
+                construct_batch_item(check, interned)
+                for check in unique[i * max_batch_size : (i + 1) * max_batch_size]
+            ]
+            for i in range((len(unique) + max_batch_size - 1) // max_batch_size)
         ]
 
         def map_response(id, result):
-            check = id_to_check[id]
-            return ClientBatchCheckSingleResponse(
-                allowed=result.allowed,
-                request=check,
-                correlation_id=id,
-                error=result.error,
-            )
+            return [
+                ClientBatchCheckSingleResponse(
+                    allowed=result.allowed,
+                    request=id_to_check[c_id],
+                    correlation_id=c_id,
+                    error=result.error,
+                )
+                for c_id in [id, *duplicate_ids.get(id, [])]
+            ]
 
         def single_batch_check(checks):
-            res = self._single_batch_check(
-                BatchCheckRequest(
-                    checks=checks,
-                    authorization_model_id=self._get_authorization_model_id(options),
-                    consistency=self._get_consistency(options),
+            try:
+                res = self._single_batch_check(
+                    BatchCheckRequest(
+                        checks=checks,
+                        authorization_model_id=self._get_authorization_model_id(
+                            options
+                        ),
+                        consistency=self._get_consistency(options),
+                    ),
+                    options,
+                )
+            except FgaDeadlineExceededException as err:
+                # The checks cut short are reported alongside those that completed in time
+                res = BatchCheckResponse(
+                    result={
+                        check.correlation_id: deadline_exceeded_check_result(err)
+                        for check in checks
+                    }
+                )
+
+            return res
+
+        result = list(invalid_results)
+
+        for response in self._map_parallel(
+            single_batch_check, checks, max_parallel_requests
+        ):
+            for c_id, c_result in response.result.items():
+                result.extend(map_response(c_id, c_result))
+
+        return ClientBatchCheckResponse(result)
+
+    @traced
+    def check_matrix(
+        self,
+        users: Iterable[str],
+        relations: Iterable[str],
+        objects: Iterable[str],
+        contextual_tuples: list[ClientTuple] | None = None,
+        context: dict[str, Any] | None = None,
+        options: dict[str, int | str | dict[str, int | str]] | None = None,
+    ) -> ClientCheckMatrix:
+        """
+        Check every combination of users, relations and objects using the BatchCheck API
+        :param users - users to check, duplicates are checked once
+        :param relations - relations to check, duplicates are checked once
+        :param objects - objects to check, duplicates are checked once
+        :param contextual_tuples - contextual tuples sent with every check
+        :param context - context sent with every check
+        :param authorization_model_id(options) - Overrides the authorization model id in the configuration
+        :param max_parallel_requests(options) - Max number of requests to issue in parallel. Defaults to 10
+        :param max_batch_size(options) - Max number of checks to include in a request. Defaults to 50
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
+        :param header(options) - Custom headers to send alongside the request
+        :param retryParams(options) - Override the retry parameters for this request
+        :param retryParams.maxRetry(options) - Override the max number of retries on each API request
+        :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
+        :param consistency(options) - The type of consistency preferred for the request
+        """
+        options = set_heading_if_not_set(options, CLIENT_METHOD_HEADER, "CheckMatrix")
+        options = set_deadline_if_not_set(options)
+        options = set_heading_if_not_set(
+            options, CLIENT_BULK_REQUEST_ID_HEADER, str(uuid.uuid4())
+        )
+
+        max_parallel_requests = CLIENT_MAX_METHOD_PARALLEL_REQUESTS
+        if options is not None and "max_parallel_requests" in options:
+            if (
+                isinstance(options["max_parallel_requests"], str)
+                and options["max_parallel_requests"].isdigit()
+            ):
+                max_parallel_requests = int(options["max_parallel_requests"])
+            elif isinstance(options["max_parallel_requests"], int):
+                max_parallel_requests = options["max_parallel_requests"]
+        self._api_client.rest_client.pool_usage.expect(max_parallel_requests)
+
+        max_batch_size = CLIENT_MAX_BATCH_SIZE
+        if options is not None and "max_batch_size" in options:
+            if (
+                isinstance(options["max_batch_size"], str)
+                and options["max_batch_size"].isdigit()
+            ):
+                max_batch_size = int(options["max_batch_size"])
+            elif isinstance(options["max_batch_size"], int):
+                max_batch_size = options["max_batch_size"]
+
+        matrix = ClientCheckMatrix(users, relations, objects)
+        kwargs = self._options_to_kwargs(options)
+        authorization_model_id = self._get_authorization_model_id(options)
+        consistency = self._get_consistency(options)
+        # Validate the models against the client configuration rather than copying the default one for each check
+        configuration = self._client_configuration
+        shared_contextual_tuples = None
+        if contextual_tuples:
+            shared_contextual_tuples = ContextualTupleKeys(
+                tuple_keys=convert_tuple_keys(contextual_tuples)
+            )
+
+        def construct_item(index: int) -> BatchCheckItem:
+            user, relation, object = matrix.key(index)
+            return BatchCheckItem(
+                tuple_key=CheckRequestTupleKey(
+                    user=user,
+                    relation=relation,
+                    object=object,
+                    local_vars_configuration=configuration,
                 ),
-                options,
+                contextual_tuples=shared_contextual_tuples,
+                context=context,
+                correlation_id=str(index),
+                local_vars_configuration=configuration,
             )
 
-            return res
+        # The cross product is walked lazily, one chunk per request
+        chunks = (
+            range(start, min(start + max_batch_size, len(matrix)))
+            for start in range(0, len(matrix), max_batch_size)
+        )
+
+        lock = threading.Lock()
+
+        def next_chunk() -> range | None:
+            with lock:
+                return next(chunks, None)
+
+        def worker():
+            while (chunk := next_chunk()) is not None:
+                try:
+                    res = self._api.batch_check(
+                        BatchCheckRequest(
+                            checks=[construct_item(index) for index in chunk],
+                            authorization_model_id=authorization_model_id,
+                            consistency=consistency,
+                        ),
+                        **kwargs,
+                    )
+                except (AuthenticationError, UnauthorizedException) as err:
+                    raise err
+                except Exception as err:
+                    for index in chunk:
+                        matrix.set_error(index, err)
+                    continue
+
+                apply_check_matrix_results(matrix, chunk, res.result)
+
+        workers = min(max_parallel_requests, -(-len(matrix) // max_batch_size))
+        self._map_parallel(lambda _: worker(), range(workers), workers)
+
+        return matrix
+
+    @traced
+    def filter_allowed(
+        self,
+        user: str,
+        relation: str,
+        candidates: Iterable[str],
+        contextual_tuples: list[ClientTuple] | None = None,
+        context: dict[str, Any] | None = None,
+        options: dict[str, int | str | dict[str, int | str]] | None = None,
+    ) -> list[str]:
+        """
+        Return the candidate objects the user has the relation with, in the order they were given.
+        For each object type, the candidates are either checked in batches or intersected with the streamed
+        list of objects the user can access, whichever was observed to be faster for that many candidates.
+        :param user - user to check
+        :param relation - relation to check
+        :param candidates - objects to filter, duplicates are checked once
+        :param contextual_tuples - contextual tuples sent with every request
+        :param context - context sent with every request
+        :param strategy(options) - Force a ClientFilterStrategy instead of picking one
+        :param authorization_model_id(options) - Overrides the authorization model id in the configuration
+        :param max_parallel_requests(options) - Max number of requests to issue in parallel. Defaults to 10
+        :param max_batch_size(options) - Max number of checks to include in a request. Defaults to 50
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
+        :param header(options) - Custom headers to send alongside the request
+        :param retryParams(options) - Override the retry parameters for this request
+        :param retryParams.maxRetry(options) - Override the max number of retries on each API request
+        :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
+        :param consistency(options) - The type of consistency preferred for the request
+        """
+        options = set_heading_if_not_set(options, CLIENT_METHOD_HEADER, "FilterAllowed")
+        options = set_deadline_if_not_set(options)
+        options = set_heading_if_not_set(
+            options, CLIENT_BULK_REQUEST_ID_HEADER, str(uuid.uuid4())
+        )
+
+        max_parallel_requests = CLIENT_MAX_METHOD_PARALLEL_REQUESTS
+        if options is not None and "max_parallel_requests" in options:
+            if (
+                isinstance(options["max_parallel_requests"], str)
+                and options["max_parallel_requests"].isdigit()
+            ):
+                max_parallel_requests = int(options["max_parallel_requests"])
+            elif isinstance(options["max_parallel_requests"], int):
+                max_parallel_requests = options["max_parallel_requests"]
+        self._api_client.rest_client.pool_usage.expect(max_parallel_requests)
 
-        result = []
+        max_batch_size = CLIENT_MAX_BATCH_SIZE
+        if options is not None and "max_batch_size" in options:
+            if (
+                isinstance(options["max_batch_size"], str)
+                and options["max_batch_size"].isdigit()
+            ):
+                max_batch_size = int(options["max_batch_size"])
+            elif isinstance(options["max_batch_size"], int):
+                max_batch_size = options["max_batch_size"]
+
+        candidates = list(dict.fromkeys(candidates))
+        candidates_by_type: dict[str, list[str]] = {}
+        for object in candidates:
+            candidates_by_type.setdefault(object.split(":", 1)[0], []).append(object)
 
-        with ThreadPoolExecutor(max_workers=max_parallel_requests) as executor:
-            for response in executor.map(single_batch_check, checks):
-                result.extend(
-                    [
-                        map_response(c_id, c_result)
-                        for c_id, c_result in response.result.items()
-                    ]
+        allowed: set[str] = set()
+        for type, objects in candidates_by_type.items():
+            if options.get("strategy"):
+                strategy = ClientFilterStrategy(options["strategy"])
+            else:
+                strategy = self._filter_planner.choose(
+                    len(objects), type, relation, max_batch_size, max_parallel_requests
                 )
 
-        return ClientBatchCheckResponse(result)
+            if strategy == ClientFilterStrategy.BATCH_CHECK:
+                allowed.update(
+                    self._filter_allowed_by_batch_check(
+                        user,
+                        relation,
+                        objects,
+                        contextual_tuples,
+                        context,
+                        max_batch_size,
+                        max_parallel_requests,
+                        options,
+                    )
+                )
+            else:
+                allowed.update(
+                    self._filter_allowed_by_list_objects(
+                        user,
+                        relation,
+                        type,
+                        objects,
+                        contextual_tuples,
+                        context,
+                        options,
+                    )
+                )
+
+            self._api_client.telemetry.metrics.filterAllowed(
+                attributes={
+                    TelemetryAttributes.fga_client_filter_strategy: strategy.value,
+                    TelemetryAttributes.fga_client_request_store_id: self.get_store_id(),
+                },
+                configuration=self._client_configuration.telemetry,
+            )
+
+        return [object for object in candidates if object in allowed]
+
+    def _filter_allowed_by_batch_check(
+        self,
+        user: str,
+        relation: str,
+        objects: list[str],
+        contextual_tuples: list[ClientTuple] | None,
+        context: dict[str, Any] | None,
+        max_batch_size: int,
+        max_parallel_requests: int,
+        options: dict[str, int | str | dict[str, int | str]],
+    ) -> list[str]:
+        kwargs = self._options_to_kwargs(options)
+        authorization_model_id = self._get_authorization_model_id(options)
+        consistency = self._get_consistency(options)
+        configuration = self._client_configuration
+        shared_contextual_tuples = None
+        if contextual_tuples:
+            shared_contextual_tuples = ContextualTupleKeys(
+                tuple_keys=convert_tuple_keys(contextual_tuples)
+            )
+
+        chunks = (
+            range(start, min(start + max_batch_size, len(objects)))
+            for start in range(0, len(objects), max_batch_size)
+        )
+        allowed: list[str] = []
+        lock = threading.Lock()
+
+        def next_chunk() -> range | None:
+            with lock:
+                return next(chunks, None)
+
+        def worker():
+            while (chunk := next_chunk()) is not None:
+                started = time.perf_counter()
+                res = self._api.batch_check(
+                    BatchCheckRequest(
+                        checks=[
+                            BatchCheckItem(
+                                tuple_key=CheckRequestTupleKey(
+                                    user=user,
+                                    relation=relation,
+                                    object=objects[index],
+                                    local_vars_configuration=configuration,
+                                ),
+                                contextual_tuples=shared_contextual_tuples,
+                                context=context,
+                                correlation_id=str(index),
+                                local_vars_configuration=configuration,
+                            )
+                            for index in chunk
+                        ],
+                        authorization_model_id=authorization_model_id,
+                        consistency=consistency,
+                    ),
+                    **kwargs,
+                )
+                self._filter_planner.record_batch_check(time.perf_counter() - started)
+                allowed.extend(allowed_batch_check_results(objects, chunk, res.result))
+
+        workers = min(max_parallel_requests, -(-len(objects) // max_batch_size))
+        self._map_parallel(lambda _: worker(), range(workers), workers)
+
+        return allowed
+
+    def _filter_allowed_by_list_objects(
+        self,
+        user: str,
+        relation: str,
+        type: str,
+        objects: list[str],
+        contextual_tuples: list[ClientTuple] | None,
+        context: dict[str, Any] | None,
+        options: dict[str, int | str | dict[str, int | str]],
+    ) -> list[str]:
+        remaining = set(objects)
+        allowed: list[str] = []
+        streamed = 0
+        started = time.perf_counter()
+
+        stream = self.streamed_list_objects(
+            ClientListObjectsRequest(
+                user=user,
+                relation=relation,
+                type=type,
+                contextual_tuples=contextual_tuples,
+                context=context,
+            ),
+            options,
+        )
+        try:
+            # Only the candidates are kept; the stream is abandoned once all of them were seen
+            for response in stream:
+                streamed += 1
+                if response.object in remaining:
+                    remaining.discard(response.object)
+                    allowed.append(response.object)
+                    if not remaining:
+                        break
+        finally:
+            stream.close()
+
+        self._filter_planner.record_list_objects(
+            type,
+            relation,
+            time.perf_counter() - started,
+            streamed,
+            complete=len(remaining) > 0,
+        )
+
+        return allowed
 
+    @traced
     def expand(
         self,
         body: ClientExpandRequest,
@@ -879,7 +1778,7 @@ class OpenFgaClient:
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         :param consistency(options) - The type of consistency preferred for the request
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
 
         req_body = ExpandRequest(
             tuple_key=ExpandRequestTupleKey(
@@ -896,6 +1795,7 @@ class OpenFgaClient:
         api_response = self._api.expand(body=req_body, **kwargs)
         return api_response
 
+    @traced
     def list_objects(
         self,
         body: ClientListObjectsRequest,
@@ -911,7 +1811,7 @@ class OpenFgaClient:
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         :param consistency(options) - The type of consistency preferred for the request
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
 
         req_body = ListObjectsRequest(
             authorization_model_id=self._get_authorization_model_id(options),
@@ -944,7 +1844,7 @@ class OpenFgaClient:
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         :param consistency(options) - The type of consistency preferred for the request
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         kwargs["_streaming"] = True
 
         req_body = ListObjectsRequest(
@@ -961,12 +1861,140 @@ class OpenFgaClient:
                 tuple_keys=convert_tuple_keys(body.contextual_tuples)
             )
 
-        for response in self._api.streamed_list_objects(body=req_body, **kwargs):
-            if response and "result" in response and "object" in response["result"]:
-                yield StreamedListObjectsResponse(response["result"]["object"])
+        stream = self._api.streamed_list_objects(body=req_body, **kwargs)
+        try:
+            for response in stream:
+                if response and "result" in response and "object" in response["result"]:
+                    yield StreamedListObjectsResponse(response["result"]["object"])
+        finally:
+            # Release the connection right away when the caller stops iterating early
+            stream.close()
 
         return
 
+    def streamed_list_objects_fan_out(
+        self,
+        bodies: Iterable[ClientListObjectsRequest],
+        options: dict[str, int | str | dict[str, int | str]] | None = None,
+    ) -> Iterator[ClientStreamedListObjectsFanOutResponse]:
+        """
+        Run several streamed list objects requests concurrently and merge their results into one stream.
+        Each object is tagged with the position of the request that streamed it. The requests run on the
+        client's executor, see max_worker_threads. Stopping the iteration returns at once: requests not
+        started yet are never sent, and running requests close their connection when their next object
+        arrives or their read timeout expires, in the background.
+
+        :param bodies - list object parameters of each request
+        :param deduplicate(options) - Only yield the first occurrence of each object across the requests
+        :param max_parallel_requests(options) - Max number of requests to run concurrently. Defaults to 10
+        :param authorization_model_id(options) - Overrides the authorization model id in the configuration
+        :param header(options) - Custom headers to send alongside the request
+        :param retryParams(options) - Override the retry parameters for this request
+        :param retryParams.maxRetry(options) - Override the max number of retries on each API request
+        :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
+        :param consistency(options) - The type of consistency preferred for the request
+        """
+        max_parallel_requests = CLIENT_MAX_METHOD_PARALLEL_REQUESTS
+        if options is not None and "max_parallel_requests" in options:
+            if (
+                isinstance(options["max_parallel_requests"], str)
+                and options["max_parallel_requests"].isdigit()
+            ):
+                max_parallel_requests = int(options["max_parallel_requests"])
+            elif isinstance(options["max_parallel_requests"], int):
+                max_parallel_requests = options["max_parallel_requests"]
+        self._api_client.rest_client.pool_usage.expect(max_parallel_requests)
+
+        deduplicate = bool(options.get("deduplicate")) if options else False
+        bodies = list(bodies)
+        seen: set[str] = set()
+
+        if getattr(_executor_thread, "active", False):
+            # Called from an executor thread: stream the requests one after the other, so the pool cannot be exhausted
+            for source, body in enumerate(bodies):
+                for response in self.streamed_list_objects(body, options):
+                    if deduplicate:
+                        if response.object in seen:
+                            continue
+                        seen.add(response.object)
+                    yield ClientStreamedListObjectsFanOutResponse(
+                        response.object, source, body
+                    )
+            return
+
+        # Bounded, so fast streams wait for the consumer instead of buffering their whole result
+        results: queue.Queue = queue.Queue(maxsize=max_parallel_requests)
+        stopped = threading.Event()
+
+        def put(item) -> bool:
+            while not stopped.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(source: int, body: ClientListObjectsRequest):
+            if stopped.is_set():
+                return
+
+            stream = self.streamed_list_objects(body, options)
+            try:
+                for response in stream:
+                    if not put((source, response.object)):
+                        return
+            except Exception as err:
+                put((source, err))
+                return
+            finally:
+                stream.close()
+
+            put((source, None))
+
+        # The requests run on the client's executor, which bounds the threads left behind by stopped iterations
+        executor = self._get_executor()
+        remaining = iter(enumerate(bodies))
+        futures = []
+
+        def submit_next() -> int:
+            for source, body in itertools.islice(remaining, 1):
+                futures.append(
+                    executor.submit(
+                        contextvars.copy_context().run, produce, source, body
+                    )
+                )
+                return 1
+            return 0
+
+        running = 0
+        try:
+            for _ in range(max(1, max_parallel_requests)):
+                running += submit_next()
+
+            while running:
+                source, item = results.get()
+                if item is None:
+                    running -= 1
+                    running += submit_next()
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                if deduplicate:
+                    if item in seen:
+                        continue
+                    seen.add(item)
+
+                yield ClientStreamedListObjectsFanOutResponse(
+                    item, source, bodies[source]
+                )
+        finally:
+            stopped.set()
+            # A producer blocked on a slow stream only sees the stop on its next object, so do not wait for it
+            for future in futures:
+                future.cancel()
+
+    @traced
     def list_relations(
         self,
         body: ClientListRelationsRequest,
@@ -976,6 +2004,9 @@ class OpenFgaClient:
         Return all the relations for which user has a relationship with the object
         :param body - list relation request
         :param authorization_model_id(options) - Overrides the authorization model id in the configuration
+        :param max_parallel_requests(options) - Max number of requests to issue in parallel. Defaults to 10
+        :param max_batch_size(options) - Max number of checks to include in a request. Defaults to 50
+        :param timeout_budget(options) - Seconds the whole operation may take. Requests that cannot complete in time are not sent nor retried, and fail with FgaDeadlineExceededException
         :param header(options) - Custom headers to send alongside the request
         :param retryParams(options) - Override the retry parameters for this request
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
@@ -983,6 +2014,7 @@ class OpenFgaClient:
         :param consistency(options) - The type of consistency preferred for the request
         """
         options = set_heading_if_not_set(options, CLIENT_METHOD_HEADER, "ListRelations")
+        options = set_deadline_if_not_set(options)
         options = set_heading_if_not_set(
             options, CLIENT_BULK_REQUEST_ID_HEADER, str(uuid.uuid4())
         )
@@ -1003,6 +2035,17 @@ class OpenFgaClient:
         errored_result_iterator = filter(_check_errored, result)
         errored_result_list = list(errored_result_iterator)
         if len(errored_result_list) > 0:
+            if all(
+                isinstance(i.error, FgaDeadlineExceededException)
+                for i in errored_result_list
+            ):
+                # Only the deadline failed the checks: hand over the relations confirmed in time
+                raise FgaDeadlineExceededException(
+                    str(errored_result_list[0].error),
+                    partial_result=[
+                        i.request.relation for i in filter(_check_allowed, result)
+                    ],
+                )
             raise errored_result_list[0].error
 
         # need to filter with the allowed response
@@ -1010,6 +2053,7 @@ class OpenFgaClient:
         result_list = list(result_iterator)
         return [i.request.relation for i in result_list]
 
+    @traced
     def list_users(
         self,
         body: ClientListUsersRequest,
@@ -1025,7 +2069,7 @@ class OpenFgaClient:
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         :param consistency(options) - The type of consistency preferred for the request
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
 
         req_body = ListUsersRequest(
             authorization_model_id=self._get_authorization_model_id(options),
@@ -1047,6 +2091,7 @@ class OpenFgaClient:
     #######################
     # Assertions
     #######################
+    @traced
     def read_assertions(
         self, options: dict[str, int | str | dict[str, int | str]] | None = None
     ):
@@ -1059,11 +2104,12 @@ class OpenFgaClient:
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
 
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         authorization_model_id = self._get_authorization_model_id(options)
         api_response = self._api.read_assertions(authorization_model_id, **kwargs)
         return api_response
 
+    @traced
     def write_assertions(
         self,
         body: list[ClientAssertion],
@@ -1078,7 +2124,7 @@ class OpenFgaClient:
         :param retryParams.maxRetry(options) - Override the max number of retries on each API request
         :param retryParams.minWaitInMs(options) - Override the minimum wait before a retry is initiated
         """
-        kwargs = options_to_kwargs(options)
+        kwargs = self._options_to_kwargs(options)
         authorization_model_id = self._get_authorization_model_id(options)
 
         def map_to_assertion(client_assertion: ClientAssertion) -> Assertion:
@@ -1102,6 +2148,7 @@ class OpenFgaClient:
     #######################
     # Execute API Request
     #######################
+    @traced
     def execute_api_request(
         self,
         *,
@@ -1139,7 +2186,7 @@ class OpenFgaClient:
             body=body,
             query_params=query_params,
             headers=headers,
-            options=options,
+            options=self._raw_request_options(options),
         )
 
     def execute_streamed_api_request(
@@ -1170,5 +2217,5 @@ class OpenFgaClient:
             body=body,
             query_params=query_params,
             headers=headers,
-            options=options,
+            options=self._raw_request_options(options),
         )
@@ -0,0 +1,6 @@
+from openfga_sdk.sync.local.replica import TupleReplica
+
+
+__all__ = [
+    "TupleReplica",
+]
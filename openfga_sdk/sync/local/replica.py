@@ -0,0 +1,218 @@
+import logging
+import threading
+import time
+
+from openfga_sdk.client.models.read_changes_request import ClientReadChangesRequest
+from openfga_sdk.local.tuple_store import LocalTupleStore
+from openfga_sdk.models.read_request_tuple_key import ReadRequestTupleKey
+from openfga_sdk.models.tuple_key import TupleKey
+from openfga_sdk.sync.client.client import OpenFgaClient
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+
+
+logger = logging.getLogger(__name__)
+
+
+class TupleReplica:
+    """
+    TupleReplica is a read-only, in-process mirror of the tuples in a store.
+
+    It is bootstrapped with a paginated `read` and kept up to date by tailing `read_changes`.
+    Exact tuple lookups are then answered from memory; `staleness` reports how long ago the
+    replica was last known to match the server, so callers can decide when to trust it.
+    """
+
+    def __init__(
+        self,
+        client: OpenFgaClient,
+        type: str | None = None,
+        page_size: int = 100,
+        options: dict[str, int | str | dict[str, int | str]] | None = None,
+    ) -> None:
+        """
+        :param client - client used to read tuples and changes from the store
+        :param type - only mirror tuples whose object is of this type
+        :param page_size - number of tuples or changes to request per page
+        :param options - extra options (headers, retry_params, consistency) sent with every request
+        """
+        self._client = client
+        self._type = type
+        self._page_size = page_size
+        self._options = options or {}
+        self._store = LocalTupleStore()
+        self._changes_token: str | None = None
+        self._synced_at: float | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @property
+    def store(self) -> LocalTupleStore:
+        """
+        Return the underlying tuple store
+        """
+        return self._store
+
+    @property
+    def is_bootstrapped(self) -> bool:
+        """
+        Return whether the replica has completed its initial load
+        """
+        return self._synced_at is not None
+
+    @property
+    def staleness(self) -> float | None:
+        """
+        Return the number of seconds since the replica was last known to be up to date,
+        or None when it has not been bootstrapped yet
+        """
+        if self._synced_at is None:
+            return None
+
+        return time.monotonic() - self._synced_at
+
+    def _request_options(
+        self, continuation_token: str | None
+    ) -> dict[str, int | str | dict[str, int | str]]:
+        options = dict(self._options)
+        options["page_size"] = self._page_size
+        if continuation_token:
+            options["continuation_token"] = continuation_token
+        return options
+
+    def _record_staleness(self) -> None:
+        staleness = self.staleness
+        if staleness is None:
+            return
+
+        self._client.get_telemetry().metrics.replicaStaleness(
+            staleness * 1000,
+            attributes={
+                TelemetryAttributes.fga_client_request_store_id: self._client.get_store_id()
+            },
+            configuration=self._client.get_telemetry_configuration(),
+        )
+
+    def _changes_head(self) -> str | None:
+        """
+        Return the continuation token of the end of the changelog, None when it is empty
+        """
+        continuation_token = None
+        while True:
+            response = self._client.read_changes(
+                ClientReadChangesRequest(self._type),
+                self._request_options(continuation_token),
+            )
+            if response.continuation_token:
+                continuation_token = response.continuation_token
+            if len(response.changes or []) == 0:
+                return continuation_token
+
+    def bootstrap(self) -> None:
+        """
+        Load every matching tuple with a paginated read, then catch up on changes made while loading
+        """
+        self._store.clear()
+        self._synced_at = None
+        # The changelog is tailed from the position the server returns before the read, as the local
+        # clock may be ahead of the server's and skip the changes made while loading
+        changes_token = self._changes_head()
+
+        continuation_token = None
+        while True:
+            response = self._client.read(
+                ReadRequestTupleKey(), self._request_options(continuation_token)
+            )
+            for item in response.tuples or []:
+                if self._type is None or item.key.object.startswith(f"{self._type}:"):
+                    self._store.write(item.key)
+
+            continuation_token = response.continuation_token
+            if not continuation_token:
+                break
+
+        # Changes are applied idempotently, so replaying the ones that overlap the read is harmless
+        self._changes_token = changes_token
+        self.sync()
+
+    def sync(self) -> int:
+        """
+        Apply the changes made since the last sync and return how many were applied
+        """
+        applied = 0
+        while True:
+            requested_at = time.monotonic()
+            response = self._client.read_changes(
+                ClientReadChangesRequest(self._type),
+                self._request_options(self._changes_token),
+            )
+
+            if response.continuation_token:
+                self._changes_token = response.continuation_token
+
+            changes = response.changes or []
+            applied += self._store.apply_changes(changes, self._type)
+
+            if len(changes) == 0:
+                self._synced_at = requested_at
+                break
+
+        self._record_staleness()
+        return applied
+
+    def _poll(self, interval_in_sec: float) -> None:
+        while not self._stopped.wait(interval_in_sec):
+            try:
+                self.sync()
+            except Exception as err:
+                # Keep polling; the growing staleness signals the failure to readers
+                logger.warning("Tuple replica sync failed: %s", err)
+                self._record_staleness()
+
+    def start(self, interval_in_sec: float = 1.0) -> None:
+        """
+        Bootstrap the replica (if needed) and keep it up to date in a background thread
+        """
+        if not self.is_bootstrapped:
+            self.bootstrap()
+
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._poll, args=(interval_in_sec,), daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background sync
+        """
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def contains(self, user: str, relation: str, object: str) -> bool:
+        """
+        Return whether the exact tuple exists in the replica
+        """
+        return self._store.contains(user, relation, object)
+
+    def read(self, body: ReadRequestTupleKey | None = None) -> list[TupleKey]:
+        """
+        Return the tuples in the replica matching the filter, following the semantics of `OpenFgaClient.read`
+        """
+        if body is None:
+            return self._store.read()
+
+        return self._store.read(
+            user=body.user, relation=body.relation, object=body.object
+        )
@@ -37,6 +37,9 @@ class OpenFgaApi:
         "_headers",
         "_retry_params",
         "_streaming",
+        "_deadline",
+        "_priority",
+        "_store_id",
     ]
 
     _COMMON_ERROR_RESPONSE_TYPES = {
@@ -71,6 +74,16 @@ class OpenFgaApi:
     def close(self):
         self.api_client.close()
 
+    def _get_store_id(self, options: dict) -> str:
+        """
+        Return the store of a request: the one passed as `_store_id`, by a client viewing
+        a store, or else the one of the api_client's configuration
+        """
+        store_id = options.get("_store_id")
+        if store_id:
+            return store_id
+        return self.api_client._get_store_id()
+
     def _execute(
         self,
         method: str,
@@ -103,7 +116,8 @@ class OpenFgaApi:
 
         telemetry_attributes: dict[TelemetryAttribute, str | bool | int | float] = {
             TelemetryAttributes.fga_client_request_method: operation_name,
-            TelemetryAttributes.fga_client_request_store_id: self.api_client.get_store_id(),
+            TelemetryAttributes.fga_client_request_store_id: options.get("_store_id")
+            or self.api_client.get_store_id(),
             TelemetryAttributes.fga_client_request_model_id: options.get(
                 "authorization_model_id", ""
             ),
@@ -213,16 +227,22 @@ class OpenFgaApi:
             else None
         )
         request_timeout = options.get("_request_timeout") if options else None
+        deadline = options.get("_deadline") if options else None
+        priority = options.get("_priority") if options else None
         async_req = options.get("async_req") if options else None
 
         if telemetry_attributes is None:
             telemetry_attributes = {
                 TelemetryAttributes.fga_client_request_method: operation_name.lower(),
             }
-            if self.api_client.get_store_id():
+            # The store of a client viewing a store, else the configured one, if any
+            store_id = (options or {}).get(
+                "_store_id"
+            ) or self.api_client.get_store_id()
+            if store_id:
                 telemetry_attributes[
                     TelemetryAttributes.fga_client_request_store_id
-                ] = self.api_client.get_store_id()
+                ] = store_id
 
         if response_types_map is not None:
             merged_response_types_map = {
@@ -245,6 +265,8 @@ class OpenFgaApi:
                 _preload_content=True,
                 _request_timeout=request_timeout,
                 _retry_params=retry_params,
+                _deadline=deadline,
+                _priority=priority,
                 collection_formats={},
                 _oauth2_client=self._oauth2_client,
                 _telemetry_attributes=telemetry_attributes,
@@ -263,6 +285,8 @@ class OpenFgaApi:
             _return_http_data_only=True,
             _preload_content=True,
             _retry_params=retry_params,
+            _deadline=deadline,
+            _priority=priority,
             _oauth2_client=self._oauth2_client,
             _telemetry_attributes=telemetry_attributes,
             _streaming=False,
@@ -347,15 +371,21 @@ class OpenFgaApi:
             else None
         )
         request_timeout = options.get("_request_timeout") if options else None
+        deadline = options.get("_deadline") if options else None
+        priority = options.get("_priority") if options else None
 
         if telemetry_attributes is None:
             telemetry_attributes = {
                 TelemetryAttributes.fga_client_request_method: operation_name.lower(),
             }
-            if self.api_client.get_store_id():
+            # The store of a client viewing a store, else the configured one, if any
+            store_id = (options or {}).get(
+                "_store_id"
+            ) or self.api_client.get_store_id()
+            if store_id:
                 telemetry_attributes[
                     TelemetryAttributes.fga_client_request_store_id
-                ] = self.api_client.get_store_id()
+                ] = store_id
 
         if response_types_map is not None:
             merged_response_types_map = {
@@ -377,6 +407,8 @@ class OpenFgaApi:
             _preload_content=True,
             _request_timeout=request_timeout,
             _retry_params=retry_params,
+            _deadline=deadline,
+            _priority=priority,
             _oauth2_client=self._oauth2_client,
             _telemetry_attributes=telemetry_attributes,
             _streaming=True,
@@ -465,11 +497,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `batch_check`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `batch_check`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -562,11 +594,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `check`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `check`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -730,11 +762,11 @@ class OpenFgaApi:
             local_var_params[key] = val
         del local_var_params["kwargs"]
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `delete_store`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="DELETE",
@@ -826,11 +858,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `expand`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `expand`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -911,11 +943,11 @@ class OpenFgaApi:
             local_var_params[key] = val
         del local_var_params["kwargs"]
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `get_store`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="GET",
@@ -1007,11 +1039,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `list_objects`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `list_objects`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -1205,11 +1237,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `list_users`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `list_users`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -1302,11 +1334,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `read`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -1399,11 +1431,11 @@ class OpenFgaApi:
                 "Missing the required parameter `authorization_model_id` when calling `read_assertions`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_assertions`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         auth_model_id = urllib.parse.quote(
             str(local_var_params["authorization_model_id"]), safe=""
         )
@@ -1498,11 +1530,11 @@ class OpenFgaApi:
                 "Missing the required parameter `id` when calling `read_authorization_model`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_authorization_model`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         model_id = urllib.parse.quote(str(local_var_params["id"]), safe="")
 
         return self._execute(
@@ -1591,11 +1623,11 @@ class OpenFgaApi:
             local_var_params[key] = val
         del local_var_params["kwargs"]
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_authorization_models`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         query_params = []
         if local_var_params.get("page_size") is not None:
@@ -1700,11 +1732,11 @@ class OpenFgaApi:
             local_var_params[key] = val
         del local_var_params["kwargs"]
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `read_changes`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         query_params = []
         if local_var_params.get("type") is not None:
@@ -1809,11 +1841,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `streamed_list_objects`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `streamed_list_objects`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -1906,11 +1938,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `write`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `write`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -2017,11 +2049,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `write_assertions`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `write_assertions`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
         auth_model_id = urllib.parse.quote(
             str(local_var_params["authorization_model_id"]), safe=""
         )
@@ -2117,11 +2149,11 @@ class OpenFgaApi:
                 "Missing the required parameter `body` when calling `write_authorization_model`"
             )
 
-        if self.api_client._get_store_id() is None:
+        if self._get_store_id(local_var_params) is None:
             raise ApiValueError(
                 "Store ID expected in api_client's configuration when calling `write_authorization_model`"
             )
-        store_id = self.api_client._get_store_id()
+        store_id = self._get_store_id(local_var_params)
 
         return self._execute(
             method="POST",
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from openfga_sdk.exceptions import FgaDeadlineExceededException
+from openfga_sdk.priority import RequestPriority
+
+
+class PriorityScheduler:
+    """
+    PriorityScheduler bounds the requests in flight to the size of the connection pool,
+    keeping `reserved` connections for high priority requests:
+    low priority requests only use the leftover capacity, and wait while high priority requests are waiting.
+    """
+
+    def __init__(self, limit: int, reserved: int) -> None:
+        """
+        :param limit - the number of requests allowed in flight
+        :param reserved - how many of them only high priority requests may use
+        """
+        self._limit = limit
+        self._low_limit = limit - reserved
+        self._in_flight = 0
+        self._high_waiting = 0
+        self._condition = threading.Condition()
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        if priority == RequestPriority.HIGH:
+            return self._in_flight < self._limit
+        return self._in_flight < self._low_limit and not self._high_waiting
+
+    @contextmanager
+    def slot(
+        self, priority: RequestPriority, deadline: float | None = None
+    ) -> Iterator[None]:
+        """
+        Wait for a request of the given priority to be allowed, and hold its place while it runs
+        :param deadline - time.monotonic() by which the wait must end, raising FgaDeadlineExceededException otherwise
+        """
+        with self._condition:
+            high = priority == RequestPriority.HIGH
+            if high:
+                self._high_waiting += 1
+            try:
+                if not self._condition.wait_for(
+                    lambda: self._can_start(priority),
+                    None if deadline is None else deadline - time.monotonic(),
+                ):
+                    raise FgaDeadlineExceededException(
+                        "deadline exceeded waiting for a connection"
+                    )
+                self._in_flight += 1
+            finally:
+                if high:
+                    self._high_waiting -= 1
+                    # Low priority requests may proceed once no high priority request waits
+                    self._condition.notify_all()
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
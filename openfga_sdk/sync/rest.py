@@ -1,13 +1,18 @@
 import io
 import json
 import logging
-import ssl
+import time
 import urllib
 
 from typing import Any
 
 import urllib3
 
+from openfga_sdk.connection_pool import (
+    ConnectionPoolStats,
+    ConnectionPoolUsage,
+    create_ssl_context,
+)
 from openfga_sdk.exceptions import (
     ApiException,
     ApiValueError,
@@ -33,6 +38,9 @@ class RESTResponse(io.IOBase):
     _status: int
     _reason: str | None
 
+    # Milliseconds spent in each phase of the request, by histogram, when request phases are recorded
+    timings: dict | None = None
+
     def __init__(
         self,
         response: urllib3.HTTPResponse,
@@ -145,16 +153,7 @@ class RESTClientObject:
 
         # Reuse SSL context to mitigate OpenSSL 3.0+ performance issues
         # See: https://github.com/openssl/openssl/issues/17064
-        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
-
-        if configuration.cert_file:
-            ssl_context.load_cert_chain(
-                configuration.cert_file, keyfile=configuration.key_file
-            )
-
-        if not configuration.verify_ssl:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        ssl_context = create_ssl_context(configuration)
 
         addition_pool_args = {}
 
@@ -180,10 +179,32 @@ class RESTClientObject:
             ):
                 maxsize = configuration.connection_pool_maxsize
             else:
-                maxsize = 4
+                # Fit the threads the client sends requests from, when it has a pool of them
+                maxsize = getattr(configuration, "max_worker_threads", None) or 4
+
+        self.pool_usage = ConnectionPoolUsage(
+            maxsize,
+            "connections are opened for them and discarded afterwards",
+            self._grow_pool,
+        )
 
         self._timeout_millisec = configuration.timeout_millisec
 
+        # Imported here, as the telemetry package depends on this module
+        from openfga_sdk.telemetry.configuration import isMetricEnabled
+        from openfga_sdk.telemetry.histograms import TelemetryHistograms
+
+        self._phase_timings = any(
+            isMetricEnabled(getattr(configuration, "telemetry", None), histogram)
+            for histogram in TelemetryHistograms.getRequestPhases()
+        )
+
+        # Requests collect timings for the request phases, and the time spent serializing them
+        self._timings = self._phase_timings or isMetricEnabled(
+            getattr(configuration, "telemetry", None),
+            TelemetryHistograms.fga_client_sdk_overhead,
+        )
+
         if hasattr(configuration, "proxy") and configuration.proxy is not None:
             self.pool_manager: urllib3.ProxyManager | urllib3.PoolManager = (
                 urllib3.ProxyManager(
@@ -211,6 +232,39 @@ class RESTClientObject:
         """
         self.pool_manager.clear()
 
+    def _grow_pool(self, maxsize: int) -> bool:
+        """
+        Raises the size of the connection pools not created yet, returns False once one exists.
+        """
+        if len(self.pool_manager.pools):
+            return False
+        self.pool_manager.connection_pool_kw["maxsize"] = maxsize
+        return True
+
+    def pool_stats(self) -> ConnectionPoolStats:
+        """
+        Returns a snapshot of the connection pools, one per host, added together.
+        """
+        usage = self.pool_usage
+        waiting = usage.waiting
+        idle = created = requests = 0
+        pools = self.pool_manager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            # Empty slots of the queue are None, the others are connections waiting to be reused
+            idle += sum(1 for connection in list(pool.pool.queue) if connection)
+            created += pool.num_connections
+            requests += pool.num_requests
+        return ConnectionPoolStats(
+            active=usage.in_flight,
+            idle=idle,
+            waiting=waiting,
+            created=created,
+            reused=max(0, requests - created),
+        )
+
     def build_request(
         self,
         method: str,
@@ -232,7 +286,7 @@ class RESTClientObject:
         :param body: The request body, if any.
         :param post_params: Form or multipart parameters, if any.
         :param _preload_content: If True, response data is read immediately (by urllib3).
-        :param _request_timeout: Timeout setting, in seconds or a (connect, read) tuple.
+        :param _request_timeout: Timeout setting, in seconds or a (connect, read) tuple, or a urllib3.Timeout.
         :return: A dictionary of request arguments for urllib3.
         """
         method = method.upper()
@@ -258,6 +312,8 @@ class RESTClientObject:
             if read_t > 100:
                 read_t /= 1000
             timeout = urllib3.Timeout(connect=connect_t, read=read_t)
+        elif isinstance(timeout_val, urllib3.Timeout):
+            timeout = timeout_val
         else:
             timeout = urllib3.Timeout(total=None)  # fallback
 
@@ -405,22 +461,23 @@ class RESTClientObject:
         buffer = bytearray()
         leftover = b""
 
-        # Send request, collect response handler
-        response = self.pool_manager.request(**args)
+        with self.pool_usage.track():
+            # Send request, collect response handler
+            response = self.pool_manager.request(**args)
 
-        try:
-            # Iterate over streamed/chunked response data
-            for chunk in response.stream(1024):
-                # Process data chunk
-                leftover, decoded_objects = self._accumulate_json_lines(
-                    leftover, chunk, buffer
-                )
+            try:
+                # Iterate over streamed/chunked response data
+                for chunk in response.stream(1024):
+                    # Process data chunk
+                    leftover, decoded_objects = self._accumulate_json_lines(
+                        leftover, chunk, buffer
+                    )
 
-                # Yield any complete objects
-                yield from decoded_objects
+                    # Yield any complete objects
+                    yield from decoded_objects
 
-        except Exception as e:
-            logger.exception("Stream error: %s", e)
+            except Exception as e:
+                logger.exception("Stream error: %s", e)
 
         # Handle any remaining data after stream ends
         if response is not None:
@@ -474,6 +531,7 @@ class RESTClientObject:
         """
 
         # Build our request payload
+        build_start = time.perf_counter()
         args = self.build_request(
             method,
             url,
@@ -485,17 +543,49 @@ class RESTClientObject:
             _request_timeout=_request_timeout,
         )
 
-        # Send request, collect response handler
-        wrapped_response: RESTResponse | None = None
-        raw_response: urllib3.HTTPResponse = self.pool_manager.request(**args)
+        # Collect the time spent in each phase of the request, and building it, when they are recorded
+        timings: dict | None = None
+        if self._timings:
+            from openfga_sdk.telemetry.histograms import TelemetryHistograms
 
-        # If we want to preload the response, read it
-        if _preload_content:
-            # Collect response data and transform response (JSON) into RESTResponse object
-            wrapped_response = RESTResponse(raw_response, raw_response.data)
+            timings = {
+                TelemetryHistograms.fga_client_sdk_overhead: (
+                    time.perf_counter() - build_start
+                )
+                * 1000
+            }
 
-            # Log the response body
-            logger.debug("response body: %s", wrapped_response.data.decode("utf-8"))
+        # Send request, collect response handler
+        wrapped_response: RESTResponse | None = None
+        with self.pool_usage.track():
+            if timings is None or not self._phase_timings:
+                raw_response: urllib3.HTTPResponse = self.pool_manager.request(**args)
+            else:
+                # urllib3 has no hooks into the connection: only time to first byte and the body
+                # are told apart, by leaving the body unread until the response headers are in
+                sent = time.perf_counter()
+                raw_response = self.pool_manager.request(
+                    **{**args, "preload_content": False}
+                )
+                received = time.perf_counter()
+                timings[TelemetryHistograms.fga_client_request_time_to_first_byte] = (
+                    received - sent
+                ) * 1000
+
+            # If we want to preload the response, read it
+            if _preload_content:
+                # Collect response data and transform response (JSON) into RESTResponse object
+                wrapped_response = RESTResponse(raw_response, raw_response.data)
+
+                if timings is not None:
+                    if self._phase_timings:
+                        timings[TelemetryHistograms.fga_client_response_body_read] = (
+                            time.perf_counter() - received
+                        ) * 1000
+                    wrapped_response.timings = timings
+
+                # Log the response body
+                logger.debug("response body: %s", wrapped_response.data.decode("utf-8"))
 
         # Handle any errors that may have occurred. If an exception is raised,
         # ensure the underlying response is closed so the connection is not
@@ -1,14 +1,20 @@
-from openfga_sdk.telemetry.attributes import TelemetryAttribute, TelemetryAttributes
-from openfga_sdk.telemetry.configuration import (
-    TelemetryConfiguration,
-    TelemetryConfigurations,
-    TelemetryConfigurationType,
-    TelemetryMetricConfiguration,
-    TelemetryMetricsConfiguration,
-)
-from openfga_sdk.telemetry.histograms import TelemetryHistogram, TelemetryHistograms
-from openfga_sdk.telemetry.metrics import TelemetryMetrics
-from openfga_sdk.telemetry.telemetry import Telemetry
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from openfga_sdk.telemetry.attributes import TelemetryAttribute, TelemetryAttributes
+    from openfga_sdk.telemetry.configuration import (
+        TelemetryConfiguration,
+        TelemetryConfigurations,
+        TelemetryConfigurationType,
+        TelemetryMetricConfiguration,
+        TelemetryMetricsConfiguration,
+    )
+    from openfga_sdk.telemetry.gauges import TelemetryGauge, TelemetryGauges
+    from openfga_sdk.telemetry.histograms import TelemetryHistogram, TelemetryHistograms
+    from openfga_sdk.telemetry.metrics import TelemetryMetrics
+    from openfga_sdk.telemetry.telemetry import Telemetry
+    from openfga_sdk.telemetry.tracing import TelemetryTracing
 
 
 __all__ = [
@@ -20,7 +26,43 @@ __all__ = [
     "TelemetryConfigurationType",
     "TelemetryMetricConfiguration",
     "TelemetryMetricsConfiguration",
+    "TelemetryGauge",
+    "TelemetryGauges",
     "TelemetryHistogram",
     "TelemetryHistograms",
     "TelemetryMetrics",
+    "TelemetryTracing",
 ]
+
+# The module defining each export, imported on first access (PEP 562):
+# the configuration and attributes are needed by every client, opentelemetry only once telemetry is recorded.
+_exports: dict[str, str] = {
+    "Telemetry": "openfga_sdk.telemetry.telemetry",
+    "TelemetryAttribute": "openfga_sdk.telemetry.attributes",
+    "TelemetryAttributes": "openfga_sdk.telemetry.attributes",
+    "TelemetryConfiguration": "openfga_sdk.telemetry.configuration",
+    "TelemetryConfigurations": "openfga_sdk.telemetry.configuration",
+    "TelemetryConfigurationType": "openfga_sdk.telemetry.configuration",
+    "TelemetryMetricConfiguration": "openfga_sdk.telemetry.configuration",
+    "TelemetryMetricsConfiguration": "openfga_sdk.telemetry.configuration",
+    "TelemetryGauge": "openfga_sdk.telemetry.gauges",
+    "TelemetryGauges": "openfga_sdk.telemetry.gauges",
+    "TelemetryHistogram": "openfga_sdk.telemetry.histograms",
+    "TelemetryHistograms": "openfga_sdk.telemetry.histograms",
+    "TelemetryMetrics": "openfga_sdk.telemetry.metrics",
+    "TelemetryTracing": "openfga_sdk.telemetry.tracing",
+}
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(__import__(module, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_exports})
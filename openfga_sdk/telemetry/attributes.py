@@ -1,14 +1,27 @@
 import time
-import urllib
+import urllib.parse
 
-from typing import Any, NamedTuple
-
-from aiohttp import ClientResponse
-from urllib3 import HTTPResponse
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from openfga_sdk.credentials import Credentials
 from openfga_sdk.exceptions import ApiException
-from openfga_sdk.rest import RESTResponse
+
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse
+    from urllib3 import HTTPResponse
+
+    from openfga_sdk.rest import RESTResponse
+
+
+@lru_cache(maxsize=1024)
+def _parseUrl(url: str) -> tuple[str | None, str]:
+    """
+    Return the host and scheme of a URL. A client only sends requests to a handful of URLs, so they are parsed once.
+    """
+    parsed_url = urllib.parse.urlparse(url)
+    return parsed_url.hostname, parsed_url.scheme
 
 
 class TelemetryAttribute(NamedTuple):
@@ -17,6 +30,9 @@ class TelemetryAttribute(NamedTuple):
 
 
 class TelemetryAttributes:
+    fga_client_filter_strategy: TelemetryAttribute = TelemetryAttribute(
+        name="fga-client.filter.strategy",
+    )
     fga_client_request_batch_check_size: TelemetryAttribute = TelemetryAttribute(
         name="fga-client.request.batch_check_size", format="int"
     )
@@ -71,6 +87,7 @@ class TelemetryAttributes:
     )
 
     _attributes: list[TelemetryAttribute] = [
+        fga_client_filter_strategy,
         fga_client_request_batch_check_size,
         fga_client_request_client_id,
         fga_client_request_method,
@@ -241,9 +258,7 @@ class TelemetryAttributes:
             _attributes[TelemetryAttributes.http_request_method] = http_method
 
         if url is not None:
-            _parsed_url = urllib.parse.urlparse(url)
-            _hostname = _parsed_url.hostname
-            _scheme = _parsed_url.scheme
+            _hostname, _scheme = _parseUrl(url)
 
             if type(_hostname) is str:
                 _attributes[TelemetryAttributes.http_host] = _hostname
@@ -272,7 +287,7 @@ class TelemetryAttributes:
     @staticmethod
     def fromResponse(
         response: (
-            HTTPResponse | RESTResponse | ClientResponse | ApiException | None
+            "HTTPResponse | RESTResponse | ClientResponse | ApiException | None"
         ) = None,
         credentials: Credentials | None = None,
         attributes: dict[TelemetryAttribute, str | bool | int | float] | None = None,
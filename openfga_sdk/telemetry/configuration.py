@@ -2,6 +2,7 @@ from typing import NamedTuple, Protocol, runtime_checkable
 
 from openfga_sdk.telemetry.attributes import TelemetryAttribute, TelemetryAttributes
 from openfga_sdk.telemetry.counters import TelemetryCounter, TelemetryCounters
+from openfga_sdk.telemetry.gauges import TelemetryGauge, TelemetryGauges
 from openfga_sdk.telemetry.histograms import TelemetryHistogram, TelemetryHistograms
 
 
@@ -13,6 +14,8 @@ class TelemetryMetricConfiguration:
 
     _state: dict[TelemetryAttribute, bool] = {}
     _valid: bool | None = None
+    # Incremented on every change, so the metrics configuration holding this one can tell its resolved attributes are stale
+    _version: int = 0
 
     def __init__(
         self,
@@ -33,6 +36,7 @@ class TelemetryMetricConfiguration:
         url_full: bool | None = None,
         user_agent_original: bool | None = None,
         fga_client_request_batch_check_size: bool | None = None,
+        fga_client_filter_strategy: bool | None = None,
     ):
         """
         Initialize a new instance of the `TelemetryMetricConfiguration` class.
@@ -54,6 +58,7 @@ class TelemetryMetricConfiguration:
         :param url_full: The `url.full` attribute includes the full URL of the request.
         :param user_agent_original: The `user_agent.original` attribute includes the original user agent string of the request.
         :param fga_client_request_batch_check_size: The `fga-client.request.batch_check_size` attribute includes the size of the `checks` list in a `BatchCheck` request.
+        :param fga_client_filter_strategy: The `fga-client.filter.strategy` attribute includes the strategy `filter_allowed` used to filter the candidates.
         """
 
         self.configure(
@@ -61,6 +66,11 @@ class TelemetryMetricConfiguration:
             clear=True,
         )
 
+        if fga_client_filter_strategy is not None:
+            self._state[TelemetryAttributes.fga_client_filter_strategy] = (
+                fga_client_filter_strategy
+            )
+
         if fga_client_request_batch_check_size is not None:
             self._state[TelemetryAttributes.fga_client_request_batch_check_size] = (
                 fga_client_request_batch_check_size
@@ -130,6 +140,28 @@ class TelemetryMetricConfiguration:
             self._state[TelemetryAttributes.user_agent_original] = user_agent_original
 
         self._valid = None  # Reset the validation state
+        self._version += 1
+
+    @property
+    def fga_client_filter_strategy(self) -> bool:
+        """
+        Get the configuration for the `fga-client.filter.strategy` attribute.
+
+        :return: The configuration for the `fga-client.filter.strategy` attribute.
+        """
+        return self._state[TelemetryAttributes.fga_client_filter_strategy]
+
+    @fga_client_filter_strategy.setter
+    def fga_client_filter_strategy(self, value: bool):
+        """
+        Set the configuration for the `fga-client.filter.strategy` attribute.
+
+        :param value: The configuration for the `fga-client.filter.strategy` attribute.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._version += 1
+        self._state[TelemetryAttributes.fga_client_filter_strategy] = value
 
     @property
     def fga_client_request_batch_check_size(self) -> bool:
@@ -148,6 +180,7 @@ class TelemetryMetricConfiguration:
         :param value: The configuration for the `fga_client_request_batch_check_size` attribute.
         """
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_request_batch_check_size] = value
 
     @property
@@ -169,6 +202,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_request_client_id] = value
 
     @property
@@ -190,6 +224,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_request_method] = value
 
     @property
@@ -211,6 +246,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_request_model_id] = value
 
     @property
@@ -232,6 +268,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_request_store_id] = value
 
     @property
@@ -253,6 +290,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_response_model_id] = value
 
     @property
@@ -274,6 +312,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.fga_client_user] = value
 
     @property
@@ -295,6 +334,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.http_client_request_duration] = value
 
     @property
@@ -316,6 +356,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.http_host] = value
 
     @property
@@ -337,6 +378,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._http_request_method = value
 
     @property
@@ -358,6 +400,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.http_request_resend_count] = value
 
     @property
@@ -379,6 +422,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.http_response_status_code] = value
 
     @property
@@ -400,6 +444,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.http_server_request_duration] = value
 
     @property
@@ -421,6 +466,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.url_scheme] = value
 
     @property
@@ -442,6 +488,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.url_full] = value
 
     @property
@@ -463,6 +510,7 @@ class TelemetryMetricConfiguration:
         """
 
         self._valid = None  # Reset the validation state
+        self._version += 1
         self._state[TelemetryAttributes.user_agent_original] = value
 
     def clear(self) -> None:
@@ -472,6 +520,7 @@ class TelemetryMetricConfiguration:
 
         # Reset the configuration to the default state
         self._state = {
+            TelemetryAttributes.fga_client_filter_strategy: False,
             TelemetryAttributes.fga_client_request_batch_check_size: False,
             TelemetryAttributes.fga_client_request_client_id: False,
             TelemetryAttributes.fga_client_request_method: False,
@@ -492,6 +541,7 @@ class TelemetryMetricConfiguration:
 
         # Reset the validation state
         self._valid = True
+        self._version += 1
 
     def configure(
         self,
@@ -538,6 +588,7 @@ class TelemetryMetricConfiguration:
 
             # Reset the validation state
             self._valid = None
+            self._version += 1
 
     def getAttributes(
         self, filter_enabled: bool | None = True
@@ -609,6 +660,7 @@ class TelemetryMetricConfiguration:
         :return: The default SDK configuration for the telemetry metric.
         """
         return {
+            TelemetryAttributes.fga_client_filter_strategy: False,
             TelemetryAttributes.fga_client_request_batch_check_size: False,
             TelemetryAttributes.fga_client_request_client_id: True,
             TelemetryAttributes.fga_client_request_method: True,
@@ -636,7 +688,7 @@ class TelemetryMetricsConfigurationProtocol(Protocol):
         self,
         config: (
             dict[
-                TelemetryHistogram | TelemetryCounter | str,
+                TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                 TelemetryMetricConfiguration
                 | dict[TelemetryAttribute | str, bool]
                 | None,
@@ -649,12 +701,13 @@ class TelemetryMetricsConfigurationProtocol(Protocol):
     def getMetrics(
         self, filter_enabled: bool = True
     ) -> dict[
-        TelemetryHistogram | TelemetryCounter,
+        TelemetryHistogram | TelemetryCounter | TelemetryGauge,
         TelemetryMetricConfiguration | dict[TelemetryAttribute | str, bool] | None,
     ]: ...
 
     def isEnabled(
-        self, metric: TelemetryCounter | TelemetryHistogram | None = None
+        self,
+        metric: TelemetryCounter | TelemetryHistogram | TelemetryGauge | None = None,
     ) -> bool: ...
 
     def isValid(self, raise_exception: bool = False) -> bool: ...
@@ -662,16 +715,24 @@ class TelemetryMetricsConfigurationProtocol(Protocol):
 
 class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
     _state: dict[
-        TelemetryHistogram | TelemetryCounter,
+        TelemetryHistogram | TelemetryCounter | TelemetryGauge,
         TelemetryMetricConfiguration | dict[TelemetryAttribute | str, bool] | None,
     ] = {}
     _valid: bool | None = None
+    _resolved: (
+        dict[
+            TelemetryHistogram | TelemetryCounter | TelemetryGauge,
+            dict[TelemetryAttribute, bool],
+        ]
+        | None
+    ) = None
+    _resolved_versions: list[tuple[TelemetryMetricConfiguration, int]] = []
 
     def __init__(
         self,
         config: (
             dict[
-                TelemetryHistogram | TelemetryCounter | str,
+                TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                 TelemetryMetricConfiguration
                 | dict[TelemetryAttribute | str, bool]
                 | None,
@@ -682,6 +743,23 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         fga_client_request_duration: TelemetryMetricConfiguration | None = None,
         fga_client_query_duration: TelemetryMetricConfiguration | None = None,
         fga_client_request: TelemetryMetricConfiguration | None = None,
+        fga_client_replica_staleness: TelemetryMetricConfiguration | None = None,
+        fga_client_filter_allowed: TelemetryMetricConfiguration | None = None,
+        fga_client_connection_pool_active: TelemetryMetricConfiguration | None = None,
+        fga_client_connection_pool_idle: TelemetryMetricConfiguration | None = None,
+        fga_client_connection_pool_waiting: TelemetryMetricConfiguration | None = None,
+        fga_client_connection_pool_created: TelemetryMetricConfiguration | None = None,
+        fga_client_connection_pool_reuse_ratio: TelemetryMetricConfiguration
+        | None = None,
+        fga_client_request_pool_wait: TelemetryMetricConfiguration | None = None,
+        fga_client_request_dns: TelemetryMetricConfiguration | None = None,
+        fga_client_request_connect: TelemetryMetricConfiguration | None = None,
+        fga_client_request_time_to_first_byte: TelemetryMetricConfiguration
+        | None = None,
+        fga_client_response_body_read: TelemetryMetricConfiguration | None = None,
+        fga_client_response_json_decode: TelemetryMetricConfiguration | None = None,
+        fga_client_response_deserialize: TelemetryMetricConfiguration | None = None,
+        fga_client_sdk_overhead: TelemetryMetricConfiguration | None = None,
     ):
         """
         Initialize a new instance of the `TelemetryMetricsConfiguration` class.
@@ -691,6 +769,21 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         :param fga_client_request_duration: The `fga-client.query.duration` histogram tracks how long requests take to complete from the client's perspective.
         :param fga_client_query_duration: The `fga-client.request.duration` histogram tracks how long requests take to process from the server's perspective.
         :param fga_client_request: The `fga-client.request` counter collects the number of requests made to the FGA server.
+        :param fga_client_replica_staleness: The `fga-client.replica.staleness` histogram tracks how far a local tuple replica lags behind the FGA server.
+        :param fga_client_filter_allowed: The `fga-client.filter_allowed` counter collects the number of `filter_allowed` calls, by the strategy used.
+        :param fga_client_connection_pool_active: The `fga-client.connection_pool.active` gauge tracks the connections of the connection pool serving a request.
+        :param fga_client_connection_pool_idle: The `fga-client.connection_pool.idle` gauge tracks the open connections of the connection pool waiting to be reused.
+        :param fga_client_connection_pool_waiting: The `fga-client.connection_pool.waiting` gauge tracks the requests in flight beyond the connections of the connection pool.
+        :param fga_client_connection_pool_created: The `fga-client.connection_pool.created` counter collects the number of connections opened by the connection pool.
+        :param fga_client_connection_pool_reuse_ratio: The `fga-client.connection_pool.reuse_ratio` gauge tracks the share of the requests sent over a connection the connection pool already had open.
+        :param fga_client_request_pool_wait: The `fga-client.request.pool_wait` histogram tracks how long requests wait for a connection of the connection pool.
+        :param fga_client_request_dns: The `fga-client.request.dns` histogram tracks how long resolving the FGA server's host takes for new connections.
+        :param fga_client_request_connect: The `fga-client.request.connect` histogram tracks how long opening new connections takes, including the TLS handshake.
+        :param fga_client_request_time_to_first_byte: The `fga-client.request.time_to_first_byte` histogram tracks how long the FGA server takes to start responding.
+        :param fga_client_response_body_read: The `fga-client.response.body_read` histogram tracks how long reading response bodies takes.
+        :param fga_client_response_json_decode: The `fga-client.response.json_decode` histogram tracks how long decoding JSON response bodies takes.
+        :param fga_client_response_deserialize: The `fga-client.response.deserialize` histogram tracks how long turning decoded responses into models takes.
+        :param fga_client_sdk_overhead: The `fga-client.sdk.overhead` histogram tracks how long requests spend within the SDK, serializing requests and deserializing responses.
         """
 
         # Instantiate with default state, and apply the incoming configuration, if one was provided
@@ -714,6 +807,81 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         if fga_client_request is not None:
             self._state[TelemetryCounters.fga_client_request] = fga_client_request
 
+        if fga_client_replica_staleness is not None:
+            self._state[TelemetryHistograms.fga_client_replica_staleness] = (
+                fga_client_replica_staleness
+            )
+
+        if fga_client_filter_allowed is not None:
+            self._state[TelemetryCounters.fga_client_filter_allowed] = (
+                fga_client_filter_allowed
+            )
+
+        if fga_client_connection_pool_active is not None:
+            self._state[TelemetryGauges.fga_client_connection_pool_active] = (
+                fga_client_connection_pool_active
+            )
+
+        if fga_client_connection_pool_idle is not None:
+            self._state[TelemetryGauges.fga_client_connection_pool_idle] = (
+                fga_client_connection_pool_idle
+            )
+
+        if fga_client_connection_pool_waiting is not None:
+            self._state[TelemetryGauges.fga_client_connection_pool_waiting] = (
+                fga_client_connection_pool_waiting
+            )
+
+        if fga_client_connection_pool_created is not None:
+            self._state[TelemetryGauges.fga_client_connection_pool_created] = (
+                fga_client_connection_pool_created
+            )
+
+        if fga_client_connection_pool_reuse_ratio is not None:
+            self._state[TelemetryGauges.fga_client_connection_pool_reuse_ratio] = (
+                fga_client_connection_pool_reuse_ratio
+            )
+
+        if fga_client_request_pool_wait is not None:
+            self._state[TelemetryHistograms.fga_client_request_pool_wait] = (
+                fga_client_request_pool_wait
+            )
+
+        if fga_client_request_dns is not None:
+            self._state[TelemetryHistograms.fga_client_request_dns] = (
+                fga_client_request_dns
+            )
+
+        if fga_client_request_connect is not None:
+            self._state[TelemetryHistograms.fga_client_request_connect] = (
+                fga_client_request_connect
+            )
+
+        if fga_client_request_time_to_first_byte is not None:
+            self._state[TelemetryHistograms.fga_client_request_time_to_first_byte] = (
+                fga_client_request_time_to_first_byte
+            )
+
+        if fga_client_response_body_read is not None:
+            self._state[TelemetryHistograms.fga_client_response_body_read] = (
+                fga_client_response_body_read
+            )
+
+        if fga_client_response_json_decode is not None:
+            self._state[TelemetryHistograms.fga_client_response_json_decode] = (
+                fga_client_response_json_decode
+            )
+
+        if fga_client_response_deserialize is not None:
+            self._state[TelemetryHistograms.fga_client_response_deserialize] = (
+                fga_client_response_deserialize
+            )
+
+        if fga_client_sdk_overhead is not None:
+            self._state[TelemetryHistograms.fga_client_sdk_overhead] = (
+                fga_client_sdk_overhead
+            )
+
         # Reset the validation state
         self._valid = None
 
@@ -819,6 +987,401 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         self._valid = None  # Reset the validation state
         self._state[TelemetryHistograms.fga_client_query_duration] = value
 
+    @property
+    def fga_client_replica_staleness(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.replica.staleness` histogram.
+
+        :return: The configuration for the `fga-client.replica.staleness` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_replica_staleness]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_replica_staleness.setter
+    def fga_client_replica_staleness(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.replica.staleness` histogram.
+
+        :param value: The configuration for the `fga-client.replica.staleness` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_replica_staleness] = value
+
+    @property
+    def fga_client_filter_allowed(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.filter_allowed` counter.
+
+        :return: The configuration for the `fga-client.filter_allowed` counter.
+        """
+        state = self._state[TelemetryCounters.fga_client_filter_allowed]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_filter_allowed.setter
+    def fga_client_filter_allowed(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.filter_allowed` counter.
+
+        :param value: The configuration for the `fga-client.filter_allowed` counter.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryCounters.fga_client_filter_allowed] = value
+
+    @property
+    def fga_client_connection_pool_active(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.connection_pool.active` gauge.
+
+        :return: The configuration for the `fga-client.connection_pool.active` gauge.
+        """
+        state = self._state[TelemetryGauges.fga_client_connection_pool_active]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_connection_pool_active.setter
+    def fga_client_connection_pool_active(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.connection_pool.active` gauge.
+
+        :param value: The configuration for the `fga-client.connection_pool.active` gauge.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryGauges.fga_client_connection_pool_active] = value
+
+    @property
+    def fga_client_connection_pool_idle(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.connection_pool.idle` gauge.
+
+        :return: The configuration for the `fga-client.connection_pool.idle` gauge.
+        """
+        state = self._state[TelemetryGauges.fga_client_connection_pool_idle]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_connection_pool_idle.setter
+    def fga_client_connection_pool_idle(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.connection_pool.idle` gauge.
+
+        :param value: The configuration for the `fga-client.connection_pool.idle` gauge.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryGauges.fga_client_connection_pool_idle] = value
+
+    @property
+    def fga_client_connection_pool_waiting(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.connection_pool.waiting` gauge.
+
+        :return: The configuration for the `fga-client.connection_pool.waiting` gauge.
+        """
+        state = self._state[TelemetryGauges.fga_client_connection_pool_waiting]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_connection_pool_waiting.setter
+    def fga_client_connection_pool_waiting(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.connection_pool.waiting` gauge.
+
+        :param value: The configuration for the `fga-client.connection_pool.waiting` gauge.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryGauges.fga_client_connection_pool_waiting] = value
+
+    @property
+    def fga_client_connection_pool_created(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.connection_pool.created` counter.
+
+        :return: The configuration for the `fga-client.connection_pool.created` counter.
+        """
+        state = self._state[TelemetryGauges.fga_client_connection_pool_created]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_connection_pool_created.setter
+    def fga_client_connection_pool_created(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.connection_pool.created` counter.
+
+        :param value: The configuration for the `fga-client.connection_pool.created` counter.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryGauges.fga_client_connection_pool_created] = value
+
+    @property
+    def fga_client_connection_pool_reuse_ratio(
+        self,
+    ) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.connection_pool.reuse_ratio` gauge.
+
+        :return: The configuration for the `fga-client.connection_pool.reuse_ratio` gauge.
+        """
+        state = self._state[TelemetryGauges.fga_client_connection_pool_reuse_ratio]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_connection_pool_reuse_ratio.setter
+    def fga_client_connection_pool_reuse_ratio(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.connection_pool.reuse_ratio` gauge.
+
+        :param value: The configuration for the `fga-client.connection_pool.reuse_ratio` gauge.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryGauges.fga_client_connection_pool_reuse_ratio] = value
+
+    @property
+    def fga_client_request_pool_wait(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.request.pool_wait` histogram.
+
+        :return: The configuration for the `fga-client.request.pool_wait` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_request_pool_wait]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_request_pool_wait.setter
+    def fga_client_request_pool_wait(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.request.pool_wait` histogram.
+
+        :param value: The configuration for the `fga-client.request.pool_wait` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_request_pool_wait] = value
+
+    @property
+    def fga_client_request_dns(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.request.dns` histogram.
+
+        :return: The configuration for the `fga-client.request.dns` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_request_dns]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_request_dns.setter
+    def fga_client_request_dns(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.request.dns` histogram.
+
+        :param value: The configuration for the `fga-client.request.dns` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_request_dns] = value
+
+    @property
+    def fga_client_request_connect(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.request.connect` histogram.
+
+        :return: The configuration for the `fga-client.request.connect` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_request_connect]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_request_connect.setter
+    def fga_client_request_connect(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.request.connect` histogram.
+
+        :param value: The configuration for the `fga-client.request.connect` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_request_connect] = value
+
+    @property
+    def fga_client_request_time_to_first_byte(
+        self,
+    ) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.request.time_to_first_byte` histogram.
+
+        :return: The configuration for the `fga-client.request.time_to_first_byte` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_request_time_to_first_byte]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_request_time_to_first_byte.setter
+    def fga_client_request_time_to_first_byte(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.request.time_to_first_byte` histogram.
+
+        :param value: The configuration for the `fga-client.request.time_to_first_byte` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_request_time_to_first_byte] = value
+
+    @property
+    def fga_client_response_body_read(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.response.body_read` histogram.
+
+        :return: The configuration for the `fga-client.response.body_read` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_response_body_read]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_response_body_read.setter
+    def fga_client_response_body_read(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.response.body_read` histogram.
+
+        :param value: The configuration for the `fga-client.response.body_read` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_response_body_read] = value
+
+    @property
+    def fga_client_response_json_decode(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.response.json_decode` histogram.
+
+        :return: The configuration for the `fga-client.response.json_decode` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_response_json_decode]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_response_json_decode.setter
+    def fga_client_response_json_decode(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.response.json_decode` histogram.
+
+        :param value: The configuration for the `fga-client.response.json_decode` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_response_json_decode] = value
+
+    @property
+    def fga_client_response_deserialize(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.response.deserialize` histogram.
+
+        :return: The configuration for the `fga-client.response.deserialize` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_response_deserialize]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_response_deserialize.setter
+    def fga_client_response_deserialize(
+        self, value: TelemetryMetricConfiguration | None
+    ):
+        """
+        Set the configuration for the `fga-client.response.deserialize` histogram.
+
+        :param value: The configuration for the `fga-client.response.deserialize` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_response_deserialize] = value
+
+    @property
+    def fga_client_sdk_overhead(self) -> TelemetryMetricConfiguration | None:
+        """
+        Get the configuration for the `fga-client.sdk.overhead` histogram.
+
+        :return: The configuration for the `fga-client.sdk.overhead` histogram.
+        """
+        state = self._state[TelemetryHistograms.fga_client_sdk_overhead]
+
+        if isinstance(state, TelemetryMetricConfiguration):
+            return state
+
+        return None
+
+    @fga_client_sdk_overhead.setter
+    def fga_client_sdk_overhead(self, value: TelemetryMetricConfiguration | None):
+        """
+        Set the configuration for the `fga-client.sdk.overhead` histogram.
+
+        :param value: The configuration for the `fga-client.sdk.overhead` histogram.
+        """
+
+        self._valid = None  # Reset the validation state
+        self._state[TelemetryHistograms.fga_client_sdk_overhead] = value
+
     def clear(self) -> None:
         """
         Reset the configuration to the default state (all attributes disabled).
@@ -826,16 +1389,32 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         self._state = {
             TelemetryCounters.fga_client_request: None,
             TelemetryCounters.fga_client_credentials_request: None,
+            TelemetryCounters.fga_client_filter_allowed: None,
             TelemetryHistograms.fga_client_request_duration: None,
             TelemetryHistograms.fga_client_query_duration: None,
+            TelemetryHistograms.fga_client_replica_staleness: None,
+            TelemetryGauges.fga_client_connection_pool_active: None,
+            TelemetryGauges.fga_client_connection_pool_idle: None,
+            TelemetryGauges.fga_client_connection_pool_waiting: None,
+            TelemetryGauges.fga_client_connection_pool_created: None,
+            TelemetryGauges.fga_client_connection_pool_reuse_ratio: None,
+            TelemetryHistograms.fga_client_request_pool_wait: None,
+            TelemetryHistograms.fga_client_request_dns: None,
+            TelemetryHistograms.fga_client_request_connect: None,
+            TelemetryHistograms.fga_client_request_time_to_first_byte: None,
+            TelemetryHistograms.fga_client_response_body_read: None,
+            TelemetryHistograms.fga_client_response_json_decode: None,
+            TelemetryHistograms.fga_client_response_deserialize: None,
+            TelemetryHistograms.fga_client_sdk_overhead: None,
         }
         self._valid = True
+        self._resolved = {}
 
     def configure(
         self,
         config: (
             dict[
-                TelemetryHistogram | TelemetryCounter | str,
+                TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                 TelemetryMetricConfiguration
                 | dict[TelemetryAttribute | str, bool]
                 | None,
@@ -852,22 +1431,26 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
 
         if isinstance(config, dict):
             for metric, configuration in config.items():
-                _metric: TelemetryHistogram | TelemetryCounter | None = None
+                _metric: (
+                    TelemetryHistogram | TelemetryCounter | TelemetryGauge | None
+                ) = None
 
-                if isinstance(metric, TelemetryCounter) or isinstance(
-                    metric, TelemetryHistogram
+                if isinstance(
+                    metric, (TelemetryCounter, TelemetryHistogram, TelemetryGauge)
                 ):
                     _metric = metric
                 elif isinstance(metric, str):
-                    _metric = TelemetryCounters.get(metric) or TelemetryHistograms.get(
-                        metric
+                    _metric = (
+                        TelemetryCounters.get(metric)
+                        or TelemetryHistograms.get(metric)
+                        or TelemetryGauges.get(metric)
                     )
 
-                if not isinstance(_metric, TelemetryCounter) and not isinstance(
-                    _metric, TelemetryHistogram
+                if not isinstance(
+                    _metric, (TelemetryCounter, TelemetryHistogram, TelemetryGauge)
                 ):
                     raise ValueError(
-                        f"Invalid metric type provided in `TelemetryMetricsConfiguration`; `TelemetryHistogram` or `TelemetryCounter` was expected, but `{type(metric)}` was provided.",
+                        f"Invalid metric type provided in `TelemetryMetricsConfiguration`; `TelemetryHistogram`, `TelemetryCounter` or `TelemetryGauge` was expected, but `{type(metric)}` was provided.",
                         metric,
                     )
 
@@ -896,7 +1479,7 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
     def getMetrics(
         self, filter_enabled: bool = True
     ) -> dict[
-        TelemetryHistogram | TelemetryCounter,
+        TelemetryHistogram | TelemetryCounter | TelemetryGauge,
         TelemetryMetricConfiguration | dict[TelemetryAttribute | str, bool] | None,
     ]:
         """
@@ -920,7 +1503,8 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         return metrics
 
     def isEnabled(
-        self, metric: TelemetryCounter | TelemetryHistogram | None = None
+        self,
+        metric: TelemetryCounter | TelemetryHistogram | TelemetryGauge | None = None,
     ) -> bool:
         """
         Check if a metric is enabled for telemetry.
@@ -957,6 +1541,18 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
 
         enabled = self.getMetrics(filter_enabled=True)
 
+        # Resolve the attributes of each enabled metric, for as long as the validation state is cached
+        self._resolved = {
+            metric: configuration.getAttributes()
+            for metric, configuration in enabled.items()
+            if isinstance(configuration, TelemetryMetricConfiguration)
+        }
+        self._resolved_versions = [
+            (configuration, configuration._version)
+            for configuration in self._state.values()
+            if isinstance(configuration, TelemetryMetricConfiguration)
+        ]
+
         # Validate all sub-configurations and cache the result
         for configuration in enabled.values():
             if (
@@ -976,9 +1572,34 @@ class TelemetryMetricsConfiguration(TelemetryMetricsConfigurationProtocol):
         # Return the validation state
         return self._valid
 
+    def getEnabledMetrics(
+        self,
+    ) -> dict[
+        TelemetryHistogram | TelemetryCounter | TelemetryGauge,
+        dict[TelemetryAttribute, bool],
+    ]:
+        """
+        Returns the enabled metrics, with the attributes each of them reports.
+        They are resolved once, and again after the configuration, or the configuration of any metric, changes.
+
+        :return: The enabled attributes of each enabled metric.
+        """
+        if (
+            self._valid is None
+            or self._resolved is None
+            or any(
+                configuration._version != version
+                for configuration, version in self._resolved_versions
+            )
+        ):
+            self._valid = None
+            self.isValid()
+
+        return self._resolved or {}
+
     @staticmethod
     def getSdkDefaults() -> dict[
-        TelemetryHistogram | TelemetryCounter | str,
+        TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
         TelemetryMetricConfiguration | dict[TelemetryAttribute | str, bool] | None,
     ]:
         """
@@ -1032,7 +1653,7 @@ class TelemetryConfiguration:
                 TelemetryConfigurationType | str,
                 TelemetryMetricsConfiguration
                 | dict[
-                    TelemetryHistogram | TelemetryCounter | str,
+                    TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                     TelemetryMetricConfiguration
                     | dict[TelemetryAttribute | str, bool]
                     | None,
@@ -1095,7 +1716,7 @@ class TelemetryConfiguration:
                 TelemetryConfigurationType | str,
                 TelemetryMetricsConfiguration
                 | dict[
-                    TelemetryHistogram | TelemetryCounter | str,
+                    TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
                     TelemetryMetricConfiguration
                     | dict[TelemetryAttribute | str, bool]
                     | None,
@@ -1232,7 +1853,7 @@ class TelemetryConfiguration:
         TelemetryConfigurationType | str,
         TelemetryMetricsConfiguration
         | dict[
-            TelemetryHistogram | TelemetryCounter | str,
+            TelemetryHistogram | TelemetryCounter | TelemetryGauge | str,
             TelemetryMetricConfiguration | dict[TelemetryAttribute | str, bool] | None,
         ]
         | None,
@@ -1247,18 +1868,27 @@ class TelemetryConfiguration:
         }
 
 
+def getMetricAttributes(
+    config: TelemetryConfiguration | TelemetryMetricsConfiguration | None,
+    metric: TelemetryCounter | TelemetryHistogram | TelemetryGauge,
+) -> dict[TelemetryAttribute, bool] | None:
+    """
+    Return the attributes a particular metric reports, or None if it is not enabled for telemetry collection.
+    """
+    if isinstance(config, TelemetryConfiguration):
+        config = config.metrics
+
+    if isinstance(config, TelemetryMetricsConfiguration):
+        return config.getEnabledMetrics().get(metric)
+
+    return None
+
+
 def isMetricEnabled(
     config: TelemetryConfiguration | TelemetryMetricsConfiguration | None,
-    metric: TelemetryCounter | TelemetryHistogram,
+    metric: TelemetryCounter | TelemetryHistogram | TelemetryGauge,
 ) -> bool:
     """
     Check if a particular metric is enabled for telemetry collection.
     """
-    if config is not None and metric is not None:
-        if isinstance(config, TelemetryConfiguration):
-            config = config.metrics
-
-        if isinstance(config, TelemetryMetricsConfiguration):
-            return config.isEnabled(metric)
-
-    return False
+    return getMetricAttributes(config, metric) is not None
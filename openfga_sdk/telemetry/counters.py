@@ -13,6 +13,11 @@ class TelemetryCounters:
         description="Total number of new token requests initiated using the Client Credentials flow.",
     )
 
+    fga_client_filter_allowed: TelemetryCounter = TelemetryCounter(
+        name="fga-client.filter_allowed",
+        description="Total number of filter_allowed calls, by the strategy used to filter the candidates.",
+    )
+
     fga_client_request: TelemetryCounter = TelemetryCounter(
         name="fga-client.request",
         description="Total number of requests made to the FGA server.",
@@ -20,6 +25,7 @@ class TelemetryCounters:
 
     _counters: list[TelemetryCounter] = [
         fga_client_credentials_request,
+        fga_client_filter_allowed,
         fga_client_request,
     ]
 
@@ -0,0 +1,55 @@
+from typing import NamedTuple
+
+
+class TelemetryGauge(NamedTuple):
+    name: str
+    description: str
+    unit: str = ""
+    # Reported as an observable counter, as it only ever grows
+    monotonic: bool = False
+
+
+class TelemetryGauges:
+    fga_client_connection_pool_active: TelemetryGauge = TelemetryGauge(
+        name="fga-client.connection_pool.active",
+        description="Number of connections of the connection pool serving a request.",
+    )
+    fga_client_connection_pool_idle: TelemetryGauge = TelemetryGauge(
+        name="fga-client.connection_pool.idle",
+        description="Number of open connections of the connection pool waiting to be reused.",
+    )
+    fga_client_connection_pool_waiting: TelemetryGauge = TelemetryGauge(
+        name="fga-client.connection_pool.waiting",
+        description="Number of requests in flight beyond the connections of the connection pool.",
+    )
+    fga_client_connection_pool_created: TelemetryGauge = TelemetryGauge(
+        name="fga-client.connection_pool.created",
+        description="Total number of connections opened by the connection pool.",
+        monotonic=True,
+    )
+    fga_client_connection_pool_reuse_ratio: TelemetryGauge = TelemetryGauge(
+        name="fga-client.connection_pool.reuse_ratio",
+        description="Share of the requests sent over a connection the connection pool already had open.",
+    )
+
+    _gauges: list[TelemetryGauge] = [
+        fga_client_connection_pool_active,
+        fga_client_connection_pool_idle,
+        fga_client_connection_pool_waiting,
+        fga_client_connection_pool_created,
+        fga_client_connection_pool_reuse_ratio,
+    ]
+
+    @staticmethod
+    def getAll() -> list[TelemetryGauge]:
+        return TelemetryGauges._gauges
+
+    @staticmethod
+    def get(
+        name: str | None = None,
+    ) -> TelemetryGauge | None:
+        for gauge in TelemetryGauges._gauges:
+            if gauge.name == name:
+                return gauge
+
+        return None
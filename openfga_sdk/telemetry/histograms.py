@@ -16,16 +16,70 @@ class TelemetryHistograms:
         name="fga-client.query.duration",
         description="Time taken by the FGA server to process and evaluate the request, in milliseconds.",
     )
+    fga_client_replica_staleness: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.replica.staleness",
+        description="Time since a local tuple replica was last known to be up to date with the FGA server, in milliseconds.",
+    )
+    fga_client_request_pool_wait: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.request.pool_wait",
+        description="Time a request waited for a connection of the connection pool, in milliseconds.",
+    )
+    fga_client_request_dns: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.request.dns",
+        description="Time taken to resolve the host of the FGA server for a new connection, in milliseconds.",
+    )
+    fga_client_request_connect: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.request.connect",
+        description="Time taken to open a new connection to the FGA server, including the TLS handshake, in milliseconds.",
+    )
+    fga_client_request_time_to_first_byte: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.request.time_to_first_byte",
+        description="Time from sending a request to receiving the headers of its response, in milliseconds.",
+    )
+    fga_client_response_body_read: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.response.body_read",
+        description="Time taken to read the body of a response, in milliseconds.",
+    )
+    fga_client_response_json_decode: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.response.json_decode",
+        description="Time taken to decode the JSON body of a response, in milliseconds.",
+    )
+    fga_client_response_deserialize: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.response.deserialize",
+        description="Time taken to turn the decoded body of a response into models, in milliseconds.",
+    )
+    fga_client_sdk_overhead: TelemetryHistogram = TelemetryHistogram(
+        name="fga-client.sdk.overhead",
+        description="Time spent within the SDK serializing a request, preparing its telemetry attributes, and decoding and deserializing its response, in milliseconds.",
+    )
+
+    # The phases a request is broken down into, in the order they happen
+    _request_phases: list[TelemetryHistogram] = [
+        fga_client_request_pool_wait,
+        fga_client_request_dns,
+        fga_client_request_connect,
+        fga_client_request_time_to_first_byte,
+        fga_client_response_body_read,
+        fga_client_response_json_decode,
+        fga_client_response_deserialize,
+    ]
 
     _histograms: list[TelemetryHistogram] = [
         fga_client_request_duration,
         fga_client_query_duration,
+        fga_client_replica_staleness,
+        *_request_phases,
+        fga_client_sdk_overhead,
     ]
 
     @staticmethod
     def getAll() -> list[TelemetryHistogram]:
         return TelemetryHistograms._histograms
 
+    @staticmethod
+    def getRequestPhases() -> list[TelemetryHistogram]:
+        return TelemetryHistograms._request_phases
+
     @staticmethod
     def get(
         name: str | None = None,
@@ -1,33 +1,118 @@
-from opentelemetry.metrics import Counter, Histogram, Meter, get_meter
+import weakref
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
+
+from opentelemetry.metrics import (
+    CallbackOptions,
+    Counter,
+    Histogram,
+    Meter,
+    NoOpMeterProvider,
+    ObservableCounter,
+    ObservableGauge,
+    Observation,
+    get_meter,
+    get_meter_provider,
+)
 
+from openfga_sdk.connection_pool import ConnectionPoolStats
 from openfga_sdk.telemetry.attributes import (
     TelemetryAttribute,
     TelemetryAttributes,
 )
 from openfga_sdk.telemetry.configuration import (
     TelemetryConfiguration,
-    TelemetryMetricConfiguration,
     TelemetryMetricsConfiguration,
-    isMetricEnabled,
+    getMetricAttributes,
 )
 from openfga_sdk.telemetry.counters import TelemetryCounter, TelemetryCounters
+from openfga_sdk.telemetry.gauges import TelemetryGauge, TelemetryGauges
 from openfga_sdk.telemetry.histograms import TelemetryHistogram, TelemetryHistograms
 
 
+try:
+    # The provider the API hands out until one is set, which drops measurements until then
+    from opentelemetry.metrics._internal import _ProxyMeterProvider
+
+    _unset_meter_providers: tuple[type, ...] = (NoOpMeterProvider, _ProxyMeterProvider)
+except ImportError:  # pragma: no cover
+    _unset_meter_providers = (NoOpMeterProvider,)
+
+
+def isMeterProviderSet() -> bool:
+    """
+    Check if an OpenTelemetry MeterProvider was set, without which no measurement is recorded.
+    """
+    return not isinstance(get_meter_provider(), _unset_meter_providers)
+
+
+_connection_pool_values: dict[str, Callable[[ConnectionPoolStats], float | None]] = {
+    TelemetryGauges.fga_client_connection_pool_active.name: lambda stats: stats.active,
+    TelemetryGauges.fga_client_connection_pool_idle.name: lambda stats: stats.idle,
+    TelemetryGauges.fga_client_connection_pool_waiting.name: lambda stats: (
+        stats.waiting
+    ),
+    TelemetryGauges.fga_client_connection_pool_created.name: lambda stats: (
+        stats.created
+    ),
+    TelemetryGauges.fga_client_connection_pool_reuse_ratio.name: lambda stats: (
+        stats.reuse_ratio
+    ),
+}
+
+# The connection pools each gauge reports, with their attributes.
+# The meter keeps a single instrument per name, so the pools are shared by every TelemetryMetrics.
+_observed_pools: dict[str, weakref.WeakKeyDictionary] = {}
+
+
+def _observe_connection_pools(
+    gauge: TelemetryGauge, options: CallbackOptions
+) -> Iterable[Observation]:
+    value = _connection_pool_values[gauge.name]
+
+    for pool, attributes in list(_observed_pools.get(gauge.name, {}).items()):
+        observed = value(pool.pool_stats())
+
+        if observed is not None:
+            yield Observation(observed, attributes)
+
+
 class TelemetryMetrics:
     _meter: Meter | None = None
     _histograms: dict[str, Histogram] = {}
     _counters: dict[str, Counter] = {}
+    _gauges: dict[str, ObservableGauge | ObservableCounter] = {}
 
     def __init__(
         self,
         meter: Meter | None = None,
         counters: dict[str, Counter] | None = None,
         histograms: dict[str, Histogram] | None = None,
+        gauges: dict[str, ObservableGauge | ObservableCounter] | None = None,
     ):
         self._meter = meter
+        self._meter_provided = meter is not None
         self._counters = counters or {}
         self._histograms = histograms or {}
+        self._gauges = gauges or {}
+
+    def isRecording(self, configuration: TelemetryConfiguration | None = None) -> bool:
+        """
+        Check if measurements will be recorded: a metric is enabled, and there is a meter to record it.
+        Callers skip building the attributes of a measurement when they will not be.
+        """
+        if isinstance(configuration, TelemetryConfiguration):
+            configuration = configuration.metrics
+
+        if (
+            not isinstance(configuration, TelemetryMetricsConfiguration)
+            or not configuration.getEnabledMetrics()
+        ):
+            return False
+
+        return self._meter_provided or isMeterProviderSet()
 
     def meter(self) -> Meter:
         if self._meter is None:
@@ -63,6 +148,53 @@ class TelemetryMetrics:
 
         return self._histograms[histogram.name]
 
+    def gauge(self, gauge: TelemetryGauge) -> ObservableGauge | ObservableCounter:
+        if not isinstance(gauge, TelemetryGauge):
+            raise ValueError(
+                "gauge must be a TelemetryGauge, or a string that is a key in TelemetryGauges"
+            )
+
+        if gauge.name not in self._gauges:
+            create = (
+                self.meter().create_observable_counter
+                if gauge.monotonic
+                else self.meter().create_observable_gauge
+            )
+            self._gauges[gauge.name] = create(
+                name=gauge.name,
+                callbacks=[partial(_observe_connection_pools, gauge)],
+                unit=gauge.unit,
+                description=gauge.description,
+            )
+
+        return self._gauges[gauge.name]
+
+    def connectionPool(
+        self,
+        pool: Any,
+        attributes: dict[TelemetryAttribute, str | bool | int | float] | None = None,
+        configuration: TelemetryConfiguration | None = None,
+    ) -> None:
+        """
+        Report the connections of a pool, an object with a `pool_stats()` method, through the connection pool gauges.
+        The gauges are only created, and the pool only observed, when they are enabled.
+        """
+        for gauge in TelemetryGauges.getAll():
+            attribute_filters = getMetricAttributes(configuration, gauge)
+
+            if attribute_filters is None:
+                continue
+
+            prepared_attributes = TelemetryAttributes.prepare(
+                attributes,
+                filter=attribute_filters,
+            )
+
+            self.gauge(gauge)
+            _observed_pools.setdefault(gauge.name, weakref.WeakKeyDictionary())[
+                pool
+            ] = prepared_attributes
+
     def request(
         self,
         value: int = 1,
@@ -74,21 +206,11 @@ class TelemetryMetrics:
         """
         counter = self.counter(TelemetryCounters.fga_client_request)
 
-        if isMetricEnabled(configuration, TelemetryCounters.fga_client_request):
-            attribute_filters = None
-
-            if (
-                isinstance(configuration, TelemetryConfiguration)
-                and isinstance(configuration.metrics, TelemetryMetricsConfiguration)
-                and isinstance(
-                    configuration.metrics.fga_client_request,
-                    TelemetryMetricConfiguration,
-                )
-            ):
-                attribute_filters = (
-                    configuration.metrics.fga_client_request.getAttributes()
-                )
+        attribute_filters = getMetricAttributes(
+            configuration, TelemetryCounters.fga_client_request
+        )
 
+        if attribute_filters is not None:
             prepared_attributes = TelemetryAttributes.prepare(
                 attributes,
                 filter=attribute_filters,
@@ -109,23 +231,36 @@ class TelemetryMetrics:
         """
         counter = self.counter(TelemetryCounters.fga_client_credentials_request)
 
-        if isMetricEnabled(
+        attribute_filters = getMetricAttributes(
             configuration, TelemetryCounters.fga_client_credentials_request
-        ):
-            attribute_filters = None
-
-            if (
-                isinstance(configuration, TelemetryConfiguration)
-                and isinstance(configuration.metrics, TelemetryMetricsConfiguration)
-                and isinstance(
-                    configuration.metrics.fga_client_credentials_request,
-                    TelemetryMetricConfiguration,
-                )
-            ):
-                attribute_filters = (
-                    configuration.metrics.fga_client_credentials_request.getAttributes()
-                )
+        )
 
+        if attribute_filters is not None:
+            prepared_attributes = TelemetryAttributes.prepare(
+                attributes,
+                filter=attribute_filters,
+            )
+
+            counter.add(amount=value, attributes=prepared_attributes)  # type: ignore[arg-type]
+
+        return counter
+
+    def filterAllowed(
+        self,
+        value: int = 1,
+        attributes: dict[TelemetryAttribute, str | bool | int | float] | None = None,
+        configuration: TelemetryConfiguration | None = None,
+    ) -> Counter:
+        """
+        Record a filter_allowed call made by the client.
+        """
+        counter = self.counter(TelemetryCounters.fga_client_filter_allowed)
+
+        attribute_filters = getMetricAttributes(
+            configuration, TelemetryCounters.fga_client_filter_allowed
+        )
+
+        if attribute_filters is not None:
             prepared_attributes = TelemetryAttributes.prepare(
                 attributes,
                 filter=attribute_filters,
@@ -149,9 +284,11 @@ class TelemetryMetrics:
             attributes or {}
         )
 
-        if isMetricEnabled(
+        attribute_filters = getMetricAttributes(
             configuration, TelemetryHistograms.fga_client_request_duration
-        ):
+        )
+
+        if attribute_filters is not None:
             coalesced_value = TelemetryAttributes.coalesceAttributeValue(
                 TelemetryAttributes.http_client_request_duration,
                 value,
@@ -163,18 +300,6 @@ class TelemetryMetrics:
                     value
                 ) = coalesced_value
 
-                attribute_filters = None
-
-                if (
-                    isinstance(configuration, TelemetryConfiguration)
-                    and isinstance(configuration.metrics, TelemetryMetricsConfiguration)
-                    and isinstance(
-                        configuration.metrics.fga_client_request_duration,
-                        TelemetryMetricConfiguration,
-                    )
-                ):
-                    attribute_filters = configuration.metrics.fga_client_request_duration.getAttributes()
-
                 prepared_attributes = TelemetryAttributes.prepare(
                     _attributes,
                     filter=attribute_filters,
@@ -198,9 +323,11 @@ class TelemetryMetrics:
             attributes or {}
         )
 
-        if isMetricEnabled(
+        attribute_filters = getMetricAttributes(
             configuration, TelemetryHistograms.fga_client_query_duration
-        ):
+        )
+
+        if attribute_filters is not None:
             coalesced_value = TelemetryAttributes.coalesceAttributeValue(
                 TelemetryAttributes.http_server_request_duration,
                 value,
@@ -212,20 +339,6 @@ class TelemetryMetrics:
                     value
                 ) = coalesced_value
 
-                attribute_filters = None
-
-                if (
-                    isinstance(configuration, TelemetryConfiguration)
-                    and isinstance(configuration.metrics, TelemetryMetricsConfiguration)
-                    and isinstance(
-                        configuration.metrics.fga_client_query_duration,
-                        TelemetryMetricConfiguration,
-                    )
-                ):
-                    attribute_filters = (
-                        configuration.metrics.fga_client_query_duration.getAttributes()
-                    )
-
                 prepared_attributes = TelemetryAttributes.prepare(
                     _attributes,
                     filter=attribute_filters,
@@ -234,3 +347,79 @@ class TelemetryMetrics:
                 histogram.record(amount=value, attributes=prepared_attributes)  # type: ignore[arg-type]
 
         return histogram
+
+    def replicaStaleness(
+        self,
+        value: int | float,
+        attributes: dict[TelemetryAttribute, str | bool | int | float] | None = None,
+        configuration: TelemetryConfiguration | None = None,
+    ) -> Histogram:
+        """
+        Record how far a local tuple replica lags behind the server, in milliseconds.
+        """
+        histogram = self.histogram(TelemetryHistograms.fga_client_replica_staleness)
+
+        attribute_filters = getMetricAttributes(
+            configuration, TelemetryHistograms.fga_client_replica_staleness
+        )
+
+        if attribute_filters is not None:
+            prepared_attributes = TelemetryAttributes.prepare(
+                attributes,
+                filter=attribute_filters,
+            )
+
+            histogram.record(amount=value, attributes=prepared_attributes)  # type: ignore[arg-type]
+
+        return histogram
+
+    def sdkOverhead(
+        self,
+        value: int | float,
+        attributes: dict[TelemetryAttribute, str | bool | int | float] | None = None,
+        configuration: TelemetryConfiguration | None = None,
+    ) -> Histogram:
+        """
+        Record the time a request spent within the SDK rather than on the network, in milliseconds.
+        """
+        histogram = self.histogram(TelemetryHistograms.fga_client_sdk_overhead)
+
+        attribute_filters = getMetricAttributes(
+            configuration, TelemetryHistograms.fga_client_sdk_overhead
+        )
+
+        if attribute_filters is not None:
+            prepared_attributes = TelemetryAttributes.prepare(
+                attributes,
+                filter=attribute_filters,
+            )
+
+            histogram.record(amount=value, attributes=prepared_attributes)  # type: ignore[arg-type]
+
+        return histogram
+
+    def requestPhases(
+        self,
+        timings: dict[TelemetryHistogram, int | float],
+        attributes: dict[TelemetryAttribute, str | bool | int | float] | None = None,
+        configuration: TelemetryConfiguration | None = None,
+    ) -> None:
+        """
+        Record the milliseconds a request spent in each of its phases, through the request phase histograms.
+        Phases the request did not go through, such as opening a new connection, are not recorded.
+        """
+        for histogram in TelemetryHistograms.getRequestPhases():
+            value = timings.get(histogram)
+            attribute_filters = getMetricAttributes(configuration, histogram)
+
+            if value is None or attribute_filters is None:
+                continue
+
+            prepared_attributes = TelemetryAttributes.prepare(
+                attributes,
+                filter=attribute_filters,
+            )
+
+            self.histogram(histogram).record(
+                amount=value, attributes=prepared_attributes
+            )  # type: ignore[arg-type]
@@ -1,12 +1,44 @@
-from openfga_sdk.telemetry.metrics import TelemetryMetrics
+import sys
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from openfga_sdk.telemetry.metrics import TelemetryMetrics
+    from openfga_sdk.telemetry.tracing import TelemetryTracing
+
+
+# The modules of the classes below, imported when first used rather than with the module:
+# they import opentelemetry, which programs that never record telemetry need not load.
+# Telemetry looks the classes up on the module, through __getattr__, to create them.
+_modules: dict[str, str] = {
+    "TelemetryMetrics": "openfga_sdk.telemetry.metrics",
+    "TelemetryTracing": "openfga_sdk.telemetry.tracing",
+}
+
+
+def __getattr__(name: str):
+    module = _modules.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(__import__(module, fromlist=[name]), name)
 
 
 class Telemetry:
-    _metrics: TelemetryMetrics | None = None
+    _metrics: "TelemetryMetrics | None" = None
+    _tracing: "TelemetryTracing | None" = None
 
     @property
-    def metrics(self) -> TelemetryMetrics:
+    def metrics(self) -> "TelemetryMetrics":
         if self._metrics is None:
-            self._metrics = TelemetryMetrics()
+            self._metrics = sys.modules[__name__].TelemetryMetrics()
 
         return self._metrics
+
+    @property
+    def tracing(self) -> "TelemetryTracing":
+        if self._tracing is None:
+            self._tracing = sys.modules[__name__].TelemetryTracing()
+
+        return self._tracing
@@ -0,0 +1,218 @@
+import functools
+import inspect
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from openfga_sdk.exceptions import FGA_QUERY_DURATION_MS, ApiException
+from openfga_sdk.telemetry.attributes import TelemetryAttribute, TelemetryAttributes
+
+
+# opentelemetry is imported by the functions using it, once a client call is first traced,
+# so importing the clients does not load it.
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span, Tracer
+
+# Number of items, such as checks or tuples, a client call carries
+FGA_CLIENT_REQUEST_BATCH_SIZE = "fga-client.request.batch_size"
+
+# The request attributes HTTP attempt spans report
+_attempt_attributes: list[TelemetryAttribute] = [
+    TelemetryAttributes.fga_client_request_batch_check_size,
+    TelemetryAttributes.fga_client_request_client_id,
+    TelemetryAttributes.fga_client_request_method,
+    TelemetryAttributes.fga_client_request_model_id,
+    TelemetryAttributes.fga_client_request_store_id,
+    TelemetryAttributes.http_host,
+    TelemetryAttributes.http_request_method,
+    TelemetryAttributes.http_request_resend_count,
+    TelemetryAttributes.url_scheme,
+    TelemetryAttributes.url_full,
+    TelemetryAttributes.user_agent_original,
+]
+
+
+def isTracerProviderSet() -> bool:
+    """
+    Check if an OpenTelemetry TracerProvider was set, without which no span is recorded.
+    """
+    from opentelemetry import trace
+
+    return not isinstance(
+        trace.get_tracer_provider(),
+        (trace.NoOpTracerProvider, trace.ProxyTracerProvider),
+    )
+
+
+class TelemetryTracing:
+    _tracer: "Tracer | None" = None
+
+    def __init__(self, tracer: "Tracer | None" = None):
+        self._tracer = tracer
+        self._tracer_provided = tracer is not None
+
+    def tracer(self) -> "Tracer":
+        if self._tracer is None:
+            from opentelemetry import trace
+
+            self._tracer = trace.get_tracer("openfga-sdk")
+
+        return self._tracer
+
+    def isRecording(self) -> bool:
+        """
+        Check if spans will be recorded: there is a tracer, or a TracerProvider to record them.
+        Callers skip creating spans, and propagating their context, when they will not be.
+        """
+        return self._tracer_provided or isTracerProviderSet()
+
+    @contextmanager
+    def operation(
+        self,
+        name: str,
+        attributes: dict[str, str | bool | int | float] | None = None,
+    ) -> Iterator["Span"]:
+        """
+        Record a client call as a span, current for the block so the HTTP attempts it makes are its children.
+        """
+        from opentelemetry.trace import SpanKind
+
+        with self.tracer().start_as_current_span(
+            name, kind=SpanKind.INTERNAL, attributes=attributes
+        ) as span:
+            yield span
+
+    @contextmanager
+    def attempt(
+        self,
+        http_method: str,
+        attributes: dict[TelemetryAttribute, str | bool | int | float] | None,
+        headers: dict[str, str],
+    ) -> Iterator["Span"]:
+        """
+        Record an HTTP attempt as a span, and propagate its context to the FGA server through the headers.
+        """
+        from opentelemetry import propagate
+        from opentelemetry.trace import SpanKind
+
+        with self.tracer().start_as_current_span(
+            http_method,
+            kind=SpanKind.CLIENT,
+            attributes=TelemetryAttributes.prepare(
+                attributes, filter=_attempt_attributes
+            ),
+        ) as span:
+            propagate.inject(headers)
+
+            try:
+                yield span
+            except ApiException as e:
+                if e.status is not None:
+                    span.set_attribute(
+                        TelemetryAttributes.http_response_status_code.name,
+                        int(e.status),
+                    )
+                self._setQueryDuration(
+                    span, (e.header or {}).get(FGA_QUERY_DURATION_MS)
+                )
+                raise
+
+    def recordResponse(self, span: "Span", response: Any) -> None:
+        """
+        Record the status and the server-side duration of the response to an HTTP attempt.
+        """
+        status = getattr(response, "status", None)
+        if status is not None:
+            span.set_attribute(
+                TelemetryAttributes.http_response_status_code.name, int(status)
+            )
+
+        if hasattr(response, "getheader") and callable(response.getheader):
+            self._setQueryDuration(span, response.getheader(FGA_QUERY_DURATION_MS))
+        elif hasattr(response, "headers"):
+            self._setQueryDuration(span, response.headers.get(FGA_QUERY_DURATION_MS))
+
+    def retry(self, resend_count: int, wait: float, retry_after: bool) -> None:
+        """
+        Record a retry as an event of the current span, with how long the client waits before it.
+        """
+        from opentelemetry import trace
+
+        span = trace.get_current_span()
+
+        if span.is_recording():
+            span.add_event(
+                "fga-client.retry",
+                attributes={
+                    TelemetryAttributes.http_request_resend_count.name: resend_count,
+                    "fga-client.retry.wait_ms": int(wait * 1000),
+                    "fga-client.retry.retry_after": retry_after,
+                },
+            )
+
+    @staticmethod
+    def _setQueryDuration(span: "Span", value: str | None) -> None:
+        if value is None:
+            return
+
+        try:
+            span.set_attribute(
+                TelemetryAttributes.http_server_request_duration.name, int(value)
+            )
+        except ValueError:
+            pass
+
+
+_tracing = TelemetryTracing()
+
+
+def setSpanAttributes(attributes: dict[str, str | bool | int | float]) -> None:
+    """
+    Add attributes to the span of the current client call, when it is recorded.
+    """
+    if not _tracing.isRecording():
+        return
+
+    from opentelemetry import trace
+
+    span = trace.get_current_span()
+
+    if span.is_recording():
+        span.set_attributes(attributes)
+
+
+def traced(method: Callable) -> Callable:
+    """
+    Record each call of a client method as a span named after it, the parent of the spans of its HTTP attempts.
+    Nothing is recorded when no TracerProvider was set.
+    """
+    name = method.__name__
+
+    def attributes(client: Any) -> dict[str, str | bool | int | float]:
+        store_id = client.get_store_id()
+        if store_id:
+            return {TelemetryAttributes.fga_client_request_store_id.name: store_id}
+        return {}
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            if not _tracing.isRecording():
+                return await method(self, *args, **kwargs)
+
+            with _tracing.operation(name, attributes(self)):
+                return await method(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _tracing.isRecording():
+            return method(self, *args, **kwargs)
+
+        with _tracing.operation(name, attributes(self)):
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from datetime import datetime, timedelta, timezone
@@ -15,6 +16,7 @@ from openfga_sdk.credentials import CredentialConfiguration, Credentials
 from openfga_sdk.exceptions import (
     FGA_REQUEST_ID,
     ApiValueError,
+    FgaDeadlineExceededException,
     FgaValidationException,
     NotFoundException,
     RateLimitExceededError,
@@ -80,6 +82,9 @@ from openfga_sdk.models.write_authorization_model_response import (
 from openfga_sdk.models.write_request import WriteRequest
 from openfga_sdk.models.write_request_deletes import WriteRequestDeletes
 from openfga_sdk.models.write_request_writes import WriteRequestWrites
+from openfga_sdk.priority import PriorityScheduler, RequestPriority
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.histograms import TelemetryHistograms
 
 
 store_id = "01H0H015178Y2V4CX10C2KGHF4"
@@ -166,6 +171,79 @@ class TestOpenFgaApi(IsolatedAsyncioTestCase):
             )
             await api_client.close()
 
+    @patch("openfga_sdk.telemetry.metrics.isMeterProviderSet", return_value=True)
+    @patch("openfga_sdk.telemetry.metrics.TelemetryMetrics.sdkOverhead")
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_check_sdk_overhead(
+        self, mock_request, mock_sdk_overhead, mock_meter_provider_set
+    ):
+        """Test case for check, recording the overhead of the SDK
+
+        The time the REST client spent building the request is part of the overhead
+        """
+        response = mock_response('{"allowed": true, "resolution": "1234"}', 200)
+        response.timings = {TelemetryHistograms.fga_client_sdk_overhead: 25.0}
+        mock_request.return_value = response
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        async with openfga_sdk.ApiClient(configuration) as api_client:
+            api_instance = open_fga_api.OpenFgaApi(api_client)
+            api_response = await api_instance.check(
+                body=CheckRequest(
+                    tuple_key=TupleKey(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    ),
+                ),
+            )
+            self.assertTrue(api_response.allowed)
+            mock_sdk_overhead.assert_called_once()
+            self.assertGreater(mock_sdk_overhead.call_args.args[0], 25.0)
+            self.assertEqual(
+                mock_sdk_overhead.call_args.kwargs["attributes"][
+                    TelemetryAttributes.fga_client_request_method
+                ],
+                "Check",
+            )
+            await api_client.close()
+
+    @patch("openfga_sdk.telemetry.attributes.TelemetryAttributes.fromResponse")
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_check_without_meter_provider(self, mock_request, mock_from_response):
+        """Test case for check, without a MeterProvider to record metrics
+
+        The attributes of the metrics are not built, and errors still name their operation
+        """
+        mock_request.return_value = mock_response(
+            '{"allowed": true, "resolution": "1234"}', 200
+        )
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        async with openfga_sdk.ApiClient(configuration) as api_client:
+            api_instance = open_fga_api.OpenFgaApi(api_client)
+            body = CheckRequest(
+                tuple_key=TupleKey(
+                    object="document:2021-budget",
+                    relation="reader",
+                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                ),
+            )
+            api_response = await api_instance.check(body=body)
+            self.assertTrue(api_response.allowed)
+            mock_from_response.assert_not_called()
+
+            mock_request.side_effect = NotFoundException(
+                http_resp=http_mock_response("{}", 404)
+            )
+            with self.assertRaises(NotFoundException) as api_exception:
+                await api_instance.check(body=body)
+            self.assertEqual(api_exception.exception.operation_name, "check")
+            mock_from_response.assert_not_called()
+            await api_client.close()
+
     @patch.object(rest.RESTClientObject, "request")
     async def test_create_store(self, mock_request):
         """Test case for create_store
@@ -1698,6 +1776,81 @@ class TestOpenFgaApi(IsolatedAsyncioTestCase):
             mock_request.assert_called()
             self.assertEqual(mock_request.call_count, 5)
 
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_deadline(self, mock_request):
+        """
+        Test to ensure requests are bounded by the deadline and not retried past it
+        """
+        response_body = """
+{
+  "code": "internal_error",
+  "message": "Internal Server Error"
+}
+        """
+        mock_request.side_effect = [
+            ServiceException(http_resp=http_mock_response(response_body, 500)),
+            mock_response(response_body, 200),
+        ]
+
+        retry = openfga_sdk.configuration.RetryParams(5, 1000)
+        configuration = self.configuration
+        configuration.store_id = store_id
+        configuration.retry_params = retry
+
+        async with openfga_sdk.ApiClient(configuration) as api_client:
+            api_instance = open_fga_api.OpenFgaApi(api_client)
+            body = CheckRequest(
+                tuple_key=TupleKey(
+                    object="document:2021-budget",
+                    relation="reader",
+                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                ),
+            )
+
+            # The retry would wait at least a second, past the deadline
+            with self.assertRaises(FgaDeadlineExceededException) as context:
+                await api_instance.check(
+                    body=body,
+                    _deadline=time.monotonic() + 0.5,
+                )
+            self.assertIsInstance(context.exception.__cause__, ServiceException)
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertLessEqual(
+                mock_request.call_args.kwargs["_request_timeout"],
+                0.5,
+            )
+
+            # An explicit timeout is capped to the time left as well
+            for request_timeout in (30.0, (10.0, 30.0)):
+                mock_request.side_effect = [mock_response(response_body, 200)]
+                await api_instance.check(
+                    body=body,
+                    _deadline=time.monotonic() + 0.5,
+                    _request_timeout=request_timeout,
+                )
+                timeout = mock_request.call_args.kwargs["_request_timeout"]
+                self.assertIsInstance(timeout, type(request_timeout))
+                for value in timeout if isinstance(timeout, tuple) else (timeout,):
+                    self.assertLessEqual(value, 0.5)
+            self.assertEqual(mock_request.call_count, 3)
+
+            with self.assertRaises(FgaDeadlineExceededException):
+                await api_instance.check(
+                    body=body,
+                    _deadline=time.monotonic() - 1,
+                )
+            self.assertEqual(mock_request.call_count, 3)
+
+            # Waiting for a connection counts against the deadline too
+            api_client._scheduler = PriorityScheduler(1, 0)
+            async with api_client._scheduler.slot(RequestPriority.HIGH):
+                with self.assertRaises(FgaDeadlineExceededException):
+                    await api_instance.check(
+                        body=body,
+                        _deadline=time.monotonic() + 0.05,
+                    )
+            self.assertEqual(mock_request.call_count, 3)
+
     @patch.object(rest.RESTClientObject, "request")
     async def test_501_error_retry(self, mock_request):
         """
@@ -0,0 +1,75 @@
+import threading
+
+from unittest.mock import patch
+
+from openfga_sdk.client.model_cache import AuthorizationModelCache
+from openfga_sdk.models.authorization_model import AuthorizationModel
+from openfga_sdk.models.read_authorization_model_response import (
+    ReadAuthorizationModelResponse,
+)
+
+
+def model_response(model_id):
+    return ReadAuthorizationModelResponse(
+        AuthorizationModel(id=model_id, schema_version="1.1", type_definitions=[])
+    )
+
+
+def test_latest_models_kept_for_max_size_stores():
+    cache = AuthorizationModelCache(max_size=2, latest_ttl_in_sec=60)
+    responses = {store: model_response(f"model-{store}") for store in "abc"}
+
+    cache.set_latest("a", responses["a"])
+    cache.set_latest("b", responses["b"])
+    # Reading the latest model of a store keeps it over the least recently used one
+    assert cache.get_latest("a") is responses["a"]
+    cache.set_latest("c", responses["c"])
+
+    assert cache.get_latest("a") is responses["a"]
+    assert cache.get_latest("b") is None
+    assert cache.get_latest("c") is responses["c"]
+
+    cache.invalidate_latest("a")
+    assert cache.get_latest("a") is None
+
+
+def test_latest_models_expire():
+    cache = AuthorizationModelCache(max_size=2, latest_ttl_in_sec=10)
+
+    with patch("openfga_sdk.client.model_cache.time.monotonic", return_value=100.0):
+        cache.set_latest("a", model_response("model"))
+    with patch("openfga_sdk.client.model_cache.time.monotonic", return_value=110.0):
+        assert cache.get_latest("a") is None
+    # The expired model no longer counts against the size of the cache
+    assert len(cache._latest) == 0
+
+
+def test_latest_models_not_kept_when_disabled():
+    for cache in [
+        AuthorizationModelCache(max_size=0, latest_ttl_in_sec=60),
+        AuthorizationModelCache(max_size=2, latest_ttl_in_sec=0),
+    ]:
+        cache.set_latest("a", model_response("model"))
+        assert cache.get_latest("a") is None
+
+
+def test_latest_models_set_from_threads():
+    cache = AuthorizationModelCache(max_size=8, latest_ttl_in_sec=60)
+    response = model_response("model")
+
+    def set_latest(thread):
+        for index in range(500):
+            store = f"{thread}-{index % 16}"
+            cache.set_latest(store, response)
+            cache.get_latest(store)
+            cache.invalidate_latest(f"{thread}-{(index + 8) % 16}")
+
+    threads = [
+        threading.Thread(target=set_latest, args=(thread,)) for thread in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache._latest) <= 8
@@ -0,0 +1,14 @@
+import pytest
+
+from openfga_sdk.connection_pool import _ssl_context
+
+
+@pytest.fixture(autouse=True)
+def clear_ssl_context_cache():
+    """
+    SSL contexts are shared by the clients of the process: each test starts without any,
+    so the ones created while ssl is patched do not outlive the test
+    """
+    _ssl_context.cache_clear()
+    yield
+    _ssl_context.cache_clear()
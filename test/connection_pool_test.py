@@ -0,0 +1,124 @@
+import logging
+import ssl
+
+from unittest.mock import patch
+
+from openfga_sdk.configuration import Configuration
+from openfga_sdk.connection_pool import ConnectionPoolUsage, create_ssl_context
+
+
+def test_track_counts_requests_in_flight():
+    usage = ConnectionPoolUsage(2, "requests wait")
+
+    with usage.track():
+        with usage.track():
+            assert usage.in_flight == 2
+        assert usage.in_flight == 1
+
+    assert usage.in_flight == 0
+    assert usage.peak_in_flight == 2
+    assert usage.waited == 0
+
+
+def test_track_warns_once_when_the_pool_is_busy(caplog):
+    usage = ConnectionPoolUsage(1, "requests wait")
+
+    with caplog.at_level(logging.WARNING, logger="openfga_sdk.connection_pool"):
+        with usage.track():
+            with usage.track():
+                pass
+            with usage.track():
+                pass
+
+    assert usage.waited == 2
+    assert usage.peak_in_flight == 2
+    assert len(caplog.records) == 1
+    assert "All 1 connections of the pool are busy: requests wait" in caplog.text
+
+
+def test_track_unbounded_pool():
+    usage = ConnectionPoolUsage(None, "requests wait")
+
+    with usage.track():
+        with usage.track():
+            pass
+
+    assert usage.waited == 0
+    assert usage.peak_in_flight == 2
+
+
+def test_expect_warns_once_per_parallelism(caplog):
+    usage = ConnectionPoolUsage(4, "requests wait")
+
+    with caplog.at_level(logging.WARNING, logger="openfga_sdk.connection_pool"):
+        usage.expect(4)
+        usage.expect(10)
+        usage.expect(10)
+
+    assert len(caplog.records) == 1
+    assert (
+        "max_parallel_requests (10) exceeds connection_pool_maxsize (4)" in caplog.text
+    )
+
+
+def test_expect_grows_the_pool_until_it_is_created(caplog):
+    created = False
+    sizes = []
+
+    def grow(maxsize):
+        if created:
+            return False
+        sizes.append(maxsize)
+        return True
+
+    usage = ConnectionPoolUsage(4, "requests wait", grow)
+
+    with caplog.at_level(logging.WARNING, logger="openfga_sdk.connection_pool"):
+        usage.expect(10)
+        usage.expect(6)
+        assert usage.maxsize == 10
+        assert caplog.records == []
+
+        created = True
+        usage.expect(20)
+
+    assert sizes == [10]
+    assert usage.maxsize == 10
+    assert len(caplog.records) == 1
+    assert (
+        "max_parallel_requests (20) exceeds connection_pool_maxsize (10)" in caplog.text
+    )
+
+
+def test_ssl_context_shared_by_tls_settings():
+    configuration = Configuration(api_url="https://api.fga.example")
+
+    ssl_context = create_ssl_context(configuration)
+    assert create_ssl_context(Configuration(api_url="https://other.example")) is (
+        ssl_context
+    )
+
+    configuration.verify_ssl = False
+    insecure_context = create_ssl_context(configuration)
+    assert insecure_context is not ssl_context
+    assert insecure_context.verify_mode == ssl.CERT_NONE
+    assert ssl_context.verify_mode == ssl.CERT_REQUIRED
+
+
+@patch("ssl.create_default_context")
+def test_ssl_context_created_again_when_the_ca_cert_changes(
+    mock_create_context, tmp_path
+):
+    ca_cert = tmp_path / "ca.pem"
+    ca_cert.write_text("certificate")
+    configuration = Configuration(api_url="https://api.fga.example")
+    configuration.ssl_ca_cert = str(ca_cert)
+
+    create_ssl_context(configuration)
+    create_ssl_context(configuration)
+    mock_create_context.assert_called_once_with(cafile=str(ca_cert))
+
+    # A rotated certificate is loaded again
+    ca_cert.write_text("rotated certificate")
+    create_ssl_context(configuration)
+    assert mock_create_context.call_count == 2
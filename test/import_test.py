@@ -0,0 +1,134 @@
+import subprocess
+import sys
+
+from unittest import TestCase
+
+import openfga_sdk
+import openfga_sdk.client
+import openfga_sdk.models
+import openfga_sdk.sync
+import openfga_sdk.telemetry
+
+
+def import_time(statement: str) -> dict[str, int]:
+    """
+    Run the import statement in a fresh interpreter with -X importtime,
+    and return the cumulative import time, in microseconds, of each module it loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        modules[module.strip()] = int(cumulative)
+    return modules
+
+
+class TestImportTime(TestCase):
+    """Tests for the modules loaded when importing the SDK"""
+
+    def assertNotLoaded(self, modules: dict[str, int], *packages: str):
+        loaded = [
+            module
+            for module in modules
+            if any(
+                module == package or module.startswith(package + ".")
+                for package in packages
+            )
+        ]
+        self.assertEqual(loaded, [])
+
+    def test_import_package(self):
+        modules = import_time("import openfga_sdk")
+
+        self.assertIn("openfga_sdk", modules)
+        self.assertNotLoaded(
+            modules,
+            "aiohttp",
+            "urllib3",
+            "opentelemetry",
+            "openfga_sdk.models",
+            "openfga_sdk.client",
+            "openfga_sdk.sync",
+            "openfga_sdk.api_client",
+        )
+
+    def test_import_model(self):
+        modules = import_time("from openfga_sdk.models import CheckRequest")
+
+        self.assertIn("openfga_sdk.models.check_request", modules)
+        self.assertNotIn("openfga_sdk.models.write_request", modules)
+        self.assertNotLoaded(modules, "aiohttp", "urllib3", "opentelemetry")
+
+    def test_import_client(self):
+        modules = import_time("from openfga_sdk import OpenFgaClient")
+
+        self.assertIn("openfga_sdk.client.client", modules)
+        self.assertNotLoaded(modules, "opentelemetry", "openfga_sdk.sync")
+
+    def test_import_sync_client(self):
+        modules = import_time("from openfga_sdk.sync import OpenFgaClient")
+
+        self.assertIn("openfga_sdk.sync.client.client", modules)
+        self.assertNotLoaded(
+            modules, "aiohttp", "opentelemetry", "openfga_sdk.client.client"
+        )
+
+    def test_construct_configuration(self):
+        for package in ["openfga_sdk", "openfga_sdk.client"]:
+            with self.subTest(package=package):
+                # Built before anything imports a client, which would load http.client for it
+                modules = import_time(
+                    f"from {package} import ClientConfiguration; "
+                    "ClientConfiguration(api_url='http://api.fga.example')"
+                )
+
+                self.assertIn("openfga_sdk.client.configuration", modules)
+                self.assertNotLoaded(
+                    modules, "aiohttp", "urllib3", "opentelemetry", "openfga_sdk.sync"
+                )
+
+    def test_construct_clients(self):
+        for package in ["openfga_sdk", "openfga_sdk.sync"]:
+            with self.subTest(package=package):
+                # The statement fails, and so does the test, when opentelemetry was loaded
+                modules = import_time(
+                    "import sys; "
+                    "from openfga_sdk.client import ClientConfiguration; "
+                    f"from {package} import OpenFgaClient; "
+                    "OpenFgaClient(ClientConfiguration(api_url='http://api.fga.example')); "
+                    "assert 'opentelemetry' not in sys.modules"
+                )
+
+                self.assertIn(f"{package}.client.client", modules)
+                self.assertNotLoaded(modules, "opentelemetry")
+
+
+class TestLazyExports(TestCase):
+    """Tests for the exports of the packages, imported on first access"""
+
+    def test_exports(self):
+        for package in [
+            openfga_sdk,
+            openfga_sdk.client,
+            openfga_sdk.models,
+            openfga_sdk.sync,
+            openfga_sdk.telemetry,
+        ]:
+            for name in package.__all__:
+                with self.subTest(package=package.__name__, name=name):
+                    self.assertEqual(getattr(package, name).__name__, name)
+                    self.assertIn(name, dir(package))
+
+    def test_unknown_export(self):
+        with self.assertRaises(AttributeError):
+            openfga_sdk.NotAnExport  # noqa: B018
+
+        with self.assertRaises(ImportError):
+            from openfga_sdk.models import NotAModel  # noqa: F401
@@ -0,0 +1,580 @@
+"""
+Differential tests for the local check evaluator.
+
+Every case in CASES, LIST_OBJECTS_CASES and LIST_USERS_CASES is asserted against the local evaluator. The integration test at the bottom
+replays the same cases against a running OpenFGA server, so the two can be compared whenever
+one is available (set FGA_API_URL to run it).
+"""
+
+import json
+import os
+
+from unittest import TestCase
+
+import pytest
+
+from openfga_sdk.client.models.check_request import ClientCheckRequest
+from openfga_sdk.client.models.list_objects_request import ClientListObjectsRequest
+from openfga_sdk.client.models.list_users_request import ClientListUsersRequest
+from openfga_sdk.client.models.tuple import ClientTuple
+from openfga_sdk.configuration import Configuration
+from openfga_sdk.exceptions import FgaValidationException
+from openfga_sdk.local.evaluator import LocalCheckEvaluator
+from openfga_sdk.local.tuple_store import LocalTupleStore
+from openfga_sdk.models.fga_object import FgaObject
+from openfga_sdk.models.relationship_condition import RelationshipCondition
+from openfga_sdk.models.tuple_key import TupleKey
+from openfga_sdk.models.user_type_filter import UserTypeFilter
+from openfga_sdk.sync.api_client import ApiClient
+
+
+MODEL = {
+    "schema_version": "1.1",
+    "type_definitions": [
+        {"type": "user", "relations": {}},
+        {
+            "type": "group",
+            "relations": {"member": {"this": {}}},
+            "metadata": {
+                "relations": {
+                    "member": {
+                        "directly_related_user_types": [
+                            {"type": "user"},
+                            {"type": "group", "relation": "member"},
+                        ]
+                    }
+                }
+            },
+        },
+        {
+            "type": "folder",
+            "relations": {
+                "viewer": {"this": {}},
+                "parent": {"this": {}},
+            },
+            "metadata": {
+                "relations": {
+                    "viewer": {
+                        "directly_related_user_types": [
+                            {"type": "user"},
+                            {"type": "group", "relation": "member"},
+                        ]
+                    },
+                    "parent": {"directly_related_user_types": [{"type": "folder"}]},
+                }
+            },
+        },
+        {
+            "type": "document",
+            "relations": {
+                "parent": {"this": {}},
+                "owner": {"this": {}},
+                "blocked": {"this": {}},
+                "approved": {"this": {}},
+                "editor": {
+                    "union": {
+                        "child": [
+                            {"this": {}},
+                            {"computedUserset": {"relation": "owner"}},
+                        ]
+                    }
+                },
+                "viewer": {
+                    "union": {
+                        "child": [
+                            {"this": {}},
+                            {"computedUserset": {"relation": "editor"}},
+                            {
+                                "tupleToUserset": {
+                                    "tupleset": {"relation": "parent"},
+                                    "computedUserset": {"relation": "viewer"},
+                                }
+                            },
+                        ]
+                    }
+                },
+                "can_read": {
+                    "difference": {
+                        "base": {"computedUserset": {"relation": "viewer"}},
+                        "subtract": {"computedUserset": {"relation": "blocked"}},
+                    }
+                },
+                "can_publish": {
+                    "intersection": {
+                        "child": [
+                            {"computedUserset": {"relation": "editor"}},
+                            {"computedUserset": {"relation": "approved"}},
+                        ]
+                    }
+                },
+            },
+            "metadata": {
+                "relations": {
+                    "parent": {"directly_related_user_types": [{"type": "folder"}]},
+                    "owner": {"directly_related_user_types": [{"type": "user"}]},
+                    "blocked": {"directly_related_user_types": [{"type": "user"}]},
+                    "approved": {"directly_related_user_types": [{"type": "user"}]},
+                    "editor": {"directly_related_user_types": [{"type": "user"}]},
+                    "viewer": {
+                        "directly_related_user_types": [
+                            {"type": "user"},
+                            {"type": "user", "wildcard": {}},
+                            {"type": "group", "relation": "member"},
+                        ]
+                    },
+                }
+            },
+        },
+    ],
+}
+
+TUPLES = [
+    ("user:anne", "owner", "document:roadmap"),
+    ("user:bob", "viewer", "document:roadmap"),
+    ("group:eng#member", "viewer", "document:specs"),
+    ("group:backend#member", "member", "group:eng"),
+    ("user:carl", "member", "group:backend"),
+    # Cyclic group membership
+    ("group:a#member", "member", "group:b"),
+    ("group:b#member", "member", "group:a"),
+    ("user:dana", "member", "group:a"),
+    ("folder:root", "parent", "document:budget"),
+    ("folder:top", "parent", "folder:root"),
+    ("user:erin", "viewer", "folder:root"),
+    ("user:*", "viewer", "document:public"),
+    ("user:anne", "blocked", "document:roadmap"),
+    ("user:bob", "editor", "document:roadmap"),
+    ("user:bob", "approved", "document:roadmap"),
+    ("user:anne", "approved", "document:specs"),
+]
+
+# (user, relation, object, contextual tuples, expected)
+CASES = [
+    ("user:anne", "owner", "document:roadmap", [], True),
+    ("user:anne", "editor", "document:roadmap", [], True),
+    ("user:anne", "viewer", "document:roadmap", [], True),
+    ("user:bob", "viewer", "document:roadmap", [], True),
+    ("user:bob", "owner", "document:roadmap", [], False),
+    ("user:carl", "viewer", "document:specs", [], True),
+    ("user:anne", "viewer", "document:specs", [], False),
+    ("group:backend#member", "viewer", "document:specs", [], True),
+    ("user:dana", "member", "group:b", [], True),
+    ("user:carl", "member", "group:a", [], False),
+    ("user:erin", "viewer", "document:budget", [], True),
+    ("user:erin", "viewer", "document:roadmap", [], False),
+    ("user:zoe", "viewer", "document:public", [], True),
+    ("user:anne", "can_read", "document:roadmap", [], False),
+    ("user:bob", "can_read", "document:roadmap", [], True),
+    ("user:bob", "can_publish", "document:roadmap", [], True),
+    ("user:anne", "can_publish", "document:roadmap", [], False),
+    ("user:anne", "can_publish", "document:specs", [], False),
+    (
+        "user:zoe",
+        "viewer",
+        "document:budget",
+        [("user:zoe", "viewer", "folder:root")],
+        True,
+    ),
+    (
+        "user:zoe",
+        "viewer",
+        "document:specs",
+        [("user:zoe", "member", "group:backend")],
+        True,
+    ),
+    (
+        "user:bob",
+        "can_read",
+        "document:roadmap",
+        [("user:bob", "blocked", "document:roadmap")],
+        False,
+    ),
+]
+
+# (user, relation, type, contextual tuples, expected objects)
+LIST_OBJECTS_CASES = [
+    ("user:anne", "viewer", "document", [], {"document:roadmap", "document:public"}),
+    ("user:carl", "viewer", "document", [], {"document:specs", "document:public"}),
+    ("user:erin", "viewer", "document", [], {"document:budget", "document:public"}),
+    ("user:anne", "can_read", "document", [], {"document:public"}),
+    ("user:bob", "can_read", "document", [], {"document:roadmap", "document:public"}),
+    ("user:bob", "can_publish", "document", [], {"document:roadmap"}),
+    ("user:dana", "member", "group", [], {"group:a", "group:b"}),
+    ("group:backend#member", "viewer", "document", [], {"document:specs"}),
+    (
+        "user:zoe",
+        "viewer",
+        "document",
+        [("user:zoe", "member", "group:backend")],
+        {"document:specs", "document:public"},
+    ),
+]
+
+# (object, relation, user filters, contextual tuples, expected users)
+LIST_USERS_CASES = [
+    ("document:specs", "viewer", [("user", None)], [], {"user:carl"}),
+    (
+        "document:specs",
+        "viewer",
+        [("group", "member")],
+        [],
+        {"group:eng#member", "group:backend#member"},
+    ),
+    ("document:public", "viewer", [("user", None)], [], {"user:*"}),
+    ("document:roadmap", "can_read", [("user", None)], [], {"user:bob"}),
+    ("document:budget", "viewer", [("user", None)], [], {"user:erin"}),
+    (
+        "document:budget",
+        "viewer",
+        [("user", None)],
+        [("user:zoe", "viewer", "folder:top")],
+        {"user:erin"},
+    ),
+    (
+        "document:budget",
+        "viewer",
+        [("user", None)],
+        [("user:zoe", "viewer", "folder:root")],
+        {"user:erin", "user:zoe"},
+    ),
+]
+
+
+def _user_filters(filters):
+    return [UserTypeFilter(type=type, relation=relation) for type, relation in filters]
+
+
+def _user_string(user):
+    if user.object is not None:
+        return f"{user.object.type}:{user.object.id}"
+    if user.userset is not None:
+        return f"{user.userset.type}:{user.userset.id}#{user.userset.relation}"
+    return f"{user.wildcard.type}:*"
+
+
+def _tuple_keys(tuples):
+    return [
+        TupleKey(user=user, relation=relation, object=object)
+        for user, relation, object in tuples
+    ]
+
+
+def _client_tuples(tuples):
+    return [
+        ClientTuple(user=user, relation=relation, object=object)
+        for user, relation, object in tuples
+    ]
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+
+class TestLocalCheckEvaluator(TestCase):
+    """Test for the local check evaluator"""
+
+    def setUp(self):
+        self.evaluator = LocalCheckEvaluator(
+            MODEL, LocalTupleStore(_tuple_keys(TUPLES))
+        )
+
+    def test_cases(self):
+        for user, relation, object, contextual_tuples, expected in CASES:
+            with self.subTest(user=user, relation=relation, object=object):
+                response = self.evaluator.check(
+                    ClientCheckRequest(
+                        user=user,
+                        relation=relation,
+                        object=object,
+                        contextual_tuples=_client_tuples(contextual_tuples),
+                    )
+                )
+                self.assertEqual(response.allowed, expected)
+
+    def test_compiles_model_instances(self):
+        model = ApiClient(Configuration()).deserialize(
+            _Response(json.dumps({"id": "01HVMMBCMGZNT3SED4Z17ECXCA", **MODEL})),
+            "AuthorizationModel",
+        )
+        evaluator = LocalCheckEvaluator(model, self.evaluator.store)
+        for user, relation, object, contextual_tuples, expected in CASES:
+            with self.subTest(user=user, relation=relation, object=object):
+                self.assertEqual(
+                    evaluator.is_allowed(
+                        user, relation, object, _client_tuples(contextual_tuples)
+                    ),
+                    expected,
+                )
+
+    def test_contextual_tuples_do_not_leak(self):
+        self.assertTrue(
+            self.evaluator.is_allowed(
+                "user:zoe",
+                "viewer",
+                "document:budget",
+                _client_tuples([("user:zoe", "viewer", "folder:root")]),
+            )
+        )
+        self.assertFalse(
+            self.evaluator.is_allowed("user:zoe", "viewer", "document:budget")
+        )
+
+    def test_type_restrictions(self):
+        # folder is not an allowed user type for document#owner
+        self.evaluator.store.write(
+            TupleKey(user="folder:root", relation="owner", object="document:x")
+        )
+        self.assertFalse(
+            self.evaluator.is_allowed("folder:root", "owner", "document:x")
+        )
+
+    def test_unknown_relation(self):
+        with self.assertRaises(FgaValidationException):
+            self.evaluator.is_allowed("user:anne", "unknown", "document:roadmap")
+        with self.assertRaises(FgaValidationException):
+            self.evaluator.is_allowed("user:anne", "viewer", "unknown:roadmap")
+
+    def test_conditions(self):
+        self.evaluator.store.write(
+            TupleKey(
+                user="user:carl",
+                relation="approved",
+                object="document:roadmap",
+                condition=RelationshipCondition(
+                    name="in_office", context={"office": "nyc"}
+                ),
+            )
+        )
+        self.evaluator.store.write(
+            TupleKey(user="user:carl", relation="editor", object="document:roadmap")
+        )
+
+        with self.assertRaises(FgaValidationException):
+            self.evaluator.is_allowed("user:carl", "can_publish", "document:roadmap")
+
+        seen = []
+
+        def condition_evaluator(condition, context):
+            seen.append((condition.name, context))
+            return context["office"] == context["location"]
+
+        evaluator = LocalCheckEvaluator(
+            MODEL, self.evaluator.store, condition_evaluator=condition_evaluator
+        )
+        self.assertTrue(
+            evaluator.is_allowed(
+                "user:carl",
+                "can_publish",
+                "document:roadmap",
+                context={"location": "nyc"},
+            )
+        )
+        self.assertFalse(
+            evaluator.is_allowed(
+                "user:carl",
+                "can_publish",
+                "document:roadmap",
+                context={"location": "sfo"},
+            )
+        )
+        self.assertEqual(seen[0], ("in_office", {"office": "nyc", "location": "nyc"}))
+
+        # The context of the tuple takes precedence over the one of the request
+        self.assertTrue(
+            evaluator.is_allowed(
+                "user:carl",
+                "can_publish",
+                "document:roadmap",
+                context={"office": "sfo", "location": "nyc"},
+            )
+        )
+        self.assertEqual(seen[-1], ("in_office", {"office": "nyc", "location": "nyc"}))
+
+    def test_cycle_through_difference(self):
+        def this(relation):
+            return {relation: {"directly_related_user_types": [{"type": "user"}]}}
+
+        model = {
+            "schema_version": "1.1",
+            "type_definitions": [
+                {"type": "user", "relations": {}},
+                {
+                    "type": "document",
+                    "relations": {
+                        "granted": {"this": {}},
+                        # Checking allowed cycles back to it through pending and requested, then succeeds through granted
+                        "allowed": {
+                            "union": {
+                                "child": [
+                                    {"computedUserset": {"relation": "pending"}},
+                                    {"computedUserset": {"relation": "granted"}},
+                                ]
+                            }
+                        },
+                        "pending": {"computedUserset": {"relation": "requested"}},
+                        "requested": {
+                            "difference": {
+                                "base": {"this": {}},
+                                "subtract": {
+                                    "computedUserset": {"relation": "allowed"}
+                                },
+                            }
+                        },
+                        "open_request": {
+                            "intersection": {
+                                "child": [
+                                    {"computedUserset": {"relation": "allowed"}},
+                                    {"computedUserset": {"relation": "requested"}},
+                                ]
+                            }
+                        },
+                    },
+                    "metadata": {"relations": {**this("granted"), **this("requested")}},
+                },
+            ],
+        }
+        evaluator = LocalCheckEvaluator(
+            model,
+            LocalTupleStore(
+                _tuple_keys(
+                    [
+                        ("user:anne", "granted", "document:1"),
+                        ("user:anne", "requested", "document:1"),
+                    ]
+                )
+            ),
+        )
+
+        self.assertTrue(evaluator.is_allowed("user:anne", "allowed", "document:1"))
+        self.assertFalse(evaluator.is_allowed("user:anne", "requested", "document:1"))
+        # Checking allowed first must not leave the answer for requested computed while it was cut short
+        self.assertFalse(
+            evaluator.is_allowed("user:anne", "open_request", "document:1")
+        )
+
+    def test_list_objects_cases(self):
+        for user, relation, type, contextual_tuples, expected in LIST_OBJECTS_CASES:
+            with self.subTest(user=user, relation=relation, type=type):
+                response = self.evaluator.list_objects(
+                    ClientListObjectsRequest(
+                        user=user,
+                        relation=relation,
+                        type=type,
+                        contextual_tuples=_client_tuples(contextual_tuples),
+                    )
+                )
+                self.assertEqual(set(response.objects), expected)
+
+    def test_list_users_cases(self):
+        for object, relation, filters, contextual_tuples, expected in LIST_USERS_CASES:
+            with self.subTest(object=object, relation=relation, filters=filters):
+                type, _, id = object.partition(":")
+                response = self.evaluator.list_users(
+                    ClientListUsersRequest(
+                        object=FgaObject(type=type, id=id),
+                        relation=relation,
+                        user_filters=_user_filters(filters),
+                        contextual_tuples=_client_tuples(contextual_tuples),
+                    )
+                )
+                self.assertEqual(
+                    {_user_string(user) for user in response.users}, expected
+                )
+
+    def test_list_objects_follows_store_updates(self):
+        self.assertEqual(
+            self.evaluator.allowed_objects("user:zoe", "viewer", "document"),
+            ["document:public"],
+        )
+
+        self.evaluator.store.write(
+            TupleKey(user="user:zoe", relation="member", object="group:a")
+        )
+        self.assertEqual(
+            set(self.evaluator.allowed_objects("user:zoe", "member", "group")),
+            {"group:a", "group:b"},
+        )
+
+        self.evaluator.store.delete(
+            TupleKey(user="user:zoe", relation="member", object="group:a")
+        )
+        self.assertEqual(
+            self.evaluator.allowed_objects("user:zoe", "member", "group"), []
+        )
+
+    def test_list_objects_unknown_relation(self):
+        with self.assertRaises(FgaValidationException):
+            self.evaluator.allowed_objects("user:anne", "unknown", "document")
+
+    def test_reflects_store_updates(self):
+        self.assertFalse(self.evaluator.is_allowed("user:zoe", "viewer", "document:x"))
+        self.evaluator.store.write(
+            TupleKey(user="user:zoe", relation="viewer", object="document:x")
+        )
+        self.assertTrue(self.evaluator.is_allowed("user:zoe", "viewer", "document:x"))
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not os.environ.get("FGA_API_URL"),
+    reason="OpenFGA server not available. Set FGA_API_URL to run integration tests.",
+)
+async def test_cases_match_server():
+    from openfga_sdk.client import ClientConfiguration
+    from openfga_sdk.client.client import OpenFgaClient
+    from openfga_sdk.client.models import ClientWriteRequest
+    from openfga_sdk.models import CreateStoreRequest
+
+    configuration = ClientConfiguration(api_url=os.environ["FGA_API_URL"])
+    async with OpenFgaClient(configuration) as client:
+        store = await client.create_store(CreateStoreRequest(name="LocalCheckStore"))
+        client.set_store_id(store.id)
+        try:
+            model = await client.write_authorization_model(MODEL)
+            client.set_authorization_model_id(model.authorization_model_id)
+            await client.write(ClientWriteRequest(writes=_client_tuples(TUPLES)))
+
+            for user, relation, object, contextual_tuples, expected in CASES:
+                response = await client.check(
+                    ClientCheckRequest(
+                        user=user,
+                        relation=relation,
+                        object=object,
+                        contextual_tuples=_client_tuples(contextual_tuples),
+                    )
+                )
+                assert response.allowed == expected, (user, relation, object)
+
+            for user, relation, type, contextual_tuples, expected in LIST_OBJECTS_CASES:
+                response = await client.list_objects(
+                    ClientListObjectsRequest(
+                        user=user,
+                        relation=relation,
+                        type=type,
+                        contextual_tuples=_client_tuples(contextual_tuples),
+                    )
+                )
+                assert set(response.objects) == expected, (user, relation, type)
+
+            for (
+                object,
+                relation,
+                filters,
+                contextual_tuples,
+                expected,
+            ) in LIST_USERS_CASES:
+                type, _, id = object.partition(":")
+                response = await client.list_users(
+                    ClientListUsersRequest(
+                        object=FgaObject(type=type, id=id),
+                        relation=relation,
+                        user_filters=_user_filters(filters),
+                        contextual_tuples=_client_tuples(contextual_tuples),
+                    )
+                )
+                users = {_user_string(user) for user in response.users}
+                assert users == expected, (object, relation, filters)
+        finally:
+            await client.delete_store()
@@ -0,0 +1,181 @@
+import json
+
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+import urllib3
+
+from openfga_sdk import rest
+from openfga_sdk.client import ClientConfiguration
+from openfga_sdk.client.client import OpenFgaClient
+from openfga_sdk.local.replica import TupleReplica
+from openfga_sdk.models.read_request_tuple_key import ReadRequestTupleKey
+from openfga_sdk.models.tuple_key import TupleKey
+
+
+store_id = "01YCP46JKYM8FJCQ37NMBYHE5X"
+
+
+def mock_response(body, status=200):
+    headers = urllib3.response.HTTPHeaderDict({"content-type": "application/json"})
+    obj = urllib3.HTTPResponse(
+        json.dumps(body).encode("utf-8"), headers, status, preload_content=False
+    )
+    return rest.RESTResponse(obj, obj.data)
+
+
+def tuple_json(user, relation, object):
+    return {"user": user, "relation": relation, "object": object}
+
+
+class TestTupleReplica(IsolatedAsyncioTestCase):
+    """Test for the local tuple replica"""
+
+    def setUp(self):
+        self.configuration = ClientConfiguration(
+            api_url="http://api.fga.example", store_id=store_id
+        )
+        self.read_pages = [
+            {
+                "tuples": [
+                    {
+                        "timestamp": "2022-07-25T21:15:37.524Z",
+                        "key": tuple_json("user:anne", "viewer", "document:a"),
+                    },
+                    {
+                        "timestamp": "2022-07-25T21:15:37.524Z",
+                        "key": tuple_json("user:bob", "viewer", "document:a"),
+                    },
+                ],
+                "continuation_token": "page2",
+            },
+            {
+                "tuples": [
+                    {
+                        "timestamp": "2022-07-25T21:15:37.524Z",
+                        "key": tuple_json("user:anne", "viewer", "folder:x"),
+                    }
+                ],
+                "continuation_token": "",
+            },
+        ]
+        self.change_pages = [
+            # The end of the changelog, found before the read
+            {"changes": [], "continuation_token": "changes0"},
+            {
+                "changes": [
+                    {
+                        "tuple_key": tuple_json("user:bob", "viewer", "document:a"),
+                        "operation": "TUPLE_OPERATION_DELETE",
+                        "timestamp": "2022-07-26T15:55:55.809Z",
+                    },
+                    {
+                        "tuple_key": tuple_json("user:carl", "viewer", "document:b"),
+                        "operation": "TUPLE_OPERATION_WRITE",
+                        "timestamp": "2022-07-26T15:55:56.809Z",
+                    },
+                ],
+                "continuation_token": "changes1",
+            },
+            {"changes": [], "continuation_token": "changes1"},
+        ]
+
+    def mock_requests(self, method, url, **kwargs):
+        if url.endswith("/read"):
+            return mock_response(self.read_pages.pop(0))
+        if url.endswith("/changes"):
+            return mock_response(self.change_pages.pop(0))
+        raise AssertionError(f"unexpected request to {url}")
+
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_bootstrap_and_sync(self, mock_request):
+        mock_request.side_effect = self.mock_requests
+
+        async with OpenFgaClient(self.configuration) as client:
+            replica = TupleReplica(client, page_size=2)
+            self.assertIsNone(replica.staleness)
+
+            await replica.bootstrap()
+
+            self.assertTrue(replica.is_bootstrapped)
+            self.assertLess(replica.staleness, 1)
+            self.assertTrue(replica.contains("user:anne", "viewer", "document:a"))
+            self.assertTrue(replica.contains("user:carl", "viewer", "document:b"))
+            self.assertFalse(replica.contains("user:bob", "viewer", "document:a"))
+            self.assertEqual(
+                replica.read(ReadRequestTupleKey(user="user:anne", object="folder:")),
+                [TupleKey(user="user:anne", relation="viewer", object="folder:x")],
+            )
+
+            read_calls = [
+                c for c in mock_request.call_args_list if c.args[1].endswith("/read")
+            ]
+            self.assertEqual(read_calls[0].kwargs["body"], {"page_size": 2})
+            changes_calls = [
+                c for c in mock_request.call_args_list if c.args[1].endswith("/changes")
+            ]
+            # The changes are tailed from the end of the changelog found before the read, not from a time
+            self.assertLess(
+                mock_request.call_args_list.index(changes_calls[0]),
+                mock_request.call_args_list.index(read_calls[0]),
+            )
+            self.assertEqual(
+                changes_calls[0].kwargs["query_params"], [("page_size", 2)]
+            )
+            self.assertEqual(
+                changes_calls[1].kwargs["query_params"],
+                [("page_size", 2), ("continuation_token", "changes0")],
+            )
+            self.assertEqual(
+                read_calls[1].kwargs["body"],
+                {"page_size": 2, "continuation_token": "page2"},
+            )
+
+            # Subsequent syncs resume from the stored continuation token
+            self.change_pages = [{"changes": [], "continuation_token": "changes1"}]
+            self.assertEqual(await replica.sync(), 0)
+            self.assertIn(
+                ("continuation_token", "changes1"),
+                mock_request.call_args.kwargs["query_params"],
+            )
+
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_staleness_recorded(self, mock_request):
+        mock_request.side_effect = self.mock_requests
+
+        async with OpenFgaClient(self.configuration) as client:
+            replica = TupleReplica(client)
+            with patch.object(
+                client.get_telemetry().metrics, "replicaStaleness"
+            ) as mock_staleness:
+                await replica.bootstrap()
+
+            mock_staleness.assert_called_once()
+            self.assertIs(
+                mock_staleness.call_args.kwargs["configuration"],
+                client.get_telemetry_configuration(),
+            )
+
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_type_filter(self, mock_request):
+        mock_request.side_effect = self.mock_requests
+
+        async with OpenFgaClient(self.configuration) as client:
+            replica = TupleReplica(client, type="folder")
+            await replica.bootstrap()
+
+            self.assertEqual(len(replica.store), 1)
+            self.assertTrue(replica.contains("user:anne", "viewer", "folder:x"))
+            changes_call = mock_request.call_args_list[-1]
+            self.assertIn(("type", "folder"), changes_call.kwargs["query_params"])
+
+    @patch.object(rest.RESTClientObject, "request")
+    async def test_start_and_stop(self, mock_request):
+        mock_request.side_effect = self.mock_requests
+
+        async with OpenFgaClient(self.configuration) as client:
+            replica = TupleReplica(client)
+            await replica.start(interval_in_sec=60)
+            self.assertTrue(replica.is_bootstrapped)
+            await replica.stop()
+            await replica.stop()
@@ -0,0 +1,140 @@
+from datetime import datetime
+from unittest import TestCase
+
+from openfga_sdk.local.tuple_store import LocalTupleStore
+from openfga_sdk.models.relationship_condition import RelationshipCondition
+from openfga_sdk.models.tuple_change import TupleChange
+from openfga_sdk.models.tuple_key import TupleKey
+from openfga_sdk.models.tuple_operation import TupleOperation
+
+
+class TestLocalTupleStore(TestCase):
+    """Test for the in-memory tuple store"""
+
+    def setUp(self):
+        self.store = LocalTupleStore(
+            [
+                TupleKey(user="user:anne", relation="viewer", object="document:a"),
+                TupleKey(user="user:anne", relation="editor", object="document:a"),
+                TupleKey(user="user:bob", relation="viewer", object="document:a"),
+                TupleKey(user="user:anne", relation="viewer", object="folder:x"),
+            ]
+        )
+
+    def test_contains(self):
+        self.assertEqual(len(self.store), 4)
+        self.assertTrue(self.store.contains("user:anne", "viewer", "document:a"))
+        self.assertFalse(self.store.contains("user:bob", "editor", "document:a"))
+        self.assertFalse(self.store.contains("user:anne", "viewer", "document:b"))
+        self.assertIn(
+            TupleKey(user="user:bob", relation="viewer", object="document:a"),
+            self.store,
+        )
+
+    def test_write_is_idempotent(self):
+        added = self.store.write(
+            TupleKey(user="user:anne", relation="viewer", object="document:a")
+        )
+        self.assertFalse(added)
+        self.assertEqual(len(self.store), 4)
+
+    def test_delete(self):
+        self.assertTrue(
+            self.store.delete(
+                TupleKey(user="user:anne", relation="viewer", object="folder:x")
+            )
+        )
+        self.assertFalse(
+            self.store.delete(
+                TupleKey(user="user:anne", relation="viewer", object="folder:x")
+            )
+        )
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.objects("user:anne", "viewer"), {"document:a"})
+        self.assertEqual(self.store.read(object="folder:x"), [])
+
+    def test_indexes(self):
+        self.assertEqual(
+            self.store.users("document:a", "viewer"), {"user:anne", "user:bob"}
+        )
+        self.assertEqual(
+            self.store.objects("user:anne", "viewer"), {"document:a", "folder:x"}
+        )
+        self.assertEqual(self.store.users("document:missing", "viewer"), set())
+
+    def test_read(self):
+        self.assertEqual(len(self.store.read()), 4)
+        self.assertEqual(len(self.store.read(object="document:a")), 3)
+        self.assertEqual(
+            len(self.store.read(object="document:a", relation="viewer")), 2
+        )
+        self.assertEqual(
+            self.store.read(user="user:anne", relation="viewer", object="document:"),
+            [TupleKey(user="user:anne", relation="viewer", object="document:a")],
+        )
+        self.assertEqual(len(self.store.read(user="user:anne")), 3)
+
+    def test_condition(self):
+        condition = RelationshipCondition(name="in_region", context={"region": "eu"})
+        self.store.write(
+            TupleKey(
+                user="user:carl",
+                relation="viewer",
+                object="document:a",
+                condition=condition,
+            )
+        )
+        self.assertEqual(
+            self.store.condition("user:carl", "viewer", "document:a"), condition
+        )
+        self.assertEqual(
+            self.store.read(user="user:carl", object="document:a")[0].condition,
+            condition,
+        )
+
+    def test_apply_changes(self):
+        timestamp = datetime.fromisoformat("2022-07-26T15:55:55.809+00:00")
+        applied = self.store.apply_changes(
+            [
+                TupleChange(
+                    tuple_key=TupleKey(
+                        user="user:carl", relation="viewer", object="document:b"
+                    ),
+                    operation=TupleOperation.WRITE,
+                    timestamp=timestamp,
+                ),
+                TupleChange(
+                    tuple_key=TupleKey(
+                        user="user:bob", relation="viewer", object="document:a"
+                    ),
+                    operation=TupleOperation.DELETE,
+                    timestamp=timestamp,
+                ),
+                TupleChange(
+                    tuple_key=TupleKey(
+                        user="user:carl", relation="viewer", object="folder:y"
+                    ),
+                    operation=TupleOperation.WRITE,
+                    timestamp=timestamp,
+                ),
+            ],
+            type="document",
+        )
+        self.assertEqual(applied, 2)
+        self.assertTrue(self.store.contains("user:carl", "viewer", "document:b"))
+        self.assertFalse(self.store.contains("user:bob", "viewer", "document:a"))
+        self.assertFalse(self.store.contains("user:carl", "viewer", "folder:y"))
+
+    def test_usersets(self):
+        self.store.write(
+            TupleKey(user="group:eng#member", relation="viewer", object="document:a")
+        )
+        self.assertEqual(
+            self.store.usersets("document:a", "viewer"), {"group:eng#member"}
+        )
+        self.assertIn("group:eng#member", self.store.users("document:a", "viewer"))
+
+        self.store.delete(
+            TupleKey(user="group:eng#member", relation="viewer", object="document:a")
+        )
+        self.assertEqual(self.store.usersets("document:a", "viewer"), set())
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from openfga_sdk.configuration import Configuration
+from openfga_sdk.exceptions import (
+    FgaDeadlineExceededException,
+    FgaValidationException,
+)
+from openfga_sdk.priority import (
+    PriorityScheduler,
+    RequestPriority,
+    request_priority,
+    reserved_connections,
+    resolve_request_priority,
+)
+
+
+class TestRequestPriority(TestCase):
+    """Test for resolving the priority of a request"""
+
+    def test_resolve_request_priority(self):
+        self.assertEqual(resolve_request_priority(), RequestPriority.HIGH)
+        self.assertEqual(resolve_request_priority("low"), RequestPriority.LOW)
+        with request_priority(RequestPriority.LOW):
+            self.assertEqual(resolve_request_priority(), RequestPriority.LOW)
+            self.assertEqual(
+                resolve_request_priority(RequestPriority.HIGH), RequestPriority.HIGH
+            )
+        self.assertEqual(resolve_request_priority(), RequestPriority.HIGH)
+
+    def test_reserved_connections(self):
+        configuration = Configuration(api_url="http://api.fga.example")
+        self.assertEqual(reserved_connections(configuration), 0)
+
+        configuration.connection_pool_maxsize = 4
+        configuration.connection_pool_reserved_for_high_priority = 1
+        self.assertEqual(reserved_connections(configuration), 1)
+        configuration.is_valid()
+
+        configuration.connection_pool_reserved_for_high_priority = 4
+        with self.assertRaises(FgaValidationException):
+            configuration.is_valid()
+
+
+class TestPriorityScheduler(IsolatedAsyncioTestCase):
+    """Test for the asynchronous priority scheduler"""
+
+    async def test_low_priority_leaves_reserved_connections(self):
+        scheduler = PriorityScheduler(2, 1)
+        started = []
+
+        async with scheduler.slot(RequestPriority.LOW):
+            low = asyncio.create_task(
+                self._run(scheduler, RequestPriority.LOW, started)
+            )
+            high = asyncio.create_task(
+                self._run(scheduler, RequestPriority.HIGH, started)
+            )
+            await asyncio.wait_for(high, 1)
+            await asyncio.sleep(0.01)
+            self.assertEqual(started, [RequestPriority.HIGH])
+
+        await asyncio.wait_for(low, 1)
+        self.assertEqual(started, [RequestPriority.HIGH, RequestPriority.LOW])
+
+    async def test_high_priority_waiters_go_first(self):
+        scheduler = PriorityScheduler(1, 0)
+        started = []
+
+        async with scheduler.slot(RequestPriority.HIGH):
+            low = asyncio.create_task(
+                self._run(scheduler, RequestPriority.LOW, started)
+            )
+            await asyncio.sleep(0.01)
+            high = asyncio.create_task(
+                self._run(scheduler, RequestPriority.HIGH, started)
+            )
+            await asyncio.sleep(0.01)
+            self.assertEqual(started, [])
+
+        await asyncio.wait_for(asyncio.gather(low, high), 1)
+        self.assertEqual(started, [RequestPriority.HIGH, RequestPriority.LOW])
+
+    async def test_deadline(self):
+        scheduler = PriorityScheduler(1, 0)
+        started = []
+
+        async with scheduler.slot(RequestPriority.HIGH):
+            with self.assertRaises(FgaDeadlineExceededException):
+                async with scheduler.slot(
+                    RequestPriority.HIGH, time.monotonic() + 0.05
+                ):
+                    started.append(RequestPriority.HIGH)
+
+        # The request that gave up does not hold a place
+        await asyncio.wait_for(self._run(scheduler, RequestPriority.LOW, started), 1)
+        self.assertEqual(started, [RequestPriority.LOW])
+
+    @staticmethod
+    async def _run(scheduler, priority, started):
+        async with scheduler.slot(priority):
+            started.append(priority)
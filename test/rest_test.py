@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 import aiohttp
 import pytest
 
+from openfga_sdk.configuration import Configuration
 from openfga_sdk.exceptions import (
     ApiException,
     ForbiddenException,
@@ -15,6 +16,9 @@ from openfga_sdk.exceptions import (
     ValidationException,
 )
 from openfga_sdk.rest import RESTClientObject, RESTResponse
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.gauges import TelemetryGauges
+from openfga_sdk.telemetry.histograms import TelemetryHistograms
 
 
 @pytest.mark.asyncio
@@ -523,3 +527,139 @@ async def test_stream_releases_conn_on_success():
     assert results == [{"ok": True}]
     client.handle_response_exception.assert_awaited_once()
     mock_response.release.assert_called_once()
+
+
+def test_session_created_on_first_use():
+    client = RESTClientObject(
+        configuration=Configuration(api_url="http://api.fga.example")
+    )
+
+    # Nothing is bound to an event loop until a request is sent
+    assert client._pool_manager is None
+    assert client.pool_stats().idle == 0
+
+
+@pytest.mark.asyncio
+async def test_session_sized_to_the_expected_parallelism():
+    configuration = Configuration(api_url="http://api.fga.example")
+    configuration.connection_pool_maxsize = 4
+    client = RESTClientObject(configuration=configuration)
+
+    client.pool_usage.expect(10)
+    try:
+        assert client.pool_manager.connector.limit == 10
+        assert client.pool_usage.maxsize == 10
+
+        # The connector of the session can no longer be resized
+        client.pool_usage.expect(20)
+        assert client.pool_manager.connector.limit == 10
+        assert client.pool_usage.maxsize == 10
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_session_created_in_running_loop():
+    client = RESTClientObject(
+        configuration=Configuration(api_url="http://api.fga.example")
+    )
+    # Closing a client that never sent a request has nothing to close
+    await client.close()
+
+    session = client.pool_manager
+    try:
+        assert isinstance(session, aiohttp.ClientSession)
+        assert client.pool_manager is session
+        assert client.pool_stats().idle == 0
+    finally:
+        await client.close()
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_connection_trace_config_installed_when_enabled():
+    configuration = Configuration(
+        api_url="http://api.fga.example",
+        telemetry={
+            "metrics": {
+                TelemetryGauges.fga_client_connection_pool_created: {
+                    TelemetryAttributes.url_scheme: True,
+                },
+            }
+        },
+    )
+    client = RESTClientObject(configuration=configuration)
+    try:
+        assert len(client.pool_manager.trace_configs) == 1
+        trace_config = client.pool_manager.trace_configs[0]
+        await trace_config.on_connection_create_end.send(None, None, None)
+        await trace_config.on_connection_reuseconn.send(None, None, None)
+        await trace_config.on_connection_reuseconn.send(None, None, None)
+
+        stats = client.pool_stats()
+        assert (stats.created, stats.reused, stats.active, stats.idle) == (1, 2, 0, 0)
+    finally:
+        await client.close()
+
+    client = RESTClientObject(
+        configuration=Configuration(api_url="http://api.fga.example")
+    )
+    try:
+        assert client.pool_manager.trace_configs == []
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_phase_timings_when_enabled():
+    configuration = Configuration(
+        api_url="http://api.fga.example",
+        telemetry={
+            "metrics": {
+                TelemetryHistograms.fga_client_request_time_to_first_byte: {
+                    TelemetryAttributes.url_scheme: True,
+                },
+            }
+        },
+    )
+    client = RESTClientObject(configuration=configuration)
+    session = client.pool_manager
+    try:
+        assert len(client.pool_manager.trace_configs) == 1
+        trace_config = client.pool_manager.trace_configs[0]
+
+        # aiohttp gives every hook of a request the same context
+        timings = {}
+        context = trace_config.trace_config_ctx(trace_request_ctx=timings)
+        await trace_config.on_dns_resolvehost_start.send(None, context, None)
+        await trace_config.on_dns_resolvehost_end.send(None, context, None)
+        await trace_config.on_connection_create_start.send(None, context, None)
+        await trace_config.on_connection_create_end.send(None, context, None)
+        await trace_config.on_request_headers_sent.send(None, context, None)
+        await trace_config.on_request_end.send(None, context, None)
+        assert set(timings) == {
+            TelemetryHistograms.fga_client_request_dns,
+            TelemetryHistograms.fga_client_request_connect,
+            TelemetryHistograms.fga_client_request_time_to_first_byte,
+        }
+        assert all(value >= 0 for value in timings.values())
+
+        mock_raw_response = MagicMock(spec=aiohttp.ClientResponse)
+        mock_raw_response.status = 200
+        mock_raw_response.reason = "OK"
+        mock_raw_response.read = AsyncMock(return_value=b'{"some":"data"}')
+        client.pool_manager = MagicMock()
+        client.pool_manager.request = AsyncMock(return_value=mock_raw_response)
+
+        resp = await client.request(method="GET", url="http://api.fga.example")
+        assert client.pool_manager.request.call_args.kwargs["trace_request_ctx"] is (
+            resp.timings
+        )
+        # The time spent building the request is part of the overhead of the SDK
+        assert set(resp.timings) == {
+            TelemetryHistograms.fga_client_sdk_overhead,
+            TelemetryHistograms.fga_client_response_body_read,
+        }
+    finally:
+        await session.close()
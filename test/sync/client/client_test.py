@@ -1,15 +1,24 @@
 import copy
 import json
+import sys
+import threading
+import time
 import uuid
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest import IsolatedAsyncioTestCase, TestCase
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 import urllib3
 
+from opentelemetry.trace import SpanKind, Tracer
+
 from openfga_sdk.client import ClientConfiguration
+from openfga_sdk.client.filter_planner import ClientFilterStrategy, FilterPlanner
+from openfga_sdk.client.model_validator import ClientModelValidator
+from openfga_sdk.client.models import batch_check_item
 from openfga_sdk.client.models.assertion import ClientAssertion
 from openfga_sdk.client.models.batch_check_item import ClientBatchCheckItem
 from openfga_sdk.client.models.batch_check_request import ClientBatchCheckRequest
@@ -26,6 +35,7 @@ from openfga_sdk.client.models.write_single_response import ClientWriteSingleRes
 from openfga_sdk.client.models.write_transaction_opts import WriteTransactionOpts
 from openfga_sdk.configuration import RetryParams
 from openfga_sdk.exceptions import (
+    FgaDeadlineExceededException,
     FgaValidationException,
     RateLimitExceededError,
     UnauthorizedException,
@@ -34,6 +44,7 @@ from openfga_sdk.exceptions import (
 from openfga_sdk.models.assertion import Assertion
 from openfga_sdk.models.authorization_model import AuthorizationModel
 from openfga_sdk.models.check_response import CheckResponse
+from openfga_sdk.models.condition import Condition
 from openfga_sdk.models.consistency_preference import ConsistencyPreference
 from openfga_sdk.models.create_store_request import CreateStoreRequest
 from openfga_sdk.models.create_store_response import CreateStoreResponse
@@ -44,6 +55,7 @@ from openfga_sdk.models.leaf import Leaf
 from openfga_sdk.models.list_objects_response import ListObjectsResponse
 from openfga_sdk.models.list_stores_response import ListStoresResponse
 from openfga_sdk.models.list_users_response import ListUsersResponse
+from openfga_sdk.models.metadata import Metadata
 from openfga_sdk.models.node import Node
 from openfga_sdk.models.object_relation import ObjectRelation
 from openfga_sdk.models.read_assertions_response import ReadAssertionsResponse
@@ -56,6 +68,9 @@ from openfga_sdk.models.read_authorization_models_response import (
 from openfga_sdk.models.read_changes_response import ReadChangesResponse
 from openfga_sdk.models.read_request_tuple_key import ReadRequestTupleKey
 from openfga_sdk.models.read_response import ReadResponse
+from openfga_sdk.models.relation_metadata import RelationMetadata
+from openfga_sdk.models.relation_reference import RelationReference
+from openfga_sdk.models.relationship_condition import RelationshipCondition
 from openfga_sdk.models.store import Store
 from openfga_sdk.models.tuple import Tuple
 from openfga_sdk.models.tuple_change import TupleChange
@@ -77,8 +92,12 @@ from openfga_sdk.models.write_authorization_model_request import (
 from openfga_sdk.models.write_authorization_model_response import (
     WriteAuthorizationModelResponse,
 )
+from openfga_sdk.priority import RequestPriority
 from openfga_sdk.sync import rest
+from openfga_sdk.sync.api_client import ApiClient
 from openfga_sdk.sync.client.client import OpenFgaClient, set_heading_if_not_set
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.tracing import TelemetryTracing
 
 
 store_id = "01YCP46JKYM8FJCQ37NMBYHE5X"
@@ -100,6 +119,21 @@ def mock_response(body, status):
     return rest.RESTResponse(obj, obj.data)
 
 
+def mock_batch_check_response(allowed):
+    """
+    Return a side effect answering each BatchCheck request with allowed(tuple_key) per check
+    """
+
+    def side_effect(*args, **kwargs):
+        result = {
+            check["correlation_id"]: {"allowed": allowed(check["tuple_key"])}
+            for check in kwargs["body"]["checks"]
+        }
+        return mock_response(json.dumps({"result": result}), 200)
+
+    return side_effect
+
+
 class TestOpenFgaClient(IsolatedAsyncioTestCase):
     """Test for OpenFGA Client"""
 
@@ -683,6 +717,219 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                 _request_timeout=None,
             )
 
+    @patch.object(rest.RESTClientObject, "request")
+    def test_authorization_model_cache(self, mock_request):
+        """Test case for the authorization model cache
+
+        Models read by id are kept, the latest model is kept until it is refreshed or a model is written
+        """
+        models = ["01G5JAVJ41T49E9TT3SKVS7X1J", "01GXSA8YR785C4FYS3C0RTG7B1"]
+
+        def model_body(model_id):
+            return {
+                "id": model_id,
+                "schema_version": "1.1",
+                "type_definitions": [{"type": "user"}],
+            }
+
+        def mock_side_effect(method, url, **kwargs):
+            if url.endswith("/authorization-models") and method == "GET":
+                return mock_response(
+                    json.dumps({"authorization_models": [model_body(models[-1])]}),
+                    200,
+                )
+            if url.endswith("/authorization-models"):
+                models.append("01GXSB4A5KYQTSA8AZZ5KRF0XF")
+                return mock_response(
+                    json.dumps({"authorization_model_id": models[-1]}), 201
+                )
+            model_id = url.rsplit("/", 1)[1]
+            return mock_response(
+                json.dumps({"authorization_model": model_body(model_id)}), 200
+            )
+
+        mock_request.side_effect = mock_side_effect
+        configuration = ClientConfiguration(
+            api_url="http://api.fga.example",
+            store_id=store_id,
+            authorization_model_cache_size=1,
+            pin_latest_authorization_model=True,
+        )
+        with OpenFgaClient(configuration) as api_client:
+            for model_id in [models[0], models[0], models[1], models[0]]:
+                api_response = api_client.read_authorization_model(
+                    options={"authorization_model_id": model_id}
+                )
+                self.assertEqual(api_response.authorization_model.id, model_id)
+            # The cache holds a single model: the third and fourth reads evict each other
+            self.assertEqual(mock_request.call_count, 3)
+
+            mock_request.reset_mock()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                responses = list(
+                    executor.map(
+                        lambda _: api_client.read_latest_authorization_model(), range(3)
+                    )
+                )
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertEqual(
+                {response.authorization_model.id for response in responses},
+                {models[1]},
+            )
+            self.assertEqual(configuration.authorization_model_id, models[1])
+
+            # Writing a model makes the next read fetch the new latest model
+            api_client.write_authorization_model(
+                WriteAuthorizationModelRequest(
+                    schema_version="1.1", type_definitions=[TypeDefinition(type="user")]
+                )
+            )
+            api_response = api_client.read_latest_authorization_model()
+            self.assertEqual(api_response.authorization_model.id, models[2])
+            self.assertEqual(configuration.authorization_model_id, models[2])
+            self.assertEqual(mock_request.call_count, 3)
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_check_pins_latest_authorization_model(self, mock_request):
+        """Test case for check with pin_latest_authorization_model and no model configured
+
+        The latest authorization model is read once, and sent with every check
+        """
+        model_id = "01GXSA8YR785C4FYS3C0RTG7B1"
+
+        def mock_side_effect(method, url, **kwargs):
+            if url.endswith("/authorization-models"):
+                return mock_response(
+                    json.dumps(
+                        {
+                            "authorization_models": [
+                                {
+                                    "id": model_id,
+                                    "schema_version": "1.1",
+                                    "type_definitions": [],
+                                }
+                            ]
+                        }
+                    ),
+                    200,
+                )
+            return mock_response('{"allowed": true}', 200)
+
+        mock_request.side_effect = mock_side_effect
+        configuration = ClientConfiguration(
+            api_url="http://api.fga.example",
+            store_id=store_id,
+            pin_latest_authorization_model=True,
+        )
+        body = ClientCheckRequest(
+            object="document:2021-budget",
+            relation="reader",
+            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        )
+        options = {"headers": {"X-Custom": "value"}}
+        with OpenFgaClient(configuration) as api_client:
+            api_client.check(body=body, options=options)
+            api_client.check(body=body)
+
+        self.assertEqual(configuration.authorization_model_id, model_id)
+        self.assertEqual(
+            [call.args[1].rsplit("/", 1)[1] for call in mock_request.call_args_list],
+            ["authorization-models", "check", "check"],
+        )
+        read = mock_request.call_args_list[0]
+        self.assertEqual(read.kwargs["query_params"], [("page_size", 1)])
+        self.assertEqual(read.kwargs["headers"]["X-Custom"], "value")
+        self.assertEqual(
+            read.kwargs["headers"]["X-OpenFGA-Client-Method"],
+            "ReadLatestAuthorizationModel",
+        )
+        for call in mock_request.call_args_list[1:]:
+            self.assertEqual(call.kwargs["body"]["authorization_model_id"], model_id)
+
+        # The options of the caller are not changed by the read
+        options = {"retry_params": RetryParams(max_retry=1)}
+        with OpenFgaClient(configuration) as api_client:
+            api_client.read_latest_authorization_model(options)
+        self.assertEqual(list(options), ["retry_params"])
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_write_authorization_model_unpins_latest(self, mock_request):
+        """Test case for write_authorization_model with pin_latest_authorization_model
+
+        The pinned model is dropped when a model is written, and the next check reads the new latest model
+        """
+        models = ["01GXSA8YR785C4FYS3C0RTG7B1"]
+
+        def mock_side_effect(method, url, **kwargs):
+            if url.endswith("/authorization-models") and method == "GET":
+                return mock_response(
+                    json.dumps(
+                        {
+                            "authorization_models": [
+                                {
+                                    "id": models[-1],
+                                    "schema_version": "1.1",
+                                    "type_definitions": [],
+                                }
+                            ]
+                        }
+                    ),
+                    200,
+                )
+            if url.endswith("/authorization-models"):
+                models.append("01GXSB4A5KYQTSA8AZZ5KRF0XF")
+                return mock_response(
+                    json.dumps({"authorization_model_id": models[-1]}), 201
+                )
+            return mock_response('{"allowed": true}', 200)
+
+        mock_request.side_effect = mock_side_effect
+        configuration = ClientConfiguration(
+            api_url="http://api.fga.example",
+            store_id=store_id,
+            pin_latest_authorization_model=True,
+        )
+        body = ClientCheckRequest(
+            object="document:2021-budget",
+            relation="reader",
+            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        )
+        write_body = WriteAuthorizationModelRequest(
+            schema_version="1.1", type_definitions=[TypeDefinition(type="user")]
+        )
+        with OpenFgaClient(configuration) as api_client:
+            api_client.check(body=body)
+            self.assertEqual(configuration.authorization_model_id, models[0])
+
+            api_client.write_authorization_model(write_body)
+            self.assertIsNone(configuration.authorization_model_id)
+            api_client.check(body=body)
+            self.assertEqual(configuration.authorization_model_id, models[1])
+
+            self.assertEqual(
+                [
+                    call.args[1].rsplit("/", 1)[1]
+                    for call in mock_request.call_args_list
+                ],
+                [
+                    "authorization-models",
+                    "check",
+                    "authorization-models",
+                    "authorization-models",
+                    "check",
+                ],
+            )
+            self.assertEqual(
+                mock_request.call_args.kwargs["body"]["authorization_model_id"],
+                models[1],
+            )
+
+            # A model id that was configured rather than pinned is kept
+            api_client.set_authorization_model_id(models[0])
+            api_client.write_authorization_model(write_body)
+            self.assertEqual(configuration.authorization_model_id, models[0])
+
     @patch.object(rest.RESTClientObject, "request")
     def test_read_latest_authorization_model_with_no_models(self, mock_request):
         """Test case for read_latest_authorization_model when no models are in the store
@@ -1216,173 +1463,409 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
 
     @patch.object(rest.RESTClientObject, "request")
-    def test_write_batch_min_parallel(self, mock_request):
-        """Test case for write
+    def test_write_compact(self, mock_request):
+        """Test case for write with compaction
 
-        Add tuples from the store with transaction disabled and minimum parallel request
+        Send the net effect of the writes and deletes once
         """
-        mock_request.side_effect = [
-            mock_response("{}", 200),
-            mock_response("{}", 200),
-            mock_response("{}", 200),
-        ]
+        mock_request.return_value = mock_response("{}", 200)
+
+        def write_tuple(user, condition=None):
+            return ClientTuple(
+                user=user,
+                relation="reader",
+                object="document:2021-budget",
+                condition=condition,
+            )
+
+        condition = RelationshipCondition(name="in_range", context={"x": 1, "y": 2})
+        same_condition = RelationshipCondition(
+            name="in_range", context={"y": 2, "x": 1}
+        )
         configuration = self.configuration
         configuration.store_id = store_id
         with OpenFgaClient(configuration) as api_client:
             body = ClientWriteRequest(
                 writes=[
-                    ClientTuple(
-                        object="document:2021-budget",
-                        relation="reader",
-                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    ),
-                    ClientTuple(
-                        object="document:2021-budget",
-                        relation="reader",
-                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
-                    ),
-                    ClientTuple(
-                        object="document:2021-budget",
-                        relation="reader",
-                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
-                    ),
+                    write_tuple("user:anne"),
+                    write_tuple("user:anne"),
+                    write_tuple("user:bob", condition),
+                    write_tuple("user:bob", same_condition),
+                    write_tuple("user:carl"),
+                ],
+                deletes=[
+                    write_tuple("user:carl"),
+                    write_tuple("user:carl"),
+                    write_tuple("user:dan"),
                 ],
-            )
-            transaction = WriteTransactionOpts(
-                disabled=True, max_per_chunk=1, max_parallel_requests=1
             )
             response = api_client.write(
                 body,
                 options={
                     "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
-                    "transaction": transaction,
+                    "transaction": WriteTransactionOpts(disabled=True),
+                    "compact": True,
                 },
             )
 
-            self.assertEqual(response.deletes, None)
             self.assertEqual(
-                response.writes,
-                [
-                    ClientWriteSingleResponse(
-                        tuple_key=ClientTuple(
-                            object="document:2021-budget",
-                            relation="reader",
-                            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                        ),
-                        success=True,
-                        error=None,
-                    ),
-                    ClientWriteSingleResponse(
-                        tuple_key=ClientTuple(
-                            object="document:2021-budget",
-                            relation="reader",
-                            user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
-                        ),
-                        success=True,
-                        error=None,
-                    ),
-                    ClientWriteSingleResponse(
-                        tuple_key=ClientTuple(
-                            object="document:2021-budget",
-                            relation="reader",
-                            user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
-                        ),
-                        success=True,
-                        error=None,
-                    ),
-                ],
-            )
-            self.assertEqual(mock_request.call_count, 3)
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "writes": {
-                        "tuple_keys": [
-                            {
-                                "object": "document:2021-budget",
-                                "relation": "reader",
-                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                            }
-                        ],
-                        "on_duplicate": "error",
-                    },
-                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
-            )
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "writes": {
-                        "tuple_keys": [
-                            {
-                                "object": "document:2021-budget",
-                                "relation": "reader",
-                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31c",
-                            }
-                        ],
-                        "on_duplicate": "error",
-                    },
-                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
+                [item.tuple_key for item in response.writes],
+                [write_tuple("user:anne"), write_tuple("user:bob", condition)],
             )
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "writes": {
-                        "tuple_keys": [
-                            {
-                                "object": "document:2021-budget",
-                                "relation": "reader",
-                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31d",
-                            }
-                        ],
-                        "on_duplicate": "error",
-                    },
-                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
+            self.assertEqual(
+                [item.tuple_key for item in response.deletes],
+                [write_tuple("user:carl"), write_tuple("user:dan")],
             )
+            self.assertEqual(mock_request.call_count, 4)
+            api_client.close()
 
     @patch.object(rest.RESTClientObject, "request")
-    def test_write_batch_larger_chunk(self, mock_request):
-        """Test case for write
+    def test_model_validator(self, mock_request):
+        """Test case for validating requests against the authorization model
 
-        Add tuples from the store with transaction disabled and minimum parallel request
+        Invalid tuples and checks are answered locally, the valid ones are still sent
         """
-        mock_request.side_effect = [
-            mock_response("{}", 200),
-            mock_response("{}", 200),
-            mock_response("{}", 200),
-        ]
-        configuration = self.configuration
-        configuration.store_id = store_id
-        with OpenFgaClient(configuration) as api_client:
-            body = ClientWriteRequest(
-                writes=[
-                    ClientTuple(
-                        object="document:2021-budget",
-                        relation="reader",
-                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        mock_request.return_value = mock_response("{}", 200)
+        model = AuthorizationModel(
+            id="01G5JAVJ41T49E9TT3SKVS7X1J",
+            schema_version="1.1",
+            type_definitions=[
+                TypeDefinition(type="user"),
+                TypeDefinition(
+                    type="document",
+                    relations={"reader": Userset(this={}), "owner": Userset(this={})},
+                    metadata=Metadata(
+                        relations={
+                            "reader": RelationMetadata(
+                                directly_related_user_types=[
+                                    RelationReference(type="user"),
+                                    RelationReference(type="user", wildcard={}),
+                                ]
+                            ),
+                            "owner": RelationMetadata(
+                                directly_related_user_types=[
+                                    RelationReference(type="user", condition="in_range")
+                                ]
+                            ),
+                        }
                     ),
-                    ClientTuple(
-                        object="document:2021-budget",
+                ),
+            ],
+            conditions={
+                "in_range": Condition(name="in_range", expression="x < y"),
+            },
+        )
+        validator = ClientModelValidator(model)
+        condition = RelationshipCondition(name="in_range", context={"x": 1, "y": 2})
+
+        self.assertIsNone(
+            validator.validate_tuple(
+                ClientTuple(user="user:*", relation="reader", object="document:1")
+            )
+        )
+        self.assertIsNone(
+            validator.validate_tuple(
+                ClientTuple(
+                    user="user:anne",
+                    relation="owner",
+                    object="document:1",
+                    condition=condition,
+                )
+            )
+        )
+        self.assertIn(
+            "requires a condition",
+            validator.validate_tuple(
+                ClientTuple(user="user:anne", relation="owner", object="document:1")
+            ),
+        )
+        # Deletes do not need the condition
+        self.assertIsNone(
+            validator.validate_tuple(
+                ClientTuple(user="user:anne", relation="owner", object="document:1"),
+                False,
+            )
+        )
+        self.assertIn(
+            "not an allowed type",
+            validator.validate_tuple(
+                ClientTuple(user="user:*", relation="owner", object="document:1")
+            ),
+        )
+        self.assertIn(
+            "relation 'document#writer'",
+            validator.validate_tuple(
+                ClientTuple(user="user:anne", relation="writer", object="document:1")
+            ),
+        )
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            writes = [
+                ClientTuple(user="user:anne", relation="reader", object="document:1"),
+                ClientTuple(user="user:bob", relation="writer", object="document:1"),
+                ClientTuple(user="user:carl", relation="reader", object="document:1"),
+            ]
+            response = api_client.write(
+                ClientWriteRequest(writes=writes),
+                options={
+                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                    "transaction": WriteTransactionOpts(disabled=True, max_per_chunk=2),
+                    "validator": validator,
+                },
+            )
+
+            self.assertEqual([item.tuple_key for item in response.writes], writes)
+            self.assertEqual(
+                [item.success for item in response.writes], [True, False, True]
+            )
+            self.assertIsInstance(response.writes[1].error, ValidationException)
+            # Both valid tuples fit in a single chunk
+            self.assertEqual(mock_request.call_count, 1)
+
+            with self.assertRaises(ValidationException):
+                api_client.write(
+                    ClientWriteRequest(writes=writes),
+                    options={
+                        "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                        "validator": validator,
+                    },
+                )
+            with self.assertRaises(ValidationException):
+                api_client.check(
+                    ClientCheckRequest(
+                        user="folder:1", relation="reader", object="document:1"
+                    ),
+                    options={
+                        "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                        "validator": validator,
+                    },
+                )
+            self.assertEqual(mock_request.call_count, 1)
+
+            mock_request.side_effect = mock_batch_check_response(lambda _: True)
+            response = api_client.batch_check(
+                ClientBatchCheckRequest(
+                    checks=[
+                        ClientBatchCheckItem(
+                            user="user:anne",
+                            relation="reader",
+                            object="document:1",
+                            correlation_id="1",
+                        ),
+                        ClientBatchCheckItem(
+                            user="user:anne",
+                            relation="writer",
+                            object="document:1",
+                            correlation_id="2",
+                        ),
+                    ]
+                ),
+                options={
+                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                    "validator": validator,
+                },
+            )
+
+            results = {item.correlation_id: item for item in response.result}
+            self.assertTrue(results["1"].allowed)
+            self.assertFalse(results["2"].allowed)
+            self.assertEqual(results["2"].error.input_error, "validation_error")
+            self.assertEqual(mock_request.call_count, 2)
+            self.assertEqual(
+                [
+                    check["correlation_id"]
+                    for check in mock_request.call_args.kwargs["body"]["checks"]
+                ],
+                ["1"],
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_reconcile(self, mock_request):
+        """Test case for reconcile
+
+        Write and delete only the difference between the current and desired tuples
+        """
+        pages = [
+            {
+                "tuples": [
+                    {
+                        "key": {
+                            "user": "user:anne",
+                            "relation": "viewer",
+                            "object": "document:1",
+                        },
+                        "timestamp": "2021-10-06T15:32:11.128Z",
+                    },
+                    {
+                        "key": {
+                            "user": "user:bob",
+                            "relation": "viewer",
+                            "object": "document:1",
+                        },
+                        "timestamp": "2021-10-06T15:32:11.128Z",
+                    },
+                ],
+                "continuation_token": "token",
+            },
+            {
+                "tuples": [
+                    {
+                        "key": {
+                            "user": "user:carl",
+                            "relation": "viewer",
+                            "object": "document:1",
+                            "condition": {"name": "in_range", "context": {"x": 1}},
+                        },
+                        "timestamp": "2021-10-06T15:32:11.128Z",
+                    },
+                ],
+                "continuation_token": "",
+            },
+        ]
+
+        def mock_side_effect(method, url, **kwargs):
+            if url.endswith("/read"):
+                return mock_response(json.dumps(pages.pop(0)), 200)
+            return mock_response("{}", 200)
+
+        mock_request.side_effect = mock_side_effect
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            response = api_client.reconcile(
+                ReadRequestTupleKey(object="document:1"),
+                [
+                    ClientTuple(
+                        user="user:anne", relation="viewer", object="document:1"
+                    ),
+                    ClientTuple(
+                        user="user:carl",
+                        relation="viewer",
+                        object="document:1",
+                        condition=RelationshipCondition(
+                            name="in_range", context={"x": 2}
+                        ),
+                    ),
+                    ClientTuple(
+                        user="user:dan", relation="viewer", object="document:1"
+                    ),
+                ],
+                options={"page_size": 2},
+            )
+
+            self.assertEqual(
+                [item.tuple_key.user for item in response.deletes],
+                ["user:bob", "user:carl"],
+            )
+            self.assertEqual(
+                [item.tuple_key.user for item in response.writes],
+                ["user:carl", "user:dan"],
+            )
+            self.assertTrue(all(item.success for item in response.writes))
+            self.assertTrue(all(item.success for item in response.deletes))
+
+            calls = mock_request.call_args_list
+            self.assertEqual(len(calls), 4)
+            self.assertEqual(calls[1][1]["body"]["continuation_token"], "token")
+            self.assertEqual(calls[1][1]["body"]["page_size"], 2)
+            self.assertEqual(
+                calls[2][1]["body"]["deletes"]["tuple_keys"],
+                [
+                    {"user": "user:bob", "relation": "viewer", "object": "document:1"},
+                    {"user": "user:carl", "relation": "viewer", "object": "document:1"},
+                ],
+            )
+            self.assertEqual(len(calls[3][1]["body"]["writes"]["tuple_keys"]), 2)
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_reconcile_pending_deletes(self, mock_request):
+        """Test case for reconcile over many pages of tuples to delete
+
+        The tuples to delete are sent a chunk at a time while reading, so at most one chunk of them is pending
+        """
+        pages = [
+            {
+                "tuples": [
+                    {
+                        "key": {
+                            "user": f"user:{page}-{index}",
+                            "relation": "viewer",
+                            "object": "document:1",
+                        },
+                        "timestamp": "2021-10-06T15:32:11.128Z",
+                    }
+                    for index in range(3)
+                ],
+                "continuation_token": f"token-{page}" if page < 3 else "",
+            }
+            for page in range(4)
+        ]
+        read = 0
+        deleted = 0
+        pending = []
+
+        def mock_side_effect(method, url, **kwargs):
+            nonlocal read, deleted
+            if url.endswith("/read"):
+                pending.append(read - deleted)
+                page = pages.pop(0)
+                read += len(page["tuples"])
+                return mock_response(json.dumps(page), 200)
+            deletes = kwargs["body"]["deletes"]["tuple_keys"]
+            self.assertLessEqual(len(deletes), 2)
+            deleted += len(deletes)
+            return mock_response("{}", 200)
+
+        mock_request.side_effect = mock_side_effect
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            response = api_client.reconcile(
+                ReadRequestTupleKey(object="document:1"),
+                [],
+                options={
+                    "page_size": 3,
+                    "transaction": WriteTransactionOpts(
+                        disabled=True, max_per_chunk=2, max_parallel_requests=1
+                    ),
+                },
+            )
+
+            self.assertEqual(len(response.deletes), 12)
+            self.assertTrue(all(item.success for item in response.deletes))
+            self.assertIsNone(response.writes)
+            self.assertEqual(deleted, 12)
+            # Tuples read but not deleted yet, as each page is requested
+            self.assertEqual(pending, [0, 1, 0, 1])
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_write_batch_min_parallel(self, mock_request):
+        """Test case for write
+
+        Add tuples from the store with transaction disabled and minimum parallel request
+        """
+        mock_request.side_effect = [
+            mock_response("{}", 200),
+            mock_response("{}", 200),
+            mock_response("{}", 200),
+        ]
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            body = ClientWriteRequest(
+                writes=[
+                    ClientTuple(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    ),
+                    ClientTuple(
+                        object="document:2021-budget",
                         relation="reader",
                         user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
                     ),
@@ -1394,7 +1877,7 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                 ],
             )
             transaction = WriteTransactionOpts(
-                disabled=True, max_per_chunk=2, max_parallel_requests=2
+                disabled=True, max_per_chunk=1, max_parallel_requests=1
             )
             response = api_client.write(
                 body,
@@ -1437,7 +1920,7 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                     ),
                 ],
             )
-            self.assertEqual(mock_request.call_count, 2)
+            self.assertEqual(mock_request.call_count, 3)
             mock_request.assert_any_call(
                 "POST",
                 "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
@@ -1451,12 +1934,29 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                                 "object": "document:2021-budget",
                                 "relation": "reader",
                                 "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                            },
+                            }
+                        ],
+                        "on_duplicate": "error",
+                    },
+                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                },
+                _preload_content=ANY,
+                _request_timeout=None,
+            )
+            mock_request.assert_any_call(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
+                headers=ANY,
+                query_params=[],
+                post_params=[],
+                body={
+                    "writes": {
+                        "tuple_keys": [
                             {
                                 "object": "document:2021-budget",
                                 "relation": "reader",
                                 "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31c",
-                            },
+                            }
                         ],
                         "on_duplicate": "error",
                     },
@@ -1489,21 +1989,14 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
 
     @patch.object(rest.RESTClientObject, "request")
-    def test_write_batch_failed(self, mock_request):
+    def test_write_batch_larger_chunk(self, mock_request):
         """Test case for write
 
-        Add tuples from the store with transaction disabled where one of the request failed
-        """
-        response_body = """
-{
-  "code": "validation_error",
-  "message": "Generic validation error"
-}
+        Add tuples from the store with transaction disabled and minimum parallel request
         """
-
         mock_request.side_effect = [
             mock_response("{}", 200),
-            ValidationException(http_resp=http_mock_response(response_body, 400)),
+            mock_response("{}", 200),
             mock_response("{}", 200),
         ]
         configuration = self.configuration
@@ -1529,7 +2022,7 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                 ],
             )
             transaction = WriteTransactionOpts(
-                disabled=True, max_per_chunk=1, max_parallel_requests=10
+                disabled=True, max_per_chunk=2, max_parallel_requests=2
             )
             response = api_client.write(
                 body,
@@ -1540,49 +2033,189 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
 
             self.assertEqual(response.deletes, None)
-            self.assertEqual(len(response.writes), 3)
             self.assertEqual(
-                response.writes[0],
-                ClientWriteSingleResponse(
-                    tuple_key=ClientTuple(
-                        object="document:2021-budget",
-                        relation="reader",
-                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                response.writes,
+                [
+                    ClientWriteSingleResponse(
+                        tuple_key=ClientTuple(
+                            object="document:2021-budget",
+                            relation="reader",
+                            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                        ),
+                        success=True,
+                        error=None,
                     ),
-                    success=True,
-                    error=None,
-                ),
-            )
-            self.assertEqual(
-                response.writes[1].tuple_key,
-                ClientTuple(
-                    object="document:2021-budget",
-                    relation="reader",
-                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
-                ),
-            )
-            self.assertFalse(response.writes[1].success)
-            self.assertIsInstance(response.writes[1].error, ValidationException)
-            self.assertIsInstance(
-                response.writes[1].error.parsed_exception,
-                ValidationErrorMessageResponse,
-            )
-            self.assertEqual(
-                response.writes[2],
-                ClientWriteSingleResponse(
-                    tuple_key=ClientTuple(
-                        object="document:2021-budget",
-                        relation="reader",
-                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                    ClientWriteSingleResponse(
+                        tuple_key=ClientTuple(
+                            object="document:2021-budget",
+                            relation="reader",
+                            user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
+                        ),
+                        success=True,
+                        error=None,
                     ),
-                    success=True,
-                    error=None,
-                ),
-            )
-            self.assertEqual(mock_request.call_count, 3)
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
+                    ClientWriteSingleResponse(
+                        tuple_key=ClientTuple(
+                            object="document:2021-budget",
+                            relation="reader",
+                            user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                        ),
+                        success=True,
+                        error=None,
+                    ),
+                ],
+            )
+            self.assertEqual(mock_request.call_count, 2)
+            mock_request.assert_any_call(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
+                headers=ANY,
+                query_params=[],
+                post_params=[],
+                body={
+                    "writes": {
+                        "tuple_keys": [
+                            {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                            },
+                            {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31c",
+                            },
+                        ],
+                        "on_duplicate": "error",
+                    },
+                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                },
+                _preload_content=ANY,
+                _request_timeout=None,
+            )
+            mock_request.assert_any_call(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
+                headers=ANY,
+                query_params=[],
+                post_params=[],
+                body={
+                    "writes": {
+                        "tuple_keys": [
+                            {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                            }
+                        ],
+                        "on_duplicate": "error",
+                    },
+                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                },
+                _preload_content=ANY,
+                _request_timeout=None,
+            )
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_write_batch_failed(self, mock_request):
+        """Test case for write
+
+        Add tuples from the store with transaction disabled where one of the request failed
+        """
+        response_body = """
+{
+  "code": "validation_error",
+  "message": "Generic validation error"
+}
+        """
+
+        def respond(*args, **kwargs):
+            # Chunks are sent in parallel, so the failure is keyed on the tuple rather than the call order
+            user = kwargs["body"]["writes"]["tuple_keys"][0]["user"]
+            if user == "user:81684243-9356-4421-8fbf-a4f8d36aa31c":
+                raise ValidationException(
+                    http_resp=http_mock_response(response_body, 400)
+                )
+            return mock_response("{}", 200)
+
+        mock_request.side_effect = respond
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            body = ClientWriteRequest(
+                writes=[
+                    ClientTuple(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    ),
+                    ClientTuple(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
+                    ),
+                    ClientTuple(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                    ),
+                ],
+            )
+            transaction = WriteTransactionOpts(
+                disabled=True, max_per_chunk=1, max_parallel_requests=10
+            )
+            response = api_client.write(
+                body,
+                options={
+                    "authorization_model_id": "01G5JAVJ41T49E9TT3SKVS7X1J",
+                    "transaction": transaction,
+                },
+            )
+
+            self.assertEqual(response.deletes, None)
+            self.assertEqual(len(response.writes), 3)
+            self.assertEqual(
+                response.writes[0],
+                ClientWriteSingleResponse(
+                    tuple_key=ClientTuple(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    ),
+                    success=True,
+                    error=None,
+                ),
+            )
+            self.assertEqual(
+                response.writes[1].tuple_key,
+                ClientTuple(
+                    object="document:2021-budget",
+                    relation="reader",
+                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31c",
+                ),
+            )
+            self.assertFalse(response.writes[1].success)
+            self.assertIsInstance(response.writes[1].error, ValidationException)
+            self.assertIsInstance(
+                response.writes[1].error.parsed_exception,
+                ValidationErrorMessageResponse,
+            )
+            self.assertEqual(
+                response.writes[2],
+                ClientWriteSingleResponse(
+                    tuple_key=ClientTuple(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                    ),
+                    success=True,
+                    error=None,
+                ),
+            )
+            self.assertEqual(mock_request.call_count, 3)
+            mock_request.assert_any_call(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/write",
                 headers=ANY,
                 query_params=[],
                 post_params=[],
@@ -1952,16 +2585,84 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
             api_client.close()
 
+    @patch("time.sleep")
+    @patch("opentelemetry.trace.get_current_span")
+    @patch("opentelemetry.propagate.inject")
+    @patch("opentelemetry.trace.get_tracer")
+    @patch("openfga_sdk.telemetry.tracing.isTracerProviderSet", return_value=True)
     @patch.object(rest.RESTClientObject, "request")
-    def test_check_config_auth_model(self, mock_request):
-        """Test case for check
+    def test_check_tracing(
+        self,
+        mock_request,
+        mock_provider_set,
+        mock_get_tracer,
+        mock_inject,
+        mock_get_current_span,
+        mock_sleep,
+    ):
+        """Test case for check when a TracerProvider is set
 
-        Check whether a user is authorized to access an object and the auth model is already encoded in store
+        A span records the call, with a child span per HTTP attempt and an event per retry
         """
+        error_response_body = (
+            '{"code": "rate_limit_exceeded", "message": "Rate Limit exceeded"}'
+        )
+        mock_request.side_effect = [
+            RateLimitExceededError(
+                http_resp=http_mock_response(error_response_body, 429)
+            ),
+            mock_response('{"allowed": true, "resolution": "1234"}', 200),
+        ]
+        tracer = MagicMock(spec=Tracer)
+        mock_get_tracer.return_value = tracer
+        mock_inject.side_effect = lambda headers: headers.update(
+            {"traceparent": "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"}
+        )
+        mock_get_current_span.return_value.is_recording.return_value = True
 
-        # First, mock the response
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with patch("openfga_sdk.telemetry.tracing._tracing", TelemetryTracing()):
+            with OpenFgaClient(configuration) as api_client:
+                api_response = api_client.check(
+                    body=ClientCheckRequest(
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                        relation="reader",
+                        object="document:budget",
+                    ),
+                    options={"authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1"},
+                )
+                self.assertTrue(api_response.allowed)
+
+        spans = [
+            (c.args[0], c.kwargs["kind"])
+            for c in tracer.start_as_current_span.call_args_list
+        ]
+        self.assertEqual(
+            spans,
+            [
+                ("check", SpanKind.INTERNAL),
+                ("POST", SpanKind.CLIENT),
+                ("POST", SpanKind.CLIENT),
+            ],
+        )
+        self.assertEqual(
+            mock_request.call_args.kwargs["headers"]["traceparent"],
+            "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01",
+        )
+        event = mock_get_current_span.return_value.add_event.call_args
+        self.assertEqual(event.args[0], "fga-client.retry")
+        self.assertEqual(event.kwargs["attributes"]["http.request.resend_count"], 1)
+        self.assertFalse(event.kwargs["attributes"]["fga-client.retry.retry_after"])
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_check_shared_api_client(self, mock_request):
+        """Test case for check from clients sharing an ApiClient
+
+        Each client sends the authorization model of its own configuration
+        """
         response_body = '{"allowed": true, "resolution": "1234"}'
-        mock_request.return_value = mock_response(response_body, 200)
+        mock_request.side_effect = [mock_response(response_body, 200) for _ in range(3)]
         body = ClientCheckRequest(
             object="document:2021-budget",
             relation="reader",
@@ -1970,42 +2671,40 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
         configuration = self.configuration
         configuration.store_id = store_id
         configuration.authorization_model_id = "01GXSA8YR785C4FYS3C0RTG7B1"
+        view_configuration = copy.copy(configuration)
+        view_configuration.authorization_model_id = "01G5JAVJ41T49E9TT3SKVS7X1J"
         with OpenFgaClient(configuration) as api_client:
-            api_response = api_client.check(body=body, options={})
-            self.assertIsInstance(api_response, CheckResponse)
-            self.assertTrue(api_response.allowed)
-            # Make sure the API was called with the right data
-            mock_request.assert_called_once_with(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
+            view = OpenFgaClient(view_configuration, api_client._api_client)
+            self.assertIs(view._api_client, api_client._api_client)
+
+            api_client.check(body=body)
+            view.check(body=body)
+            # Closing a client leaves the ApiClient it shares open
+            with patch.object(view._api_client, "close") as mock_close:
+                view.close()
+                mock_close.assert_not_called()
+            view.check(body=body)
+
+            self.assertEqual(
+                [
+                    call.kwargs["body"]["authorization_model_id"]
+                    for call in mock_request.call_args_list
+                ],
+                [
+                    "01GXSA8YR785C4FYS3C0RTG7B1",
+                    "01G5JAVJ41T49E9TT3SKVS7X1J",
+                    "01G5JAVJ41T49E9TT3SKVS7X1J",
+                ],
             )
-            api_client.close()
 
     @patch.object(rest.RESTClientObject, "request")
-    def test_client_batch_check_single_request(self, mock_request):
-        """Test case for check with single request
+    def test_check_for_store(self, mock_request):
+        """Test case for check from a view of another store
 
-        Check whether a user is authorized to access an object
+        The view sends its store and model, and the client keeps its own
         """
-
-        # First, mock the response
         response_body = '{"allowed": true, "resolution": "1234"}'
-        mock_request.side_effect = [
-            mock_response(response_body, 200),
-        ]
+        mock_request.side_effect = [mock_response(response_body, 200) for _ in range(3)]
         body = ClientCheckRequest(
             object="document:2021-budget",
             relation="reader",
@@ -2013,37 +2712,203 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
         )
         configuration = self.configuration
         configuration.store_id = store_id
+        configuration.authorization_model_id = "01GXSA8YR785C4FYS3C0RTG7B1"
         with OpenFgaClient(configuration) as api_client:
-            api_response = api_client.client_batch_check(
-                body=[body],
-                options={
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                    "consistency": ConsistencyPreference.MINIMIZE_LATENCY,
-                },
+            view = api_client.for_store(
+                "01H0H015178Y2V4CX10C2KGHF4", "01G5JAVJ41T49E9TT3SKVS7X1J"
             )
-            self.assertIsInstance(api_response, list)
-            self.assertEqual(len(api_response), 1)
-            self.assertEqual(api_response[0].error, None)
-            self.assertTrue(api_response[0].allowed)
-            self.assertEqual(api_response[0].request, body)
-            # Make sure the API was called with the right data
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                    "consistency": "MINIMIZE_LATENCY",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
+            self.assertIs(view._api, api_client._api)
+            self.assertIs(view._model_cache, api_client._model_cache)
+            self.assertIs(view._get_executor(), api_client._get_executor())
+            self.assertEqual(view.get_store_id(), "01H0H015178Y2V4CX10C2KGHF4")
+            self.assertEqual(
+                view.get_authorization_model_id(), "01G5JAVJ41T49E9TT3SKVS7X1J"
+            )
+
+            view.check(body=body)
+            api_client.check(body=body)
+            # Closing a view leaves the client open
+            view.close()
+            view.for_store("01H0H015178Y2V4CX10C2KGHF4").check(body=body)
+
+            self.assertEqual(
+                [
+                    (call.args[1], call.kwargs["body"].get("authorization_model_id"))
+                    for call in mock_request.call_args_list
+                ],
+                [
+                    (
+                        "http://api.fga.example/stores/01H0H015178Y2V4CX10C2KGHF4/check",
+                        "01G5JAVJ41T49E9TT3SKVS7X1J",
+                    ),
+                    (
+                        "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
+                        "01GXSA8YR785C4FYS3C0RTG7B1",
+                    ),
+                    (
+                        "http://api.fga.example/stores/01H0H015178Y2V4CX10C2KGHF4/check",
+                        None,
+                    ),
+                ],
+            )
+            self.assertEqual(api_client.get_store_id(), store_id)
+            self.assertEqual(configuration.store_id, store_id)
+
+            with self.assertRaises(FgaValidationException):
+                api_client.for_store("not-a-store")
+
+    @patch.object(rest.RESTClientObject, "stream")
+    def test_streamed_requests_for_store_telemetry(self, mock_stream):
+        """Test case for the telemetry of streamed requests from a view of another store
+
+        Their telemetry reports the store of the view, not the one of the client
+        """
+        other_store_id = "01H0H015178Y2V4CX10C2KGHF4"
+
+        def mock_gen(*args, **kwargs):
+            yield {"result": {"object": "document:roadmap"}}
+
+        mock_stream.side_effect = mock_gen
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with patch.object(
+            ApiClient, "call_api", autospec=True, side_effect=ApiClient.call_api
+        ) as mock_call_api:
+            with OpenFgaClient(configuration) as api_client:
+                view = api_client.for_store(other_store_id)
+                objects = [
+                    response.object
+                    for response in view.streamed_list_objects(
+                        ClientListObjectsRequest(
+                            type="document", relation="viewer", user="user:anne"
+                        )
+                    )
+                ]
+                chunks = [
+                    chunk
+                    for chunk in view.execute_streamed_api_request(
+                        operation_name="StreamedListObjects",
+                        method="POST",
+                        path="/stores/{store_id}/streamed-list-objects",
+                        path_params={"store_id": other_store_id},
+                        body={
+                            "type": "document",
+                            "relation": "viewer",
+                            "user": "user:anne",
+                        },
+                    )
+                ]
+
+        self.assertEqual(objects, ["document:roadmap"])
+        self.assertEqual(chunks, [{"result": {"object": "document:roadmap"}}])
+        self.assertEqual(
+            [
+                call.kwargs["_telemetry_attributes"][
+                    TelemetryAttributes.fga_client_request_store_id
+                ]
+                for call in mock_call_api.call_args_list
+            ],
+            [other_store_id, other_store_id],
+        )
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_check_config_auth_model(self, mock_request):
+        """Test case for check
+
+        Check whether a user is authorized to access an object and the auth model is already encoded in store
+        """
+
+        # First, mock the response
+        response_body = '{"allowed": true, "resolution": "1234"}'
+        mock_request.return_value = mock_response(response_body, 200)
+        body = ClientCheckRequest(
+            object="document:2021-budget",
+            relation="reader",
+            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        configuration.authorization_model_id = "01GXSA8YR785C4FYS3C0RTG7B1"
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.check(body=body, options={})
+            self.assertIsInstance(api_response, CheckResponse)
+            self.assertTrue(api_response.allowed)
+            # Make sure the API was called with the right data
+            mock_request.assert_called_once_with(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
+                headers=ANY,
+                query_params=[],
+                post_params=[],
+                body={
+                    "tuple_key": {
+                        "object": "document:2021-budget",
+                        "relation": "reader",
+                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    },
+                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+                },
+                _preload_content=ANY,
+                _request_timeout=None,
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_client_batch_check_single_request(self, mock_request):
+        """Test case for check with single request
+
+        Check whether a user is authorized to access an object
+        """
+
+        # First, mock the response
+        response_body = '{"result": {"0": {"allowed": true}}}'
+        mock_request.side_effect = [
+            mock_response(response_body, 200),
+        ]
+        body = ClientCheckRequest(
+            object="document:2021-budget",
+            relation="reader",
+            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.client_batch_check(
+                body=[body],
+                options={
+                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+                    "consistency": ConsistencyPreference.MINIMIZE_LATENCY,
+                },
+            )
+            self.assertIsInstance(api_response, list)
+            self.assertEqual(len(api_response), 1)
+            self.assertEqual(api_response[0].error, None)
+            self.assertTrue(api_response[0].allowed)
+            self.assertEqual(api_response[0].request, body)
+            self.assertTrue(api_response[0].response.allowed)
+            # Make sure the API was called with the right data
+            mock_request.assert_called_once_with(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/batch-check",
+                headers=ANY,
+                query_params=[],
+                post_params=[],
+                body={
+                    "checks": [
+                        {
+                            "tuple_key": {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                            },
+                            "correlation_id": "0",
+                        }
+                    ],
+                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+                    "consistency": "MINIMIZE_LATENCY",
+                },
+                _preload_content=ANY,
+                _request_timeout=None,
             )
             api_client.close()
 
@@ -2070,19 +2935,11 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
         )
 
-        # Mock the response based on request body to avoid race conditions
-        def mock_side_effect(*args, **kwargs):
-            body = kwargs.get("body", {})
-            user = body.get("tuple_key", {}).get("user", "")
-            if user == "user:81684243-9356-4421-8fbf-a4f8d36aa31b":
-                return mock_response('{"allowed": true, "resolution": "1234"}', 200)
-            elif user == "user:81684243-9356-4421-8fbf-a4f8d36aa31c":
-                return mock_response('{"allowed": false, "resolution": "1234"}', 200)
-            elif user == "user:81684243-9356-4421-8fbf-a4f8d36aa31d":
-                return mock_response('{"allowed": true, "resolution": "1234"}', 200)
-            return mock_response('{"allowed": false, "resolution": "1234"}', 200)
-
-        mock_request.side_effect = mock_side_effect
+        mock_request.side_effect = mock_batch_check_response(
+            lambda tuple_key: (
+                tuple_key["user"] != "user:81684243-9356-4421-8fbf-a4f8d36aa31c"
+            )
+        )
         configuration = self.configuration
         configuration.store_id = store_id
         with OpenFgaClient(configuration) as api_client:
@@ -2091,6 +2948,7 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                 options={
                     "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
                     "max_parallel_requests": 2,
+                    "max_batch_size": 2,
                 },
             )
             self.assertIsInstance(api_response, list)
@@ -2104,36 +2962,33 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             self.assertEqual(api_response[2].error, None)
             self.assertTrue(api_response[2].allowed)
             self.assertEqual(api_response[2].request, body3)
-            # Make sure the API was called with the right data
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
-            )
+            # Make sure the checks were chunked by max_batch_size
+            self.assertEqual(mock_request.call_count, 2)
             mock_request.assert_any_call(
                 "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/batch-check",
                 headers=ANY,
                 query_params=[],
                 post_params=[],
                 body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31c",
-                    },
+                    "checks": [
+                        {
+                            "tuple_key": {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                            },
+                            "correlation_id": "0",
+                        },
+                        {
+                            "tuple_key": {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31c",
+                            },
+                            "correlation_id": "1",
+                        },
+                    ],
                     "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
                 },
                 _preload_content=ANY,
@@ -2141,16 +2996,21 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
             mock_request.assert_any_call(
                 "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/batch-check",
                 headers=ANY,
                 query_params=[],
                 post_params=[],
                 body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31d",
-                    },
+                    "checks": [
+                        {
+                            "tuple_key": {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                            },
+                            "correlation_id": "2",
+                        },
+                    ],
                     "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
                 },
                 _preload_content=ANY,
@@ -2187,19 +3047,20 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             user="user:81684243-9356-4421-8fbf-a4f8d36aa31d",
         )
 
-        # Mock the response based on request body to avoid race conditions
+        # The request carrying the second check fails as a whole
+        allowed = mock_batch_check_response(
+            lambda tuple_key: (
+                tuple_key["user"] == "user:81684243-9356-4421-8fbf-a4f8d36aa31b"
+            )
+        )
+
         def mock_side_effect(*args, **kwargs):
-            body = kwargs.get("body", {})
-            user = body.get("tuple_key", {}).get("user", "")
-            if user == "user:81684243-9356-4421-8fbf-a4f8d36aa31b":
-                return mock_response('{"allowed": true, "resolution": "1234"}', 200)
-            elif user == "user:81684243-9356-4421-8fbf-a4f8d36aa31c":
+            user = kwargs["body"]["checks"][0]["tuple_key"]["user"]
+            if user == "user:81684243-9356-4421-8fbf-a4f8d36aa31c":
                 raise ValidationException(
                     http_resp=http_mock_response(response_body, 400)
                 )
-            elif user == "user:81684243-9356-4421-8fbf-a4f8d36aa31d":
-                return mock_response('{"allowed": false, "resolution": "1234"}', 200)
-            return mock_response('{"allowed": false, "resolution": "1234"}', 200)
+            return allowed(*args, **kwargs)
 
         mock_request.side_effect = mock_side_effect
         configuration = self.configuration
@@ -2210,6 +3071,7 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
                 options={
                     "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
                     "max_parallel_requests": 2,
+                    "max_batch_size": 1,
                 },
             )
             self.assertIsInstance(api_response, list)
@@ -2226,126 +3088,791 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             self.assertEqual(api_response[2].error, None)
             self.assertFalse(api_response[2].allowed)
             self.assertEqual(api_response[2].request, body3)
-            # Make sure the API was called with the right data
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
+            self.assertEqual(mock_request.call_count, 3)
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_client_batch_check_shared_context(self, mock_request):
+        """Test case for client batch check with a context shared by the checks
+
+        The checks are converted on the calling thread before the chunks are sent in parallel
+        """
+        mock_request.side_effect = mock_batch_check_response(lambda _: True)
+        context = {"ip": "127.0.0.1"}
+        body = [
+            ClientCheckRequest(
+                object=f"document:{index}",
+                relation="reader",
+                user="user:anne",
+                context=dict(context),
             )
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31c",
+            for index in range(4)
+        ]
+        threads = set()
+
+        def construct_batch_item(*args, **kwargs):
+            threads.add(threading.current_thread())
+            return batch_check_item.construct_batch_item(*args, **kwargs)
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            with patch(
+                "openfga_sdk.sync.client.client.construct_batch_item",
+                side_effect=construct_batch_item,
+            ):
+                api_response = api_client.client_batch_check(
+                    body=body,
+                    options={
+                        "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+                        "max_parallel_requests": 4,
+                        "max_batch_size": 1,
                     },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
-            )
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
+                )
+
+            self.assertTrue(all(response.allowed for response in api_response))
+            self.assertEqual(mock_request.call_count, 4)
+            self.assertEqual(threads, {threading.current_thread()})
+            for call in mock_request.call_args_list:
+                self.assertEqual(call.kwargs["body"]["checks"][0]["context"], context)
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_client_batch_check_single_check_error(self, mock_request):
+        """Test case for check with multiple request with one check errored
+
+        Check whether a user is authorized to access an object
+        """
+        response_body = """
+{
+  "result": {
+    "0": {"allowed": true},
+    "1": {
+      "error": {
+        "input_error": "validation_error",
+        "message": "type 'unknown' not found"
+      }
+    }
+  }
+}
+        """
+        mock_request.side_effect = [
+            mock_response(response_body, 200),
+        ]
+
+        body1 = ClientCheckRequest(
+            object="document:2021-budget",
+            relation="reader",
+            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        )
+        body2 = ClientCheckRequest(
+            object="unknown:2021-budget",
+            relation="reader",
+            user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.client_batch_check(
+                body=[body1, body2],
+                options={"authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1"},
+            )
+            self.assertEqual(len(api_response), 2)
+            self.assertEqual(api_response[0].error, None)
+            self.assertTrue(api_response[0].allowed)
+            self.assertFalse(api_response[1].allowed)
+            self.assertEqual(api_response[1].request, body2)
+            self.assertIsInstance(api_response[1].error, ValidationException)
+            self.assertEqual(api_response[1].error.code, "validation_error")
+            self.assertEqual(
+                api_response[1].error.error_message, "type 'unknown' not found"
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_check_matrix_parallel_chunks(self, mock_request):
+        """Test case for check_matrix with requests answered at once
+
+        Chunks of 3 checks share bytes of the matrix, set from different threads
+        """
+        allowed = mock_batch_check_response(lambda tuple_key: True)
+        barrier = threading.Barrier(8)
+
+        def mock_side_effect(*args, **kwargs):
+            # Hold each request until 8 are in flight, so their results are set together
+            try:
+                barrier.wait(timeout=1)
+            except threading.BrokenBarrierError:
+                pass
+            return allowed(*args, **kwargs)
+
+        mock_request.side_effect = mock_side_effect
+        configuration = self.configuration
+        configuration.store_id = store_id
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with OpenFgaClient(configuration) as api_client:
+                matrix = api_client.check_matrix(
+                    users=[f"user:{i}" for i in range(40)],
+                    relations=["viewer", "editor"],
+                    objects=[f"document:{i}" for i in range(3)],
+                    options={"max_parallel_requests": 8, "max_batch_size": 3},
+                )
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(mock_request.call_count, 80)
+        self.assertEqual(
+            sum(matrix.get(index) for index in range(len(matrix))), len(matrix)
+        )
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_check_matrix(self, mock_request):
+        """Test case for check_matrix
+
+        Check every combination of users, relations and objects
+        """
+        response_body = """
+{
+  "code": "validation_error",
+  "message": "Generic validation error"
+}
+        """
+        allowed = mock_batch_check_response(
+            lambda tuple_key: (
+                tuple_key["user"] == "user:anne" or tuple_key["relation"] == "viewer"
+            )
+        )
+
+        def mock_side_effect(*args, **kwargs):
+            # The request carrying the last chunk fails as a whole
+            if kwargs["body"]["checks"][0]["correlation_id"] == "10":
+                raise ValidationException(
+                    http_resp=http_mock_response(response_body, 400)
+                )
+            return allowed(*args, **kwargs)
+
+        mock_request.side_effect = mock_side_effect
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            matrix = api_client.check_matrix(
+                users=["user:anne", "user:bob", "user:anne"],
+                relations=["viewer", "editor"],
+                objects=["document:1", "document:2", "document:3"],
+                contextual_tuples=[
+                    ClientTuple(
+                        user="user:bob", relation="member", object="team:admins"
+                    )
+                ],
+                options={
+                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+                    "max_parallel_requests": 2,
+                    "max_batch_size": 5,
+                },
+            )
+
+            # Duplicate users are checked once
+            self.assertEqual(len(matrix), 12)
+            self.assertEqual(mock_request.call_count, 3)
+            self.assertEqual(
+                sum(
+                    len(call[1]["body"]["checks"])
+                    for call in mock_request.call_args_list
+                ),
+                12,
+            )
+
+            self.assertTrue(matrix.allowed("user:anne", "editor", "document:2"))
+            self.assertTrue(matrix.allowed("user:bob", "viewer", "document:3"))
+            self.assertFalse(matrix.allowed("user:bob", "editor", "document:1"))
+            self.assertEqual(
+                matrix.allowed_objects("user:anne", "viewer"),
+                ["document:1", "document:2", "document:3"],
+            )
+
+            # Checks 10 and 11 (bob, editor, document:2 and document:3) were in the failed request
+            self.assertFalse(matrix.allowed("user:bob", "editor", "document:3"))
+            self.assertEqual(
+                set(matrix.errors),
+                {
+                    ("user:bob", "editor", "document:2"),
+                    ("user:bob", "editor", "document:3"),
+                },
+            )
+            self.assertIsInstance(
+                matrix.error("user:bob", "editor", "document:2"), ValidationException
+            )
+            self.assertIsNone(matrix.error("user:anne", "editor", "document:2"))
+
+            first_body = mock_request.call_args_list[0][1]["body"]
+            self.assertEqual(
+                first_body["checks"][0],
+                {
                     "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31d",
+                        "user": "user:anne",
+                        "relation": "viewer",
+                        "object": "document:1",
                     },
+                    "contextual_tuples": {
+                        "tuple_keys": [
+                            {
+                                "user": "user:bob",
+                                "relation": "member",
+                                "object": "team:admins",
+                            }
+                        ]
+                    },
+                    "correlation_id": "0",
+                },
+            )
+            self.assertEqual(
+                first_body["authorization_model_id"], "01GXSA8YR785C4FYS3C0RTG7B1"
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_filter_allowed_batch_check(self, mock_request):
+        """Test case for filter_allowed using batch check
+
+        Keep the candidates the user has the relation with
+        """
+        mock_request.side_effect = mock_batch_check_response(
+            lambda tuple_key: tuple_key["object"] != "document:2"
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            allowed = api_client.filter_allowed(
+                "user:anne",
+                "viewer",
+                ["document:3", "document:2", "folder:1", "document:3", "document:1"],
+                options={"max_batch_size": 2},
+            )
+
+            self.assertEqual(allowed, ["document:3", "folder:1", "document:1"])
+            # A single round of batch checks per type: 2 requests for documents, 1 for folders
+            self.assertEqual(mock_request.call_count, 3)
+            self.assertEqual(
+                mock_request.call_args_list[0][1]["headers"]["X-OpenFGA-Client-Method"],
+                "FilterAllowed",
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "stream")
+    def test_filter_allowed_list_objects(self, mock_stream):
+        """Test case for filter_allowed using streamed list objects
+
+        Stop streaming once every candidate was found
+        """
+        consumed = []
+
+        def mock_gen():
+            for object in ["document:1", "document:2", "document:3", "document:4"]:
+                consumed.append(object)
+                yield {"result": {"object": object}}
+
+        mock_stream.return_value = mock_gen()
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            allowed = api_client.filter_allowed(
+                "user:anne",
+                "viewer",
+                ["document:3", "document:7", "document:1"],
+                options={"strategy": "list_objects"},
+            )
+
+            self.assertEqual(allowed, ["document:3", "document:1"])
+            self.assertEqual(len(consumed), 4)
+            self.assertEqual(
+                mock_stream.call_args[1]["body"],
+                {"user": "user:anne", "relation": "viewer", "type": "document"},
+            )
+
+            mock_stream.return_value = mock_gen()
+            consumed.clear()
+            allowed = api_client.filter_allowed(
+                "user:anne",
+                "viewer",
+                ["document:2", "document:1"],
+                options={"strategy": "list_objects"},
+            )
+
+            self.assertEqual(allowed, ["document:2", "document:1"])
+            self.assertEqual(consumed, ["document:1", "document:2"])
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_filter_allowed_strategy_choice(self, mock_request):
+        """Test case for filter_allowed picking a strategy
+
+        Use the strategy observed to be faster for the number of candidates
+        """
+        mock_request.side_effect = mock_batch_check_response(lambda tuple_key: True)
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            planner = api_client._filter_planner
+            candidates = [f"document:{i}" for i in range(1000)]
+
+            # Nothing observed yet: a single round of batch checks, or a listing to learn its cost
+            self.assertEqual(
+                planner.choose(10, "document", "viewer", 50, 10),
+                ClientFilterStrategy.BATCH_CHECK,
+            )
+            self.assertEqual(
+                planner.choose(len(candidates), "document", "viewer", 50, 10),
+                ClientFilterStrategy.LIST_OBJECTS,
+            )
+
+            planner.record_batch_check(0.01)
+            planner.record_list_objects("document", "viewer", 0.5, 100000)
+            self.assertEqual(
+                planner.choose(len(candidates), "document", "viewer", 50, 10),
+                ClientFilterStrategy.BATCH_CHECK,
+            )
+
+            allowed = api_client.filter_allowed("user:anne", "viewer", candidates)
+            self.assertEqual(allowed, candidates)
+            self.assertEqual(mock_request.call_count, 20)
+
+            # Listing a small result beats several rounds of batch checks
+            planner = FilterPlanner()
+            planner.record_batch_check(0.05)
+            planner.record_list_objects("document", "viewer", 0.02, 200)
+            self.assertEqual(
+                planner.choose(len(candidates), "document", "viewer", 50, 10),
+                ClientFilterStrategy.LIST_OBJECTS,
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_batch_check_single_request(self, mock_request):
+        """Test case for check with single request
+
+        Check whether a user is authorized to access an object
+        """
+
+        # First, mock the response
+        response_body = """
+        {
+            "result": {
+                "1": {
+                    "allowed": true
+                }
+            }
+        }
+        """
+        mock_request.side_effect = [
+            mock_response(response_body, 200),
+        ]
+
+        body = ClientBatchCheckRequest(
+            checks=[
+                ClientBatchCheckItem(
+                    object="document:2021-budget",
+                    relation="reader",
+                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    correlation_id="1",
+                ),
+            ]
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.batch_check(
+                body=body,
+                options={"authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1"},
+            )
+            self.assertEqual(len(api_response.result), 1)
+            self.assertEqual(api_response.result[0].error, None)
+            self.assertTrue(api_response.result[0].allowed)
+            self.assertEqual(api_response.result[0].correlation_id, "1")
+            self.assertEqual(api_response.result[0].request, body.checks[0])
+            # Make sure the API was called with the right data
+            mock_request.assert_any_call(
+                "POST",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/batch-check",
+                headers=ANY,
+                query_params=[],
+                post_params=[],
+                body={
+                    "checks": [
+                        {
+                            "tuple_key": {
+                                "object": "document:2021-budget",
+                                "relation": "reader",
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                            },
+                            "correlation_id": "1",
+                        }
+                    ],
                     "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
                 },
-                _preload_content=ANY,
-                _request_timeout=None,
+                _preload_content=ANY,
+                _request_timeout=None,
+            )
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_batch_check_duplicate_checks(self, mock_request):
+        """Test case for batch check with identical checks
+
+        Identical checks are sent once and their result is returned for every correlation id
+        """
+        mock_request.side_effect = mock_batch_check_response(
+            lambda tuple_key: tuple_key["object"] == "document:roadmap"
+        )
+
+        def check(correlation_id, object, context=None, contextual_tuples=None):
+            return ClientBatchCheckItem(
+                user="user:anne",
+                relation="reader",
+                object=object,
+                correlation_id=correlation_id,
+                context=context,
+                contextual_tuples=contextual_tuples,
+            )
+
+        body = ClientBatchCheckRequest(
+            checks=[
+                check("1", "document:roadmap"),
+                check("2", "document:budget"),
+                check("3", "document:roadmap"),
+                check("4", "document:roadmap", context={"a": 1, "b": 2}),
+                check("5", "document:roadmap", context={"b": 2, "a": 1}),
+                check(
+                    "6",
+                    "document:roadmap",
+                    contextual_tuples=[
+                        ClientTuple(
+                            user="user:anne", relation="member", object="team:x"
+                        )
+                    ],
+                ),
+                check("7", "document:budget"),
+            ]
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.batch_check(
+                body=body, options={"max_batch_size": 2}
+            )
+
+            sent = [
+                check["correlation_id"]
+                for call in mock_request.call_args_list
+                for check in call[1]["body"]["checks"]
+            ]
+            self.assertEqual(sent, ["1", "2", "4", "6"])
+            self.assertEqual(mock_request.call_count, 2)
+
+            results = {
+                response.correlation_id: response for response in api_response.result
+            }
+            self.assertEqual(set(results), {"1", "2", "3", "4", "5", "6", "7"})
+            self.assertTrue(results["3"].allowed)
+            self.assertTrue(results["5"].allowed)
+            self.assertFalse(results["7"].allowed)
+            self.assertIs(results["3"].request, body.checks[2])
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_batch_check_shared_contextual_tuples(self, mock_request):
+        """Test case for batch check with contextual tuples shared by the checks
+
+        Identical contextual tuples and contexts are converted once and referenced by every check
+        """
+        mock_request.side_effect = mock_batch_check_response(lambda _: True)
+
+        def contextual_tuples():
+            return [
+                ClientTuple(
+                    user="user:anne",
+                    relation="member",
+                    object="team:x",
+                    condition=RelationshipCondition(
+                        name="in_range", context={"x": 1, "y": 2}
+                    ),
+                )
+            ]
+
+        shared = contextual_tuples()
+        shared_context = {"ip": "127.0.0.1"}
+        body = ClientBatchCheckRequest(
+            checks=[
+                ClientBatchCheckItem(
+                    user="user:anne",
+                    relation="reader",
+                    object=f"document:{index}",
+                    correlation_id=str(index),
+                    # the last check carries equal copies rather than the same list and dict
+                    contextual_tuples=shared if index < 2 else contextual_tuples(),
+                    context=shared_context if index < 2 else dict(shared_context),
+                )
+                for index in range(3)
+            ]
+        )
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            with patch.object(batch_check_item, "json", wraps=json) as mock_json:
+                api_response = api_client.batch_check(
+                    body=body, options={"max_batch_size": 3}
+                )
+
+            self.assertEqual(len(api_response.result), 3)
+            # Each context is serialized once, the first time it is seen, for the contexts and the conditions
+            self.assertEqual(mock_json.dumps.call_count, 4)
+            self.assertEqual(mock_request.call_count, 1)
+            checks = mock_request.call_args.kwargs["body"]["checks"]
+            self.assertEqual(
+                checks[0]["contextual_tuples"],
+                {
+                    "tuple_keys": [
+                        {
+                            "user": "user:anne",
+                            "relation": "member",
+                            "object": "team:x",
+                            "condition": {
+                                "name": "in_range",
+                                "context": {"x": 1, "y": 2},
+                            },
+                        }
+                    ]
+                },
             )
+            self.assertEqual(checks[0]["context"], {"ip": "127.0.0.1"})
+            for check in checks[1:]:
+                self.assertIs(
+                    check["contextual_tuples"], checks[0]["contextual_tuples"]
+                )
+                self.assertIs(check["context"], checks[0]["context"])
             api_client.close()
 
     @patch.object(rest.RESTClientObject, "request")
-    def test_batch_check_single_request(self, mock_request):
-        """Test case for check with single request
+    def test_parallel_methods_share_executor(self, mock_request):
+        """Test case for the executor the parallel methods send their requests from
 
-        Check whether a user is authorized to access an object
+        The client keeps one bounded executor across calls and shuts it down on close
         """
+        respond = mock_batch_check_response(lambda _: True)
+        threads = set()
 
-        # First, mock the response
-        response_body = """
-        {
-            "result": {
-                "1": {
-                    "allowed": true
-                }
-            }
-        }
-        """
-        mock_request.side_effect = [
-            mock_response(response_body, 200),
-        ]
+        def response(*args, **kwargs):
+            threads.add(threading.current_thread().name)
+            if args[1].endswith("/write"):
+                return mock_response("{}", 200)
+            return respond(*args, **kwargs)
 
-        body = ClientBatchCheckRequest(
+        mock_request.side_effect = response
+        configuration = self.configuration
+        configuration.store_id = store_id
+        configuration.max_worker_threads = 2
+        api_client = OpenFgaClient(configuration)
+        checks = ClientBatchCheckRequest(
             checks=[
                 ClientBatchCheckItem(
-                    object="document:2021-budget",
+                    user="user:anne",
                     relation="reader",
-                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    correlation_id="1",
-                ),
+                    object=f"document:{index}",
+                )
+                for index in range(4)
             ]
         )
+        options = {"max_batch_size": 1, "max_parallel_requests": 4}
+
+        api_client.batch_check(checks, options)
+        executor = api_client._executor
+        self.assertIsNotNone(executor)
+        api_client.batch_check(checks, options)
+        self.assertIs(api_client._executor, executor)
+
+        response = api_client.write(
+            ClientWriteRequest(
+                writes=[
+                    ClientTuple(
+                        object=f"document:{index}",
+                        relation="reader",
+                        user="user:anne",
+                    )
+                    for index in range(4)
+                ]
+            ),
+            options={
+                "transaction": WriteTransactionOpts(
+                    disabled=True, max_per_chunk=1, max_parallel_requests=4
+                )
+            },
+        )
+        self.assertEqual(
+            [item.tuple_key.object for item in response.writes],
+            [f"document:{index}" for index in range(4)],
+        )
+        self.assertTrue(all(item.success for item in response.writes))
+
+        self.assertEqual(mock_request.call_count, 12)
+        self.assertLessEqual(len(threads), 2)
+        self.assertTrue(all(name.startswith("openfga-client") for name in threads))
+
+        api_client.close()
+        self.assertIsNone(api_client._executor)
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_parallel_methods_refill_window(self, mock_request):
+        """Test case for a slow request not stalling the rest of the parallel window
+
+        The first request is only answered once the last one has been sent
+        """
+        respond = mock_batch_check_response(lambda _: True)
+        last_sent = threading.Event()
+        answered = []
+
+        def response(*args, **kwargs):
+            objects = [
+                check["tuple_key"]["object"] for check in kwargs["body"]["checks"]
+            ]
+            if objects == ["document:0"]:
+                answered.append(last_sent.wait(5))
+            elif objects == ["document:5"]:
+                last_sent.set()
+            return respond(*args, **kwargs)
+
+        mock_request.side_effect = response
         configuration = self.configuration
         configuration.store_id = store_id
+        configuration.max_worker_threads = 2
         with OpenFgaClient(configuration) as api_client:
-            api_response = api_client.batch_check(
-                body=body,
-                options={"authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1"},
+            response = api_client.batch_check(
+                ClientBatchCheckRequest(
+                    checks=[
+                        ClientBatchCheckItem(
+                            user="user:anne",
+                            relation="reader",
+                            object=f"document:{index}",
+                        )
+                        for index in range(6)
+                    ]
+                ),
+                options={"max_batch_size": 1, "max_parallel_requests": 2},
             )
-            self.assertEqual(len(api_response.result), 1)
-            self.assertEqual(api_response.result[0].error, None)
-            self.assertTrue(api_response.result[0].allowed)
-            self.assertEqual(api_response.result[0].correlation_id, "1")
-            self.assertEqual(api_response.result[0].request, body.checks[0])
-            # Make sure the API was called with the right data
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/batch-check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "checks": [
-                        {
-                            "tuple_key": {
-                                "object": "document:2021-budget",
-                                "relation": "reader",
-                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                            },
-                            "correlation_id": "1",
-                        }
-                    ],
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+
+        self.assertEqual(answered, [True])
+        self.assertEqual(
+            [result.request.object for result in response.result],
+            [f"document:{index}" for index in range(6)],
+        )
+        self.assertTrue(all(result.allowed for result in response.result))
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_request_priority(self, mock_request):
+        """Test case for low priority requests leaving connections to high priority ones
+
+        Only the connections that are not reserved for high priority requests are used by low priority ones
+        """
+        respond = mock_batch_check_response(lambda _: True)
+        lock = threading.Lock()
+        in_flight = []
+        most_in_flight = 0
+
+        def slow_response(*args, **kwargs):
+            nonlocal most_in_flight
+            with lock:
+                in_flight.append(True)
+                most_in_flight = max(most_in_flight, len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+            return respond(*args, **kwargs)
+
+        mock_request.side_effect = slow_response
+        configuration = self.configuration
+        configuration.store_id = store_id
+        configuration.connection_pool_maxsize = 3
+        configuration.connection_pool_reserved_for_high_priority = 2
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.batch_check(
+                ClientBatchCheckRequest(
+                    checks=[
+                        ClientBatchCheckItem(
+                            user="user:anne",
+                            relation="reader",
+                            object=f"document:{index}",
+                        )
+                        for index in range(4)
+                    ]
+                ),
+                options={
+                    "max_batch_size": 1,
+                    "max_parallel_requests": 4,
+                    "priority": RequestPriority.LOW,
                 },
-                _preload_content=ANY,
-                _request_timeout=None,
             )
+
+            self.assertEqual(len(api_response.result), 4)
+            self.assertEqual(mock_request.call_count, 4)
+            self.assertEqual(most_in_flight, 1)
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_timeout_budget(self, mock_request):
+        """Test case for an operation running out of its timeout budget
+
+        Requests that cannot start in time are not sent and their checks are reported as cut short
+        """
+        respond = mock_batch_check_response(lambda _: True)
+
+        def slow_response(*args, **kwargs):
+            time.sleep(0.2)
+            return respond(*args, **kwargs)
+
+        mock_request.side_effect = slow_response
+        options = {
+            "max_batch_size": 1,
+            "max_parallel_requests": 1,
+            "timeout_budget": 0.1,
+        }
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            api_response = api_client.batch_check(
+                ClientBatchCheckRequest(
+                    checks=[
+                        ClientBatchCheckItem(
+                            user="user:anne",
+                            relation="reader",
+                            object=f"document:{index}",
+                            correlation_id=str(index),
+                        )
+                        for index in range(3)
+                    ]
+                ),
+                options=options,
+            )
+
+            results = {item.correlation_id: item for item in api_response.result}
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertTrue(results["0"].allowed)
+            self.assertIsNone(results["0"].error)
+            for correlation_id in ("1", "2"):
+                self.assertFalse(results[correlation_id].allowed)
+                self.assertEqual(
+                    results[correlation_id].error.internal_error, "deadline_exceeded"
+                )
+
+            # The budget spans the whole operation: a second call gets a budget of its own
+            with self.assertRaises(FgaDeadlineExceededException) as error:
+                api_client.list_relations(
+                    ClientListRelationsRequest(
+                        user="user:anne",
+                        relations=["reader", "owner", "viewer"],
+                        object="document:1",
+                    ),
+                    options=options,
+                )
+            self.assertEqual(error.exception.partial_result, ["reader"])
+            self.assertEqual(mock_request.call_count, 2)
             api_client.close()
 
     @patch.object(uuid, "uuid4")
@@ -2792,6 +4319,201 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
             api_client.close()
 
+    @patch.object(rest.RESTClientObject, "stream")
+    def test_streamed_list_objects_fan_out(self, mock_stream):
+        """Test case for streamed_list_objects_fan_out
+
+        Merge the objects streamed by several requests
+        """
+        objects = {
+            "group:a": ["document:1", "document:2"],
+            "group:b": ["document:2", "document:3"],
+            "group:c": [],
+        }
+
+        def mock_gen(user):
+            for object in objects[user]:
+                yield {"result": {"object": object}}
+
+        mock_stream.side_effect = lambda *args, **kwargs: mock_gen(
+            kwargs["body"]["user"]
+        )
+        bodies = [
+            ClientListObjectsRequest(user=user, relation="viewer", type="document")
+            for user in objects
+        ]
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            responses = [
+                response
+                for response in api_client.streamed_list_objects_fan_out(
+                    bodies, options={"max_parallel_requests": 2}
+                )
+            ]
+            self.assertEqual(mock_stream.call_count, 3)
+            self.assertEqual(
+                sorted((response.source, response.object) for response in responses),
+                [
+                    (0, "document:1"),
+                    (0, "document:2"),
+                    (1, "document:2"),
+                    (1, "document:3"),
+                ],
+            )
+            self.assertIs(responses[0].request, bodies[responses[0].source])
+
+            responses = [
+                response.object
+                for response in api_client.streamed_list_objects_fan_out(
+                    bodies, options={"deduplicate": True}
+                )
+            ]
+            self.assertEqual(
+                sorted(responses), ["document:1", "document:2", "document:3"]
+            )
+            api_client.close()
+
+        # From a thread of the client's executor, the requests run inline instead of waiting for a free thread
+        configuration.max_worker_threads = 1
+        with OpenFgaClient(configuration) as api_client:
+            responses = (
+                api_client._get_executor()
+                .submit(
+                    lambda: [
+                        (response.source, response.object)
+                        for response in api_client.streamed_list_objects_fan_out(bodies)
+                    ]
+                )
+                .result(timeout=5)
+            )
+            self.assertEqual(
+                responses,
+                [
+                    (0, "document:1"),
+                    (0, "document:2"),
+                    (1, "document:2"),
+                    (1, "document:3"),
+                ],
+            )
+
+    @patch.object(rest.RESTClientObject, "stream")
+    def test_streamed_list_objects_fan_out_error(self, mock_stream):
+        """Test case for streamed_list_objects_fan_out with a failing request
+
+        The error of any request is raised to the consumer
+        """
+
+        def mock_gen(user):
+            if user == "user:bob":
+                raise ValidationException(status=400, reason="invalid user")
+            yield {"result": {"object": "document:1"}}
+
+        mock_stream.side_effect = lambda *args, **kwargs: mock_gen(
+            kwargs["body"]["user"]
+        )
+        bodies = [
+            ClientListObjectsRequest(user=user, relation="viewer", type="document")
+            for user in ["user:anne", "user:bob"]
+        ]
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            with self.assertRaises(ValidationException):
+                for _ in api_client.streamed_list_objects_fan_out(bodies):
+                    pass
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "stream")
+    def test_streamed_list_objects_fan_out_stop(self, mock_stream):
+        """Test case for streamed_list_objects_fan_out stopped by the consumer
+
+        Stopping the iteration closes every running request
+        """
+        closed = []
+        all_closed = threading.Event()
+
+        def mock_gen(user):
+            try:
+                i = 0
+                while True:
+                    i += 1
+                    yield {"result": {"object": f"document:{i}"}}
+            finally:
+                closed.append(user)
+                if len(closed) == 2:
+                    all_closed.set()
+
+        mock_stream.side_effect = lambda *args, **kwargs: mock_gen(
+            kwargs["body"]["user"]
+        )
+        bodies = [
+            ClientListObjectsRequest(user=user, relation="viewer", type="document")
+            for user in ["user:anne", "user:bob"]
+        ]
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            stream = api_client.streamed_list_objects_fan_out(bodies)
+            for response in stream:
+                if response.object == "document:10":
+                    break
+            stream.close()
+
+            self.assertTrue(all_closed.wait(5))
+            self.assertEqual(sorted(closed), ["user:anne", "user:bob"])
+            api_client.close()
+
+    @patch.object(rest.RESTClientObject, "stream")
+    def test_streamed_list_objects_fan_out_stop_stalled(self, mock_stream):
+        """Test case for streamed_list_objects_fan_out stopped while a request stalls
+
+        Stopping the iteration does not wait for a request that is not sending anything,
+        which is left to a thread of the client's executor
+        """
+        started = threading.Event()
+        release = threading.Event()
+        closed = threading.Event()
+        threads = set()
+
+        def mock_gen(user):
+            threads.add(threading.current_thread().name)
+            try:
+                if user == "user:bob":
+                    started.set()
+                    release.wait(5)
+                yield {"result": {"object": f"document:{user}"}}
+            finally:
+                if user == "user:bob":
+                    closed.set()
+
+        mock_stream.side_effect = lambda *args, **kwargs: mock_gen(
+            kwargs["body"]["user"]
+        )
+        bodies = [
+            ClientListObjectsRequest(user=user, relation="viewer", type="document")
+            for user in ["user:anne", "user:bob"]
+        ]
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with OpenFgaClient(configuration) as api_client:
+            stream = api_client.streamed_list_objects_fan_out(bodies)
+            self.assertEqual(next(stream).object, "document:user:anne")
+            self.assertTrue(started.wait(5))
+            start = time.monotonic()
+            stream.close()
+            self.assertLess(time.monotonic() - start, 1)
+            self.assertFalse(closed.is_set())
+
+            release.set()
+            self.assertTrue(closed.wait(5))
+            self.assertTrue(all(name.startswith("openfga-client") for name in threads))
+            api_client.close()
+
     @patch.object(rest.RESTClientObject, "request")
     def test_list_relations(self, mock_request):
         """Test case for list relations
@@ -2799,15 +4521,10 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
         Check whether a user is authorized to access an object
         """
 
-        def mock_check_requests(*args, **kwargs):
-            body = kwargs.get("body")
-            tuple_key = body.get("tuple_key")
-            if tuple_key["relation"] == "owner":
-                return mock_response('{"allowed": false, "resolution": "1234"}', 200)
-            return mock_response('{"allowed": true, "resolution": "1234"}', 200)
-
         # First, mock the response
-        mock_request.side_effect = mock_check_requests
+        mock_request.side_effect = mock_batch_check_response(
+            lambda tuple_key: tuple_key["relation"] != "owner"
+        )
 
         configuration = self.configuration
         configuration.store_id = store_id
@@ -2825,55 +4542,25 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             )
             self.assertEqual(api_response, ["reader", "viewer"])
 
-            # Make sure the API was called with the right data
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "reader",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                    "consistency": "MINIMIZE_LATENCY",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
-            )
-            mock_request.assert_any_call(
-                "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
-                headers=ANY,
-                query_params=[],
-                post_params=[],
-                body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "owner",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
-                    "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
-                    "consistency": "MINIMIZE_LATENCY",
-                },
-                _preload_content=ANY,
-                _request_timeout=None,
-            )
-            mock_request.assert_any_call(
+            # Make sure all relations were checked in a single request
+            mock_request.assert_called_once_with(
                 "POST",
-                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/check",
+                "http://api.fga.example/stores/01YCP46JKYM8FJCQ37NMBYHE5X/batch-check",
                 headers=ANY,
                 query_params=[],
                 post_params=[],
                 body={
-                    "tuple_key": {
-                        "object": "document:2021-budget",
-                        "relation": "viewer",
-                        "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
-                    },
+                    "checks": [
+                        {
+                            "tuple_key": {
+                                "object": "document:2021-budget",
+                                "relation": relation,
+                                "user": "user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                            },
+                            "correlation_id": str(index),
+                        }
+                        for index, relation in enumerate(["reader", "owner", "viewer"])
+                    ],
                     "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
                     "consistency": "MINIMIZE_LATENCY",
                 },
@@ -3686,16 +5373,9 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
     def test_client_batch_check_with_custom_headers(self, mock_request):
         """Test that custom headers work correctly in batch check operations."""
 
-        def mock_side_effect(*args, **kwargs):
-            body = kwargs.get("body", {})
-            user = body.get("tuple_key", {}).get("user", "")
-            if user == "user:anne":
-                return mock_response('{"allowed": true, "resolution": "1234"}', 200)
-            elif user == "user:bob":
-                return mock_response('{"allowed": false, "resolution": "5678"}', 200)
-            return mock_response('{"allowed": false, "resolution": "0000"}', 200)
-
-        mock_request.side_effect = mock_side_effect
+        mock_request.side_effect = mock_batch_check_response(
+            lambda tuple_key: tuple_key["user"] == "user:anne"
+        )
 
         body = [
             ClientCheckRequest(
@@ -3717,17 +5397,18 @@ class TestOpenFgaClient(IsolatedAsyncioTestCase):
             custom_options = {
                 "headers": {"X-Batch-Id": "batch-xyz-123"},
                 "authorization_model_id": "01GXSA8YR785C4FYS3C0RTG7B1",
+                "max_batch_size": 1,
             }
             api_response = api_client.client_batch_check(
                 body=body, options=custom_options
             )
 
             # Verify all calls had the custom header
+            self.assertEqual(mock_request.call_count, 2)
             for call_args in mock_request.call_args_list:
                 headers = call_args[1]["headers"]
                 self.assertEqual(headers.get("X-Batch-Id"), "batch-xyz-123")
 
-            # Verify responses are correct
             self.assertEqual(len(api_response), 2)
             self.assertTrue(api_response[0].allowed)
             self.assertFalse(api_response[1].allowed)
@@ -0,0 +1,151 @@
+import json
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import urllib3
+
+from openfga_sdk.client import ClientConfiguration
+from openfga_sdk.sync import rest
+from openfga_sdk.sync.client.client import OpenFgaClient
+from openfga_sdk.sync.local.replica import TupleReplica
+
+
+store_id = "01YCP46JKYM8FJCQ37NMBYHE5X"
+
+
+def mock_response(body, status=200):
+    headers = urllib3.response.HTTPHeaderDict({"content-type": "application/json"})
+    obj = urllib3.HTTPResponse(
+        json.dumps(body).encode("utf-8"), headers, status, preload_content=False
+    )
+    return rest.RESTResponse(obj, obj.data)
+
+
+class TestTupleReplica(TestCase):
+    """Test for the synchronous local tuple replica"""
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_bootstrap_and_sync(self, mock_request):
+        responses = {
+            "/read": [
+                {
+                    "tuples": [
+                        {
+                            "key": {
+                                "user": "user:anne",
+                                "relation": "viewer",
+                                "object": "document:a",
+                            },
+                            "timestamp": "2022-07-25T21:15:37.524Z",
+                        }
+                    ],
+                    "continuation_token": "",
+                }
+            ],
+            "/changes": [
+                # The end of the changelog, found before the read
+                {"changes": [], "continuation_token": "changes0"},
+                {
+                    "changes": [
+                        {
+                            "tuple_key": {
+                                "user": "user:anne",
+                                "relation": "viewer",
+                                "object": "document:a",
+                            },
+                            "operation": "TUPLE_OPERATION_DELETE",
+                            "timestamp": "2022-07-26T15:55:55.809Z",
+                        }
+                    ],
+                    "continuation_token": "changes1",
+                },
+                {"changes": [], "continuation_token": "changes1"},
+            ],
+        }
+
+        def mock_requests(method, url, **kwargs):
+            return mock_response(responses["/" + url.rsplit("/", 1)[1]].pop(0))
+
+        mock_request.side_effect = mock_requests
+
+        configuration = ClientConfiguration(
+            api_url="http://api.fga.example", store_id=store_id
+        )
+        with OpenFgaClient(configuration) as client:
+            replica = TupleReplica(client)
+            with patch.object(
+                client.get_telemetry().metrics, "replicaStaleness"
+            ) as mock_staleness:
+                replica.start(interval_in_sec=60)
+
+            self.assertTrue(replica.is_bootstrapped)
+            self.assertFalse(replica.contains("user:anne", "viewer", "document:a"))
+            self.assertEqual(len(replica.store), 0)
+
+            # The changes are tailed from the end of the changelog found before the read, not from a time
+            urls = [c.args[1].rsplit("/", 1)[1] for c in mock_request.call_args_list]
+            self.assertEqual(urls, ["changes", "read", "changes", "changes"])
+            self.assertEqual(
+                mock_request.call_args_list[2].kwargs["query_params"],
+                [("page_size", 100), ("continuation_token", "changes0")],
+            )
+            mock_staleness.assert_called_once()
+            self.assertIs(
+                mock_staleness.call_args.kwargs["configuration"],
+                client.get_telemetry_configuration(),
+            )
+
+            replica.stop()
+
+    @patch.object(rest.RESTClientObject, "request")
+    def test_read_while_polling(self, mock_request):
+        pages = iter(range(1_000_000))
+
+        def mock_requests(method, url, **kwargs):
+            if url.endswith("/read"):
+                return mock_response({"tuples": [], "continuation_token": ""})
+
+            # Every other page of changes writes 200 tuples, the others end the sync
+            page = next(pages)
+            if page % 2:
+                return mock_response({"changes": [], "continuation_token": "token"})
+            return mock_response(
+                {
+                    "changes": [
+                        {
+                            "tuple_key": {
+                                "user": "user:anne",
+                                "relation": "viewer",
+                                "object": f"document:{page}-{i}",
+                            },
+                            "operation": "TUPLE_OPERATION_WRITE",
+                            "timestamp": "2022-07-26T15:55:55.809Z",
+                        }
+                        for i in range(200)
+                    ],
+                    "continuation_token": "token",
+                }
+            )
+
+        mock_request.side_effect = mock_requests
+
+        configuration = ClientConfiguration(
+            api_url="http://api.fga.example", store_id=store_id
+        )
+        with OpenFgaClient(configuration) as client:
+            replica = TupleReplica(client)
+            replica.start(interval_in_sec=0.001)
+            try:
+                reads = 0
+                while len(replica.store) < 2000:
+                    # Pages of changes are applied as a whole while the tuples are read
+                    self.assertEqual(len(replica.read()) % 200, 0)
+                    self.assertEqual(
+                        len(replica.store.objects("user:anne", "viewer")) % 200, 0
+                    )
+                    reads += 1
+            finally:
+                replica.stop()
+
+            self.assertGreater(reads, 0)
@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from datetime import datetime, timedelta, timezone
@@ -14,6 +15,7 @@ from openfga_sdk.credentials import CredentialConfiguration, Credentials
 from openfga_sdk.exceptions import (
     FGA_REQUEST_ID,
     ApiValueError,
+    FgaDeadlineExceededException,
     FgaValidationException,
     NotFoundException,
     RateLimitExceededError,
@@ -79,8 +81,11 @@ from openfga_sdk.models.write_authorization_model_response import (
 from openfga_sdk.models.write_request import WriteRequest
 from openfga_sdk.models.write_request_deletes import WriteRequestDeletes
 from openfga_sdk.models.write_request_writes import WriteRequestWrites
+from openfga_sdk.priority import RequestPriority
 from openfga_sdk.sync import open_fga_api, rest
 from openfga_sdk.sync.api_client import ApiClient
+from openfga_sdk.sync.priority import PriorityScheduler
+from openfga_sdk.telemetry.histograms import TelemetryHistograms
 
 
 store_id = "01H0H015178Y2V4CX10C2KGHF4"
@@ -167,6 +172,47 @@ class TestOpenFgaApiSync(IsolatedAsyncioTestCase):
             )
             api_client.close()
 
+    @patch("openfga_sdk.telemetry.metrics.isMeterProviderSet", return_value=True)
+    @patch("openfga_sdk.telemetry.metrics.TelemetryMetrics.requestPhases")
+    @patch.object(rest.RESTClientObject, "request")
+    def test_check_request_phases(
+        self, mock_request, mock_request_phases, mock_meter_provider_set
+    ):
+        """Test case for check, recording the phases of the request
+
+        The time spent decoding and deserializing the response is added to the timings of the request
+        """
+        response = mock_response('{"allowed": true, "resolution": "1234"}', 200)
+        response.timings = {TelemetryHistograms.fga_client_response_body_read: 0.5}
+        mock_request.return_value = response
+
+        configuration = self.configuration
+        configuration.store_id = store_id
+        with ApiClient(configuration) as api_client:
+            api_instance = open_fga_api.OpenFgaApi(api_client)
+            api_response = api_instance.check(
+                body=CheckRequest(
+                    tuple_key=TupleKey(
+                        object="document:2021-budget",
+                        relation="reader",
+                        user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                    ),
+                ),
+            )
+            self.assertTrue(api_response.allowed)
+            self.assertEqual(
+                set(response.timings),
+                {
+                    TelemetryHistograms.fga_client_response_body_read,
+                    TelemetryHistograms.fga_client_response_json_decode,
+                    TelemetryHistograms.fga_client_response_deserialize,
+                },
+            )
+            mock_request_phases.assert_called_once_with(
+                response.timings, attributes=ANY, configuration=ANY
+            )
+            api_client.close()
+
     @patch.object(rest.RESTClientObject, "request")
     def test_create_store(self, mock_request):
         """Test case for create_store
@@ -1759,6 +1805,86 @@ class TestOpenFgaApiSync(IsolatedAsyncioTestCase):
             mock_request.assert_called()
             self.assertEqual(mock_request.call_count, 5)
 
+    @patch.object(rest.RESTClientObject, "request")
+    def test_deadline(self, mock_request):
+        """
+        Test to ensure requests are bounded by the deadline and not retried past it
+        """
+        response_body = """
+{
+  "code": "internal_error",
+  "message": "Internal Server Error"
+}
+        """
+        mock_request.side_effect = [
+            ServiceException(http_resp=http_mock_response(response_body, 500)),
+            mock_response(response_body, 200),
+        ]
+
+        retry = openfga_sdk.configuration.RetryParams(5, 1000)
+        configuration = self.configuration
+        configuration.store_id = store_id
+        configuration.retry_params = retry
+
+        with ApiClient(configuration) as api_client:
+            api_instance = open_fga_api.OpenFgaApi(api_client)
+            body = CheckRequest(
+                tuple_key=TupleKey(
+                    object="document:2021-budget",
+                    relation="reader",
+                    user="user:81684243-9356-4421-8fbf-a4f8d36aa31b",
+                ),
+            )
+
+            # The retry would wait at least a second, past the deadline
+            with self.assertRaises(FgaDeadlineExceededException) as context:
+                api_instance.check(
+                    body=body,
+                    _deadline=time.monotonic() + 0.5,
+                )
+            self.assertIsInstance(context.exception.__cause__, ServiceException)
+            self.assertEqual(mock_request.call_count, 1)
+            self.assertLessEqual(
+                mock_request.call_args.kwargs["_request_timeout"].total,
+                0.5,
+            )
+
+            # An explicit timeout is capped to the time left as well, in every form
+            for request_timeout in (
+                30,
+                30000,
+                (10, 30),
+                urllib3.Timeout(connect=10, read=30),
+                urllib3.Timeout(total=30),
+            ):
+                mock_request.side_effect = [mock_response(response_body, 200)]
+                api_instance.check(
+                    body=body,
+                    _deadline=time.monotonic() + 0.5,
+                    _request_timeout=request_timeout,
+                )
+                timeout = mock_request.call_args.kwargs["_request_timeout"]
+                self.assertLessEqual(timeout.total, 0.5)
+                self.assertLessEqual(timeout.connect_timeout, 0.5)
+            self.assertEqual(mock_request.call_count, 6)
+
+            with self.assertRaises(FgaDeadlineExceededException):
+                api_instance.check(
+                    body=body,
+                    _deadline=time.monotonic() - 1,
+                )
+            self.assertEqual(mock_request.call_count, 6)
+
+            # Waiting for a connection counts against the deadline too
+            api_client._scheduler = PriorityScheduler(1, 0)
+            with api_client._scheduler.slot(RequestPriority.HIGH):
+                with self.assertRaises(FgaDeadlineExceededException):
+                    api_instance.check(
+                        body=body,
+                        _deadline=time.monotonic() + 0.05,
+                    )
+            self.assertEqual(mock_request.call_count, 6)
+
     @patch.object(rest.RESTClientObject, "request")
     def test_501_error_retry(self, mock_request):
         """
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from unittest import TestCase
+
+from openfga_sdk.exceptions import FgaDeadlineExceededException
+from openfga_sdk.priority import RequestPriority
+from openfga_sdk.sync.priority import PriorityScheduler
+
+
+class TestPriorityScheduler(TestCase):
+    """Test for the synchronous priority scheduler"""
+
+    def test_low_priority_leaves_reserved_connections(self):
+        scheduler = PriorityScheduler(2, 1)
+        started = []
+
+        with scheduler.slot(RequestPriority.LOW):
+            low = self._start(scheduler, RequestPriority.LOW, started)
+            high = self._start(scheduler, RequestPriority.HIGH, started)
+            high.join(1)
+            time.sleep(0.05)
+            self.assertEqual(started, [RequestPriority.HIGH])
+
+        low.join(1)
+        self.assertEqual(started, [RequestPriority.HIGH, RequestPriority.LOW])
+
+    def test_high_priority_waiters_go_first(self):
+        scheduler = PriorityScheduler(1, 0)
+        started = []
+
+        with scheduler.slot(RequestPriority.HIGH):
+            low = self._start(scheduler, RequestPriority.LOW, started)
+            time.sleep(0.05)
+            high = self._start(scheduler, RequestPriority.HIGH, started)
+            time.sleep(0.05)
+            self.assertEqual(started, [])
+
+        low.join(1)
+        high.join(1)
+        self.assertEqual(started, [RequestPriority.HIGH, RequestPriority.LOW])
+
+    def test_deadline(self):
+        scheduler = PriorityScheduler(1, 0)
+        started = []
+
+        with scheduler.slot(RequestPriority.HIGH):
+            with self.assertRaises(FgaDeadlineExceededException):
+                with scheduler.slot(RequestPriority.HIGH, time.monotonic() + 0.05):
+                    started.append(RequestPriority.HIGH)
+
+        # The request that gave up does not hold a place
+        self._start(scheduler, RequestPriority.LOW, started).join(1)
+        self.assertEqual(started, [RequestPriority.LOW])
+
+    @staticmethod
+    def _start(scheduler, priority, started):
+        def run():
+            with scheduler.slot(priority):
+                started.append(priority)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
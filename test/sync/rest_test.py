@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from openfga_sdk.configuration import Configuration
+from openfga_sdk.connection_pool import ConnectionPoolStats
 from openfga_sdk.exceptions import (
     ApiException,
     ForbiddenException,
@@ -15,6 +17,9 @@ from openfga_sdk.exceptions import (
     ValidationException,
 )
 from openfga_sdk.sync.rest import RESTClientObject, RESTResponse
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.configuration import TelemetryConfiguration
+from openfga_sdk.telemetry.histograms import TelemetryHistograms
 
 
 def test_restresponse_init():
@@ -325,6 +330,77 @@ def test_request_preload_content():
     assert resp.data == b'{"some":"data"}'
 
 
+def test_request_tracks_pool_usage():
+    mock_config = MagicMock(
+        spec=[
+            "verify_ssl",
+            "ssl_ca_cert",
+            "cert_file",
+            "key_file",
+            "assert_hostname",
+            "retries",
+            "socket_options",
+            "connection_pool_maxsize",
+            "max_worker_threads",
+            "timeout_millisec",
+            "proxy",
+            "proxy_headers",
+        ]
+    )
+    mock_config.ssl_ca_cert = None
+    mock_config.cert_file = None
+    mock_config.key_file = None
+    mock_config.verify_ssl = True
+    mock_config.connection_pool_maxsize = None
+    mock_config.max_worker_threads = 12
+    mock_config.timeout_millisec = 5000
+    mock_config.proxy = None
+    mock_config.proxy_headers = None
+
+    client = RESTClientObject(configuration=mock_config)
+    assert client.pool_manager.connection_pool_kw["maxsize"] == 12
+    assert client.pool_usage.maxsize == 12
+    assert client.pool_stats() == ConnectionPoolStats(
+        active=0, idle=0, waiting=0, created=0, reused=0
+    )
+
+    mock_pool_manager = MagicMock()
+    client.pool_manager = mock_pool_manager
+
+    def request(**kwargs):
+        assert client.pool_usage.in_flight == 1
+        mock_raw_response = MagicMock()
+        mock_raw_response.status = 200
+        mock_raw_response.reason = "OK"
+        mock_raw_response.data = b'{"some":"data"}'
+        return mock_raw_response
+
+    mock_pool_manager.request.side_effect = request
+
+    client.request(method="GET", url="http://example.com", _preload_content=True)
+
+    assert client.pool_usage.in_flight == 0
+    assert client.pool_usage.peak_in_flight == 1
+
+
+def test_pool_sized_to_the_expected_parallelism():
+    configuration = Configuration(api_url="http://api.fga.example")
+    configuration.connection_pool_maxsize = 4
+    client = RESTClientObject(configuration=configuration)
+
+    client.pool_usage.expect(10)
+    assert client.pool_manager.connection_pool_kw["maxsize"] == 10
+    assert client.pool_usage.maxsize == 10
+
+    pool = client.pool_manager.connection_from_url("http://api.fga.example")
+    assert pool.pool.maxsize == 10
+
+    # The pools already created can no longer be resized
+    client.pool_usage.expect(20)
+    assert client.pool_manager.connection_pool_kw["maxsize"] == 10
+    assert client.pool_usage.maxsize == 10
+
+
 def test_request_no_preload_content():
     mock_config = MagicMock(
         spec=[
@@ -950,3 +1026,60 @@ def test_api_client_context_manager_calls_close():
 
     # After exiting the context manager, close() should have been called
     mock_rest_client.close.assert_called_once()
+
+
+def test_request_phase_timings_when_enabled():
+    mock_config = MagicMock(
+        spec=[
+            "verify_ssl",
+            "ssl_ca_cert",
+            "cert_file",
+            "key_file",
+            "assert_hostname",
+            "retries",
+            "socket_options",
+            "connection_pool_maxsize",
+            "timeout_millisec",
+            "proxy",
+            "proxy_headers",
+            "telemetry",
+        ]
+    )
+    mock_config.ssl_ca_cert = None
+    mock_config.cert_file = None
+    mock_config.key_file = None
+    mock_config.verify_ssl = True
+    mock_config.connection_pool_maxsize = 4
+    mock_config.timeout_millisec = 5000
+    mock_config.proxy = None
+    mock_config.proxy_headers = None
+    mock_config.telemetry = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryHistograms.fga_client_response_body_read: {
+                    TelemetryAttributes.url_scheme: True,
+                },
+            }
+        }
+    )
+
+    client = RESTClientObject(configuration=mock_config)
+    mock_pool_manager = MagicMock()
+    client.pool_manager = mock_pool_manager
+
+    mock_raw_response = MagicMock()
+    mock_raw_response.status = 200
+    mock_raw_response.reason = "OK"
+    mock_raw_response.data = b'{"some":"data"}'
+    mock_pool_manager.request.return_value = mock_raw_response
+
+    resp = client.request(method="GET", url="http://example.com", _preload_content=True)
+
+    # The body is read once the response headers are in
+    assert mock_pool_manager.request.call_args.kwargs["preload_content"] is False
+    assert resp.data == b'{"some":"data"}'
+    assert set(resp.timings) == {
+        TelemetryHistograms.fga_client_sdk_overhead,
+        TelemetryHistograms.fga_client_request_time_to_first_byte,
+        TelemetryHistograms.fga_client_response_body_read,
+    }
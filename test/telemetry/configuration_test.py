@@ -293,7 +293,7 @@ def test_default_telemetry_metric_configuration():
     metric_config = TelemetryMetricConfiguration.getSdkDefaults()
 
     assert isinstance(metric_config, dict)
-    assert len(metric_config) == 16
+    assert len(metric_config) == 17
 
     assert (
         metric_config[TelemetryAttributes.fga_client_request_batch_check_size] is False
@@ -313,3 +313,50 @@ def test_default_telemetry_metric_configuration():
     assert metric_config[TelemetryAttributes.url_scheme] is True
     assert metric_config[TelemetryAttributes.url_full] is True
     assert metric_config[TelemetryAttributes.user_agent_original] is True
+
+
+def test_telemetry_metrics_configuration_enabled_metrics():
+    metrics_config = TelemetryMetricsConfiguration(
+        {
+            TelemetryHistograms.fga_client_request_duration: {
+                TelemetryAttributes.http_host: True,
+                TelemetryAttributes.url_full: False,
+            },
+            TelemetryCounters.fga_client_request: None,
+        }
+    )
+
+    enabled = metrics_config.getEnabledMetrics()
+    assert enabled == {
+        TelemetryHistograms.fga_client_request_duration: {
+            TelemetryAttributes.http_host: True
+        }
+    }
+
+    # Resolved once, and again after the configuration changes
+    assert metrics_config.getEnabledMetrics() is enabled
+
+    metrics_config.fga_client_request = TelemetryMetricConfiguration(
+        {TelemetryAttributes.url_scheme: True}
+    )
+    assert metrics_config.getEnabledMetrics() == {
+        TelemetryHistograms.fga_client_request_duration: {
+            TelemetryAttributes.http_host: True
+        },
+        TelemetryCounters.fga_client_request: {TelemetryAttributes.url_scheme: True},
+    }
+
+    # Changing the configuration of a metric resolves its attributes again
+    metrics_config.fga_client_request_duration.http_host = False
+    metrics_config.fga_client_request_duration.url_full = True
+    assert metrics_config.getEnabledMetrics()[
+        TelemetryHistograms.fga_client_request_duration
+    ] == {TelemetryAttributes.url_full: True}
+
+    metrics_config.fga_client_request.configure({TelemetryAttributes.url_scheme: False})
+    assert (
+        TelemetryCounters.fga_client_request not in metrics_config.getEnabledMetrics()
+    )
+
+    metrics_config.clear()
+    assert metrics_config.getEnabledMetrics() == {}
@@ -0,0 +1,32 @@
+from openfga_sdk.telemetry.gauges import TelemetryGauge, TelemetryGauges
+
+
+def test_telemetry_gauge_initialization():
+    gauge = TelemetryGauge(
+        name="fga-client.test.gauge",
+        description="A test gauge for unit testing.",
+    )
+
+    assert gauge.name == "fga-client.test.gauge"
+    assert gauge.description == "A test gauge for unit testing."
+    assert gauge.unit == ""
+    assert gauge.monotonic is False
+
+
+def test_telemetry_gauges_default_values():
+    gauges = TelemetryGauges()
+
+    assert (
+        gauges.fga_client_connection_pool_active.name
+        == "fga-client.connection_pool.active"
+    )
+    assert gauges.fga_client_connection_pool_created.monotonic is True
+    assert len(TelemetryGauges.getAll()) == 5
+
+
+def test_telemetry_gauges_get():
+    assert (
+        TelemetryGauges.get("fga-client.connection_pool.waiting")
+        == TelemetryGauges.fga_client_connection_pool_waiting
+    )
+    assert TelemetryGauges.get("fga-client.unknown") is None
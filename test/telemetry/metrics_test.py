@@ -2,9 +2,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from opentelemetry.metrics import Counter, Histogram, Meter
+from opentelemetry.metrics import CallbackOptions, Counter, Histogram, Meter
 
+from openfga_sdk.connection_pool import ConnectionPoolStats
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.configuration import TelemetryConfiguration
 from openfga_sdk.telemetry.counters import TelemetryCounters
+from openfga_sdk.telemetry.gauges import TelemetryGauges
 from openfga_sdk.telemetry.histograms import TelemetryHistograms
 from openfga_sdk.telemetry.metrics import TelemetryMetrics
 
@@ -30,6 +34,28 @@ def test_meter_lazy_initialization(mock_get_meter):
     mock_get_meter.assert_called_once()
 
 
+def test_is_recording():
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryHistograms.fga_client_request_duration: {
+                    TelemetryAttributes.http_host: True,
+                },
+            }
+        }
+    )
+
+    # Without a MeterProvider, OpenTelemetry drops every measurement
+    with patch("openfga_sdk.telemetry.metrics.isMeterProviderSet", return_value=False):
+        assert TelemetryMetrics().isRecording(configuration) is False
+        assert TelemetryMetrics(meter=MagicMock(spec=Meter)).isRecording(configuration)
+
+    with patch("openfga_sdk.telemetry.metrics.isMeterProviderSet", return_value=True):
+        assert TelemetryMetrics().isRecording(configuration) is True
+        assert TelemetryMetrics().isRecording(TelemetryConfiguration()) is False
+        assert TelemetryMetrics().isRecording(None) is False
+
+
 @patch("openfga_sdk.telemetry.metrics.get_meter")
 def test_counter_creation(mock_get_meter):
     mock_meter = MagicMock(spec=Meter)
@@ -80,3 +106,269 @@ def test_invalid_histogram_key():
     telemetry = TelemetryMetrics()
     with pytest.raises(ValueError):
         telemetry.histogram("invalid_histogram_key")
+
+
+@patch("openfga_sdk.telemetry.metrics.get_meter")
+def test_replica_staleness_recorded_when_enabled(mock_get_meter):
+    mock_meter = MagicMock(spec=Meter)
+    mock_histogram = MagicMock(spec=Histogram)
+    mock_get_meter.return_value = mock_meter
+    mock_meter.create_histogram.return_value = mock_histogram
+
+    telemetry = TelemetryMetrics()
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryHistograms.fga_client_replica_staleness: {
+                    TelemetryAttributes.fga_client_request_store_id: True,
+                }
+            }
+        }
+    )
+
+    telemetry.replicaStaleness(
+        250,
+        attributes={TelemetryAttributes.fga_client_request_store_id: "store"},
+        configuration=configuration,
+    )
+    mock_histogram.record.assert_called_once_with(
+        amount=250, attributes={"fga-client.request.store_id": "store"}
+    )
+
+    mock_histogram.reset_mock()
+    telemetry.replicaStaleness(250, configuration=TelemetryConfiguration())
+    mock_histogram.record.assert_not_called()
+
+
+@patch("openfga_sdk.telemetry.metrics.get_meter")
+def test_sdk_overhead_recorded_when_enabled(mock_get_meter):
+    mock_meter = MagicMock(spec=Meter)
+    mock_histogram = MagicMock(spec=Histogram)
+    mock_get_meter.return_value = mock_meter
+    mock_meter.create_histogram.return_value = mock_histogram
+
+    telemetry = TelemetryMetrics()
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryHistograms.fga_client_sdk_overhead: {
+                    TelemetryAttributes.fga_client_request_method: True,
+                }
+            }
+        }
+    )
+
+    telemetry.sdkOverhead(
+        80,
+        attributes={
+            TelemetryAttributes.fga_client_request_method: "Read",
+            TelemetryAttributes.fga_client_request_store_id: "store",
+        },
+        configuration=configuration,
+    )
+    mock_histogram.record.assert_called_once_with(
+        amount=80, attributes={"fga-client.request.method": "Read"}
+    )
+
+    mock_histogram.reset_mock()
+    telemetry.sdkOverhead(80, configuration=TelemetryConfiguration())
+    mock_histogram.record.assert_not_called()
+
+
+@patch("openfga_sdk.telemetry.metrics.get_meter")
+def test_metric_attributes_follow_configuration_changes(mock_get_meter):
+    mock_meter = MagicMock(spec=Meter)
+    mock_histogram = MagicMock(spec=Histogram)
+    mock_get_meter.return_value = mock_meter
+    mock_meter.create_histogram.return_value = mock_histogram
+
+    telemetry = TelemetryMetrics()
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryHistograms.fga_client_sdk_overhead: {
+                    TelemetryAttributes.fga_client_request_method: True,
+                    TelemetryAttributes.http_host: True,
+                }
+            }
+        }
+    )
+    attributes = {
+        TelemetryAttributes.fga_client_request_method: "Read",
+        TelemetryAttributes.http_host: "api.fga.example",
+    }
+
+    telemetry.sdkOverhead(80, attributes=attributes, configuration=configuration)
+    mock_histogram.record.assert_called_once_with(
+        amount=80,
+        attributes={
+            "fga-client.request.method": "Read",
+            "http.host": "api.fga.example",
+        },
+    )
+
+    # Changed after the first metric was recorded
+    configuration.metrics.fga_client_sdk_overhead.http_host = False
+
+    mock_histogram.reset_mock()
+    telemetry.sdkOverhead(80, attributes=attributes, configuration=configuration)
+    mock_histogram.record.assert_called_once_with(
+        amount=80, attributes={"fga-client.request.method": "Read"}
+    )
+
+
+@patch("openfga_sdk.telemetry.metrics.get_meter")
+def test_filter_allowed_recorded_when_enabled(mock_get_meter):
+    mock_meter = MagicMock(spec=Meter)
+    mock_counter = MagicMock(spec=Counter)
+    mock_get_meter.return_value = mock_meter
+    mock_meter.create_counter.return_value = mock_counter
+
+    telemetry = TelemetryMetrics()
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryCounters.fga_client_filter_allowed: {
+                    TelemetryAttributes.fga_client_filter_strategy: True,
+                }
+            }
+        }
+    )
+
+    telemetry.filterAllowed(
+        attributes={
+            TelemetryAttributes.fga_client_filter_strategy: "list_objects",
+            TelemetryAttributes.fga_client_request_store_id: "store",
+        },
+        configuration=configuration,
+    )
+    mock_counter.add.assert_called_once_with(
+        amount=1, attributes={"fga-client.filter.strategy": "list_objects"}
+    )
+
+    mock_counter.reset_mock()
+    telemetry.filterAllowed(configuration=TelemetryConfiguration())
+    mock_counter.add.assert_not_called()
+
+
+@patch("openfga_sdk.telemetry.metrics.get_meter")
+def test_connection_pool_observed_when_enabled(mock_get_meter):
+    mock_meter = MagicMock(spec=Meter)
+    mock_get_meter.return_value = mock_meter
+
+    pool = MagicMock()
+    pool.pool_stats.return_value = ConnectionPoolStats(
+        active=2, idle=1, waiting=0, created=3, reused=9
+    )
+
+    telemetry = TelemetryMetrics()
+    telemetry.connectionPool(pool, configuration=TelemetryConfiguration())
+    mock_meter.create_observable_gauge.assert_not_called()
+    mock_meter.create_observable_counter.assert_not_called()
+
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryGauges.fga_client_connection_pool_active: {
+                    TelemetryAttributes.http_host: True,
+                },
+                TelemetryGauges.fga_client_connection_pool_created: {
+                    TelemetryAttributes.url_scheme: True,
+                },
+                TelemetryGauges.fga_client_connection_pool_reuse_ratio: {
+                    TelemetryAttributes.url_scheme: True,
+                },
+            }
+        }
+    )
+    telemetry.connectionPool(
+        pool,
+        attributes={
+            TelemetryAttributes.http_host: "api.fga.example",
+            TelemetryAttributes.url_scheme: "https",
+        },
+        configuration=configuration,
+    )
+
+    gauges = {
+        call.kwargs["name"]: call.kwargs["callbacks"][0]
+        for call in mock_meter.create_observable_gauge.call_args_list
+    }
+    counters = {
+        call.kwargs["name"]: call.kwargs["callbacks"][0]
+        for call in mock_meter.create_observable_counter.call_args_list
+    }
+    assert set(gauges) == {
+        "fga-client.connection_pool.active",
+        "fga-client.connection_pool.reuse_ratio",
+    }
+    assert set(counters) == {"fga-client.connection_pool.created"}
+
+    observations = list(gauges["fga-client.connection_pool.active"](CallbackOptions()))
+    assert [(o.value, dict(o.attributes)) for o in observations] == [
+        (2, {"http.host": "api.fga.example"})
+    ]
+    observations = list(
+        gauges["fga-client.connection_pool.reuse_ratio"](CallbackOptions())
+    )
+    assert [o.value for o in observations] == [0.75]
+    observations = list(
+        counters["fga-client.connection_pool.created"](CallbackOptions())
+    )
+    assert [o.value for o in observations] == [3]
+
+
+@patch("openfga_sdk.telemetry.metrics.get_meter")
+def test_request_phases_recorded_when_enabled(mock_get_meter):
+    mock_meter = MagicMock(spec=Meter)
+    mock_histogram = MagicMock(spec=Histogram)
+    mock_meter.create_histogram.return_value = mock_histogram
+    mock_get_meter.return_value = mock_meter
+
+    timings = {
+        TelemetryHistograms.fga_client_request_time_to_first_byte: 12.5,
+        TelemetryHistograms.fga_client_response_body_read: 0.5,
+        TelemetryHistograms.fga_client_response_deserialize: 1.5,
+    }
+    attributes = {
+        TelemetryAttributes.fga_client_request_method: "Check",
+        TelemetryAttributes.url_scheme: "https",
+    }
+
+    telemetry = TelemetryMetrics()
+    telemetry.requestPhases(
+        timings, attributes=attributes, configuration=TelemetryConfiguration()
+    )
+    mock_meter.create_histogram.assert_not_called()
+
+    configuration = TelemetryConfiguration(
+        {
+            "metrics": {
+                TelemetryHistograms.fga_client_request_time_to_first_byte: {
+                    TelemetryAttributes.fga_client_request_method: True,
+                },
+                TelemetryHistograms.fga_client_request_connect: {
+                    TelemetryAttributes.fga_client_request_method: True,
+                },
+                TelemetryHistograms.fga_client_response_deserialize: {
+                    TelemetryAttributes.url_scheme: True,
+                },
+            }
+        }
+    )
+    telemetry.requestPhases(timings, attributes=attributes, configuration=configuration)
+
+    # Only the enabled phases the request went through are recorded
+    assert [
+        call.kwargs["name"] for call in mock_meter.create_histogram.call_args_list
+    ] == [
+        "fga-client.request.time_to_first_byte",
+        "fga-client.response.deserialize",
+    ]
+    assert [
+        (call.kwargs["amount"], call.kwargs["attributes"])
+        for call in mock_histogram.record.call_args_list
+    ] == [
+        (12.5, {"fga-client.request.method": "Check"}),
+        (1.5, {"url.scheme": "https"}),
+    ]
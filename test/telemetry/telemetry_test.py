@@ -43,3 +43,16 @@ def test_metrics_initialization_without_patch():
     # Access the metrics property again, no new instance should be created
     metrics_again = telemetry.metrics
     assert metrics_again == metrics
+
+
+def test_tracing_initialization():
+    from openfga_sdk.telemetry import Telemetry, TelemetryTracing
+
+    telemetry = Telemetry()
+
+    assert telemetry._tracing is None
+
+    tracing = telemetry.tracing
+
+    assert isinstance(tracing, TelemetryTracing)
+    assert telemetry.tracing == tracing
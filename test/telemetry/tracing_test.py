@@ -0,0 +1,194 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from opentelemetry.trace import NoOpTracerProvider, SpanKind, Tracer
+
+from openfga_sdk.exceptions import RateLimitExceededError
+from openfga_sdk.telemetry.attributes import TelemetryAttributes
+from openfga_sdk.telemetry.tracing import (
+    TelemetryTracing,
+    isTracerProviderSet,
+    setSpanAttributes,
+    traced,
+)
+
+
+def _tracer() -> tuple[MagicMock, MagicMock]:
+    tracer = MagicMock(spec=Tracer)
+    span = tracer.start_as_current_span.return_value.__enter__.return_value
+    return tracer, span
+
+
+@patch("opentelemetry.trace.get_tracer")
+def test_tracer_lazy_initialization(mock_get_tracer):
+    tracing = TelemetryTracing()
+
+    assert tracing._tracer is None
+
+    tracer = tracing.tracer()
+    assert tracer == mock_get_tracer.return_value
+    mock_get_tracer.assert_called_once_with("openfga-sdk")
+
+    assert tracing.tracer() == tracer
+    mock_get_tracer.assert_called_once()
+
+
+def test_is_recording():
+    # No TracerProvider is set while the tests run
+    assert isTracerProviderSet() is False
+    assert TelemetryTracing().isRecording() is False
+
+    with patch(
+        "opentelemetry.trace.get_tracer_provider",
+        return_value=NoOpTracerProvider(),
+    ):
+        assert isTracerProviderSet() is False
+
+    with patch("opentelemetry.trace.get_tracer_provider", return_value=MagicMock()):
+        assert isTracerProviderSet() is True
+        assert TelemetryTracing().isRecording() is True
+
+    tracer, _ = _tracer()
+    assert TelemetryTracing(tracer).isRecording() is True
+
+
+def test_operation():
+    tracer, span = _tracer()
+    tracing = TelemetryTracing(tracer)
+
+    with tracing.operation("check", {"fga-client.request.store_id": "abc"}) as s:
+        assert s == span
+
+    tracer.start_as_current_span.assert_called_once_with(
+        "check",
+        kind=SpanKind.INTERNAL,
+        attributes={"fga-client.request.store_id": "abc"},
+    )
+
+
+@patch("opentelemetry.propagate.inject")
+def test_attempt(mock_inject):
+    tracer, span = _tracer()
+    tracing = TelemetryTracing(tracer)
+    headers = {}
+
+    with tracing.attempt(
+        "POST",
+        {
+            TelemetryAttributes.fga_client_request_method: "Check",
+            TelemetryAttributes.http_request_resend_count: 1,
+            TelemetryAttributes.fga_client_user: "user:anne",
+        },
+        headers,
+    ) as s:
+        response = MagicMock()
+        response.status = 200
+        response.getheader.return_value = "12"
+        tracing.recordResponse(s, response)
+
+    tracer.start_as_current_span.assert_called_once_with(
+        "POST",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "fga-client.request.method": "Check",
+            "http.request.resend_count": 1,
+        },
+    )
+    mock_inject.assert_called_once_with(headers)
+    span.set_attribute.assert_any_call("http.response.status_code", 200)
+    span.set_attribute.assert_any_call("http.server.request.duration", 12)
+
+
+@patch("opentelemetry.propagate.inject")
+def test_attempt_error(mock_inject):
+    tracer, span = _tracer()
+    tracing = TelemetryTracing(tracer)
+
+    error = RateLimitExceededError(status=429)
+    error.header = {"fga-query-duration-ms": "5"}
+
+    with pytest.raises(RateLimitExceededError):
+        with tracing.attempt("POST", {}, {}):
+            raise error
+
+    span.set_attribute.assert_any_call("http.response.status_code", 429)
+    span.set_attribute.assert_any_call("http.server.request.duration", 5)
+
+
+@patch("opentelemetry.trace.get_current_span")
+def test_retry(mock_get_current_span):
+    span = mock_get_current_span.return_value
+    span.is_recording.return_value = True
+
+    TelemetryTracing().retry(2, 1.5, True)
+
+    span.add_event.assert_called_once_with(
+        "fga-client.retry",
+        attributes={
+            "http.request.resend_count": 2,
+            "fga-client.retry.wait_ms": 1500,
+            "fga-client.retry.retry_after": True,
+        },
+    )
+
+
+@patch("opentelemetry.trace.get_current_span")
+def test_set_span_attributes(mock_get_current_span):
+    span = mock_get_current_span.return_value
+    span.is_recording.return_value = True
+
+    # Nothing is looked up when no span will be recorded
+    setSpanAttributes({"fga-client.request.batch_size": 3})
+    mock_get_current_span.assert_not_called()
+
+    tracer, _ = _tracer()
+    with patch("openfga_sdk.telemetry.tracing._tracing", TelemetryTracing(tracer)):
+        setSpanAttributes({"fga-client.request.batch_size": 3})
+
+    span.set_attributes.assert_called_once_with({"fga-client.request.batch_size": 3})
+
+
+def test_traced():
+    class Client:
+        def get_store_id(self):
+            return "01YCP46JKYM8FJCQ37NMBYHE5X"
+
+        @traced
+        def check(self, value):
+            return value
+
+    tracer, _ = _tracer()
+
+    # Calls pass straight through when no TracerProvider is set
+    assert Client().check(1) == 1
+    tracer.start_as_current_span.assert_not_called()
+
+    with patch("openfga_sdk.telemetry.tracing._tracing", TelemetryTracing(tracer)):
+        assert Client().check(2) == 2
+
+        tracer.start_as_current_span.assert_called_once_with(
+            "check",
+            kind=SpanKind.INTERNAL,
+            attributes={"fga-client.request.store_id": "01YCP46JKYM8FJCQ37NMBYHE5X"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_traced_coroutine():
+    class Client:
+        def get_store_id(self):
+            return None
+
+        @traced
+        async def list_objects(self, value):
+            return value
+
+    tracer, _ = _tracer()
+
+    with patch("openfga_sdk.telemetry.tracing._tracing", TelemetryTracing(tracer)):
+        assert await Client().list_objects(3) == 3
+
+    tracer.start_as_current_span.assert_called_once_with(
+        "list_objects", kind=SpanKind.INTERNAL, attributes={}
+    )